@@ -2,18 +2,94 @@
 """
 ArtBeat English Text Extraction Script
 Extracts all hardcoded English text from Dart screen files.
+
+With --stream each file's hits are appended to a JSONL file as soon as the
+file is scanned (patterns stored once, hits as [text, line, pattern_id,
+context] rows) and the markdown report is rendered from that file
+afterwards, so memory does not grow with the number of hits.
+
+--profile records time, matches and the characters spanned by matches
+(chars_spanned) per pattern, and time per pattern for each file along with
+its length (file_length). Python's re does not expose how far a search ran
+before giving up, so match spans stand in for characters scanned: a long
+average span means a .*? ran far.
+
+--budget-ms caps the time a pattern may spend on one file: past the budget
+the rest of the file is scanned with the pattern's bounded-window variant
+(.*? and [^)]* limited to --window characters), and a pattern that overran
+once stays bounded for the remaining files, so an anchor such as `error`
+can no longer drag a DOTALL scan to the end of every file.
 """
 
 import os
 import re
 import json
+import time
+import bisect
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
 import argparse
 
+
+class TextMatch:
+    """One extracted literal; pattern_id indexes EnglishTextExtractor.patterns"""
+    __slots__ = ('text', 'line', 'pattern_id', 'context')
+
+    def __init__(self, text: str, line: int, pattern_id: int, context: str):
+        self.text = text
+        self.line = line
+        self.pattern_id = pattern_id
+        self.context = context
+
+    def as_row(self) -> list:
+        return [self.text, self.line, self.pattern_id, self.context]
+
+    def as_dict(self, patterns: List[str]) -> Dict:
+        return {'text': self.text, 'line': self.line, 'pattern': patterns[self.pattern_id], 'context': self.context}
+
+
+class PatternStats:
+    __slots__ = ('seconds', 'matches', 'spanned', 'files', 'fallbacks', 'demoted')
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.matches = 0
+        self.spanned = 0     # characters covered by matches; long spans mean .*? ran far
+        self.files = 0
+        self.fallbacks = 0
+        self.demoted = False  # over budget once: bounded variant from then on
+
+
+def bounded_variant(pattern: str, window: int) -> str:
+    """The pattern with its unbounded gaps limited to `window` characters"""
+    return pattern.replace('.*?', f'.{{0,{window}}}?').replace('[^)]*', f'[^)]{{0,{window}}}')
+
+
+def read_jsonl(path: str) -> Iterator[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        offset = f.tell()
+        line = f.readline()
+        while line:
+            record = json.loads(line)
+            record['_offset'] = offset
+            yield record
+            offset = f.tell()
+            line = f.readline()
+
+
+def package_of(file_path: str) -> str:
+    if 'packages/' in file_path:
+        return file_path.split('packages/')[1].split('/')[0]
+    return 'main_app'
+
+
 class EnglishTextExtractor:
-    def __init__(self, root_path: str):
+    def __init__(self, root_path: str, verbose: bool = True, profile: bool = False,
+                 budget_ms: float = None, window: int = 200):
         self.root_path = Path(root_path)
+        self.verbose = verbose
+        self.profile = profile
+        self.budget = budget_ms / 1000 if budget_ms else None
         self.english_texts: Dict[str, List[Dict]] = {}
         self.screen_files: List[Path] = []
         self.total_texts_found = 0
@@ -54,6 +130,16 @@ class EnglishTextExtractor:
             r"TextButton\s*\([^)]*child:\s*Text\s*\(\s*['\"]([^'\"]+)['\"]",
         ]
         
+        flags = re.MULTILINE | re.DOTALL
+        self.compiled = [re.compile(pattern, flags) for pattern in self.patterns]
+        self.bounded = []
+        for pattern in self.patterns:
+            variant = bounded_variant(pattern, window)
+            self.bounded.append(re.compile(variant, flags) if variant != pattern else None)
+        self.pattern_stats = [PatternStats() for _ in self.patterns]
+        # file -> [seconds, file length, {pattern_id: seconds}], only with profile=True
+        self.file_stats: Dict[str, list] = {}
+
         # Exclusion patterns (avoid false positives)
         self.exclusions = [
             r'^[a-z_]+$',  # Variable names
@@ -111,42 +197,78 @@ class EnglishTextExtractor:
             
         return True
 
-    def extract_from_file(self, file_path: Path) -> List[Dict]:
-        """Extract English text from a single Dart file."""
+    def run_pattern(self, pattern_id: int, content: str) -> list:
+        """All matches of one pattern, switching to the bounded variant once over budget"""
+        stats = self.pattern_stats[pattern_id]
+        bounded = self.bounded[pattern_id]
+        regex = bounded if stats.demoted else self.compiled[pattern_id]
+        if not self.profile and self.budget is None:
+            return list(regex.finditer(content))
+
+        start = time.perf_counter()
+        matches = []
+        fell_back = False
+        for match in regex.finditer(content):
+            matches.append(match)
+            if self.budget is not None and regex is not bounded and bounded is not None \
+                    and time.perf_counter() - start > self.budget:
+                fell_back = True
+                break
+        if fell_back:
+            matches.extend(bounded.finditer(content, matches[-1].end()))
+        elapsed = time.perf_counter() - start
+
+        # A single search that finds nothing cannot be interrupted, so a pattern that
+        # overran its budget on one file runs bounded for the rest of the scan
+        if self.budget is not None and bounded is not None and not stats.demoted and elapsed > self.budget:
+            stats.demoted = True
+            fell_back = True
+
+        stats.seconds += elapsed
+        stats.matches += len(matches)
+        stats.spanned += sum(m.end() - m.start() for m in matches)
+        stats.files += 1
+        stats.fallbacks += fell_back
+        return matches
+
+    def scan_content(self, content: str, file_label: str = None) -> List[TextMatch]:
+        """Matches in pattern order, first occurrence of each text only"""
+        seen = set()
+        unique_texts = []
+        newlines = [m.start() for m in re.finditer('\n', content)]
+        pattern_seconds = {}
+        for pattern_id in range(len(self.patterns)):
+            started = time.perf_counter()
+            matches = self.run_pattern(pattern_id, content)
+            pattern_seconds[pattern_id] = time.perf_counter() - started
+            for match in matches:
+                text = match.group(1).strip()
+                if text in seen or not self.is_likely_english(text):
+                    continue
+                seen.add(text)
+                # Find line number
+                line_num = bisect.bisect_left(newlines, match.start()) + 1
+                unique_texts.append(TextMatch(
+                    text, line_num, pattern_id, self.get_context(content, match.start(), match.end())))
+        if self.profile and file_label is not None:
+            self.file_stats[file_label] = [sum(pattern_seconds.values()), len(content), pattern_seconds]
+        return unique_texts
+
+    def read_file(self, file_path: Path):
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                return f.read()
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
-            return []
+            return None
 
-        found_texts = []
-        
-        for pattern in self.patterns:
-            matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
-            for match in matches:
-                text = match.group(1).strip()
-                
-                if self.is_likely_english(text):
-                    # Find line number
-                    line_num = content[:match.start()].count('\n') + 1
-                    
-                    found_texts.append({
-                        'text': text,
-                        'line': line_num,
-                        'pattern': pattern,
-                        'context': self.get_context(content, match.start(), match.end())
-                    })
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_texts = []
-        for item in found_texts:
-            if item['text'] not in seen:
-                seen.add(item['text'])
-                unique_texts.append(item)
-        
-        return unique_texts
+    def extract_from_file(self, file_path: Path) -> List[Dict]:
+        """Extract English text from a single Dart file."""
+        content = self.read_file(file_path)
+        if content is None:
+            return []
+        label = str(file_path.relative_to(self.root_path)) if file_path.is_relative_to(self.root_path) else str(file_path)
+        return [match.as_dict(self.patterns) for match in self.scan_content(content, label)]
 
     def get_context(self, content: str, start: int, end: int, context_chars: int = 50) -> str:
         """Get surrounding context for better understanding."""
@@ -241,17 +363,165 @@ class EnglishTextExtractor:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(output_data, f, indent=2, ensure_ascii=False)
 
+    def stream_to_jsonl(self, output_path: str, files: List[Path] = None):
+        """Scan every screen file, appending one JSONL record per file as it finishes"""
+        self.screen_files = files if files is not None else self.find_screen_files()
+        if self.verbose:
+            print(f"Found {len(self.screen_files)} screen files to analyze")
+        files_with_text = 0
+
+        with open(output_path, 'w', encoding='utf-8') as out:
+            out.write(json.dumps({'type': 'header', 'patterns': self.patterns}, ensure_ascii=False) + '\n')
+            for file_path in self.screen_files:
+                relative_path = str(file_path.relative_to(self.root_path))
+                content = self.read_file(file_path)
+                if content is None:
+                    continue
+                matches = self.scan_content(content, relative_path)
+                if not matches:
+                    continue
+                out.write(json.dumps({'type': 'file', 'file': relative_path,
+                                      'texts': [m.as_row() for m in matches]}, ensure_ascii=False) + '\n')
+                out.flush()
+                files_with_text += 1
+                self.total_texts_found += len(matches)
+                if self.verbose:
+                    print(f"  {relative_path}: {len(matches)} English text strings")
+            out.write(json.dumps({
+                'type': 'summary',
+                'generated_at': __import__('datetime').datetime.now().isoformat(),
+                'total_files': len(self.screen_files),
+                'files_with_text': files_with_text,
+                'total_texts': self.total_texts_found,
+            }) + '\n')
+        self.files_with_text = files_with_text
+
+    def profile_report(self, top: int = 10) -> Dict:
+        """Patterns and files ranked by regex time"""
+        patterns = []
+        for pattern_id, stats in enumerate(self.pattern_stats):
+            patterns.append({
+                'id': pattern_id,
+                'pattern': self.patterns[pattern_id],
+                'seconds': round(stats.seconds, 4),
+                'matches': stats.matches,
+                'chars_spanned': stats.spanned,
+                'avg_span': round(stats.spanned / stats.matches, 1) if stats.matches else 0,
+                'budget_fallbacks': stats.fallbacks,
+                'demoted': stats.demoted,
+                'bounded_variant': self.bounded[pattern_id].pattern if self.bounded[pattern_id] else None,
+            })
+        patterns.sort(key=lambda p: -p['seconds'])
+        files = []
+        for file_path, (seconds, file_length, by_pattern) in self.file_stats.items():
+            worst = max(by_pattern, key=by_pattern.get) if by_pattern else None
+            files.append({
+                'file': file_path,
+                'seconds': round(seconds, 4),
+                'file_length': file_length,
+                'worst_pattern': worst,
+                'worst_pattern_seconds': round(by_pattern[worst], 4) if worst is not None else 0,
+            })
+        files.sort(key=lambda f: -f['seconds'])
+        return {
+            'metadata': {
+                'files': len(self.file_stats),
+                'total_seconds': round(sum(p['seconds'] for p in patterns), 4),
+                'budget_ms': self.budget * 1000 if self.budget else None,
+            },
+            'patterns': patterns,
+            'files': files[:top] if top else files,
+        }
+
+    def print_profile(self, report: Dict, top: int = 10):
+        total = report['metadata']['total_seconds'] or 1
+        print(f"\n{'='*60}")
+        print("REGEX PROFILE")
+        print(f"{'='*60}")
+        print(f"{'id':>3} {'seconds':>8} {'share':>6} {'matches':>8} {'avg span':>9} {'fallbacks':>9}  pattern")
+        for p in report['patterns'][:top]:
+            print(f"{p['id']:>3} {p['seconds']:>8.3f} {p['seconds'] / total * 100:>5.1f}% {p['matches']:>8} "
+                  f"{p['avg_span']:>9} {p['budget_fallbacks']:>9}  {p['pattern'][:48]}")
+        print("\nSlowest files:")
+        for f in report['files'][:top]:
+            print(f"  {f['seconds'] * 1000:>7.1f} ms  {f['file']} ({f['file_length']:,} chars, "
+                  f"pattern {f['worst_pattern']} {f['worst_pattern_seconds'] * 1000:.1f} ms)")
+        print(f"{'='*60}")
+
+
+def write_report_from_jsonl(jsonl_path: str, output_path: str):
+    """Render the markdown report from a --stream JSONL file without loading the hits"""
+    summary = {}
+    # Pass 1: counts per package/file and where each file record starts
+    packages: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    for record in read_jsonl(jsonl_path):
+        if record['type'] == 'file':
+            packages.setdefault(package_of(record['file']), {})[record['file']] = (record['_offset'], len(record['texts']))
+        elif record['type'] == 'summary':
+            summary = record
+
+    unique_texts: Set[str] = set()
+    with open(output_path, 'w', encoding='utf-8') as out, open(jsonl_path, 'r', encoding='utf-8') as data:
+        out.write("# ArtBeat App - English Text on All Screens\n")
+        out.write(f"*Generated on: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+        out.write("## Summary\n")
+        out.write(f"- **Total Screen Files Analyzed**: {summary.get('total_files', 0)}\n")
+        out.write(f"- **Files with English Text**: {summary.get('files_with_text', 0)}\n")
+        out.write(f"- **Total English Text Strings Found**: {summary.get('total_texts', 0)}\n\n")
+
+        out.write("## By Package")
+        for package_name in sorted(packages):
+            package_files = packages[package_name]
+            total_in_package = sum(count for _, count in package_files.values())
+            out.write(f"\n\n### {package_name} ({len(package_files)} files, {total_in_package} texts)")
+
+            # Pass 2: seek to each file record in report order
+            for file_path in sorted(package_files):
+                offset, count = package_files[file_path]
+                data.seek(offset)
+                rows = json.loads(data.readline())['texts']
+                out.write(f"\n\n#### {file_path} ({count} texts)")
+                for i, (text, line, _, context) in enumerate(rows, 1):
+                    out.write(f"\n{i}. **Line {line}**: \"{text}\"")
+                    if len(context) > len(text) + 20:
+                        out.write(f"\n   *Context*: `{context[:100]}...`")
+                    unique_texts.add(text)
+
+        # Only the distinct strings are kept for the alphabetical list
+        out.write("\n\n## All Unique English Texts (Alphabetical)")
+        for i, text in enumerate(sorted(unique_texts), 1):
+            out.write(f"\n{i}. \"{text}\"")
+
 def main():
     parser = argparse.ArgumentParser(description='Extract English text from ArtBeat screen files')
     parser.add_argument('--root', default='.', help='Root directory of the project')
     parser.add_argument('--output', default='english_texts_report.md', help='Output markdown file')
     parser.add_argument('--json', default='english_texts_data.json', help='Output JSON file')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write per-file JSONL as files finish and build the report from it')
+    parser.add_argument('--jsonl', default='english_texts_data.jsonl', help='JSONL file for --stream')
+    parser.add_argument('--profile', nargs='?', const='english_texts_profile.json',
+                        help='Record per-pattern/per-file regex cost and save the ranking (JSON)')
+    parser.add_argument('--budget-ms', type=float, help='Per-pattern, per-file time budget before the bounded fallback')
+    parser.add_argument('--window', type=int, default=200, help='Gap length allowed by the bounded fallbacks')
     
     args = parser.parse_args()
     
-    extractor = EnglishTextExtractor(args.root)
+    extractor = EnglishTextExtractor(args.root, profile=bool(args.profile), budget_ms=args.budget_ms,
+                                     window=args.window)
     
     print("Starting English text extraction...")
+    if args.stream:
+        extractor.stream_to_jsonl(args.jsonl)
+        print("\nGenerating report...")
+        write_report_from_jsonl(args.jsonl, args.output)
+        print("\n✅ Extraction complete!")
+        print(f"📄 Report saved to: {args.output}")
+        print(f"📊 Data saved to: {args.jsonl}")
+        print(f"📈 Found {extractor.total_texts_found} English text strings in {extractor.files_with_text} files")
+        save_profile(extractor, args.profile)
+        return
+
     extractor.extract_all_texts()
     
     print(f"\nGenerating report...")
@@ -266,6 +536,16 @@ def main():
     print(f"📄 Report saved to: {args.output}")
     print(f"📊 Data saved to: {args.json}")
     print(f"📈 Found {extractor.total_texts_found} English text strings in {len(extractor.english_texts)} files")
+    save_profile(extractor, args.profile)
+
+def save_profile(extractor: EnglishTextExtractor, output_path: str):
+    if not output_path:
+        return
+    report = extractor.profile_report(top=0)
+    extractor.print_profile(report)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"⏱  Profile saved to: {output_path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Flutter Performance Linter
+Scans the Dart sources for widget patterns that are known to cost frames or
+memory (undecoded-size network images, shrink-wrapped lists, eager ListViews,
+Opacity and BackdropFilter layers) and reports them as SARIF or JSON.
+
+Files are linted in parallel and results are cached by file hash, so a rerun
+only re-lints what changed. Extra rules can be loaded with --plugin, a
+Python file that registers Rule subclasses:
+
+    # tools/lint_rules.py
+    import re
+    from flutter_perf_lint import Rule, register_rule
+
+    @register_rule
+    class ClipPathWidget(Rule):
+        id = 'clip-path'
+        description = 'ClipPath allocates a layer per child; prefer ClipRRect'
+        pattern = re.compile(r'(?<![.\w])ClipPath\s*\(')
+
+    python3 flutter_perf_lint.py --plugin tools/lint_rules.py --rules clip-path
+"""
+
+import re
+import sys
+import json
+import hashlib
+import inspect
+import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+
+from dart_source import find_dart_files, line_number, matching_paren, scan_dart  # noqa: E402
+
+CACHE_VERSION = 1
+SEVERITIES = ['note', 'warning', 'error']
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+
+class Rule:
+    """A performance rule: a call pattern plus a check on its argument list"""
+    id = ''
+    severity = 'warning'
+    description = ''
+    pattern: re.Pattern = re.compile(r'(?!)')
+
+    def check(self, args: str) -> Optional[str]:
+        """Return a message if the call with these (masked) arguments is a finding"""
+        return self.description
+
+    def findings(self, content: str, masked: str) -> List[Dict]:
+        results = []
+        for match in self.pattern.finditer(masked):
+            args = ''
+            if masked[match.end() - 1] == '(':
+                args = masked[match.end():matching_paren(masked, match.end() - 1)]
+            message = self.check(args)
+            if message:
+                results.append({
+                    'rule': self.id,
+                    'severity': self.severity,
+                    'line': line_number(content, match.start()),
+                    'column': match.start() - content.rfind('\n', 0, match.start()),
+                    'message': message,
+                    'snippet': content[match.start():match.end()].strip(),
+                })
+        return results
+
+
+RULES: Dict[str, Type[Rule]] = {}
+
+
+def register_rule(cls: Type[Rule]) -> Type[Rule]:
+    """Class decorator used by the built-in rules and by --plugin modules"""
+    RULES[cls.id] = cls
+    return cls
+
+
+@register_rule
+class ImageNetworkCacheSize(Rule):
+    id = 'image-network-cache-size'
+    severity = 'warning'
+    description = 'Image.network decodes at full resolution; pass cacheWidth/cacheHeight for the displayed size'
+    pattern = re.compile(r'\bImage\.network\s*\(')
+
+    def check(self, args: str) -> Optional[str]:
+        if re.search(r'\bcache(Width|Height)\s*:', args):
+            return None
+        return self.description
+
+
+@register_rule
+class ShrinkWrapList(Rule):
+    id = 'shrink-wrap-list'
+    severity = 'warning'
+    description = 'shrinkWrap: true lays out every child up front; prefer slivers (CustomScrollView) or a bounded height'
+    pattern = re.compile(r'\bshrinkWrap\s*:\s*true\b')
+
+
+@register_rule
+class EagerListView(Rule):
+    id = 'eager-list-view'
+    severity = 'note'
+    description = 'ListView(children: ...) builds every child eagerly; use ListView.builder for long or dynamic lists'
+    pattern = re.compile(r'(?<![.\w])ListView\s*\(')
+
+    def check(self, args: str) -> Optional[str]:
+        return self.description if re.search(r'\bchildren\s*:', args) else None
+
+
+@register_rule
+class OpacityWidget(Rule):
+    id = 'opacity-widget'
+    severity = 'warning'
+    description = 'Opacity forces an offscreen layer; use a color alpha, FadeTransition or AnimatedOpacity'
+    pattern = re.compile(r'(?<![.\w])Opacity\s*\(')
+
+    def check(self, args: str) -> Optional[str]:
+        if re.search(r'^\s*opacity\s*:\s*1(\.0)?\s*(,|$)', args, re.MULTILINE):
+            return 'Opacity with opacity 1.0 still allocates a layer; drop the wrapper'
+        return self.description
+
+
+@register_rule
+class BackdropFilterBlur(Rule):
+    id = 'backdrop-filter'
+    severity = 'warning'
+    description = 'BackdropFilter re-blurs everything behind it every frame; keep it small, clipped and out of lists'
+    pattern = re.compile(r'(?<![.\w])BackdropFilter\s*\(')
+
+
+def load_plugin(path: str):
+    """Import a plugin module; its @register_rule classes are added to RULES"""
+    # Run as a script this module is __main__; without the alias a plugin's
+    # `from flutter_perf_lint import register_rule` would load a second copy
+    # and register its rules there instead of in this RULES
+    sys.modules.setdefault('flutter_perf_lint', sys.modules[__name__])
+    spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+
+def _init_worker(plugins: List[str]):
+    """Worker processes start without the parent's plugins; load them again"""
+    for plugin in plugins:
+        load_plugin(plugin)
+
+
+def lint_file(file_path: str, rule_ids: List[str]) -> List[Dict]:
+    """Lint one file with the given rules (module-level so worker processes can run it)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    masked, _ = scan_dart(content)
+    findings = []
+    for rule_id in rule_ids:
+        findings.extend(RULES[rule_id]().findings(content, masked))
+    findings.sort(key=lambda f: (f['line'], f['column']))
+    return findings
+
+
+class PerfLinter:
+    def __init__(self, root_path: str, rule_ids: Optional[List[str]] = None, plugins: Optional[List[str]] = None,
+                 cache_path: Optional[str] = None, jobs: Optional[int] = None):
+        self.root_path = Path(root_path)
+        self.plugins = plugins or []
+        for plugin in self.plugins:
+            load_plugin(plugin)
+        self.rule_ids = rule_ids or sorted(RULES)
+        unknown = [r for r in self.rule_ids if r not in RULES]
+        if unknown:
+            raise ValueError(f"Unknown rules: {', '.join(unknown)}")
+        self.cache_path = Path(cache_path) if cache_path else self.root_path / 'build' / '.perf_lint_cache.json'
+        self.jobs = jobs
+        self.dart_files: List[Path] = []
+        self.findings: Dict[str, List[Dict]] = {}
+        self.cache: Dict[str, Dict] = {}
+        self.relinted = 0
+
+    def rules_hash(self) -> str:
+        """Cached results are only valid for the exact rule set and rule code that produced them"""
+        digest = hashlib.sha256()
+        for rule_id in self.rule_ids:
+            digest.update(rule_id.encode('utf-8'))
+            digest.update(inspect.getsource(RULES[rule_id]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def load_cache(self):
+        if not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {self.cache_path}: {e}")
+            return
+        if data.get('version') == CACHE_VERSION and data.get('rules') == self.rules_hash():
+            self.cache = data.get('files', {})
+
+    def save_cache(self):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'rules': self.rules_hash(), 'files': self.cache}, f)
+
+    def lint_all(self):
+        self.dart_files = find_dart_files(self.root_path)
+        self.load_cache()
+
+        pending = {}
+        for file_path in self.dart_files:
+            relative = str(file_path.relative_to(self.root_path))
+            digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            cached = self.cache.get(relative)
+            if cached and cached['sha256'] == digest:
+                self.findings[relative] = cached['findings']
+            else:
+                pending[relative] = digest
+        print(f"Linting {len(pending)} of {len(self.dart_files)} Dart files ({len(self.rule_ids)} rules)")
+
+        paths = [str(self.root_path / relative) for relative in pending]
+        if len(pending) < PARALLEL_THRESHOLD:
+            results = [lint_file(path, self.rule_ids) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                     initargs=(self.plugins,)) as pool:
+                results = list(pool.map(lint_file, paths, [self.rule_ids] * len(paths), chunksize=16))
+
+        for (relative, digest), findings in zip(pending.items(), results):
+            self.findings[relative] = findings
+            self.cache[relative] = {'sha256': digest, 'findings': findings}
+        self.relinted = len(pending)
+
+        # Forget deleted files
+        live = {str(f.relative_to(self.root_path)) for f in self.dart_files}
+        self.cache = {k: v for k, v in self.cache.items() if k in live}
+        self.save_cache()
+
+    def all_findings(self) -> List[Dict]:
+        return [dict(f, file=path) for path in sorted(self.findings) for f in self.findings[path]]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {rule_id: 0 for rule_id in self.rule_ids}
+        for finding in self.all_findings():
+            counts[finding['rule']] += 1
+        return counts
+
+    def to_sarif(self) -> Dict:
+        rules = [
+            {
+                'id': rule_id,
+                'shortDescription': {'text': RULES[rule_id].description},
+                'defaultConfiguration': {'level': RULES[rule_id].severity},
+            }
+            for rule_id in self.rule_ids
+        ]
+        index = {rule_id: i for i, rule_id in enumerate(self.rule_ids)}
+        results = [
+            {
+                'ruleId': f['rule'],
+                'ruleIndex': index[f['rule']],
+                'level': f['severity'],
+                'message': {'text': f['message']},
+                'locations': [{
+                    'physicalLocation': {
+                        'artifactLocation': {'uri': f['file'], 'uriBaseId': '%SRCROOT%'},
+                        'region': {'startLine': f['line'], 'startColumn': f['column']},
+                    }
+                }],
+            }
+            for f in self.all_findings()
+        ]
+        return {
+            '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {'driver': {'name': 'artbeat-flutter-perf-lint', 'rules': rules}},
+                'results': results,
+            }],
+        }
+
+    def save_json_output(self, output_path: str):
+        output_data = {
+            'metadata': {
+                'generated_at': __import__('datetime').datetime.now().isoformat(),
+                'total_files': len(self.dart_files),
+                'relinted_files': self.relinted,
+                'rules': self.rule_ids,
+                'counts': self.counts(),
+            },
+            'findings': self.all_findings(),
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+    def save_sarif_output(self, output_path: str):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_sarif(), f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lint ArtBeat Dart sources for Flutter performance issues')
+    parser.add_argument('--root', default='.', help='Root directory of the project')
+    parser.add_argument('--format', choices=['sarif', 'json'], default='sarif', help='Output format')
+    parser.add_argument('--output', help='Output file (default: flutter_perf_lint.sarif / .json)')
+    parser.add_argument('--rules', nargs='*', help='Only run these rule ids')
+    parser.add_argument('--plugin', action='append', default=[], help='Python file registering extra rules')
+    parser.add_argument('--jobs', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--cache', help='Cache file (default: build/.perf_lint_cache.json)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and overwrite the cache')
+    parser.add_argument('--fail-on', choices=SEVERITIES + ['none'], default='error',
+                        help='Exit non-zero when a finding has this severity or higher')
+    parser.add_argument('--list-rules', action='store_true', help='List available rules and exit')
+
+    args = parser.parse_args()
+
+    try:
+        linter = PerfLinter(args.root, args.rules, args.plugin, args.cache, args.jobs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    if args.list_rules:
+        for rule_id in sorted(RULES):
+            print(f"{rule_id} [{RULES[rule_id].severity}]: {RULES[rule_id].description}")
+        return
+
+    if args.no_cache:
+        linter.cache_path.unlink(missing_ok=True)
+    linter.lint_all()
+
+    output = args.output or f"flutter_perf_lint.{args.format}"
+    if args.format == 'sarif':
+        linter.save_sarif_output(output)
+    else:
+        linter.save_json_output(output)
+
+    counts = linter.counts()
+    print(f"\n{'='*60}")
+    print("FLUTTER PERFORMANCE LINT")
+    print(f"{'='*60}")
+    for rule_id, count in counts.items():
+        print(f"{rule_id} [{RULES[rule_id].severity}]: {count}")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {output}")
+
+    if args.fail_on != 'none':
+        threshold = SEVERITIES.index(args.fail_on)
+        if any(SEVERITIES.index(f['severity']) >= threshold for f in linter.all_findings()):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
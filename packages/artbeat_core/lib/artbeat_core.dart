@@ -12,6 +12,9 @@ export 'src/theme/artbeat_components.dart' show ArtbeatComponents;
 export 'src/theme/artbeat_theme.dart' show ArtbeatTheme;
 export 'src/theme/artbeat_typography.dart' show ArtbeatTypography;
 
+// Export generated translation keys (scripts/generate_locale_keys.py)
+export 'src/l10n/locale_keys.g.dart' show LocaleKeys;
+
 // Export Models
 // Note: AchievementModel is now provided by artbeat_art_walk package
 
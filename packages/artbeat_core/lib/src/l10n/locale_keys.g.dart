@@ -0,0 +1,3773 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_locale_keys.py from assets/translations/en.json
+// Source: en.json sha256=c5d1289cd43454255a4d062e10a52106f47514953cb931a328c2d430bcb72755
+
+// ignore_for_file: constant_identifier_names, lines_longer_than_80_chars
+
+/// Translation keys from en.json, grouped by package namespace.
+abstract class LocaleKeys {
+  // admin (570 keys)
+  static const admin_ad_button_cancel = 'admin_ad_button_cancel';
+  static const admin_ad_button_dismiss = 'admin_ad_button_dismiss';
+  static const admin_ad_button_reject = 'admin_ad_button_reject';
+  static const admin_ad_button_take_action = 'admin_ad_button_take_action';
+  static const admin_ad_empty_flagged = 'admin_ad_empty_flagged';
+  static const admin_ad_empty_pending = 'admin_ad_empty_pending';
+  static const admin_ad_empty_reports = 'admin_ad_empty_reports';
+  static const admin_ad_error_approve = 'admin_ad_error_approve';
+  static const admin_ad_error_load_data = 'admin_ad_error_load_data';
+  static const admin_ad_error_reject = 'admin_ad_error_reject';
+  static const admin_ad_error_review_report = 'admin_ad_error_review_report';
+  static const admin_ad_filter_all = 'admin_ad_filter_all';
+  static const admin_ad_filter_flagged = 'admin_ad_filter_flagged';
+  static const admin_ad_filter_pending_review = 'admin_ad_filter_pending_review';
+  static const admin_ad_filter_reports = 'admin_ad_filter_reports';
+  static const admin_ad_management_title = 'admin_ad_management_title';
+  static const admin_ad_notes_approved = 'admin_ad_notes_approved';
+  static const admin_ad_report_action_taken = 'admin_ad_report_action_taken';
+  static const admin_ad_report_dismissed = 'admin_ad_report_dismissed';
+  static const admin_ad_report_reviewed = 'admin_ad_report_reviewed';
+  static const admin_ad_success_approved = 'admin_ad_success_approved';
+  static const admin_ad_success_rejected = 'admin_ad_success_rejected';
+  static const admin_ad_tooltip_view_details = 'admin_ad_tooltip_view_details';
+  static const admin_admin_artwork_management_error_error_e = 'admin_admin_artwork_management_error_error_e';
+  static const admin_admin_artwork_management_error_error_e_6 = 'admin_admin_artwork_management_error_error_e_6';
+  static const admin_admin_artwork_management_error_error_e_8 = 'admin_admin_artwork_management_error_error_e_8';
+  static const admin_admin_artwork_management_error_error_loading_artwork = 'admin_admin_artwork_management_error_error_loading_artwork';
+  static const admin_admin_artwork_management_error_error_loading_details = 'admin_admin_artwork_management_error_error_loading_details';
+  static const admin_admin_artwork_management_message_description = 'admin_admin_artwork_management_message_description';
+  static const admin_admin_artwork_management_message_description_16 = 'admin_admin_artwork_management_message_description_16';
+  static const admin_admin_artwork_management_success_artwork_status_updated = 'admin_admin_artwork_management_success_artwork_status_updated';
+  static const admin_admin_artwork_management_text_approve = 'admin_admin_artwork_management_text_approve';
+  static const admin_admin_artwork_management_text_approve_20 = 'admin_admin_artwork_management_text_approve_20';
+  static const admin_admin_artwork_management_text_approve_21 = 'admin_admin_artwork_management_text_approve_21';
+  static const admin_admin_artwork_management_text_artwork_deleted = 'admin_admin_artwork_management_text_artwork_deleted';
+  static const admin_admin_artwork_management_text_artwork_management = 'admin_admin_artwork_management_text_artwork_management';
+  static const admin_admin_artwork_management_text_artwork_management_10 = 'admin_admin_artwork_management_text_artwork_management_10';
+  static const admin_admin_artwork_management_text_cancel = 'admin_admin_artwork_management_text_cancel';
+  static const admin_admin_artwork_management_text_cancel_34 = 'admin_admin_artwork_management_text_cancel_34';
+  static const admin_admin_artwork_management_text_cancel_39 = 'admin_admin_artwork_management_text_cancel_39';
+  static const admin_admin_artwork_management_text_cancel_40 = 'admin_admin_artwork_management_text_cancel_40';
+  static const admin_admin_artwork_management_text_cancel_45 = 'admin_admin_artwork_management_text_cancel_45';
+  static const admin_admin_artwork_management_text_cancel_46 = 'admin_admin_artwork_management_text_cancel_46';
+  static const admin_admin_artwork_management_text_comment_deleted = 'admin_admin_artwork_management_text_comment_deleted';
+  static const admin_admin_artwork_management_text_delete = 'admin_admin_artwork_management_text_delete';
+  static const admin_admin_artwork_management_text_delete_18 = 'admin_admin_artwork_management_text_delete_18';
+  static const admin_admin_artwork_management_text_delete_28 = 'admin_admin_artwork_management_text_delete_28';
+  static const admin_admin_artwork_management_text_delete_29 = 'admin_admin_artwork_management_text_delete_29';
+  static const admin_admin_artwork_management_text_delete_30 = 'admin_admin_artwork_management_text_delete_30';
+  static const admin_admin_artwork_management_text_delete_41 = 'admin_admin_artwork_management_text_delete_41';
+  static const admin_admin_artwork_management_text_delete_42 = 'admin_admin_artwork_management_text_delete_42';
+  static const admin_admin_artwork_management_text_delete_47 = 'admin_admin_artwork_management_text_delete_47';
+  static const admin_admin_artwork_management_text_delete_48 = 'admin_admin_artwork_management_text_delete_48';
+  static const admin_admin_artwork_management_text_delete_artwork = 'admin_admin_artwork_management_text_delete_artwork';
+  static const admin_admin_artwork_management_text_delete_artwork_38 = 'admin_admin_artwork_management_text_delete_artwork_38';
+  static const admin_admin_artwork_management_text_delete_comment = 'admin_admin_artwork_management_text_delete_comment';
+  static const admin_admin_artwork_management_text_delete_comment_44 = 'admin_admin_artwork_management_text_delete_comment_44';
+  static const admin_admin_artwork_management_text_flag = 'admin_admin_artwork_management_text_flag';
+  static const admin_admin_artwork_management_text_flag_26 = 'admin_admin_artwork_management_text_flag_26';
+  static const admin_admin_artwork_management_text_flag_27 = 'admin_admin_artwork_management_text_flag_27';
+  static const admin_admin_artwork_management_text_no_artwork_found = 'admin_admin_artwork_management_text_no_artwork_found';
+  static const admin_admin_artwork_management_text_reject = 'admin_admin_artwork_management_text_reject';
+  static const admin_admin_artwork_management_text_reject_23 = 'admin_admin_artwork_management_text_reject_23';
+  static const admin_admin_artwork_management_text_reject_24 = 'admin_admin_artwork_management_text_reject_24';
+  static const admin_admin_artwork_management_text_reject_35 = 'admin_admin_artwork_management_text_reject_35';
+  static const admin_admin_artwork_management_text_reject_36 = 'admin_admin_artwork_management_text_reject_36';
+  static const admin_admin_artwork_management_text_reject_artwork = 'admin_admin_artwork_management_text_reject_artwork';
+  static const admin_admin_artwork_management_text_reject_artwork_32 = 'admin_admin_artwork_management_text_reject_artwork_32';
+  static const admin_admin_artwork_management_text_select_artwork_to = 'admin_admin_artwork_management_text_select_artwork_to';
+  static const admin_admin_artwork_management_title_title = 'admin_admin_artwork_management_title_title';
+  static const admin_admin_artwork_management_title_title_14 = 'admin_admin_artwork_management_title_title_14';
+  static const admin_admin_login_text_login = 'admin_admin_login_text_login';
+  static const admin_admin_login_text_login_2 = 'admin_admin_login_text_login_2';
+  static const admin_admin_payment_button_click_below_to = 'admin_admin_payment_button_click_below_to';
+  static const admin_admin_payment_button_click_below_to_56 = 'admin_admin_payment_button_click_below_to_56';
+  static const admin_admin_payment_error_mark_as_failed = 'admin_admin_payment_error_mark_as_failed';
+  static const admin_admin_payment_label_download_filename = 'admin_admin_payment_label_download_filename';
+  static const admin_admin_payment_label_user_transactionusername = 'admin_admin_payment_label_user_transactionusername';
+  static const admin_admin_payment_message_description_transactiondescription = 'admin_admin_payment_message_description_transactiondescription';
+  static const admin_admin_payment_text_amount_transactionformattedamount = 'admin_admin_payment_text_amount_transactionformattedamount';
+  static const admin_admin_payment_text_are_you_sure = 'admin_admin_payment_text_are_you_sure';
+  static const admin_admin_payment_text_are_you_sure_7 = 'admin_admin_payment_text_are_you_sure_7';
+  static const admin_admin_payment_text_avg_transaction = 'admin_admin_payment_text_avg_transaction';
+  static const admin_admin_payment_text_avg_transaction_4 = 'admin_admin_payment_text_avg_transaction_4';
+  static const admin_admin_payment_text_bulk_refund = 'admin_admin_payment_text_bulk_refund';
+  static const admin_admin_payment_text_bulk_refund_13 = 'admin_admin_payment_text_bulk_refund_13';
+  static const admin_admin_payment_text_bulk_refund_25 = 'admin_admin_payment_text_bulk_refund_25';
+  static const admin_admin_payment_text_bulk_refund_26 = 'admin_admin_payment_text_bulk_refund_26';
+  static const admin_admin_payment_text_bulk_refund_27 = 'admin_admin_payment_text_bulk_refund_27';
+  static const admin_admin_payment_text_cancel = 'admin_admin_payment_text_cancel';
+  static const admin_admin_payment_text_cancel_14 = 'admin_admin_payment_text_cancel_14';
+  static const admin_admin_payment_text_cancel_15 = 'admin_admin_payment_text_cancel_15';
+  static const admin_admin_payment_text_cancel_9 = 'admin_admin_payment_text_cancel_9';
+  static const admin_admin_payment_text_clear_all_filters = 'admin_admin_payment_text_clear_all_filters';
+  static const admin_admin_payment_text_clear_all_filters_48 = 'admin_admin_payment_text_clear_all_filters_48';
+  static const admin_admin_payment_text_clear_all_filters_49 = 'admin_admin_payment_text_clear_all_filters_49';
+  static const admin_admin_payment_text_close = 'admin_admin_payment_text_close';
+  static const admin_admin_payment_text_close_53 = 'admin_admin_payment_text_close_53';
+  static const admin_admin_payment_text_close_61 = 'admin_admin_payment_text_close_61';
+  static const admin_admin_payment_text_close_62 = 'admin_admin_payment_text_close_62';
+  static const admin_admin_payment_text_copy_to_clipboard = 'admin_admin_payment_text_copy_to_clipboard';
+  static const admin_admin_payment_text_copy_to_clipboard_59 = 'admin_admin_payment_text_copy_to_clipboard_59';
+  static const admin_admin_payment_text_copy_to_clipboard_60 = 'admin_admin_payment_text_copy_to_clipboard_60';
+  static const admin_admin_payment_text_csv_content_copied = 'admin_admin_payment_text_csv_content_copied';
+  static const admin_admin_payment_text_date_range = 'admin_admin_payment_text_date_range';
+  static const admin_admin_payment_text_date_range_46 = 'admin_admin_payment_text_date_range_46';
+  static const admin_admin_payment_text_details = 'admin_admin_payment_text_details';
+  static const admin_admin_payment_text_details_42 = 'admin_admin_payment_text_details_42';
+  static const admin_admin_payment_text_details_43 = 'admin_admin_payment_text_details_43';
+  static const admin_admin_payment_text_entryvaluetostringasfixed2 = 'admin_admin_payment_text_entryvaluetostringasfixed2';
+  static const admin_admin_payment_text_export_selected = 'admin_admin_payment_text_export_selected';
+  static const admin_admin_payment_text_export_selected_35 = 'admin_admin_payment_text_export_selected_35';
+  static const admin_admin_payment_text_export_selected_36 = 'admin_admin_payment_text_export_selected_36';
+  static const admin_admin_payment_text_mark_as_completed = 'admin_admin_payment_text_mark_as_completed';
+  static const admin_admin_payment_text_mark_as_pending = 'admin_admin_payment_text_mark_as_pending';
+  static const admin_admin_payment_text_payment_management = 'admin_admin_payment_text_payment_management';
+  static const admin_admin_payment_text_payment_management_1 = 'admin_admin_payment_text_payment_management_1';
+  static const admin_admin_payment_text_payment_method_transactionpaymentmethod = 'admin_admin_payment_text_payment_method_transactionpaymentmethod';
+  static const admin_admin_payment_text_process_bulk_refunds = 'admin_admin_payment_text_process_bulk_refunds';
+  static const admin_admin_payment_text_process_bulk_refunds_17 = 'admin_admin_payment_text_process_bulk_refunds_17';
+  static const admin_admin_payment_text_process_refund = 'admin_admin_payment_text_process_refund';
+  static const admin_admin_payment_text_process_refund_10 = 'admin_admin_payment_text_process_refund_10';
+  static const admin_admin_payment_text_process_refund_11 = 'admin_admin_payment_text_process_refund_11';
+  static const admin_admin_payment_text_process_refund_2 = 'admin_admin_payment_text_process_refund_2';
+  static const admin_admin_payment_text_select_all = 'admin_admin_payment_text_select_all';
+  static const admin_admin_payment_text_select_all_24 = 'admin_admin_payment_text_select_all_24';
+  static const admin_admin_payment_text_total_refunds = 'admin_admin_payment_text_total_refunds';
+  static const admin_admin_payment_text_total_refunds_5 = 'admin_admin_payment_text_total_refunds_5';
+  static const admin_admin_payment_text_total_revenue = 'admin_admin_payment_text_total_revenue';
+  static const admin_admin_payment_text_total_revenue_2 = 'admin_admin_payment_text_total_revenue_2';
+  static const admin_admin_payment_text_total_transactions = 'admin_admin_payment_text_total_transactions';
+  static const admin_admin_payment_text_total_transactions_3 = 'admin_admin_payment_text_total_transactions_3';
+  static const admin_admin_payment_text_transaction_details = 'admin_admin_payment_text_transaction_details';
+  static const admin_admin_payment_text_transaction_details_51 = 'admin_admin_payment_text_transaction_details_51';
+  static const admin_admin_payment_text_transaction_id_transactionid = 'admin_admin_payment_text_transaction_id_transactionid';
+  static const admin_admin_payment_text_transaction_transactionid = 'admin_admin_payment_text_transaction_transactionid';
+  static const admin_admin_payment_text_update_status = 'admin_admin_payment_text_update_status';
+  static const admin_admin_payment_text_update_status_32 = 'admin_admin_payment_text_update_status_32';
+  static const admin_admin_payment_text_update_status_33 = 'admin_admin_payment_text_update_status_33';
+  static const admin_admin_payment_title_item_transactionitemtitle = 'admin_admin_payment_title_item_transactionitemtitle';
+  static const admin_admin_security_center_label_email_alerts = 'admin_admin_security_center_label_email_alerts';
+  static const admin_admin_security_center_label_email_alerts_10 = 'admin_admin_security_center_label_email_alerts_10';
+  static const admin_admin_security_center_label_send_email_notifications = 'admin_admin_security_center_label_send_email_notifications';
+  static const admin_admin_security_center_label_send_email_notifications_12 = 'admin_admin_security_center_label_send_email_notifications_12';
+  static const admin_admin_security_center_success_additional_details_success = 'admin_admin_security_center_success_additional_details_success';
+  static const admin_admin_security_center_success_additional_details_success_56 = 'admin_admin_security_center_success_additional_details_success_56';
+  static const admin_admin_security_center_text_100008 = 'admin_admin_security_center_text_100008';
+  static const admin_admin_security_center_text_100008_18 = 'admin_admin_security_center_text_100008_18';
+  static const admin_admin_security_center_text_1921681024 = 'admin_admin_security_center_text_1921681024';
+  static const admin_admin_security_center_text_1921681024_14 = 'admin_admin_security_center_text_1921681024_14';
+  static const admin_admin_security_center_text_add = 'admin_admin_security_center_text_add';
+  static const admin_admin_security_center_text_add_47 = 'admin_admin_security_center_text_add_47';
+  static const admin_admin_security_center_text_add_ip_range = 'admin_admin_security_center_text_add_ip_range';
+  static const admin_admin_security_center_text_add_ip_range_22 = 'admin_admin_security_center_text_add_ip_range_22';
+  static const admin_admin_security_center_text_add_ip_range_41 = 'admin_admin_security_center_text_add_ip_range_41';
+  static const admin_admin_security_center_text_add_ip_range_42 = 'admin_admin_security_center_text_add_ip_range_42';
+  static const admin_admin_security_center_text_audit_log_details = 'admin_admin_security_center_text_audit_log_details';
+  static const admin_admin_security_center_text_audit_log_details_49 = 'admin_admin_security_center_text_audit_log_details_49';
+  static const admin_admin_security_center_text_automated_threat_response = 'admin_admin_security_center_text_automated_threat_response';
+  static const admin_admin_security_center_text_automated_threat_response_6 = 'admin_admin_security_center_text_automated_threat_response_6';
+  static const admin_admin_security_center_text_automatically_block_suspicious = 'admin_admin_security_center_text_automatically_block_suspicious';
+  static const admin_admin_security_center_text_automatically_block_suspicious_8 = 'admin_admin_security_center_text_automatically_block_suspicious_8';
+  static const admin_admin_security_center_text_cancel = 'admin_admin_security_center_text_cancel';
+  static const admin_admin_security_center_text_cancel_44 = 'admin_admin_security_center_text_cancel_44';
+  static const admin_admin_security_center_text_close = 'admin_admin_security_center_text_close';
+  static const admin_admin_security_center_text_close_37 = 'admin_admin_security_center_text_close_37';
+  static const admin_admin_security_center_text_close_57 = 'admin_admin_security_center_text_close_57';
+  static const admin_admin_security_center_text_close_58 = 'admin_admin_security_center_text_close_58';
+  static const admin_admin_security_center_text_consider_blocking_if = 'admin_admin_security_center_text_consider_blocking_if';
+  static const admin_admin_security_center_text_consider_blocking_if_35 = 'admin_admin_security_center_text_consider_blocking_if_35';
+  static const admin_admin_security_center_text_disable_account = 'admin_admin_security_center_text_disable_account';
+  static const admin_admin_security_center_text_edit_permissions = 'admin_admin_security_center_text_edit_permissions';
+  static const admin_admin_security_center_text_ip_address_1921681100 = 'admin_admin_security_center_text_ip_address_1921681100';
+  static const admin_admin_security_center_text_ip_range_added = 'admin_admin_security_center_text_ip_range_added';
+  static const admin_admin_security_center_text_log_id_log1000 = 'admin_admin_security_center_text_log_id_log1000';
+  static const admin_admin_security_center_text_monitor_security_events = 'admin_admin_security_center_text_monitor_security_events';
+  static const admin_admin_security_center_text_monitor_security_events_4 = 'admin_admin_security_center_text_monitor_security_events_4';
+  static const admin_admin_security_center_text_monitor_the_ip = 'admin_admin_security_center_text_monitor_the_ip';
+  static const admin_admin_security_center_text_monitor_the_ip_31 = 'admin_admin_security_center_text_monitor_the_ip_31';
+  static const admin_admin_security_center_text_office_network = 'admin_admin_security_center_text_office_network';
+  static const admin_admin_security_center_text_office_network_16 = 'admin_admin_security_center_text_office_network_16';
+  static const admin_admin_security_center_text_realtime_monitoring = 'admin_admin_security_center_text_realtime_monitoring';
+  static const admin_admin_security_center_text_realtime_monitoring_2 = 'admin_admin_security_center_text_realtime_monitoring_2';
+  static const admin_admin_security_center_text_recommended_actions = 'admin_admin_security_center_text_recommended_actions';
+  static const admin_admin_security_center_text_recommended_actions_29 = 'admin_admin_security_center_text_recommended_actions_29';
+  static const admin_admin_security_center_text_remove_admin = 'admin_admin_security_center_text_remove_admin';
+  static const admin_admin_security_center_text_resolve = 'admin_admin_security_center_text_resolve';
+  static const admin_admin_security_center_text_resolve_40 = 'admin_admin_security_center_text_resolve_40';
+  static const admin_admin_security_center_text_review_access_logs = 'admin_admin_security_center_text_review_access_logs';
+  static const admin_admin_security_center_text_review_access_logs_33 = 'admin_admin_security_center_text_review_access_logs_33';
+  static const admin_admin_security_center_text_role_rolesindex = 'admin_admin_security_center_text_role_rolesindex';
+  static const admin_admin_security_center_text_severity_severity = 'admin_admin_security_center_text_severity_severity';
+  static const admin_admin_security_center_text_threat_marked_as = 'admin_admin_security_center_text_threat_marked_as';
+  static const admin_admin_security_center_text_user_agent_mozilla50 = 'admin_admin_security_center_text_user_agent_mozilla50';
+  static const admin_admin_security_center_text_user_agent_mozilla50_54 = 'admin_admin_security_center_text_user_agent_mozilla50_54';
+  static const admin_admin_security_center_text_user_userindex_1 = 'admin_admin_security_center_text_user_userindex_1';
+  static const admin_admin_security_center_text_vpn_network = 'admin_admin_security_center_text_vpn_network';
+  static const admin_admin_security_center_text_vpn_network_20 = 'admin_admin_security_center_text_vpn_network_20';
+  static const admin_admin_settings_error_failed_to_save = 'admin_admin_settings_error_failed_to_save';
+  static const admin_admin_settings_success_backup_created_successfully = 'admin_admin_settings_success_backup_created_successfully';
+  static const admin_admin_settings_success_cache_cleared_successfully = 'admin_admin_settings_success_cache_cleared_successfully';
+  static const admin_admin_settings_success_settings_reset_successfully = 'admin_admin_settings_success_settings_reset_successfully';
+  static const admin_admin_settings_success_settings_saved_successfully = 'admin_admin_settings_success_settings_saved_successfully';
+  static const admin_admin_settings_text_admin_settings = 'admin_admin_settings_text_admin_settings';
+  static const admin_admin_settings_text_admin_settings_1 = 'admin_admin_settings_text_admin_settings_1';
+  static const admin_admin_settings_text_are_you_absolutely = 'admin_admin_settings_text_are_you_absolutely';
+  static const admin_admin_settings_text_are_you_sure = 'admin_admin_settings_text_are_you_sure';
+  static const admin_admin_settings_text_are_you_sure_49 = 'admin_admin_settings_text_are_you_sure_49';
+  static const admin_admin_settings_text_backup = 'admin_admin_settings_text_backup';
+  static const admin_admin_settings_text_backup_19 = 'admin_admin_settings_text_backup_19';
+  static const admin_admin_settings_text_backup_44 = 'admin_admin_settings_text_backup_44';
+  static const admin_admin_settings_text_backup_45 = 'admin_admin_settings_text_backup_45';
+  static const admin_admin_settings_text_backup_database = 'admin_admin_settings_text_backup_database';
+  static const admin_admin_settings_text_backup_database_15 = 'admin_admin_settings_text_backup_database_15';
+  static const admin_admin_settings_text_backup_database_39 = 'admin_admin_settings_text_backup_database_39';
+  static const admin_admin_settings_text_backup_database_40 = 'admin_admin_settings_text_backup_database_40';
+  static const admin_admin_settings_text_cancel = 'admin_admin_settings_text_cancel';
+  static const admin_admin_settings_text_cancel_42 = 'admin_admin_settings_text_cancel_42';
+  static const admin_admin_settings_text_cancel_50 = 'admin_admin_settings_text_cancel_50';
+  static const admin_admin_settings_text_cancel_51 = 'admin_admin_settings_text_cancel_51';
+  static const admin_admin_settings_text_cancel_57 = 'admin_admin_settings_text_cancel_57';
+  static const admin_admin_settings_text_cancel_58 = 'admin_admin_settings_text_cancel_58';
+  static const admin_admin_settings_text_cancel_66 = 'admin_admin_settings_text_cancel_66';
+  static const admin_admin_settings_text_cancel_67 = 'admin_admin_settings_text_cancel_67';
+  static const admin_admin_settings_text_clear = 'admin_admin_settings_text_clear';
+  static const admin_admin_settings_text_clear_25 = 'admin_admin_settings_text_clear_25';
+  static const admin_admin_settings_text_clear_53 = 'admin_admin_settings_text_clear_53';
+  static const admin_admin_settings_text_clear_54 = 'admin_admin_settings_text_clear_54';
+  static const admin_admin_settings_text_clear_all_cached = 'admin_admin_settings_text_clear_all_cached';
+  static const admin_admin_settings_text_clear_all_cached_23 = 'admin_admin_settings_text_clear_all_cached_23';
+  static const admin_admin_settings_text_clear_cache = 'admin_admin_settings_text_clear_cache';
+  static const admin_admin_settings_text_clear_cache_21 = 'admin_admin_settings_text_clear_cache_21';
+  static const admin_admin_settings_text_clear_cache_46 = 'admin_admin_settings_text_clear_cache_46';
+  static const admin_admin_settings_text_clear_cache_47 = 'admin_admin_settings_text_clear_cache_47';
+  static const admin_admin_settings_text_content_settings = 'admin_admin_settings_text_content_settings';
+  static const admin_admin_settings_text_content_settings_4 = 'admin_admin_settings_text_content_settings_4';
+  static const admin_admin_settings_text_create_a_backup = 'admin_admin_settings_text_create_a_backup';
+  static const admin_admin_settings_text_create_a_backup_17 = 'admin_admin_settings_text_create_a_backup_17';
+  static const admin_admin_settings_text_danger_zone = 'admin_admin_settings_text_danger_zone';
+  static const admin_admin_settings_text_danger_zone_9 = 'admin_admin_settings_text_danger_zone_9';
+  static const admin_admin_settings_text_factory_reset = 'admin_admin_settings_text_factory_reset';
+  static const admin_admin_settings_text_factory_reset_34 = 'admin_admin_settings_text_factory_reset_34';
+  static const admin_admin_settings_text_factory_reset_37 = 'admin_admin_settings_text_factory_reset_37';
+  static const admin_admin_settings_text_factory_reset_38 = 'admin_admin_settings_text_factory_reset_38';
+  static const admin_admin_settings_text_factory_reset_62 = 'admin_admin_settings_text_factory_reset_62';
+  static const admin_admin_settings_text_factory_reset_63 = 'admin_admin_settings_text_factory_reset_63';
+  static const admin_admin_settings_text_factory_reset_69 = 'admin_admin_settings_text_factory_reset_69';
+  static const admin_admin_settings_text_factory_reset_70 = 'admin_admin_settings_text_factory_reset_70';
+  static const admin_admin_settings_text_factory_reset_completed = 'admin_admin_settings_text_factory_reset_completed';
+  static const admin_admin_settings_text_general_settings = 'admin_admin_settings_text_general_settings';
+  static const admin_admin_settings_text_general_settings_2 = 'admin_admin_settings_text_general_settings_2';
+  static const admin_admin_settings_text_maintenance_settings = 'admin_admin_settings_text_maintenance_settings';
+  static const admin_admin_settings_text_maintenance_settings_8 = 'admin_admin_settings_text_maintenance_settings_8';
+  static const admin_admin_settings_text_no_settings_available = 'admin_admin_settings_text_no_settings_available';
+  static const admin_admin_settings_text_notification_settings = 'admin_admin_settings_text_notification_settings';
+  static const admin_admin_settings_text_notification_settings_7 = 'admin_admin_settings_text_notification_settings_7';
+  static const admin_admin_settings_text_reset = 'admin_admin_settings_text_reset';
+  static const admin_admin_settings_text_reset_32 = 'admin_admin_settings_text_reset_32';
+  static const admin_admin_settings_text_reset_60 = 'admin_admin_settings_text_reset_60';
+  static const admin_admin_settings_text_reset_61 = 'admin_admin_settings_text_reset_61';
+  static const admin_admin_settings_text_reset_all_settings = 'admin_admin_settings_text_reset_all_settings';
+  static const admin_admin_settings_text_reset_all_settings_28 = 'admin_admin_settings_text_reset_all_settings_28';
+  static const admin_admin_settings_text_reset_all_settings_29 = 'admin_admin_settings_text_reset_all_settings_29';
+  static const admin_admin_settings_text_reset_all_settings_30 = 'admin_admin_settings_text_reset_all_settings_30';
+  static const admin_admin_settings_text_reset_settings = 'admin_admin_settings_text_reset_settings';
+  static const admin_admin_settings_text_reset_settings_56 = 'admin_admin_settings_text_reset_settings_56';
+  static const admin_admin_settings_text_retry = 'admin_admin_settings_text_retry';
+  static const admin_admin_settings_text_retry_5 = 'admin_admin_settings_text_retry_5';
+  static const admin_admin_settings_text_security_settings = 'admin_admin_settings_text_security_settings';
+  static const admin_admin_settings_text_security_settings_5 = 'admin_admin_settings_text_security_settings_5';
+  static const admin_admin_settings_text_system_settings = 'admin_admin_settings_text_system_settings';
+  static const admin_admin_settings_text_system_settings_6 = 'admin_admin_settings_text_system_settings_6';
+  static const admin_admin_settings_text_user_settings = 'admin_admin_settings_text_user_settings';
+  static const admin_admin_settings_text_user_settings_3 = 'admin_admin_settings_text_user_settings_3';
+  static const admin_admin_settings_text_warning_this_will = 'admin_admin_settings_text_warning_this_will';
+  static const admin_admin_settings_text_warning_this_will_36 = 'admin_admin_settings_text_warning_this_will_36';
+  static const admin_admin_settings_text_warning_this_will_64 = 'admin_admin_settings_text_warning_this_will_64';
+  static const admin_admin_system_monitoring_error_error_loading_system = 'admin_admin_system_monitoring_error_error_loading_system';
+  static const admin_admin_system_monitoring_text_active_users = 'admin_admin_system_monitoring_text_active_users';
+  static const admin_admin_system_monitoring_text_active_users_3 = 'admin_admin_system_monitoring_text_active_users_3';
+  static const admin_admin_system_monitoring_text_avg_session = 'admin_admin_system_monitoring_text_avg_session';
+  static const admin_admin_system_monitoring_text_avg_session_9 = 'admin_admin_system_monitoring_text_avg_session_9';
+  static const admin_admin_system_monitoring_text_cpu_usage = 'admin_admin_system_monitoring_text_cpu_usage';
+  static const admin_admin_system_monitoring_text_cpu_usage_1 = 'admin_admin_system_monitoring_text_cpu_usage_1';
+  static const admin_admin_system_monitoring_text_critical_alerts = 'admin_admin_system_monitoring_text_critical_alerts';
+  static const admin_admin_system_monitoring_text_critical_alerts_5 = 'admin_admin_system_monitoring_text_critical_alerts_5';
+  static const admin_admin_system_monitoring_text_memory_usage = 'admin_admin_system_monitoring_text_memory_usage';
+  static const admin_admin_system_monitoring_text_memory_usage_2 = 'admin_admin_system_monitoring_text_memory_usage_2';
+  static const admin_admin_system_monitoring_text_no_recent_alerts = 'admin_admin_system_monitoring_text_no_recent_alerts';
+  static const admin_admin_system_monitoring_text_no_system_alerts = 'admin_admin_system_monitoring_text_no_system_alerts';
+  static const admin_admin_system_monitoring_text_online_users = 'admin_admin_system_monitoring_text_online_users';
+  static const admin_admin_system_monitoring_text_online_users_7 = 'admin_admin_system_monitoring_text_online_users_7';
+  static const admin_admin_system_monitoring_text_peak_today = 'admin_admin_system_monitoring_text_peak_today';
+  static const admin_admin_system_monitoring_text_peak_today_8 = 'admin_admin_system_monitoring_text_peak_today_8';
+  static const admin_admin_system_monitoring_text_response_time = 'admin_admin_system_monitoring_text_response_time';
+  static const admin_admin_system_monitoring_text_response_time_4 = 'admin_admin_system_monitoring_text_response_time_4';
+  static const admin_admin_system_monitoring_text_system_monitoring = 'admin_admin_system_monitoring_text_system_monitoring';
+  static const admin_admin_system_monitoring_text_system_monitoring_3 = 'admin_admin_system_monitoring_text_system_monitoring_3';
+  static const admin_admin_system_monitoring_text_view_all = 'admin_admin_system_monitoring_text_view_all';
+  static const admin_admin_system_monitoring_text_view_all_9 = 'admin_admin_system_monitoring_text_view_all_9';
+  static const admin_admin_system_monitoring_text_warning_alerts = 'admin_admin_system_monitoring_text_warning_alerts';
+  static const admin_admin_system_monitoring_text_warning_alerts_6 = 'admin_admin_system_monitoring_text_warning_alerts_6';
+  static const admin_admin_user_detail_error_failed_to_remove = 'admin_admin_user_detail_error_failed_to_remove';
+  static const admin_admin_user_detail_error_failed_to_update = 'admin_admin_user_detail_error_failed_to_update';
+  static const admin_admin_user_detail_error_failed_to_update_28 = 'admin_admin_user_detail_error_failed_to_update_28';
+  static const admin_admin_user_detail_error_failed_to_update_30 = 'admin_admin_user_detail_error_failed_to_update_30';
+  static const admin_admin_user_detail_error_failed_to_update_31 = 'admin_admin_user_detail_error_failed_to_update_31';
+  static const admin_admin_user_detail_success_profile_image_removed = 'admin_admin_user_detail_success_profile_image_removed';
+  static const admin_admin_user_detail_success_user_profile_updated = 'admin_admin_user_detail_success_user_profile_updated';
+  static const admin_admin_user_detail_success_user_type_updated = 'admin_admin_user_detail_success_user_type_updated';
+  static const admin_admin_user_detail_text_by_currentusersuspendedby = 'admin_admin_user_detail_text_by_currentusersuspendedby';
+  static const admin_admin_user_detail_text_cancel = 'admin_admin_user_detail_text_cancel';
+  static const admin_admin_user_detail_text_cancel_22 = 'admin_admin_user_detail_text_cancel_22';
+  static const admin_admin_user_detail_text_cancel_23 = 'admin_admin_user_detail_text_cancel_23';
+  static const admin_admin_user_detail_text_cancel_7 = 'admin_admin_user_detail_text_cancel_7';
+  static const admin_admin_user_detail_text_edit_profile = 'admin_admin_user_detail_text_edit_profile';
+  static const admin_admin_user_detail_text_edit_profile_10 = 'admin_admin_user_detail_text_edit_profile_10';
+  static const admin_admin_user_detail_text_edit_profile_9 = 'admin_admin_user_detail_text_edit_profile_9';
+  static const admin_admin_user_detail_text_featured = 'admin_admin_user_detail_text_featured';
+  static const admin_admin_user_detail_text_featured_17 = 'admin_admin_user_detail_text_featured_17';
+  static const admin_admin_user_detail_text_reason_currentusersuspensionreason = 'admin_admin_user_detail_text_reason_currentusersuspensionreason';
+  static const admin_admin_user_detail_text_remove = 'admin_admin_user_detail_text_remove';
+  static const admin_admin_user_detail_text_remove_25 = 'admin_admin_user_detail_text_remove_25';
+  static const admin_admin_user_detail_text_remove_profile_image = 'admin_admin_user_detail_text_remove_profile_image';
+  static const admin_admin_user_detail_text_remove_profile_image_12 = 'admin_admin_user_detail_text_remove_profile_image_12';
+  static const admin_admin_user_detail_text_remove_profile_image_13 = 'admin_admin_user_detail_text_remove_profile_image_13';
+  static const admin_admin_user_detail_text_remove_profile_image_20 = 'admin_admin_user_detail_text_remove_profile_image_20';
+  static const admin_admin_user_detail_text_remove_profile_image_21 = 'admin_admin_user_detail_text_remove_profile_image_21';
+  static const admin_admin_user_detail_text_save_changes = 'admin_admin_user_detail_text_save_changes';
+  static const admin_admin_user_detail_text_save_changes_5 = 'admin_admin_user_detail_text_save_changes_5';
+  static const admin_admin_user_detail_text_user_details = 'admin_admin_user_detail_text_user_details';
+  static const admin_admin_user_detail_text_user_details_1 = 'admin_admin_user_detail_text_user_details_1';
+  static const admin_admin_user_detail_text_verified = 'admin_admin_user_detail_text_verified';
+  static const admin_admin_user_detail_text_verified_15 = 'admin_admin_user_detail_text_verified_15';
+  static const admin_coupon_button_cancel = 'admin_coupon_button_cancel';
+  static const admin_coupon_button_clear = 'admin_coupon_button_clear';
+  static const admin_coupon_button_create = 'admin_coupon_button_create';
+  static const admin_coupon_button_update = 'admin_coupon_button_update';
+  static const admin_coupon_dialog_title_create = 'admin_coupon_dialog_title_create';
+  static const admin_coupon_dialog_title_edit = 'admin_coupon_dialog_title_edit';
+  static const admin_coupon_error_create = 'admin_coupon_error_create';
+  static const admin_coupon_error_update = 'admin_coupon_error_update';
+  static const admin_coupon_success_created = 'admin_coupon_success_created';
+  static const admin_coupon_success_updated = 'admin_coupon_success_updated';
+  static const admin_dashboard_active_users = 'admin_dashboard_active_users';
+  static const admin_dashboard_all_systems_operational = 'admin_dashboard_all_systems_operational';
+  static const admin_dashboard_analytics = 'admin_dashboard_analytics';
+  static const admin_dashboard_api = 'admin_dashboard_api';
+  static const admin_dashboard_artists = 'admin_dashboard_artists';
+  static const admin_dashboard_artworks = 'admin_dashboard_artworks';
+  static const admin_dashboard_business_analytics = 'admin_dashboard_business_analytics';
+  static const admin_dashboard_configure_app = 'admin_dashboard_configure_app';
+  static const admin_dashboard_content_moderation = 'admin_dashboard_content_moderation';
+  static const admin_dashboard_database = 'admin_dashboard_database';
+  static const admin_dashboard_detailed_insights = 'admin_dashboard_detailed_insights';
+  static const admin_dashboard_key_metrics = 'admin_dashboard_key_metrics';
+  static const admin_dashboard_manage_users = 'admin_dashboard_manage_users';
+  static const admin_dashboard_management_actions = 'admin_dashboard_management_actions';
+  static const admin_dashboard_monitoring = 'admin_dashboard_monitoring';
+  static const admin_dashboard_monthly_performance = 'admin_dashboard_monthly_performance';
+  static const admin_dashboard_normal = 'admin_dashboard_normal';
+  static const admin_dashboard_online = 'admin_dashboard_online';
+  static const admin_dashboard_pending = 'admin_dashboard_pending';
+  static const admin_dashboard_pending_reviews = 'admin_dashboard_pending_reviews';
+  static const admin_dashboard_pending_verification = 'admin_dashboard_pending_verification';
+  static const admin_dashboard_recent_alerts = 'admin_dashboard_recent_alerts';
+  static const admin_dashboard_reports = 'admin_dashboard_reports';
+  static const admin_dashboard_revenue = 'admin_dashboard_revenue';
+  static const admin_dashboard_revenue_growth = 'admin_dashboard_revenue_growth';
+  static const admin_dashboard_review_reports = 'admin_dashboard_review_reports';
+  static const admin_dashboard_server_load = 'admin_dashboard_server_load';
+  static const admin_dashboard_servers = 'admin_dashboard_servers';
+  static const admin_dashboard_storage = 'admin_dashboard_storage';
+  static const admin_dashboard_storage_capacity = 'admin_dashboard_storage_capacity';
+  static const admin_dashboard_storage_warning = 'admin_dashboard_storage_warning';
+  static const admin_dashboard_system_health = 'admin_dashboard_system_health';
+  static const admin_dashboard_system_overview = 'admin_dashboard_system_overview';
+  static const admin_dashboard_system_settings = 'admin_dashboard_system_settings';
+  static const admin_dashboard_system_status = 'admin_dashboard_system_status';
+  static const admin_dashboard_total_users = 'admin_dashboard_total_users';
+  static const admin_dashboard_user_management = 'admin_dashboard_user_management';
+  static const admin_dashboard_view_all = 'admin_dashboard_view_all';
+  static const admin_dashboard_welcome_back = 'admin_dashboard_welcome_back';
+  static const admin_drawer_logout_dialog_cancel = 'admin_drawer_logout_dialog_cancel';
+  static const admin_drawer_logout_dialog_confirm = 'admin_drawer_logout_dialog_confirm';
+  static const admin_drawer_logout_dialog_content = 'admin_drawer_logout_dialog_content';
+  static const admin_drawer_logout_dialog_title = 'admin_drawer_logout_dialog_title';
+  static const admin_drawer_logout_error = 'admin_drawer_logout_error';
+  static const admin_drawer_menu_admin_settings = 'admin_drawer_menu_admin_settings';
+  static const admin_drawer_menu_admin_settings_subtitle = 'admin_drawer_menu_admin_settings_subtitle';
+  static const admin_drawer_menu_admin_upload_tools = 'admin_drawer_menu_admin_upload_tools';
+  static const admin_drawer_menu_admin_upload_tools_subtitle = 'admin_drawer_menu_admin_upload_tools_subtitle';
+  static const admin_drawer_menu_art_walk_moderation = 'admin_drawer_menu_art_walk_moderation';
+  static const admin_drawer_menu_art_walk_moderation_subtitle = 'admin_drawer_menu_art_walk_moderation_subtitle';
+  static const admin_drawer_menu_artwalk_moderation = 'admin_drawer_menu_artwalk_moderation';
+  static const admin_drawer_menu_artwalk_moderation_subtitle = 'admin_drawer_menu_artwalk_moderation_subtitle';
+  static const admin_drawer_menu_capture_moderation = 'admin_drawer_menu_capture_moderation';
+  static const admin_drawer_menu_capture_moderation_subtitle = 'admin_drawer_menu_capture_moderation_subtitle';
+  static const admin_drawer_menu_content_moderation = 'admin_drawer_menu_content_moderation';
+  static const admin_drawer_menu_content_moderation_subtitle = 'admin_drawer_menu_content_moderation_subtitle';
+  static const admin_drawer_menu_coupons = 'admin_drawer_menu_coupons';
+  static const admin_drawer_menu_coupons_subtitle = 'admin_drawer_menu_coupons_subtitle';
+  static const admin_drawer_menu_data_migration = 'admin_drawer_menu_data_migration';
+  static const admin_drawer_menu_data_migration_subtitle = 'admin_drawer_menu_data_migration_subtitle';
+  static const admin_drawer_menu_data_upload_tools = 'admin_drawer_menu_data_upload_tools';
+  static const admin_drawer_menu_data_upload_tools_subtitle = 'admin_drawer_menu_data_upload_tools_subtitle';
+  static const admin_drawer_menu_developer_feedback = 'admin_drawer_menu_developer_feedback';
+  static const admin_drawer_menu_developer_feedback_subtitle = 'admin_drawer_menu_developer_feedback_subtitle';
+  static const admin_drawer_menu_home = 'admin_drawer_menu_home';
+  static const admin_drawer_menu_home_subtitle = 'admin_drawer_menu_home_subtitle';
+  static const admin_drawer_menu_logout = 'admin_drawer_menu_logout';
+  static const admin_drawer_menu_payments = 'admin_drawer_menu_payments';
+  static const admin_drawer_menu_payments_subtitle = 'admin_drawer_menu_payments_subtitle';
+  static const admin_drawer_menu_security_center = 'admin_drawer_menu_security_center';
+  static const admin_drawer_menu_security_center_subtitle = 'admin_drawer_menu_security_center_subtitle';
+  static const admin_drawer_menu_system_monitoring = 'admin_drawer_menu_system_monitoring';
+  static const admin_drawer_menu_system_monitoring_subtitle = 'admin_drawer_menu_system_monitoring_subtitle';
+  static const admin_drawer_menu_unified_dashboard = 'admin_drawer_menu_unified_dashboard';
+  static const admin_drawer_menu_unified_dashboard_subtitle = 'admin_drawer_menu_unified_dashboard_subtitle';
+  static const admin_drawer_menu_user_management = 'admin_drawer_menu_user_management';
+  static const admin_drawer_menu_user_management_subtitle = 'admin_drawer_menu_user_management_subtitle';
+  static const admin_drawer_section_business = 'admin_drawer_section_business';
+  static const admin_drawer_section_content = 'admin_drawer_section_content';
+  static const admin_drawer_section_dashboard = 'admin_drawer_section_dashboard';
+  static const admin_drawer_section_developer = 'admin_drawer_section_developer';
+  static const admin_drawer_section_support = 'admin_drawer_section_support';
+  static const admin_drawer_section_system = 'admin_drawer_section_system';
+  static const admin_drawer_title_console = 'admin_drawer_title_console';
+  static const admin_drawer_title_panel = 'admin_drawer_title_panel';
+  static const admin_header_menu_analytics = 'admin_header_menu_analytics';
+  static const admin_header_menu_content_review = 'admin_header_menu_content_review';
+  static const admin_header_menu_dashboard = 'admin_header_menu_dashboard';
+  static const admin_header_menu_user_management = 'admin_header_menu_user_management';
+  static const admin_login_error_access_denied = 'admin_login_error_access_denied';
+  static const admin_login_error_auth_failed = 'admin_login_error_auth_failed';
+  static const admin_login_error_invalid_email = 'admin_login_error_invalid_email';
+  static const admin_login_error_unexpected = 'admin_login_error_unexpected';
+  static const admin_login_error_user_disabled = 'admin_login_error_user_disabled';
+  static const admin_login_error_user_not_found = 'admin_login_error_user_not_found';
+  static const admin_login_error_wrong_password = 'admin_login_error_wrong_password';
+  static const admin_login_validation_enter_email = 'admin_login_validation_enter_email';
+  static const admin_login_validation_enter_password = 'admin_login_validation_enter_password';
+  static const admin_login_validation_enter_valid_email = 'admin_login_validation_enter_valid_email';
+  static const admin_login_validation_password_min_length = 'admin_login_validation_password_min_length';
+  static const admin_main_demo_description = 'admin_main_demo_description';
+  static const admin_main_demo_subtitle = 'admin_main_demo_subtitle';
+  static const admin_main_demo_title = 'admin_main_demo_title';
+  static const admin_main_example_button = 'admin_main_example_button';
+  static const admin_main_title = 'admin_main_title';
+  static const admin_migration_dialog_geo_message = 'admin_migration_dialog_geo_message';
+  static const admin_migration_dialog_geo_title = 'admin_migration_dialog_geo_title';
+  static const admin_migration_dialog_rollback_message = 'admin_migration_dialog_rollback_message';
+  static const admin_migration_dialog_rollback_title = 'admin_migration_dialog_rollback_title';
+  static const admin_migration_dialog_run_migration_message = 'admin_migration_dialog_run_migration_message';
+  static const admin_migration_dialog_run_migration_title = 'admin_migration_dialog_run_migration_title';
+  static const admin_migration_error_check_status_failed = 'admin_migration_error_check_status_failed';
+  static const admin_migration_error_failed = 'admin_migration_error_failed';
+  static const admin_migration_error_failed_to_load = 'admin_migration_error_failed_to_load';
+  static const admin_migration_error_geo_failed = 'admin_migration_error_geo_failed';
+  static const admin_migration_error_rollback_failed = 'admin_migration_error_rollback_failed';
+  static const admin_migration_section_title = 'admin_migration_section_title';
+  static const admin_migration_success_completed = 'admin_migration_success_completed';
+  static const admin_migration_success_geo_completed = 'admin_migration_success_geo_completed';
+  static const admin_migration_success_rollback_completed = 'admin_migration_success_rollback_completed';
+  static const admin_migration_text_cancel = 'admin_migration_text_cancel';
+  static const admin_migration_text_cancel_2 = 'admin_migration_text_cancel_2';
+  static const admin_migration_text_confirm = 'admin_migration_text_confirm';
+  static const admin_migration_text_confirm_4 = 'admin_migration_text_confirm_4';
+  static const admin_migration_text_data_migration = 'admin_migration_text_data_migration';
+  static const admin_migration_text_data_migration_6 = 'admin_migration_text_data_migration_6';
+  static const admin_migration_text_migrate_geo_fields = 'admin_migration_text_migrate_geo_fields';
+  static const admin_migration_text_migrate_geo_fields_12 = 'admin_migration_text_migrate_geo_fields_12';
+  static const admin_migration_text_migrate_geo_fields_13 = 'admin_migration_text_migrate_geo_fields_13';
+  static const admin_migration_text_rollback = 'admin_migration_text_rollback';
+  static const admin_migration_text_rollback_10 = 'admin_migration_text_rollback_10';
+  static const admin_migration_text_rollback_9 = 'admin_migration_text_rollback_9';
+  static const admin_migration_tooltip_refresh = 'admin_migration_tooltip_refresh';
+  static const admin_modern_unified_admin_dashboard_error_failed_to_approve = 'admin_modern_unified_admin_dashboard_error_failed_to_approve';
+  static const admin_modern_unified_admin_dashboard_error_failed_to_clear = 'admin_modern_unified_admin_dashboard_error_failed_to_clear';
+  static const admin_modern_unified_admin_dashboard_error_failed_to_delete = 'admin_modern_unified_admin_dashboard_error_failed_to_delete';
+  static const admin_modern_unified_admin_dashboard_error_failed_to_reject = 'admin_modern_unified_admin_dashboard_error_failed_to_reject';
+  static const admin_modern_unified_admin_dashboard_error_failed_to_update = 'admin_modern_unified_admin_dashboard_error_failed_to_update';
+  static const admin_modern_unified_admin_dashboard_hint_admin_command_center = 'admin_modern_unified_admin_dashboard_hint_admin_command_center';
+  static const admin_modern_unified_admin_dashboard_hint_admin_command_center_1 = 'admin_modern_unified_admin_dashboard_hint_admin_command_center_1';
+  static const admin_modern_unified_admin_dashboard_success_deleted_contenttitle_successfully = 'admin_modern_unified_admin_dashboard_success_deleted_contenttitle_successfully';
+  static const admin_modern_unified_admin_dashboard_success_updated_newtitle_successfully = 'admin_modern_unified_admin_dashboard_success_updated_newtitle_successfully';
+  static const admin_modern_unified_admin_dashboard_text_approve = 'admin_modern_unified_admin_dashboard_text_approve';
+  static const admin_modern_unified_admin_dashboard_text_approve_3 = 'admin_modern_unified_admin_dashboard_text_approve_3';
+  static const admin_modern_unified_admin_dashboard_text_approve_4 = 'admin_modern_unified_admin_dashboard_text_approve_4';
+  static const admin_modern_unified_admin_dashboard_text_approving_content = 'admin_modern_unified_admin_dashboard_text_approving_content';
+  static const admin_modern_unified_admin_dashboard_text_clear_review = 'admin_modern_unified_admin_dashboard_text_clear_review';
+  static const admin_modern_unified_admin_dashboard_text_clear_review_16 = 'admin_modern_unified_admin_dashboard_text_clear_review_16';
+  static const admin_modern_unified_admin_dashboard_text_clear_review_17 = 'admin_modern_unified_admin_dashboard_text_clear_review_17';
+  static const admin_modern_unified_admin_dashboard_text_delete = 'admin_modern_unified_admin_dashboard_text_delete';
+  static const admin_modern_unified_admin_dashboard_text_delete_22 = 'admin_modern_unified_admin_dashboard_text_delete_22';
+  static const admin_modern_unified_admin_dashboard_text_delete_23 = 'admin_modern_unified_admin_dashboard_text_delete_23';
+  static const admin_modern_unified_admin_dashboard_text_delete_26 = 'admin_modern_unified_admin_dashboard_text_delete_26';
+  static const admin_modern_unified_admin_dashboard_text_delete_27 = 'admin_modern_unified_admin_dashboard_text_delete_27';
+  static const admin_modern_unified_admin_dashboard_text_edit = 'admin_modern_unified_admin_dashboard_text_edit';
+  static const admin_modern_unified_admin_dashboard_text_edit_19 = 'admin_modern_unified_admin_dashboard_text_edit_19';
+  static const admin_modern_unified_admin_dashboard_text_edit_20 = 'admin_modern_unified_admin_dashboard_text_edit_20';
+  static const admin_modern_unified_admin_dashboard_text_reject = 'admin_modern_unified_admin_dashboard_text_reject';
+  static const admin_modern_unified_admin_dashboard_text_reject_6 = 'admin_modern_unified_admin_dashboard_text_reject_6';
+  static const admin_modern_unified_admin_dashboard_text_reject_7 = 'admin_modern_unified_admin_dashboard_text_reject_7';
+  static const admin_modern_unified_admin_dashboard_text_rejecting_content = 'admin_modern_unified_admin_dashboard_text_rejecting_content';
+  static const admin_modern_unified_admin_dashboard_text_save_changes = 'admin_modern_unified_admin_dashboard_text_save_changes';
+  static const admin_modern_unified_admin_dashboard_text_save_changes_25 = 'admin_modern_unified_admin_dashboard_text_save_changes_25';
+  static const admin_modern_unified_admin_dashboard_title_approved_reviewtitle = 'admin_modern_unified_admin_dashboard_title_approved_reviewtitle';
+  static const admin_modern_unified_admin_dashboard_title_rejected_reviewtitle = 'admin_modern_unified_admin_dashboard_title_rejected_reviewtitle';
+  static const admin_routes_error_title = 'admin_routes_error_title';
+  static const admin_routes_go_back = 'admin_routes_go_back';
+  static const admin_routes_navigation_error = 'admin_routes_navigation_error';
+  static const admin_search_amount = 'admin_search_amount';
+  static const admin_search_modal_hint = 'admin_search_modal_hint';
+  static const admin_search_modal_no_content = 'admin_search_modal_no_content';
+  static const admin_search_modal_no_transactions = 'admin_search_modal_no_transactions';
+  static const admin_search_modal_no_users = 'admin_search_modal_no_users';
+  static const admin_search_modal_title = 'admin_search_modal_title';
+  static const admin_search_selected_content = 'admin_search_selected_content';
+  static const admin_search_selected_transaction = 'admin_search_selected_transaction';
+  static const admin_security_event_failed_login = 'admin_security_event_failed_login';
+  static const admin_security_event_new_admin = 'admin_security_event_new_admin';
+  static const admin_security_event_password_policy = 'admin_security_event_password_policy';
+  static const admin_security_event_security_scan = 'admin_security_event_security_scan';
+  static const admin_security_event_suspicious_access = 'admin_security_event_suspicious_access';
+  static const admin_security_metric_active_threats = 'admin_security_metric_active_threats';
+  static const admin_security_metric_blocked_ips = 'admin_security_metric_blocked_ips';
+  static const admin_security_metric_failed_logins = 'admin_security_metric_failed_logins';
+  static const admin_security_metric_score = 'admin_security_metric_score';
+  static const admin_security_section_active_threats = 'admin_security_section_active_threats';
+  static const admin_security_section_detection_settings = 'admin_security_section_detection_settings';
+  static const admin_security_section_recent_events = 'admin_security_section_recent_events';
+  static const admin_security_tab_access_control = 'admin_security_tab_access_control';
+  static const admin_security_tab_audit_logs = 'admin_security_tab_audit_logs';
+  static const admin_security_tab_overview = 'admin_security_tab_overview';
+  static const admin_security_tab_threat_detection = 'admin_security_tab_threat_detection';
+  static const admin_security_threat_suspicious_login = 'admin_security_threat_suspicious_login';
+  static const admin_security_threat_suspicious_login_desc = 'admin_security_threat_suspicious_login_desc';
+  static const admin_security_threat_unusual_access = 'admin_security_threat_unusual_access';
+  static const admin_security_threat_unusual_access_desc = 'admin_security_threat_unusual_access_desc';
+  static const admin_security_title_center = 'admin_security_title_center';
+  static const admin_unified_admin_dashboard_error_error_e = 'admin_unified_admin_dashboard_error_error_e';
+  static const admin_unified_admin_dashboard_error_error_e_24 = 'admin_unified_admin_dashboard_error_error_e_24';
+  static const admin_unified_admin_dashboard_error_error_e_26 = 'admin_unified_admin_dashboard_error_error_e_26';
+  static const admin_unified_admin_dashboard_error_error_e_27 = 'admin_unified_admin_dashboard_error_error_e_27';
+  static const admin_unified_admin_dashboard_error_error_e_28 = 'admin_unified_admin_dashboard_error_error_e_28';
+  static const admin_unified_admin_dashboard_error_error_error = 'admin_unified_admin_dashboard_error_error_error';
+  static const admin_unified_admin_dashboard_hint_type_contenttype_status = 'admin_unified_admin_dashboard_hint_type_contenttype_status';
+  static const admin_unified_admin_dashboard_label_by_reviewauthorname = 'admin_unified_admin_dashboard_label_by_reviewauthorname';
+  static const admin_unified_admin_dashboard_label_type_reviewcontenttypedisplayname = 'admin_unified_admin_dashboard_label_type_reviewcontenttypedisplayname';
+  static const admin_unified_admin_dashboard_success_content_approved_successfully = 'admin_unified_admin_dashboard_success_content_approved_successfully';
+  static const admin_unified_admin_dashboard_success_content_rejected_successfully = 'admin_unified_admin_dashboard_success_content_rejected_successfully';
+  static const admin_unified_admin_dashboard_text_admin_dashboard = 'admin_unified_admin_dashboard_text_admin_dashboard';
+  static const admin_unified_admin_dashboard_text_admin_dashboard_1 = 'admin_unified_admin_dashboard_text_admin_dashboard_1';
+  static const admin_unified_admin_dashboard_text_approve = 'admin_unified_admin_dashboard_text_approve';
+  static const admin_unified_admin_dashboard_text_approve_12 = 'admin_unified_admin_dashboard_text_approve_12';
+  static const admin_unified_admin_dashboard_text_chart_will_be = 'admin_unified_admin_dashboard_text_chart_will_be';
+  static const admin_unified_admin_dashboard_text_delete = 'admin_unified_admin_dashboard_text_delete';
+  static const admin_unified_admin_dashboard_text_edit = 'admin_unified_admin_dashboard_text_edit';
+  static const admin_unified_admin_dashboard_text_edit_user = 'admin_unified_admin_dashboard_text_edit_user';
+  static const admin_unified_admin_dashboard_text_no_recent_activity = 'admin_unified_admin_dashboard_text_no_recent_activity';
+  static const admin_unified_admin_dashboard_text_no_recent_activity_6 = 'admin_unified_admin_dashboard_text_no_recent_activity_6';
+  static const admin_unified_admin_dashboard_text_no_recent_ad = 'admin_unified_admin_dashboard_text_no_recent_ad';
+  static const admin_unified_admin_dashboard_text_payout_index_1 = 'admin_unified_admin_dashboard_text_payout_index_1';
+  static const admin_unified_admin_dashboard_text_reject = 'admin_unified_admin_dashboard_text_reject';
+  static const admin_unified_admin_dashboard_text_reject_14 = 'admin_unified_admin_dashboard_text_reject_14';
+  static const admin_unified_admin_dashboard_text_retry = 'admin_unified_admin_dashboard_text_retry';
+  static const admin_unified_admin_dashboard_text_retry_4 = 'admin_unified_admin_dashboard_text_retry_4';
+  static const admin_unified_admin_dashboard_text_view_details = 'admin_unified_admin_dashboard_text_view_details';
+  static const admin_unified_admin_dashboard_text_view_details_16 = 'admin_unified_admin_dashboard_text_view_details_16';
+
+  // ads (53 keys)
+  static const ads_ad_card_text_delete = 'ads_ad_card_text_delete';
+  static const ads_ad_migration_loading_loading_stats = 'ads_ad_migration_loading_loading_stats';
+  static const ads_ad_migration_loading_loading_stats_4 = 'ads_ad_migration_loading_loading_stats_4';
+  static const ads_ad_migration_text_ad_migration = 'ads_ad_migration_text_ad_migration';
+  static const ads_ad_migration_text_ad_migration_2 = 'ads_ad_migration_text_ad_migration_2';
+  static const ads_ad_migration_text_cancel = 'ads_ad_migration_text_cancel';
+  static const ads_ad_migration_text_cancel_18 = 'ads_ad_migration_text_cancel_18';
+  static const ads_ad_migration_text_dry_run_preview = 'ads_ad_migration_text_dry_run_preview';
+  static const ads_ad_migration_text_dry_run_preview_6 = 'ads_ad_migration_text_dry_run_preview_6';
+  static const ads_ad_migration_text_dry_run_preview_7 = 'ads_ad_migration_text_dry_run_preview_7';
+  static const ads_ad_migration_text_migrate_ads_overwrite = 'ads_ad_migration_text_migrate_ads_overwrite';
+  static const ads_ad_migration_text_migrate_ads_overwrite_12 = 'ads_ad_migration_text_migrate_ads_overwrite_12';
+  static const ads_ad_migration_text_migrate_ads_overwrite_13 = 'ads_ad_migration_text_migrate_ads_overwrite_13';
+  static const ads_ad_migration_text_migrate_ads_skip = 'ads_ad_migration_text_migrate_ads_skip';
+  static const ads_ad_migration_text_migrate_ads_skip_10 = 'ads_ad_migration_text_migrate_ads_skip_10';
+  static const ads_ad_migration_text_migrate_ads_skip_9 = 'ads_ad_migration_text_migrate_ads_skip_9';
+  static const ads_ad_migration_text_migration_in_progress = 'ads_ad_migration_text_migration_in_progress';
+  static const ads_ad_migration_text_overwrite_warning = 'ads_ad_migration_text_overwrite_warning';
+  static const ads_ad_migration_text_overwrite_warning_16 = 'ads_ad_migration_text_overwrite_warning_16';
+  static const ads_create_local_ad_error_failed_to_post = 'ads_create_local_ad_error_failed_to_post';
+  static const ads_create_local_ad_error_failed_to_upload = 'ads_create_local_ad_error_failed_to_upload';
+  static const ads_create_local_ad_success_ad_posted_successfully = 'ads_create_local_ad_success_ad_posted_successfully';
+  static const ads_create_local_ad_text_ad_content = 'ads_create_local_ad_text_ad_content';
+  static const ads_create_local_ad_text_create_ad = 'ads_create_local_ad_text_create_ad';
+  static const ads_create_local_ad_text_create_ad_5 = 'ads_create_local_ad_text_create_ad_5';
+  static const ads_create_local_ad_text_image_optional = 'ads_create_local_ad_text_image_optional';
+  static const ads_create_local_ad_text_post_ad_for_price = 'ads_create_local_ad_text_post_ad_for_price';
+  static const ads_create_local_ad_text_promote_your_art = 'ads_create_local_ad_text_promote_your_art';
+  static const ads_create_local_ad_text_reach_art_lovers = 'ads_create_local_ad_text_reach_art_lovers';
+  static const ads_create_local_ad_text_select_duration = 'ads_create_local_ad_text_select_duration';
+  static const ads_create_local_ad_text_select_size = 'ads_create_local_ad_text_select_size';
+  static const ads_create_local_ad_text_select_zone = 'ads_create_local_ad_text_select_zone';
+  static const ads_create_local_ad_text_size_and_duration = 'ads_create_local_ad_text_size_and_duration';
+  static const ads_create_local_ad_text_tap_to_select_image = 'ads_create_local_ad_text_tap_to_select_image';
+  static const ads_create_local_ad_text_where_to_display = 'ads_create_local_ad_text_where_to_display';
+  static const ads_local_ads_list_error_error_snapshoterror = 'ads_local_ads_list_error_error_snapshoterror';
+  static const ads_local_ads_list_error_error_snapshoterror_4 = 'ads_local_ads_list_error_error_snapshoterror_4';
+  static const ads_local_ads_list_hint_no_results_for = 'ads_local_ads_list_hint_no_results_for';
+  static const ads_local_ads_list_text_browse_ads = 'ads_local_ads_list_text_browse_ads';
+  static const ads_local_ads_list_text_browse_ads_2 = 'ads_local_ads_list_text_browse_ads_2';
+  static const ads_my_ads_error_error_e = 'ads_my_ads_error_error_e';
+  static const ads_my_ads_error_error_snapshoterror = 'ads_my_ads_error_error_snapshoterror';
+  static const ads_my_ads_text_active_ads = 'ads_my_ads_text_active_ads';
+  static const ads_my_ads_text_ad_deleted = 'ads_my_ads_text_ad_deleted';
+  static const ads_my_ads_text_cancel = 'ads_my_ads_text_cancel';
+  static const ads_my_ads_text_cancel_6 = 'ads_my_ads_text_cancel_6';
+  static const ads_my_ads_text_delete_ad = 'ads_my_ads_text_delete_ad';
+  static const ads_my_ads_text_delete_ad_2 = 'ads_my_ads_text_delete_ad_2';
+  static const ads_my_ads_text_expired_ads = 'ads_my_ads_text_expired_ads';
+  static const ads_my_ads_text_my_ads = 'ads_my_ads_text_my_ads';
+  static const ads_my_ads_text_my_ads_10 = 'ads_my_ads_text_my_ads_10';
+  static const ads_my_ads_text_this_action_cannot = 'ads_my_ads_text_this_action_cannot';
+  static const ads_my_ads_text_this_action_cannot_4 = 'ads_my_ads_text_this_action_cannot_4';
+
+  // art_walk (420 keys)
+  static const art_walk_achievements_grid_button_learn_more = 'art_walk_achievements_grid_button_learn_more';
+  static const art_walk_admin_art_walk_moderation_error_error_clearing_reports = 'art_walk_admin_art_walk_moderation_error_error_clearing_reports';
+  static const art_walk_admin_art_walk_moderation_error_error_deleting_art = 'art_walk_admin_art_walk_moderation_error_error_deleting_art';
+  static const art_walk_admin_art_walk_moderation_error_error_loading_art = 'art_walk_admin_art_walk_moderation_error_error_loading_art';
+  static const art_walk_admin_art_walk_moderation_success_art_walk_deleted = 'art_walk_admin_art_walk_moderation_success_art_walk_deleted';
+  static const art_walk_admin_art_walk_moderation_success_reports_cleared_successfully = 'art_walk_admin_art_walk_moderation_success_reports_cleared_successfully';
+  static const art_walk_admin_art_walk_moderation_text_all = 'art_walk_admin_art_walk_moderation_text_all';
+  static const art_walk_admin_art_walk_moderation_text_all_23 = 'art_walk_admin_art_walk_moderation_text_all_23';
+  static const art_walk_admin_art_walk_moderation_text_art_walk_moderation = 'art_walk_admin_art_walk_moderation_text_art_walk_moderation';
+  static const art_walk_admin_art_walk_moderation_text_art_walk_moderation_21 = 'art_walk_admin_art_walk_moderation_text_art_walk_moderation_21';
+  static const art_walk_admin_art_walk_moderation_text_cancel = 'art_walk_admin_art_walk_moderation_text_cancel';
+  static const art_walk_admin_art_walk_moderation_text_cancel_12 = 'art_walk_admin_art_walk_moderation_text_cancel_12';
+  static const art_walk_admin_art_walk_moderation_text_cancel_13 = 'art_walk_admin_art_walk_moderation_text_cancel_13';
+  static const art_walk_admin_art_walk_moderation_text_cancel_5 = 'art_walk_admin_art_walk_moderation_text_cancel_5';
+  static const art_walk_admin_art_walk_moderation_text_clear_reports = 'art_walk_admin_art_walk_moderation_text_clear_reports';
+  static const art_walk_admin_art_walk_moderation_text_clear_reports_11 = 'art_walk_admin_art_walk_moderation_text_clear_reports_11';
+  static const art_walk_admin_art_walk_moderation_text_clear_reports_14 = 'art_walk_admin_art_walk_moderation_text_clear_reports_14';
+  static const art_walk_admin_art_walk_moderation_text_clear_reports_15 = 'art_walk_admin_art_walk_moderation_text_clear_reports_15';
+  static const art_walk_admin_art_walk_moderation_text_close = 'art_walk_admin_art_walk_moderation_text_close';
+  static const art_walk_admin_art_walk_moderation_text_close_19 = 'art_walk_admin_art_walk_moderation_text_close_19';
+  static const art_walk_admin_art_walk_moderation_text_delete = 'art_walk_admin_art_walk_moderation_text_delete';
+  static const art_walk_admin_art_walk_moderation_text_delete_7 = 'art_walk_admin_art_walk_moderation_text_delete_7';
+  static const art_walk_admin_art_walk_moderation_text_delete_art_walk = 'art_walk_admin_art_walk_moderation_text_delete_art_walk';
+  static const art_walk_admin_art_walk_moderation_text_delete_art_walk_3 = 'art_walk_admin_art_walk_moderation_text_delete_art_walk_3';
+  static const art_walk_admin_art_walk_moderation_text_reported = 'art_walk_admin_art_walk_moderation_text_reported';
+  static const art_walk_admin_art_walk_moderation_text_reported_25 = 'art_walk_admin_art_walk_moderation_text_reported_25';
+  static const art_walk_are_you_an_artist = 'art_walk_are_you_an_artist';
+  static const art_walk_art_walk_celebration_error_failed_to_post = 'art_walk_art_walk_celebration_error_failed_to_post';
+  static const art_walk_art_walk_celebration_text_achievement_posted_to = 'art_walk_art_walk_celebration_text_achievement_posted_to';
+  static const art_walk_art_walk_celebration_text_explore_more = 'art_walk_art_walk_celebration_text_explore_more';
+  static const art_walk_art_walk_celebration_text_explore_more_8 = 'art_walk_art_walk_celebration_text_explore_more_8';
+  static const art_walk_art_walk_celebration_text_explore_more_9 = 'art_walk_art_walk_celebration_text_explore_more_9';
+  static const art_walk_art_walk_celebration_text_share_achievement = 'art_walk_art_walk_celebration_text_share_achievement';
+  static const art_walk_art_walk_celebration_text_share_achievement_2 = 'art_walk_art_walk_celebration_text_share_achievement_2';
+  static const art_walk_art_walk_celebration_text_share_achievement_3 = 'art_walk_art_walk_celebration_text_share_achievement_3';
+  static const art_walk_art_walk_celebration_text_view_all = 'art_walk_art_walk_celebration_text_view_all';
+  static const art_walk_art_walk_celebration_text_view_all_5 = 'art_walk_art_walk_celebration_text_view_all_5';
+  static const art_walk_art_walk_celebration_text_view_all_6 = 'art_walk_art_walk_celebration_text_view_all_6';
+  static const art_walk_art_walk_dashboard_error_error_loading_nearby = 'art_walk_art_walk_dashboard_error_error_loading_nearby';
+  static const art_walk_art_walk_dashboard_text_art_events_and = 'art_walk_art_walk_dashboard_text_art_events_and';
+  static const art_walk_art_walk_dashboard_text_browse_artwork = 'art_walk_art_walk_dashboard_text_browse_artwork';
+  static const art_walk_art_walk_dashboard_text_discover_local_and = 'art_walk_art_walk_dashboard_text_discover_local_and';
+  static const art_walk_art_walk_dashboard_text_explore_art_collections = 'art_walk_art_walk_dashboard_text_explore_art_collections';
+  static const art_walk_art_walk_dashboard_text_find_artists = 'art_walk_art_walk_dashboard_text_find_artists';
+  static const art_walk_art_walk_dashboard_text_getting_your_location = 'art_walk_art_walk_dashboard_text_getting_your_location';
+  static const art_walk_art_walk_dashboard_text_local_scene = 'art_walk_art_walk_dashboard_text_local_scene';
+  static const art_walk_art_walk_dashboard_text_my_profile = 'art_walk_art_walk_dashboard_text_my_profile';
+  static const art_walk_art_walk_dashboard_text_no_art_nearby = 'art_walk_art_walk_dashboard_text_no_art_nearby';
+  static const art_walk_art_walk_dashboard_text_popular_artists_and = 'art_walk_art_walk_dashboard_text_popular_artists_and';
+  static const art_walk_art_walk_dashboard_text_trending = 'art_walk_art_walk_dashboard_text_trending';
+  static const art_walk_art_walk_dashboard_text_view_and_edit = 'art_walk_art_walk_dashboard_text_view_and_edit';
+  static const art_walk_art_walk_dashboard_text_your_location = 'art_walk_art_walk_dashboard_text_your_location';
+  static const art_walk_art_walk_detail_error_error_completing_art = 'art_walk_art_walk_detail_error_error_completing_art';
+  static const art_walk_art_walk_detail_error_error_etostring = 'art_walk_art_walk_detail_error_error_etostring';
+  static const art_walk_art_walk_detail_error_error_sharing_etostring = 'art_walk_art_walk_detail_error_error_sharing_etostring';
+  static const art_walk_art_walk_detail_error_failed_to_start = 'art_walk_art_walk_detail_error_failed_to_start';
+  static const art_walk_art_walk_detail_text_art_walk_completed = 'art_walk_art_walk_detail_text_art_walk_completed';
+  static const art_walk_art_walk_detail_text_art_walk_details = 'art_walk_art_walk_detail_text_art_walk_details';
+  static const art_walk_art_walk_detail_text_art_walk_details_12 = 'art_walk_art_walk_detail_text_art_walk_details_12';
+  static const art_walk_art_walk_detail_text_art_walk_not = 'art_walk_art_walk_detail_text_art_walk_not';
+  static const art_walk_art_walk_detail_text_navigation_stopped = 'art_walk_art_walk_detail_text_navigation_stopped';
+  static const art_walk_art_walk_detail_text_start_navigation = 'art_walk_art_walk_detail_text_start_navigation';
+  static const art_walk_art_walk_detail_text_start_navigation_16 = 'art_walk_art_walk_detail_text_start_navigation_16';
+  static const art_walk_art_walk_detail_text_start_navigation_17 = 'art_walk_art_walk_detail_text_start_navigation_17';
+  static const art_walk_art_walk_detail_text_the_requested_art = 'art_walk_art_walk_detail_text_the_requested_art';
+  static const art_walk_art_walk_detail_text_unable_to_start = 'art_walk_art_walk_detail_text_unable_to_start';
+  static const art_walk_art_walk_detail_text_you_earned_new = 'art_walk_art_walk_detail_text_you_earned_new';
+  static const art_walk_art_walk_detail_text_you_earned_new_6 = 'art_walk_art_walk_detail_text_you_earned_new_6';
+  static const art_walk_art_walk_detail_text_you_must_be = 'art_walk_art_walk_detail_text_you_must_be';
+  static const art_walk_art_walk_edit_error_error_deleting_art = 'art_walk_art_walk_edit_error_error_deleting_art';
+  static const art_walk_art_walk_edit_error_error_loading_art = 'art_walk_art_walk_edit_error_error_loading_art';
+  static const art_walk_art_walk_edit_error_error_picking_image = 'art_walk_art_walk_edit_error_error_picking_image';
+  static const art_walk_art_walk_edit_error_error_updating_art = 'art_walk_art_walk_edit_error_error_updating_art';
+  static const art_walk_art_walk_edit_success_art_walk_deleted = 'art_walk_art_walk_edit_success_art_walk_deleted';
+  static const art_walk_art_walk_edit_success_artwork_added_to = 'art_walk_art_walk_edit_success_artwork_added_to';
+  static const art_walk_art_walk_edit_text_add_artwork = 'art_walk_art_walk_edit_text_add_artwork';
+  static const art_walk_art_walk_edit_text_add_artwork_20 = 'art_walk_art_walk_edit_text_add_artwork_20';
+  static const art_walk_art_walk_edit_text_add_artwork_21 = 'art_walk_art_walk_edit_text_add_artwork_21';
+  static const art_walk_art_walk_edit_text_art_walk_not = 'art_walk_art_walk_edit_text_art_walk_not';
+  static const art_walk_art_walk_edit_text_cancel = 'art_walk_art_walk_edit_text_cancel';
+  static const art_walk_art_walk_edit_text_cancel_7 = 'art_walk_art_walk_edit_text_cancel_7';
+  static const art_walk_art_walk_edit_text_change_cover_image = 'art_walk_art_walk_edit_text_change_cover_image';
+  static const art_walk_art_walk_edit_text_change_cover_image_17 = 'art_walk_art_walk_edit_text_change_cover_image_17';
+  static const art_walk_art_walk_edit_text_change_cover_image_18 = 'art_walk_art_walk_edit_text_change_cover_image_18';
+  static const art_walk_art_walk_edit_text_delete = 'art_walk_art_walk_edit_text_delete';
+  static const art_walk_art_walk_edit_text_delete_9 = 'art_walk_art_walk_edit_text_delete_9';
+  static const art_walk_art_walk_edit_text_delete_art_walk = 'art_walk_art_walk_edit_text_delete_art_walk';
+  static const art_walk_art_walk_edit_text_delete_art_walk_28 = 'art_walk_art_walk_edit_text_delete_art_walk_28';
+  static const art_walk_art_walk_edit_text_delete_art_walk_29 = 'art_walk_art_walk_edit_text_delete_art_walk_29';
+  static const art_walk_art_walk_edit_text_delete_art_walk_5 = 'art_walk_art_walk_edit_text_delete_art_walk_5';
+  static const art_walk_art_walk_edit_text_edit_art_walk = 'art_walk_art_walk_edit_text_edit_art_walk';
+  static const art_walk_art_walk_edit_text_make_this_art = 'art_walk_art_walk_edit_text_make_this_art';
+  static const art_walk_art_walk_edit_text_make_this_art_25 = 'art_walk_art_walk_edit_text_make_this_art_25';
+  static const art_walk_art_walk_edit_text_public_art_walk = 'art_walk_art_walk_edit_text_public_art_walk';
+  static const art_walk_art_walk_edit_text_public_art_walk_23 = 'art_walk_art_walk_edit_text_public_art_walk_23';
+  static const art_walk_art_walk_edit_text_save_changes = 'art_walk_art_walk_edit_text_save_changes';
+  static const art_walk_art_walk_edit_text_save_changes_27 = 'art_walk_art_walk_edit_text_save_changes_27';
+  static const art_walk_art_walk_edit_text_this_artwork_is = 'art_walk_art_walk_edit_text_this_artwork_is';
+  static const art_walk_art_walk_list_hint_search = 'art_walk_art_walk_list_hint_search';
+  static const art_walk_art_walk_list_hint_search_14 = 'art_walk_art_walk_list_hint_search_14';
+  static const art_walk_art_walk_list_hint_search_art_walks = 'art_walk_art_walk_list_hint_search_art_walks';
+  static const art_walk_art_walk_list_hint_search_art_walks_10 = 'art_walk_art_walk_list_hint_search_art_walks_10';
+  static const art_walk_art_walk_list_text_apply_filters = 'art_walk_art_walk_list_text_apply_filters';
+  static const art_walk_art_walk_list_text_apply_filters_8 = 'art_walk_art_walk_list_text_apply_filters_8';
+  static const art_walk_art_walk_list_text_art_walks = 'art_walk_art_walk_list_text_art_walks';
+  static const art_walk_art_walk_list_text_clear = 'art_walk_art_walk_list_text_clear';
+  static const art_walk_art_walk_list_text_clear_12 = 'art_walk_art_walk_list_text_clear_12';
+  static const art_walk_art_walk_list_text_clear_all = 'art_walk_art_walk_list_text_clear_all';
+  static const art_walk_art_walk_list_text_clear_all_6 = 'art_walk_art_walk_list_text_clear_all_6';
+  static const art_walk_art_walk_list_text_create_art_walk = 'art_walk_art_walk_list_text_create_art_walk';
+  static const art_walk_art_walk_list_text_create_art_walk_22 = 'art_walk_art_walk_list_text_create_art_walk_22';
+  static const art_walk_art_walk_list_text_create_art_walk_23 = 'art_walk_art_walk_list_text_create_art_walk_23';
+  static const art_walk_art_walk_list_text_explore = 'art_walk_art_walk_list_text_explore';
+  static const art_walk_art_walk_list_text_explore_19 = 'art_walk_art_walk_list_text_explore_19';
+  static const art_walk_art_walk_list_text_explore_20 = 'art_walk_art_walk_list_text_explore_20';
+  static const art_walk_art_walk_list_text_load_more_art = 'art_walk_art_walk_list_text_load_more_art';
+  static const art_walk_art_walk_list_text_load_more_art_17 = 'art_walk_art_walk_list_text_load_more_art_17';
+  static const art_walk_art_walk_list_text_select_difficulty = 'art_walk_art_walk_list_text_select_difficulty';
+  static const art_walk_art_walk_list_text_select_difficulty_2 = 'art_walk_art_walk_list_text_select_difficulty_2';
+  static const art_walk_art_walk_list_text_select_sorting = 'art_walk_art_walk_list_text_select_sorting';
+  static const art_walk_art_walk_list_text_select_sorting_4 = 'art_walk_art_walk_list_text_select_sorting_4';
+  static const art_walk_art_walk_map_error_location_permission_denied = 'art_walk_art_walk_map_error_location_permission_denied';
+  static const art_walk_art_walk_map_error_location_services_disabled = 'art_walk_art_walk_map_error_location_services_disabled';
+  static const art_walk_art_walk_map_error_location_services_timeout = 'art_walk_art_walk_map_error_location_services_timeout';
+  static const art_walk_art_walk_map_error_network_error = 'art_walk_art_walk_map_error_network_error';
+  static const art_walk_art_walk_map_text_art_walk_map = 'art_walk_art_walk_map_text_art_walk_map';
+  static const art_walk_art_walk_map_text_close = 'art_walk_art_walk_map_text_close';
+  static const art_walk_art_walk_map_text_close_4 = 'art_walk_art_walk_map_text_close_4';
+  static const art_walk_art_walk_map_text_create_art_walk = 'art_walk_art_walk_map_text_create_art_walk';
+  static const art_walk_art_walk_map_text_interactive_map = 'art_walk_art_walk_map_text_interactive_map';
+  static const art_walk_art_walk_map_text_map_features_mobile = 'art_walk_art_walk_map_text_map_features_mobile';
+  static const art_walk_art_walk_map_text_my_artwalks = 'art_walk_art_walk_map_text_my_artwalks';
+  static const art_walk_art_walk_map_text_my_captures = 'art_walk_art_walk_map_text_my_captures';
+  static const art_walk_art_walk_map_text_nearby_captures = 'art_walk_art_walk_map_text_nearby_captures';
+  static const art_walk_art_walk_map_text_no_captures_found = 'art_walk_art_walk_map_text_no_captures_found';
+  static const art_walk_art_walk_map_text_public = 'art_walk_art_walk_map_text_public';
+  static const art_walk_art_walk_review_error_error_capturing_selfie = 'art_walk_art_walk_review_error_error_capturing_selfie';
+  static const art_walk_art_walk_review_error_error_starting_art = 'art_walk_art_walk_review_error_error_starting_art';
+  static const art_walk_art_walk_review_text_level_up_your = 'art_walk_art_walk_review_text_level_up_your';
+  static const art_walk_art_walk_review_text_review_your_art = 'art_walk_art_walk_review_text_review_your_art';
+  static const art_walk_artbeat_artwalk_dashboard_error_error_loading_nearby = 'art_walk_artbeat_artwalk_dashboard_error_error_loading_nearby';
+  static const art_walk_artbeat_artwalk_dashboard_text_getting_your_location = 'art_walk_artbeat_artwalk_dashboard_text_getting_your_location';
+  static const art_walk_artbeat_artwalk_dashboard_text_no_art_nearby = 'art_walk_artbeat_artwalk_dashboard_text_no_art_nearby';
+  static const art_walk_artbeat_artwalk_dashboard_text_view_quest_history = 'art_walk_artbeat_artwalk_dashboard_text_view_quest_history';
+  static const art_walk_artbeat_artwalk_dashboard_text_view_quest_history_2 = 'art_walk_artbeat_artwalk_dashboard_text_view_quest_history_2';
+  static const art_walk_artbeat_artwalk_dashboard_text_view_quest_history_3 = 'art_walk_artbeat_artwalk_dashboard_text_view_quest_history_3';
+  static const art_walk_artist_marketing = 'art_walk_artist_marketing';
+  static const art_walk_artwork = 'art_walk_artwork';
+  static const art_walk_batch_theme_update_title_screentitle = 'art_walk_batch_theme_update_title_screentitle';
+  static const art_walk_browse_all_galleries = 'art_walk_browse_all_galleries';
+  static const art_walk_connect = 'art_walk_connect';
+  static const art_walk_create = 'art_walk_create';
+  static const art_walk_create_ads_featuring_your_artwork_to_reach_more_art_lovers = 'art_walk_create_ads_featuring_your_artwork_to_reach_more_art_lovers';
+  static const art_walk_create_post = 'art_walk_create_post';
+  static const art_walk_dashboard_achievements_subtitle = 'art_walk_dashboard_achievements_subtitle';
+  static const art_walk_dashboard_achievements_title = 'art_walk_dashboard_achievements_title';
+  static const art_walk_dashboard_action_achievements = 'art_walk_dashboard_action_achievements';
+  static const art_walk_dashboard_action_browse_art = 'art_walk_dashboard_action_browse_art';
+  static const art_walk_dashboard_action_create_walk = 'art_walk_dashboard_action_create_walk';
+  static const art_walk_dashboard_action_my_walks = 'art_walk_dashboard_action_my_walks';
+  static const art_walk_dashboard_clusters_artwork_count = 'art_walk_dashboard_clusters_artwork_count';
+  static const art_walk_dashboard_community_online = 'art_walk_dashboard_community_online';
+  static const art_walk_dashboard_community_subtitle = 'art_walk_dashboard_community_subtitle';
+  static const art_walk_dashboard_community_title = 'art_walk_dashboard_community_title';
+  static const art_walk_dashboard_default_explorer_name = 'art_walk_dashboard_default_explorer_name';
+  static const art_walk_dashboard_discovery_button = 'art_walk_dashboard_discovery_button';
+  static const art_walk_dashboard_discovery_nearby = 'art_walk_dashboard_discovery_nearby';
+  static const art_walk_dashboard_discovery_subtitle = 'art_walk_dashboard_discovery_subtitle';
+  static const art_walk_dashboard_discovery_title = 'art_walk_dashboard_discovery_title';
+  static const art_walk_dashboard_distance_unknown = 'art_walk_dashboard_distance_unknown';
+  static const art_walk_dashboard_empty_achievements = 'art_walk_dashboard_empty_achievements';
+  static const art_walk_dashboard_empty_achievements_subtitle = 'art_walk_dashboard_empty_achievements_subtitle';
+  static const art_walk_dashboard_empty_clusters = 'art_walk_dashboard_empty_clusters';
+  static const art_walk_dashboard_empty_clusters_subtitle = 'art_walk_dashboard_empty_clusters_subtitle';
+  static const art_walk_dashboard_greeting_afternoon = 'art_walk_dashboard_greeting_afternoon';
+  static const art_walk_dashboard_greeting_evening = 'art_walk_dashboard_greeting_evening';
+  static const art_walk_dashboard_greeting_morning = 'art_walk_dashboard_greeting_morning';
+  static const art_walk_dashboard_greeting_subtitle = 'art_walk_dashboard_greeting_subtitle';
+  static const art_walk_dashboard_hero_cta_community = 'art_walk_dashboard_hero_cta_community';
+  static const art_walk_dashboard_hero_cta_radar = 'art_walk_dashboard_hero_cta_radar';
+  static const art_walk_dashboard_hero_level_title = 'art_walk_dashboard_hero_level_title';
+  static const art_walk_dashboard_hero_mission_cta = 'art_walk_dashboard_hero_mission_cta';
+  static const art_walk_dashboard_hero_mission_fallback = 'art_walk_dashboard_hero_mission_fallback';
+  static const art_walk_dashboard_hero_mission_fallback_body = 'art_walk_dashboard_hero_mission_fallback_body';
+  static const art_walk_dashboard_hero_mission_reward = 'art_walk_dashboard_hero_mission_reward';
+  static const art_walk_dashboard_hero_mission_title = 'art_walk_dashboard_hero_mission_title';
+  static const art_walk_dashboard_hero_tag_discoveries = 'art_walk_dashboard_hero_tag_discoveries';
+  static const art_walk_dashboard_hero_tag_streak = 'art_walk_dashboard_hero_tag_streak';
+  static const art_walk_dashboard_hero_tag_walkers = 'art_walk_dashboard_hero_tag_walkers';
+  static const art_walk_dashboard_hero_xp_label = 'art_walk_dashboard_hero_xp_label';
+  static const art_walk_dashboard_hero_xp_max_level = 'art_walk_dashboard_hero_xp_max_level';
+  static const art_walk_dashboard_hero_xp_progress = 'art_walk_dashboard_hero_xp_progress';
+  static const art_walk_dashboard_location_unknown = 'art_walk_dashboard_location_unknown';
+  static const art_walk_dashboard_menu_tooltip = 'art_walk_dashboard_menu_tooltip';
+  static const art_walk_dashboard_nearby_subtitle = 'art_walk_dashboard_nearby_subtitle';
+  static const art_walk_dashboard_nearby_title = 'art_walk_dashboard_nearby_title';
+  static const art_walk_dashboard_quick_actions_subtitle = 'art_walk_dashboard_quick_actions_subtitle';
+  static const art_walk_dashboard_quick_actions_title = 'art_walk_dashboard_quick_actions_title';
+  static const art_walk_dashboard_radar_hotspot = 'art_walk_dashboard_radar_hotspot';
+  static const art_walk_dashboard_radar_move_around = 'art_walk_dashboard_radar_move_around';
+  static const art_walk_dashboard_radar_multiple_artworks = 'art_walk_dashboard_radar_multiple_artworks';
+  static const art_walk_dashboard_radar_one_artwork = 'art_walk_dashboard_radar_one_artwork';
+  static const art_walk_dashboard_radar_scanning = 'art_walk_dashboard_radar_scanning';
+  static const art_walk_dashboard_radar_tap_explore = 'art_walk_dashboard_radar_tap_explore';
+  static const art_walk_dashboard_snackbar_art_nearby = 'art_walk_dashboard_snackbar_art_nearby';
+  static const art_walk_dashboard_snackbar_unknown_art = 'art_walk_dashboard_snackbar_unknown_art';
+  static const art_walk_dashboard_snackbar_view_action = 'art_walk_dashboard_snackbar_view_action';
+  static const art_walk_dashboard_stat_discoveries = 'art_walk_dashboard_stat_discoveries';
+  static const art_walk_dashboard_stat_level = 'art_walk_dashboard_stat_level';
+  static const art_walk_dashboard_stat_streak = 'art_walk_dashboard_stat_streak';
+  static const art_walk_distance = 'art_walk_distance';
+  static const art_walk_drawer_achievements = 'art_walk_drawer_achievements';
+  static const art_walk_drawer_art_walk_settings = 'art_walk_drawer_art_walk_settings';
+  static const art_walk_drawer_art_walker = 'art_walk_drawer_art_walker';
+  static const art_walk_drawer_browse_walks = 'art_walk_drawer_browse_walks';
+  static const art_walk_drawer_completed_walks = 'art_walk_drawer_completed_walks';
+  static const art_walk_drawer_create_art_walk = 'art_walk_drawer_create_art_walk';
+  static const art_walk_drawer_discover = 'art_walk_drawer_discover';
+  static const art_walk_drawer_explore_map = 'art_walk_drawer_explore_map';
+  static const art_walk_drawer_gamification = 'art_walk_drawer_gamification';
+  static const art_walk_drawer_instant_discovery = 'art_walk_drawer_instant_discovery';
+  static const art_walk_drawer_main_dashboard = 'art_walk_drawer_main_dashboard';
+  static const art_walk_drawer_messages = 'art_walk_drawer_messages';
+  static const art_walk_drawer_my_art_walks = 'art_walk_drawer_my_art_walks';
+  static const art_walk_drawer_my_captures = 'art_walk_drawer_my_captures';
+  static const art_walk_drawer_my_walks = 'art_walk_drawer_my_walks';
+  static const art_walk_drawer_navigation = 'art_walk_drawer_navigation';
+  static const art_walk_drawer_nearby_art = 'art_walk_drawer_nearby_art';
+  static const art_walk_drawer_popular_walks = 'art_walk_drawer_popular_walks';
+  static const art_walk_drawer_profile = 'art_walk_drawer_profile';
+  static const art_walk_drawer_quest_history = 'art_walk_drawer_quest_history';
+  static const art_walk_drawer_quick_actions = 'art_walk_drawer_quick_actions';
+  static const art_walk_drawer_saved_walks = 'art_walk_drawer_saved_walks';
+  static const art_walk_drawer_search = 'art_walk_drawer_search';
+  static const art_walk_drawer_sign_out = 'art_walk_drawer_sign_out';
+  static const art_walk_drawer_tools = 'art_walk_drawer_tools';
+  static const art_walk_drawer_weekly_goals = 'art_walk_drawer_weekly_goals';
+  static const art_walk_drawer_welcome_back = 'art_walk_drawer_welcome_back';
+  static const art_walk_duration = 'art_walk_duration';
+  static const art_walk_earnings_breakdown = 'art_walk_earnings_breakdown';
+  static const art_walk_enhanced_art_walk_create_error_error_loading_art = 'art_walk_enhanced_art_walk_create_error_error_loading_art';
+  static const art_walk_enhanced_art_walk_create_success_art_walk_created = 'art_walk_enhanced_art_walk_create_success_art_walk_created';
+  static const art_walk_enhanced_art_walk_create_success_art_walk_updated = 'art_walk_enhanced_art_walk_create_success_art_walk_updated';
+  static const art_walk_enhanced_art_walk_create_text_leave = 'art_walk_enhanced_art_walk_create_text_leave';
+  static const art_walk_enhanced_art_walk_create_text_leave_12 = 'art_walk_enhanced_art_walk_create_text_leave_12';
+  static const art_walk_enhanced_art_walk_create_text_leave_art_walk = 'art_walk_enhanced_art_walk_create_text_leave_art_walk';
+  static const art_walk_enhanced_art_walk_create_text_leave_art_walk_6 = 'art_walk_enhanced_art_walk_create_text_leave_art_walk_6';
+  static const art_walk_enhanced_art_walk_create_text_no_art_pieces = 'art_walk_enhanced_art_walk_create_text_no_art_pieces';
+  static const art_walk_enhanced_art_walk_create_text_please_select_at = 'art_walk_enhanced_art_walk_create_text_please_select_at';
+  static const art_walk_enhanced_art_walk_create_text_stay = 'art_walk_enhanced_art_walk_create_text_stay';
+  static const art_walk_enhanced_art_walk_create_text_stay_10 = 'art_walk_enhanced_art_walk_create_text_stay_10';
+  static const art_walk_enhanced_art_walk_create_text_your_progress_will = 'art_walk_enhanced_art_walk_create_text_your_progress_will';
+  static const art_walk_enhanced_art_walk_create_text_your_progress_will_8 = 'art_walk_enhanced_art_walk_create_text_your_progress_will_8';
+  static const art_walk_enhanced_art_walk_experience_error_error_abandoning_walk = 'art_walk_enhanced_art_walk_experience_error_error_abandoning_walk';
+  static const art_walk_enhanced_art_walk_experience_error_error_advancing_navigation = 'art_walk_enhanced_art_walk_experience_error_error_advancing_navigation';
+  static const art_walk_enhanced_art_walk_experience_error_error_completing_walk = 'art_walk_enhanced_art_walk_experience_error_error_completing_walk';
+  static const art_walk_enhanced_art_walk_experience_error_error_completing_walk_49 = 'art_walk_enhanced_art_walk_experience_error_error_completing_walk_49';
+  static const art_walk_enhanced_art_walk_experience_error_error_getting_location = 'art_walk_enhanced_art_walk_experience_error_error_getting_location';
+  static const art_walk_enhanced_art_walk_experience_error_error_marking_as = 'art_walk_enhanced_art_walk_experience_error_error_marking_as';
+  static const art_walk_enhanced_art_walk_experience_error_error_pausing_walk = 'art_walk_enhanced_art_walk_experience_error_error_pausing_walk';
+  static const art_walk_enhanced_art_walk_experience_error_error_resuming_walk = 'art_walk_enhanced_art_walk_experience_error_error_resuming_walk';
+  static const art_walk_enhanced_art_walk_experience_error_error_stopping_navigation = 'art_walk_enhanced_art_walk_experience_error_error_stopping_navigation';
+  static const art_walk_enhanced_art_walk_experience_error_error_with_previous = 'art_walk_enhanced_art_walk_experience_error_error_with_previous';
+  static const art_walk_enhanced_art_walk_experience_error_failed_to_start = 'art_walk_enhanced_art_walk_experience_error_failed_to_start';
+  static const art_walk_enhanced_art_walk_experience_success_achievement_progress_updated = 'art_walk_enhanced_art_walk_experience_success_achievement_progress_updated';
+  static const art_walk_enhanced_art_walk_experience_success_achievement_progress_updated_25 = 'art_walk_enhanced_art_walk_experience_success_achievement_progress_updated_25';
+  static const art_walk_enhanced_art_walk_experience_text_abandon = 'art_walk_enhanced_art_walk_experience_text_abandon';
+  static const art_walk_enhanced_art_walk_experience_text_abandon_81 = 'art_walk_enhanced_art_walk_experience_text_abandon_81';
+  static const art_walk_enhanced_art_walk_experience_text_abandon_walk = 'art_walk_enhanced_art_walk_experience_text_abandon_walk';
+  static const art_walk_enhanced_art_walk_experience_text_abandon_walk_76 = 'art_walk_enhanced_art_walk_experience_text_abandon_walk_76';
+  static const art_walk_enhanced_art_walk_experience_text_abandon_walk_77 = 'art_walk_enhanced_art_walk_experience_text_abandon_walk_77';
+  static const art_walk_enhanced_art_walk_experience_text_already_at_the = 'art_walk_enhanced_art_walk_experience_text_already_at_the';
+  static const art_walk_enhanced_art_walk_experience_text_at_first_step = 'art_walk_enhanced_art_walk_experience_text_at_first_step';
+  static const art_walk_enhanced_art_walk_experience_text_cancel = 'art_walk_enhanced_art_walk_experience_text_cancel';
+  static const art_walk_enhanced_art_walk_experience_text_cancel_79 = 'art_walk_enhanced_art_walk_experience_text_cancel_79';
+  static const art_walk_enhanced_art_walk_experience_text_claim_rewards = 'art_walk_enhanced_art_walk_experience_text_claim_rewards';
+  static const art_walk_enhanced_art_walk_experience_text_claim_rewards_29 = 'art_walk_enhanced_art_walk_experience_text_claim_rewards_29';
+  static const art_walk_enhanced_art_walk_experience_text_close = 'art_walk_enhanced_art_walk_experience_text_close';
+  static const art_walk_enhanced_art_walk_experience_text_close_75 = 'art_walk_enhanced_art_walk_experience_text_close_75';
+  static const art_walk_enhanced_art_walk_experience_text_complete_now = 'art_walk_enhanced_art_walk_experience_text_complete_now';
+  static const art_walk_enhanced_art_walk_experience_text_complete_now_71 = 'art_walk_enhanced_art_walk_experience_text_complete_now_71';
+  static const art_walk_enhanced_art_walk_experience_text_complete_walk = 'art_walk_enhanced_art_walk_experience_text_complete_walk';
+  static const art_walk_enhanced_art_walk_experience_text_complete_walk_early = 'art_walk_enhanced_art_walk_experience_text_complete_walk_early';
+  static const art_walk_enhanced_art_walk_experience_text_complete_walk_early_63 = 'art_walk_enhanced_art_walk_experience_text_complete_walk_early_63';
+  static const art_walk_enhanced_art_walk_experience_text_completionbonus_xp_total = 'art_walk_enhanced_art_walk_experience_text_completionbonus_xp_total';
+  static const art_walk_enhanced_art_walk_experience_text_follow_the_blue = 'art_walk_enhanced_art_walk_experience_text_follow_the_blue';
+  static const art_walk_enhanced_art_walk_experience_text_follow_the_blue_34 = 'art_walk_enhanced_art_walk_experience_text_follow_the_blue_34';
+  static const art_walk_enhanced_art_walk_experience_text_formatdurationtimespent_duration = 'art_walk_enhanced_art_walk_experience_text_formatdurationtimespent_duration';
+  static const art_walk_enhanced_art_walk_experience_text_got_it = 'art_walk_enhanced_art_walk_experience_text_got_it';
+  static const art_walk_enhanced_art_walk_experience_text_got_it_40 = 'art_walk_enhanced_art_walk_experience_text_got_it_40';
+  static const art_walk_enhanced_art_walk_experience_text_green_markers_visited = 'art_walk_enhanced_art_walk_experience_text_green_markers_visited';
+  static const art_walk_enhanced_art_walk_experience_text_green_markers_visited_36 = 'art_walk_enhanced_art_walk_experience_text_green_markers_visited_36';
+  static const art_walk_enhanced_art_walk_experience_text_how_to_use = 'art_walk_enhanced_art_walk_experience_text_how_to_use';
+  static const art_walk_enhanced_art_walk_experience_text_how_to_use_32 = 'art_walk_enhanced_art_walk_experience_text_how_to_use_32';
+  static const art_walk_enhanced_art_walk_experience_text_keep_exploring = 'art_walk_enhanced_art_walk_experience_text_keep_exploring';
+  static const art_walk_enhanced_art_walk_experience_text_keep_exploring_69 = 'art_walk_enhanced_art_walk_experience_text_keep_exploring_69';
+  static const art_walk_enhanced_art_walk_experience_text_leave = 'art_walk_enhanced_art_walk_experience_text_leave';
+  static const art_walk_enhanced_art_walk_experience_text_leave_58 = 'art_walk_enhanced_art_walk_experience_text_leave_58';
+  static const art_walk_enhanced_art_walk_experience_text_leave_walk = 'art_walk_enhanced_art_walk_experience_text_leave_walk';
+  static const art_walk_enhanced_art_walk_experience_text_leave_walk_54 = 'art_walk_enhanced_art_walk_experience_text_leave_walk_54';
+  static const art_walk_enhanced_art_walk_experience_text_navigation_not_active = 'art_walk_enhanced_art_walk_experience_text_navigation_not_active';
+  static const art_walk_enhanced_art_walk_experience_text_navigation_paused_while = 'art_walk_enhanced_art_walk_experience_text_navigation_paused_while';
+  static const art_walk_enhanced_art_walk_experience_text_navigation_resumed = 'art_walk_enhanced_art_walk_experience_text_navigation_resumed';
+  static const art_walk_enhanced_art_walk_experience_text_navigation_stopped = 'art_walk_enhanced_art_walk_experience_text_navigation_stopped';
+  static const art_walk_enhanced_art_walk_experience_text_no_navigation_step = 'art_walk_enhanced_art_walk_experience_text_no_navigation_step';
+  static const art_walk_enhanced_art_walk_experience_text_pause_walk = 'art_walk_enhanced_art_walk_experience_text_pause_walk';
+  static const art_walk_enhanced_art_walk_experience_text_perfect_completion_bonus = 'art_walk_enhanced_art_walk_experience_text_perfect_completion_bonus';
+  static const art_walk_enhanced_art_walk_experience_text_perfect_completion_bonus_17 = 'art_walk_enhanced_art_walk_experience_text_perfect_completion_bonus_17';
+  static const art_walk_enhanced_art_walk_experience_text_photo_documentation_bonus = 'art_walk_enhanced_art_walk_experience_text_photo_documentation_bonus';
+  static const art_walk_enhanced_art_walk_experience_text_photo_documentation_bonus_21 = 'art_walk_enhanced_art_walk_experience_text_photo_documentation_bonus_21';
+  static const art_walk_enhanced_art_walk_experience_text_photoscount_photos_taken = 'art_walk_enhanced_art_walk_experience_text_photoscount_photos_taken';
+  static const art_walk_enhanced_art_walk_experience_text_red_markers_not = 'art_walk_enhanced_art_walk_experience_text_red_markers_not';
+  static const art_walk_enhanced_art_walk_experience_text_red_markers_not_38 = 'art_walk_enhanced_art_walk_experience_text_red_markers_not_38';
+  static const art_walk_enhanced_art_walk_experience_text_resume_walk = 'art_walk_enhanced_art_walk_experience_text_resume_walk';
+  static const art_walk_enhanced_art_walk_experience_text_review_walk = 'art_walk_enhanced_art_walk_experience_text_review_walk';
+  static const art_walk_enhanced_art_walk_experience_text_review_walk_27 = 'art_walk_enhanced_art_walk_experience_text_review_walk_27';
+  static const art_walk_enhanced_art_walk_experience_text_showing_previous_navigation = 'art_walk_enhanced_art_walk_experience_text_showing_previous_navigation';
+  static const art_walk_enhanced_art_walk_experience_text_speed_bonus_25 = 'art_walk_enhanced_art_walk_experience_text_speed_bonus_25';
+  static const art_walk_enhanced_art_walk_experience_text_speed_bonus_25_19 = 'art_walk_enhanced_art_walk_experience_text_speed_bonus_25_19';
+  static const art_walk_enhanced_art_walk_experience_text_stay = 'art_walk_enhanced_art_walk_experience_text_stay';
+  static const art_walk_enhanced_art_walk_experience_text_stay_56 = 'art_walk_enhanced_art_walk_experience_text_stay_56';
+  static const art_walk_enhanced_art_walk_experience_text_stop_navigation = 'art_walk_enhanced_art_walk_experience_text_stop_navigation';
+  static const art_walk_enhanced_art_walk_experience_text_stop_navigation_51 = 'art_walk_enhanced_art_walk_experience_text_stop_navigation_51';
+  static const art_walk_enhanced_art_walk_experience_text_stop_navigation_52 = 'art_walk_enhanced_art_walk_experience_text_stop_navigation_52';
+  static const art_walk_enhanced_art_walk_experience_text_view_progress = 'art_walk_enhanced_art_walk_experience_text_view_progress';
+  static const art_walk_enhanced_art_walk_experience_text_walk_completed = 'art_walk_enhanced_art_walk_experience_text_walk_completed';
+  static const art_walk_enhanced_art_walk_experience_text_walk_completed_14 = 'art_walk_enhanced_art_walk_experience_text_walk_completed_14';
+  static const art_walk_enhanced_art_walk_experience_text_walk_paused_you = 'art_walk_enhanced_art_walk_experience_text_walk_paused_you';
+  static const art_walk_enhanced_art_walk_experience_text_walk_progress = 'art_walk_enhanced_art_walk_experience_text_walk_progress';
+  static const art_walk_enhanced_art_walk_experience_text_walk_progress_73 = 'art_walk_enhanced_art_walk_experience_text_walk_progress_73';
+  static const art_walk_enhanced_art_walk_experience_text_would_you_like = 'art_walk_enhanced_art_walk_experience_text_would_you_like';
+  static const art_walk_enhanced_art_walk_experience_text_would_you_like_67 = 'art_walk_enhanced_art_walk_experience_text_would_you_like_67';
+  static const art_walk_enhanced_art_walk_experience_text_you_can_still = 'art_walk_enhanced_art_walk_experience_text_you_can_still';
+  static const art_walk_enhanced_art_walk_experience_text_you_can_still_65 = 'art_walk_enhanced_art_walk_experience_text_you_can_still_65';
+  static const art_walk_enhanced_art_walk_experience_text_your_location = 'art_walk_enhanced_art_walk_experience_text_your_location';
+  static const art_walk_enhanced_my_art_walks_error_error_abandoning_walk = 'art_walk_enhanced_my_art_walks_error_error_abandoning_walk';
+  static const art_walk_enhanced_my_art_walks_error_error_deleting_walk = 'art_walk_enhanced_my_art_walks_error_error_deleting_walk';
+  static const art_walk_enhanced_my_art_walks_error_error_loading_data = 'art_walk_enhanced_my_art_walks_error_error_loading_data';
+  static const art_walk_enhanced_my_art_walks_error_error_pausing_walk = 'art_walk_enhanced_my_art_walks_error_error_pausing_walk';
+  static const art_walk_enhanced_my_art_walks_error_error_resuming_walk = 'art_walk_enhanced_my_art_walks_error_error_resuming_walk';
+  static const art_walk_enhanced_my_art_walks_error_error_submitting_review = 'art_walk_enhanced_my_art_walks_error_error_submitting_review';
+  static const art_walk_enhanced_my_art_walks_error_error_unsaving_walk = 'art_walk_enhanced_my_art_walks_error_error_unsaving_walk';
+  static const art_walk_enhanced_my_art_walks_error_failed_to_save = 'art_walk_enhanced_my_art_walks_error_failed_to_save';
+  static const art_walk_enhanced_my_art_walks_success_no_saved_walks = 'art_walk_enhanced_my_art_walks_success_no_saved_walks';
+  static const art_walk_enhanced_my_art_walks_success_saved = 'art_walk_enhanced_my_art_walks_success_saved';
+  static const art_walk_enhanced_my_art_walks_text_abandon = 'art_walk_enhanced_my_art_walks_text_abandon';
+  static const art_walk_enhanced_my_art_walks_text_abandon_27 = 'art_walk_enhanced_my_art_walks_text_abandon_27';
+  static const art_walk_enhanced_my_art_walks_text_abandon_walk = 'art_walk_enhanced_my_art_walks_text_abandon_walk';
+  static const art_walk_enhanced_my_art_walks_text_abandon_walk_23 = 'art_walk_enhanced_my_art_walks_text_abandon_walk_23';
+  static const art_walk_enhanced_my_art_walks_text_cancel = 'art_walk_enhanced_my_art_walks_text_cancel';
+  static const art_walk_enhanced_my_art_walks_text_cancel_25 = 'art_walk_enhanced_my_art_walks_text_cancel_25';
+  static const art_walk_enhanced_my_art_walks_text_cancel_32 = 'art_walk_enhanced_my_art_walks_text_cancel_32';
+  static const art_walk_enhanced_my_art_walks_text_cancel_33 = 'art_walk_enhanced_my_art_walks_text_cancel_33';
+  static const art_walk_enhanced_my_art_walks_text_cancel_41 = 'art_walk_enhanced_my_art_walks_text_cancel_41';
+  static const art_walk_enhanced_my_art_walks_text_cancel_42 = 'art_walk_enhanced_my_art_walks_text_cancel_42';
+  static const art_walk_enhanced_my_art_walks_text_complete_your_first = 'art_walk_enhanced_my_art_walks_text_complete_your_first';
+  static const art_walk_enhanced_my_art_walks_text_completed = 'art_walk_enhanced_my_art_walks_text_completed';
+  static const art_walk_enhanced_my_art_walks_text_create_walk = 'art_walk_enhanced_my_art_walks_text_create_walk';
+  static const art_walk_enhanced_my_art_walks_text_create_walk_14 = 'art_walk_enhanced_my_art_walks_text_create_walk_14';
+  static const art_walk_enhanced_my_art_walks_text_create_walk_15 = 'art_walk_enhanced_my_art_walks_text_create_walk_15';
+  static const art_walk_enhanced_my_art_walks_text_created = 'art_walk_enhanced_my_art_walks_text_created';
+  static const art_walk_enhanced_my_art_walks_text_delete = 'art_walk_enhanced_my_art_walks_text_delete';
+  static const art_walk_enhanced_my_art_walks_text_delete_35 = 'art_walk_enhanced_my_art_walks_text_delete_35';
+  static const art_walk_enhanced_my_art_walks_text_delete_walk = 'art_walk_enhanced_my_art_walks_text_delete_walk';
+  static const art_walk_enhanced_my_art_walks_text_delete_walk_31 = 'art_walk_enhanced_my_art_walks_text_delete_walk_31';
+  static const art_walk_enhanced_my_art_walks_text_in_progress = 'art_walk_enhanced_my_art_walks_text_in_progress';
+  static const art_walk_enhanced_my_art_walks_text_log_in = 'art_walk_enhanced_my_art_walks_text_log_in';
+  static const art_walk_enhanced_my_art_walks_text_log_in_19 = 'art_walk_enhanced_my_art_walks_text_log_in_19';
+  static const art_walk_enhanced_my_art_walks_text_my_art_walks = 'art_walk_enhanced_my_art_walks_text_my_art_walks';
+  static const art_walk_enhanced_my_art_walks_text_my_art_walks_16 = 'art_walk_enhanced_my_art_walks_text_my_art_walks_16';
+  static const art_walk_enhanced_my_art_walks_text_my_art_walks_17 = 'art_walk_enhanced_my_art_walks_text_my_art_walks_17';
+  static const art_walk_enhanced_my_art_walks_text_my_art_walks_3 = 'art_walk_enhanced_my_art_walks_text_my_art_walks_3';
+  static const art_walk_enhanced_my_art_walks_text_no_completed_walks = 'art_walk_enhanced_my_art_walks_text_no_completed_walks';
+  static const art_walk_enhanced_my_art_walks_text_no_walks_created = 'art_walk_enhanced_my_art_walks_text_no_walks_created';
+  static const art_walk_enhanced_my_art_walks_text_no_walks_in = 'art_walk_enhanced_my_art_walks_text_no_walks_in';
+  static const art_walk_enhanced_my_art_walks_text_perfect_walk_all = 'art_walk_enhanced_my_art_walks_text_perfect_walk_all';
+  static const art_walk_enhanced_my_art_walks_text_perfect_walk_all_40 = 'art_walk_enhanced_my_art_walks_text_perfect_walk_all_40';
+  static const art_walk_enhanced_my_art_walks_text_submit_review = 'art_walk_enhanced_my_art_walks_text_submit_review';
+  static const art_walk_enhanced_my_art_walks_text_submit_review_44 = 'art_walk_enhanced_my_art_walks_text_submit_review_44';
+  static const art_walk_enhanced_my_art_walks_text_widgetprogresstotalpointsearned_points_earned = 'art_walk_enhanced_my_art_walks_text_widgetprogresstotalpointsearned_points_earned';
+  static const art_walk_failed_to_load_earnings_data = 'art_walk_failed_to_load_earnings_data';
+  static const art_walk_instant_discovery_radar_text_you_discovered_all = 'art_walk_instant_discovery_radar_text_you_discovered_all';
+  static const art_walk_local_artists = 'art_walk_local_artists';
+  static const art_walk_local_galleries___museums = 'art_walk_local_galleries___museums';
+  static const art_walk_manage_accounts = 'art_walk_manage_accounts';
+  static const art_walk_my_walks = 'art_walk_my_walks';
+  static const art_walk_no_audio_file_selected = 'art_walk_no_audio_file_selected';
+  static const art_walk_no_content_provided = 'art_walk_no_content_provided';
+  static const art_walk_no_engaged_followers_yet = 'art_walk_no_engaged_followers_yet';
+  static const art_walk_no_galleries_or_museums_found_in_your_area = 'art_walk_no_galleries_or_museums_found_in_your_area';
+  static const art_walk_no_recent_transactions = 'art_walk_no_recent_transactions';
+  static const art_walk_overview = 'art_walk_overview';
+  static const art_walk_post_comment = 'art_walk_post_comment';
+  static const art_walk_progress_cards_button_abandon = 'art_walk_progress_cards_button_abandon';
+  static const art_walk_progress_cards_button_review = 'art_walk_progress_cards_button_review';
+  static const art_walk_progress_cards_button_share = 'art_walk_progress_cards_button_share';
+  static const art_walk_progress_cards_button_start_walk = 'art_walk_progress_cards_button_start_walk';
+  static const art_walk_progress_cards_text_edit = 'art_walk_progress_cards_text_edit';
+  static const art_walk_promote_your_art = 'art_walk_promote_your_art';
+  static const art_walk_quick_actions = 'art_walk_quick_actions';
+  static const art_walk_recent_activity = 'art_walk_recent_activity';
+  static const art_walk_request_payout = 'art_walk_request_payout';
+  static const art_walk_retry = 'art_walk_retry';
+  static const art_walk_routes = 'art_walk_routes';
+  static const art_walk_see_all = 'art_walk_see_all';
+  static const art_walk_share_updates_with_your_community = 'art_walk_share_updates_with_your_community';
+  static const art_walk_showcase_your_work_to_local_art_lovers__get_discovered__and_grow_your_career = 'art_walk_showcase_your_work_to_local_art_lovers__get_discovered__and_grow_your_career';
+  static const art_walk_specialties = 'art_walk_specialties';
+  static const art_walk_start = 'art_walk_start';
+  static const art_walk_start_your_artist_journey = 'art_walk_start_your_artist_journey';
+  static const art_walk_steps = 'art_walk_steps';
+  static const art_walk_stop = 'art_walk_stop';
+  static const art_walk_title = 'art_walk_title';
+  static const art_walk_top_fans = 'art_walk_top_fans';
+  static const art_walk_top_performing_artwork = 'art_walk_top_performing_artwork';
+  static const art_walk_total_earnings = 'art_walk_total_earnings';
+  static const art_walk_upcoming_events = 'art_walk_upcoming_events';
+  static const art_walk_view_all = 'art_walk_view_all';
+  static const art_walk_weekly_goals_text_weekly_goals = 'art_walk_weekly_goals_text_weekly_goals';
+  static const art_walk_weekly_goals_text_weekly_goals_2 = 'art_walk_weekly_goals_text_weekly_goals_2';
+
+  // artist (282 keys)
+  static const artist_analytics_dashboard_error_error_loading_analytics = 'artist_analytics_dashboard_error_error_loading_analytics';
+  static const artist_analytics_dashboard_text_analytics_dashboard = 'artist_analytics_dashboard_text_analytics_dashboard';
+  static const artist_analytics_dashboard_text_no_artwork_data = 'artist_analytics_dashboard_text_no_artwork_data';
+  static const artist_analytics_dashboard_text_no_location_data = 'artist_analytics_dashboard_text_no_location_data';
+  static const artist_analytics_dashboard_text_no_referral_data = 'artist_analytics_dashboard_text_no_referral_data';
+  static const artist_analytics_dashboard_text_no_visitor_data = 'artist_analytics_dashboard_text_no_visitor_data';
+  static const artist_analytics_dashboard_text_unknown_artwork = 'artist_analytics_dashboard_text_unknown_artwork';
+  static const artist_analytics_dashboard_text_upgrade_now = 'artist_analytics_dashboard_text_upgrade_now';
+  static const artist_analytics_dashboard_text_upgrade_now_9 = 'artist_analytics_dashboard_text_upgrade_now_9';
+  static const artist_artist_approved_ads_text_ad_campaign_management = 'artist_artist_approved_ads_text_ad_campaign_management';
+  static const artist_artist_approved_ads_text_ad_performance_analytics = 'artist_artist_approved_ads_text_ad_performance_analytics';
+  static const artist_artist_approved_ads_text_approval_status_tracking = 'artist_artist_approved_ads_text_approval_status_tracking';
+  static const artist_artist_approved_ads_text_artist_approved_ads = 'artist_artist_approved_ads_text_artist_approved_ads';
+  static const artist_artist_approved_ads_text_revenue_tracking = 'artist_artist_approved_ads_text_revenue_tracking';
+  static const artist_artist_browse_error_error_loading_artists = 'artist_artist_browse_error_error_loading_artists';
+  static const artist_artist_browse_text_apply = 'artist_artist_browse_text_apply';
+  static const artist_artist_browse_text_apply_17 = 'artist_artist_browse_text_apply_17';
+  static const artist_artist_browse_text_artistmediumslength_2 = 'artist_artist_browse_text_artistmediumslength_2';
+  static const artist_artist_browse_text_artistmediumslength_2_11 = 'artist_artist_browse_text_artistmediumslength_2_11';
+  static const artist_artist_browse_text_cancel = 'artist_artist_browse_text_cancel';
+  static const artist_artist_browse_text_cancel_15 = 'artist_artist_browse_text_cancel_15';
+  static const artist_artist_browse_text_filter_artists = 'artist_artist_browse_text_filter_artists';
+  static const artist_artist_browse_text_filter_artists_13 = 'artist_artist_browse_text_filter_artists_13';
+  static const artist_artist_browse_text_gallery = 'artist_artist_browse_text_gallery';
+  static const artist_artist_browse_text_gallery_8 = 'artist_artist_browse_text_gallery_8';
+  static const artist_artist_browse_text_gallery_9 = 'artist_artist_browse_text_gallery_9';
+  static const artist_artist_browse_text_medium_selectedmedium = 'artist_artist_browse_text_medium_selectedmedium';
+  static const artist_artist_browse_text_medium_selectedmedium_3 = 'artist_artist_browse_text_medium_selectedmedium_3';
+  static const artist_artist_browse_text_no_artists_found = 'artist_artist_browse_text_no_artists_found';
+  static const artist_artist_browse_text_style_selectedstyle = 'artist_artist_browse_text_style_selectedstyle';
+  static const artist_artist_browse_text_style_selectedstyle_5 = 'artist_artist_browse_text_style_selectedstyle_5';
+  static const artist_artist_dashboard_text_add_new_artwork = 'artist_artist_dashboard_text_add_new_artwork';
+  static const artist_artist_dashboard_text_add_post = 'artist_artist_dashboard_text_add_post';
+  static const artist_artist_dashboard_text_announce_upcoming_events = 'artist_artist_dashboard_text_announce_upcoming_events';
+  static const artist_artist_dashboard_text_artist_dashboard = 'artist_artist_dashboard_text_artist_dashboard';
+  static const artist_artist_dashboard_text_artwork_post = 'artist_artist_dashboard_text_artwork_post';
+  static const artist_artist_dashboard_text_artwork_sold = 'artist_artist_dashboard_text_artwork_sold';
+  static const artist_artist_dashboard_text_commission_hub = 'artist_artist_dashboard_text_commission_hub';
+  static const artist_artist_dashboard_text_commission_request = 'artist_artist_dashboard_text_commission_request';
+  static const artist_artist_dashboard_text_commission_wizard = 'artist_artist_dashboard_text_commission_wizard';
+  static const artist_artist_dashboard_text_create_ad = 'artist_artist_dashboard_text_create_ad';
+  static const artist_artist_dashboard_text_create_ad_5 = 'artist_artist_dashboard_text_create_ad_5';
+  static const artist_artist_dashboard_text_create_ad_6 = 'artist_artist_dashboard_text_create_ad_6';
+  static const artist_artist_dashboard_text_create_event = 'artist_artist_dashboard_text_create_event';
+  static const artist_artist_dashboard_text_event_post = 'artist_artist_dashboard_text_event_post';
+  static const artist_artist_dashboard_text_gift_received = 'artist_artist_dashboard_text_gift_received';
+  static const artist_artist_dashboard_text_host_exhibitions_and = 'artist_artist_dashboard_text_host_exhibitions_and';
+  static const artist_artist_dashboard_text_manage_your_commissions = 'artist_artist_dashboard_text_manage_your_commissions';
+  static const artist_artist_dashboard_text_photo_post = 'artist_artist_dashboard_text_photo_post';
+  static const artist_artist_dashboard_text_retry = 'artist_artist_dashboard_text_retry';
+  static const artist_artist_dashboard_text_retry_9 = 'artist_artist_dashboard_text_retry_9';
+  static const artist_artist_dashboard_text_set_up_commission = 'artist_artist_dashboard_text_set_up_commission';
+  static const artist_artist_dashboard_text_share_photos_from = 'artist_artist_dashboard_text_share_photos_from';
+  static const artist_artist_dashboard_text_share_updates_with = 'artist_artist_dashboard_text_share_updates_with';
+  static const artist_artist_dashboard_text_share_your_thoughts = 'artist_artist_dashboard_text_share_your_thoughts';
+  static const artist_artist_dashboard_text_showcase_your_latest = 'artist_artist_dashboard_text_showcase_your_latest';
+  static const artist_artist_dashboard_text_text_post = 'artist_artist_dashboard_text_text_post';
+  static const artist_artist_dashboard_text_track_your_performance = 'artist_artist_dashboard_text_track_your_performance';
+  static const artist_artist_dashboard_text_upload_artwork = 'artist_artist_dashboard_text_upload_artwork';
+  static const artist_artist_dashboard_text_view_all_activity = 'artist_artist_dashboard_text_view_all_activity';
+  static const artist_artist_dashboard_text_view_all_activity_11 = 'artist_artist_dashboard_text_view_all_activity_11';
+  static const artist_artist_dashboard_text_view_analytics = 'artist_artist_dashboard_text_view_analytics';
+  static const artist_artist_journey_error_error_e = 'artist_artist_journey_error_error_e';
+  static const artist_artist_journey_error_error_e_13 = 'artist_artist_journey_error_error_e_13';
+  static const artist_artist_journey_hint_account_type = 'artist_artist_journey_hint_account_type';
+  static const artist_artist_journey_text_back = 'artist_artist_journey_text_back';
+  static const artist_artist_journey_text_back_11 = 'artist_artist_journey_text_back_11';
+  static const artist_artist_journey_text_become_an_artist = 'artist_artist_journey_text_become_an_artist';
+  static const artist_artist_journey_text_business_plan = 'artist_artist_journey_text_business_plan';
+  static const artist_artist_journey_text_creator_plan = 'artist_artist_journey_text_creator_plan';
+  static const artist_artist_journey_text_dashboard = 'artist_artist_journey_text_dashboard';
+  static const artist_artist_journey_text_free_plan = 'artist_artist_journey_text_free_plan';
+  static const artist_artist_journey_text_navigation = 'artist_artist_journey_text_navigation';
+  static const artist_artist_journey_text_profile = 'artist_artist_journey_text_profile';
+  static const artist_artist_journey_text_starter_plan = 'artist_artist_journey_text_starter_plan';
+  static const artist_artist_list_error_failed_to_load = 'artist_artist_list_error_failed_to_load';
+  static const artist_artist_list_error_failed_to_load_2 = 'artist_artist_list_error_failed_to_load_2';
+  static const artist_artist_list_text_refresh = 'artist_artist_list_text_refresh';
+  static const artist_artist_list_text_refresh_6 = 'artist_artist_list_text_refresh_6';
+  static const artist_artist_list_text_retry = 'artist_artist_list_text_retry';
+  static const artist_artist_list_text_retry_4 = 'artist_artist_list_text_retry_4';
+  static const artist_artist_onboarding_error_error_creating_artist = 'artist_artist_onboarding_error_error_creating_artist';
+  static const artist_artist_onboarding_success_artist_profile_created = 'artist_artist_onboarding_success_artist_profile_created';
+  static const artist_artist_profile_edit_error_error_loading_profile = 'artist_artist_profile_edit_error_error_loading_profile';
+  static const artist_artist_profile_edit_error_error_saving_profile = 'artist_artist_profile_edit_error_error_saving_profile';
+  static const artist_artist_profile_edit_success_artist_profile_saved = 'artist_artist_profile_edit_success_artist_profile_saved';
+  static const artist_artist_profile_edit_text_cover_image = 'artist_artist_profile_edit_text_cover_image';
+  static const artist_artist_profile_edit_text_cover_image_11 = 'artist_artist_profile_edit_text_cover_image_11';
+  static const artist_artist_profile_edit_text_gallery = 'artist_artist_profile_edit_text_gallery';
+  static const artist_artist_profile_edit_text_gallery_7 = 'artist_artist_profile_edit_text_gallery_7';
+  static const artist_artist_profile_edit_text_individual_artist = 'artist_artist_profile_edit_text_individual_artist';
+  static const artist_artist_profile_edit_text_individual_artist_5 = 'artist_artist_profile_edit_text_individual_artist_5';
+  static const artist_artist_profile_edit_text_mediums = 'artist_artist_profile_edit_text_mediums';
+  static const artist_artist_profile_edit_text_mediums_13 = 'artist_artist_profile_edit_text_mediums_13';
+  static const artist_artist_profile_edit_text_profile_image = 'artist_artist_profile_edit_text_profile_image';
+  static const artist_artist_profile_edit_text_profile_image_9 = 'artist_artist_profile_edit_text_profile_image_9';
+  static const artist_artist_profile_edit_text_styles = 'artist_artist_profile_edit_text_styles';
+  static const artist_artist_profile_edit_text_styles_15 = 'artist_artist_profile_edit_text_styles_15';
+  static const artist_artist_public_profile_error_error_e = 'artist_artist_public_profile_error_error_e';
+  static const artist_artist_public_profile_error_error_loading_artist = 'artist_artist_public_profile_error_error_loading_artist';
+  static const artist_artist_public_profile_text_artist_profile = 'artist_artist_public_profile_text_artist_profile';
+  static const artist_artist_public_profile_text_artist_profile_not = 'artist_artist_public_profile_text_artist_profile_not';
+  static const artist_artist_public_profile_text_could_not_open = 'artist_artist_public_profile_text_could_not_open';
+  static const artist_artist_public_profile_text_no_artwork_available = 'artist_artist_public_profile_text_no_artwork_available';
+  static const artist_artist_public_profile_text_please_log_in = 'artist_artist_public_profile_text_please_log_in';
+  static const artist_artist_public_profile_text_please_log_in_8 = 'artist_artist_public_profile_text_please_log_in_8';
+  static const artist_artist_public_profile_text_you_cannot_send = 'artist_artist_public_profile_text_you_cannot_send';
+  static const artist_cta_label = 'artist_cta_label';
+  static const artist_dashboard_active_commissions = 'artist_dashboard_active_commissions';
+  static const artist_dashboard_advertise = 'artist_dashboard_advertise';
+  static const artist_dashboard_analytics = 'artist_dashboard_analytics';
+  static const artist_dashboard_analytics_overview = 'artist_dashboard_analytics_overview';
+  static const artist_dashboard_artworks = 'artist_dashboard_artworks';
+  static const artist_dashboard_build_community = 'artist_dashboard_build_community';
+  static const artist_dashboard_business_tools = 'artist_dashboard_business_tools';
+  static const artist_dashboard_commission_hub = 'artist_dashboard_commission_hub';
+  static const artist_dashboard_commissions = 'artist_dashboard_commissions';
+  static const artist_dashboard_earnings = 'artist_dashboard_earnings';
+  static const artist_dashboard_engage_fans = 'artist_dashboard_engage_fans';
+  static const artist_dashboard_great_progress = 'artist_dashboard_great_progress';
+  static const artist_dashboard_keep_creating = 'artist_dashboard_keep_creating';
+  static const artist_dashboard_manage_all = 'artist_dashboard_manage_all';
+  static const artist_dashboard_manage_create_connect = 'artist_dashboard_manage_create_connect';
+  static const artist_dashboard_manage_income = 'artist_dashboard_manage_income';
+  static const artist_dashboard_manage_opportunities = 'artist_dashboard_manage_opportunities';
+  static const artist_dashboard_manage_requests = 'artist_dashboard_manage_requests';
+  static const artist_dashboard_manage_your_art = 'artist_dashboard_manage_your_art';
+  static const artist_dashboard_no_artworks_yet = 'artist_dashboard_no_artworks_yet';
+  static const artist_dashboard_profile = 'artist_dashboard_profile';
+  static const artist_dashboard_profile_views = 'artist_dashboard_profile_views';
+  static const artist_dashboard_promote_work = 'artist_dashboard_promote_work';
+  static const artist_dashboard_quick_actions = 'artist_dashboard_quick_actions';
+  static const artist_dashboard_recent_activity = 'artist_dashboard_recent_activity';
+  static const artist_dashboard_sales = 'artist_dashboard_sales';
+  static const artist_dashboard_track_performance = 'artist_dashboard_track_performance';
+  static const artist_dashboard_track_revenue = 'artist_dashboard_track_revenue';
+  static const artist_dashboard_update_info = 'artist_dashboard_update_info';
+  static const artist_dashboard_upload_artwork = 'artist_dashboard_upload_artwork';
+  static const artist_dashboard_view_all = 'artist_dashboard_view_all';
+  static const artist_dashboard_views = 'artist_dashboard_views';
+  static const artist_dashboard_welcome_back = 'artist_dashboard_welcome_back';
+  static const artist_dashboard_your_artwork = 'artist_dashboard_your_artwork';
+  static const artist_dashboard_your_studio = 'artist_dashboard_your_studio';
+  static const artist_event_creation_error_error_selecting_image = 'artist_event_creation_error_error_selecting_image';
+  static const artist_event_creation_success_event_saved_successfully = 'artist_event_creation_success_event_saved_successfully';
+  static const artist_event_creation_text_create_event = 'artist_event_creation_text_create_event';
+  static const artist_event_creation_text_create_event_6 = 'artist_event_creation_text_create_event_6';
+  static const artist_event_creation_text_event = 'artist_event_creation_text_event';
+  static const artist_event_creation_text_event_4 = 'artist_event_creation_text_event_4';
+  static const artist_event_creation_text_public_event = 'artist_event_creation_text_public_event';
+  static const artist_event_creation_text_public_event_10 = 'artist_event_creation_text_public_event_10';
+  static const artist_event_creation_text_upgrade_to_pro = 'artist_event_creation_text_upgrade_to_pro';
+  static const artist_event_creation_text_upgrade_to_pro_8 = 'artist_event_creation_text_upgrade_to_pro_8';
+  static const artist_events_text_events = 'artist_events_text_events';
+  static const artist_featured_artist_error_error_loading_featured = 'artist_featured_artist_error_error_loading_featured';
+  static const artist_gallery_analytics_dashboard_text_artist = 'artist_gallery_analytics_dashboard_text_artist';
+  static const artist_gallery_analytics_dashboard_text_artist_4 = 'artist_gallery_analytics_dashboard_text_artist_4';
+  static const artist_gallery_analytics_dashboard_text_artwork_views = 'artist_gallery_analytics_dashboard_text_artwork_views';
+  static const artist_gallery_analytics_dashboard_text_artwork_views_6 = 'artist_gallery_analytics_dashboard_text_artwork_views_6';
+  static const artist_gallery_analytics_dashboard_text_commission = 'artist_gallery_analytics_dashboard_text_commission';
+  static const artist_gallery_analytics_dashboard_text_commission_12 = 'artist_gallery_analytics_dashboard_text_commission_12';
+  static const artist_gallery_analytics_dashboard_text_export_report = 'artist_gallery_analytics_dashboard_text_export_report';
+  static const artist_gallery_analytics_dashboard_text_export_report_31 = 'artist_gallery_analytics_dashboard_text_export_report_31';
+  static const artist_gallery_analytics_dashboard_text_export_report_32 = 'artist_gallery_analytics_dashboard_text_export_report_32';
+  static const artist_gallery_analytics_dashboard_text_gallery_analytics = 'artist_gallery_analytics_dashboard_text_gallery_analytics';
+  static const artist_gallery_analytics_dashboard_text_gallery_analytics_14 = 'artist_gallery_analytics_dashboard_text_gallery_analytics_14';
+  static const artist_gallery_analytics_dashboard_text_gallery_analytics_15 = 'artist_gallery_analytics_dashboard_text_gallery_analytics_15';
+  static const artist_gallery_analytics_dashboard_text_gallery_analytics_16 = 'artist_gallery_analytics_dashboard_text_gallery_analytics_16';
+  static const artist_gallery_analytics_dashboard_text_gallery_analytics_19 = 'artist_gallery_analytics_dashboard_text_gallery_analytics_19';
+  static const artist_gallery_analytics_dashboard_text_last_12_months = 'artist_gallery_analytics_dashboard_text_last_12_months';
+  static const artist_gallery_analytics_dashboard_text_last_30_days = 'artist_gallery_analytics_dashboard_text_last_30_days';
+  static const artist_gallery_analytics_dashboard_text_last_7_days = 'artist_gallery_analytics_dashboard_text_last_7_days';
+  static const artist_gallery_analytics_dashboard_text_last_90_days = 'artist_gallery_analytics_dashboard_text_last_90_days';
+  static const artist_gallery_analytics_dashboard_text_no_artist_performance = 'artist_gallery_analytics_dashboard_text_no_artist_performance';
+  static const artist_gallery_analytics_dashboard_text_no_revenue_data = 'artist_gallery_analytics_dashboard_text_no_revenue_data';
+  static const artist_gallery_analytics_dashboard_text_paid_commissions = 'artist_gallery_analytics_dashboard_text_paid_commissions';
+  static const artist_gallery_analytics_dashboard_text_paid_commissions_27 = 'artist_gallery_analytics_dashboard_text_paid_commissions_27';
+  static const artist_gallery_analytics_dashboard_text_pending_commissions = 'artist_gallery_analytics_dashboard_text_pending_commissions';
+  static const artist_gallery_analytics_dashboard_text_pending_commissions_25 = 'artist_gallery_analytics_dashboard_text_pending_commissions_25';
+  static const artist_gallery_analytics_dashboard_text_revenue = 'artist_gallery_analytics_dashboard_text_revenue';
+  static const artist_gallery_analytics_dashboard_text_revenue_10 = 'artist_gallery_analytics_dashboard_text_revenue_10';
+  static const artist_gallery_analytics_dashboard_text_sales = 'artist_gallery_analytics_dashboard_text_sales';
+  static const artist_gallery_analytics_dashboard_text_sales_8 = 'artist_gallery_analytics_dashboard_text_sales_8';
+  static const artist_gallery_analytics_dashboard_text_total_commissions = 'artist_gallery_analytics_dashboard_text_total_commissions';
+  static const artist_gallery_analytics_dashboard_text_total_commissions_29 = 'artist_gallery_analytics_dashboard_text_total_commissions_29';
+  static const artist_gallery_analytics_dashboard_text_upgrade_to_gallery = 'artist_gallery_analytics_dashboard_text_upgrade_to_gallery';
+  static const artist_gallery_analytics_dashboard_text_upgrade_to_gallery_18 = 'artist_gallery_analytics_dashboard_text_upgrade_to_gallery_18';
+  static const artist_gallery_artists_management_error_error_searching_artists = 'artist_gallery_artists_management_error_error_searching_artists';
+  static const artist_gallery_artists_management_error_failed_to_cancel = 'artist_gallery_artists_management_error_failed_to_cancel';
+  static const artist_gallery_artists_management_error_failed_to_remove = 'artist_gallery_artists_management_error_failed_to_remove';
+  static const artist_gallery_artists_management_error_failed_to_resend = 'artist_gallery_artists_management_error_failed_to_resend';
+  static const artist_gallery_artists_management_error_failed_to_send = 'artist_gallery_artists_management_error_failed_to_send';
+  static const artist_gallery_artists_management_success_artist_removed_from = 'artist_gallery_artists_management_success_artist_removed_from';
+  static const artist_gallery_artists_management_success_invitation_sent_successfully = 'artist_gallery_artists_management_success_invitation_sent_successfully';
+  static const artist_gallery_artists_management_text_cancel = 'artist_gallery_artists_management_text_cancel';
+  static const artist_gallery_artists_management_text_cancel_12 = 'artist_gallery_artists_management_text_cancel_12';
+  static const artist_gallery_artists_management_text_cancel_18 = 'artist_gallery_artists_management_text_cancel_18';
+  static const artist_gallery_artists_management_text_cancel_19 = 'artist_gallery_artists_management_text_cancel_19';
+  static const artist_gallery_artists_management_text_cancel_invitation = 'artist_gallery_artists_management_text_cancel_invitation';
+  static const artist_gallery_artists_management_text_cancel_invitation_10 = 'artist_gallery_artists_management_text_cancel_invitation_10';
+  static const artist_gallery_artists_management_text_confirm = 'artist_gallery_artists_management_text_confirm';
+  static const artist_gallery_artists_management_text_confirm_14 = 'artist_gallery_artists_management_text_confirm_14';
+  static const artist_gallery_artists_management_text_gallery_artists = 'artist_gallery_artists_management_text_gallery_artists';
+  static const artist_gallery_artists_management_text_gallery_artists_8 = 'artist_gallery_artists_management_text_gallery_artists_8';
+  static const artist_gallery_artists_management_text_invitation_cancelled = 'artist_gallery_artists_management_text_invitation_cancelled';
+  static const artist_gallery_artists_management_text_invitation_reminder_sent = 'artist_gallery_artists_management_text_invitation_reminder_sent';
+  static const artist_modern_2025_onboarding_error_error_etostring = 'artist_modern_2025_onboarding_error_error_etostring';
+  static const artist_modern_2025_onboarding_text_back = 'artist_modern_2025_onboarding_text_back';
+  static const artist_modern_2025_onboarding_text_back_6 = 'artist_modern_2025_onboarding_text_back_6';
+  static const artist_modern_2025_onboarding_text_please_select_a = 'artist_modern_2025_onboarding_text_please_select_a';
+  static const artist_modern_2025_onboarding_title_welcome_setting_up = 'artist_modern_2025_onboarding_title_welcome_setting_up';
+  static const artist_modern_2025_onboarding_title_welcome_setting_up_4 = 'artist_modern_2025_onboarding_title_welcome_setting_up_4';
+  static const artist_my_artwork_error_failed_to_delete = 'artist_my_artwork_error_failed_to_delete';
+  static const artist_my_artwork_success_artworktitle_has_been = 'artist_my_artwork_success_artworktitle_has_been';
+  static const artist_my_artwork_text_cancel = 'artist_my_artwork_text_cancel';
+  static const artist_my_artwork_text_cancel_4 = 'artist_my_artwork_text_cancel_4';
+  static const artist_my_artwork_text_delete = 'artist_my_artwork_text_delete';
+  static const artist_my_artwork_text_delete_6 = 'artist_my_artwork_text_delete_6';
+  static const artist_my_artwork_text_delete_artwork = 'artist_my_artwork_text_delete_artwork';
+  static const artist_my_artwork_text_delete_artwork_2 = 'artist_my_artwork_text_delete_artwork_2';
+  static const artist_my_artwork_text_deleting_artwork = 'artist_my_artwork_text_deleting_artwork';
+  static const artist_my_artwork_text_edit = 'artist_my_artwork_text_edit';
+  static const artist_my_artwork_text_my_artwork = 'artist_my_artwork_text_my_artwork';
+  static const artist_my_artwork_text_retry = 'artist_my_artwork_text_retry';
+  static const artist_my_artwork_text_retry_12 = 'artist_my_artwork_text_retry_12';
+  static const artist_my_artwork_text_upload = 'artist_my_artwork_text_upload';
+  static const artist_my_artwork_text_upload_17 = 'artist_my_artwork_text_upload_17';
+  static const artist_my_artwork_text_upload_18 = 'artist_my_artwork_text_upload_18';
+  static const artist_my_artwork_text_upload_artwork = 'artist_my_artwork_text_upload_artwork';
+  static const artist_my_artwork_text_upload_artwork_14 = 'artist_my_artwork_text_upload_artwork_14';
+  static const artist_my_artwork_text_upload_artwork_15 = 'artist_my_artwork_text_upload_artwork_15';
+  static const artist_payment_label_subscribe_to_gettiernamewidgettier = 'artist_payment_label_subscribe_to_gettiernamewidgettier';
+  static const artist_payment_methods_text_add_payment_method = 'artist_payment_methods_text_add_payment_method';
+  static const artist_payment_methods_text_add_payment_method_4 = 'artist_payment_methods_text_add_payment_method_4';
+  static const artist_payment_methods_text_add_payment_method_5 = 'artist_payment_methods_text_add_payment_method_5';
+  static const artist_payment_methods_text_retry = 'artist_payment_methods_text_retry';
+  static const artist_payment_methods_text_retry_2 = 'artist_payment_methods_text_retry_2';
+  static const artist_payment_methods_text_set_as_default = 'artist_payment_methods_text_set_as_default';
+  static const artist_payment_methods_text_set_as_default_7 = 'artist_payment_methods_text_set_as_default_7';
+  static const artist_payment_success_subscription_successful = 'artist_payment_success_subscription_successful';
+  static const artist_payment_success_subscription_successful_5 = 'artist_payment_success_subscription_successful_5';
+  static const artist_payment_text_cancel = 'artist_payment_text_cancel';
+  static const artist_payment_text_cancel_3 = 'artist_payment_text_cancel_3';
+  static const artist_refund_request_text_payment_amount = 'artist_refund_request_text_payment_amount';
+  static const artist_refund_request_text_payment_amount_5 = 'artist_refund_request_text_payment_amount_5';
+  static const artist_refund_request_text_payment_id = 'artist_refund_request_text_payment_id';
+  static const artist_refund_request_text_payment_id_7 = 'artist_refund_request_text_payment_id_7';
+  static const artist_refund_request_text_refund_request_submitted = 'artist_refund_request_text_refund_request_submitted';
+  static const artist_refund_request_text_refund_request_submitted_2 = 'artist_refund_request_text_refund_request_submitted_2';
+  static const artist_refund_request_text_request_refund = 'artist_refund_request_text_request_refund';
+  static const artist_refund_request_text_submit_refund_request = 'artist_refund_request_text_submit_refund_request';
+  static const artist_refund_request_text_submit_refund_request_9 = 'artist_refund_request_text_submit_refund_request_9';
+  static const artist_subscription_analytics_error_error_loading_analytics = 'artist_subscription_analytics_error_error_loading_analytics';
+  static const artist_subscription_analytics_text_all_time = 'artist_subscription_analytics_text_all_time';
+  static const artist_subscription_analytics_text_last_30_days = 'artist_subscription_analytics_text_last_30_days';
+  static const artist_subscription_analytics_text_last_90_days = 'artist_subscription_analytics_text_last_90_days';
+  static const artist_subscription_analytics_text_manage_subscription = 'artist_subscription_analytics_text_manage_subscription';
+  static const artist_subscription_analytics_text_manage_subscription_12 = 'artist_subscription_analytics_text_manage_subscription_12';
+  static const artist_subscription_analytics_text_no_data_available = 'artist_subscription_analytics_text_no_data_available';
+  static const artist_subscription_analytics_text_no_data_available_14 = 'artist_subscription_analytics_text_no_data_available_14';
+  static const artist_subscription_analytics_text_subscription_analytics = 'artist_subscription_analytics_text_subscription_analytics';
+  static const artist_subscription_analytics_text_subscription_analytics_3 = 'artist_subscription_analytics_text_subscription_analytics_3';
+  static const artist_subscription_analytics_text_subscription_analytics_6 = 'artist_subscription_analytics_text_subscription_analytics_6';
+  static const artist_subscription_analytics_text_this_year = 'artist_subscription_analytics_text_this_year';
+  static const artist_subscription_analytics_text_upgrade_to_pro = 'artist_subscription_analytics_text_upgrade_to_pro';
+  static const artist_subscription_analytics_text_upgrade_to_pro_5 = 'artist_subscription_analytics_text_upgrade_to_pro_5';
+  static const artist_verified_artist_error_error_loading_verified = 'artist_verified_artist_error_error_loading_verified';
+  static const artist_verified_artist_text_apply = 'artist_verified_artist_text_apply';
+  static const artist_verified_artist_text_apply_16 = 'artist_verified_artist_text_apply_16';
+  static const artist_verified_artist_text_artistmediumslength_2 = 'artist_verified_artist_text_artistmediumslength_2';
+  static const artist_verified_artist_text_artistmediumslength_2_10 = 'artist_verified_artist_text_artistmediumslength_2_10';
+  static const artist_verified_artist_text_cancel = 'artist_verified_artist_text_cancel';
+  static const artist_verified_artist_text_cancel_14 = 'artist_verified_artist_text_cancel_14';
+  static const artist_verified_artist_text_filter_verified_artists = 'artist_verified_artist_text_filter_verified_artists';
+  static const artist_verified_artist_text_filter_verified_artists_12 = 'artist_verified_artist_text_filter_verified_artists_12';
+  static const artist_verified_artist_text_gallery = 'artist_verified_artist_text_gallery';
+  static const artist_verified_artist_text_gallery_7 = 'artist_verified_artist_text_gallery_7';
+  static const artist_verified_artist_text_gallery_8 = 'artist_verified_artist_text_gallery_8';
+  static const artist_verified_artist_text_medium_selectedmedium = 'artist_verified_artist_text_medium_selectedmedium';
+  static const artist_verified_artist_text_medium_selectedmedium_3 = 'artist_verified_artist_text_medium_selectedmedium_3';
+  static const artist_verified_artist_text_style_selectedstyle = 'artist_verified_artist_text_style_selectedstyle';
+  static const artist_verified_artist_text_style_selectedstyle_5 = 'artist_verified_artist_text_style_selectedstyle_5';
+
+  // artwork (127 keys)
+  static const artwork_analytics_action_breakdown = 'artwork_analytics_action_breakdown';
+  static const artwork_analytics_avg_engagement = 'artwork_analytics_avg_engagement';
+  static const artwork_analytics_avg_per_sale = 'artwork_analytics_avg_per_sale';
+  static const artwork_analytics_avg_results = 'artwork_analytics_avg_results';
+  static const artwork_analytics_avg_sale = 'artwork_analytics_avg_sale';
+  static const artwork_analytics_conversion_rate = 'artwork_analytics_conversion_rate';
+  static const artwork_analytics_copy_data = 'artwork_analytics_copy_data';
+  static const artwork_analytics_cross_package = 'artwork_analytics_cross_package';
+  static const artwork_analytics_dashboard_title = 'artwork_analytics_dashboard_title';
+  static const artwork_analytics_data_copied = 'artwork_analytics_data_copied';
+  static const artwork_analytics_engagement_revenue = 'artwork_analytics_engagement_revenue';
+  static const artwork_analytics_export_button = 'artwork_analytics_export_button';
+  static const artwork_analytics_export_error = 'artwork_analytics_export_error';
+  static const artwork_analytics_export_info = 'artwork_analytics_export_info';
+  static const artwork_analytics_exported = 'artwork_analytics_exported';
+  static const artwork_analytics_insights_conversion = 'artwork_analytics_insights_conversion';
+  static const artwork_analytics_insights_engagement = 'artwork_analytics_insights_engagement';
+  static const artwork_analytics_no_data = 'artwork_analytics_no_data';
+  static const artwork_analytics_performance_insights = 'artwork_analytics_performance_insights';
+  static const artwork_analytics_performance_optimization = 'artwork_analytics_performance_optimization';
+  static const artwork_analytics_revenue_section = 'artwork_analytics_revenue_section';
+  static const artwork_analytics_search_section = 'artwork_analytics_search_section';
+  static const artwork_analytics_title = 'artwork_analytics_title';
+  static const artwork_analytics_top_artworks = 'artwork_analytics_top_artworks';
+  static const artwork_analytics_top_queries = 'artwork_analytics_top_queries';
+  static const artwork_analytics_total_analytics = 'artwork_analytics_total_analytics';
+  static const artwork_analytics_total_engagement = 'artwork_analytics_total_engagement';
+  static const artwork_analytics_total_revenue = 'artwork_analytics_total_revenue';
+  static const artwork_analytics_total_sales = 'artwork_analytics_total_sales';
+  static const artwork_analytics_total_searches = 'artwork_analytics_total_searches';
+  static const artwork_analytics_total_views = 'artwork_analytics_total_views';
+  static const artwork_analytics_unique_queries = 'artwork_analytics_unique_queries';
+  static const artwork_analytics_views_engagement = 'artwork_analytics_views_engagement';
+  static const artwork_browse_title = 'artwork_browse_title';
+  static const artwork_close_button = 'artwork_close_button';
+  static const artwork_delete_failed = 'artwork_delete_failed';
+  static const artwork_deleted_success = 'artwork_deleted_success';
+  static const artwork_description_label = 'artwork_description_label';
+  static const artwork_detail_not_found = 'artwork_detail_not_found';
+  static const artwork_detail_title = 'artwork_detail_title';
+  static const artwork_dimensions_label = 'artwork_dimensions_label';
+  static const artwork_discover_error = 'artwork_discover_error';
+  static const artwork_discover_loading = 'artwork_discover_loading';
+  static const artwork_discovery_title = 'artwork_discovery_title';
+  static const artwork_edit_additional_details = 'artwork_edit_additional_details';
+  static const artwork_edit_basic_info = 'artwork_edit_basic_info';
+  static const artwork_edit_change_image = 'artwork_edit_change_image';
+  static const artwork_edit_delete_button = 'artwork_edit_delete_button';
+  static const artwork_edit_delete_cancel = 'artwork_edit_delete_cancel';
+  static const artwork_edit_delete_confirm_button = 'artwork_edit_delete_confirm_button';
+  static const artwork_edit_delete_confirm_message = 'artwork_edit_delete_confirm_message';
+  static const artwork_edit_delete_confirm_title = 'artwork_edit_delete_confirm_title';
+  static const artwork_edit_delete_error = 'artwork_edit_delete_error';
+  static const artwork_edit_delete_success = 'artwork_edit_delete_success';
+  static const artwork_edit_description_error = 'artwork_edit_description_error';
+  static const artwork_edit_description_label = 'artwork_edit_description_label';
+  static const artwork_edit_dimensions_hint = 'artwork_edit_dimensions_hint';
+  static const artwork_edit_dimensions_label = 'artwork_edit_dimensions_label';
+  static const artwork_edit_error_loading = 'artwork_edit_error_loading';
+  static const artwork_edit_error_picking_image = 'artwork_edit_error_picking_image';
+  static const artwork_edit_error_saving = 'artwork_edit_error_saving';
+  static const artwork_edit_for_sale = 'artwork_edit_for_sale';
+  static const artwork_edit_image_label = 'artwork_edit_image_label';
+  static const artwork_edit_location_hint = 'artwork_edit_location_hint';
+  static const artwork_edit_location_label = 'artwork_edit_location_label';
+  static const artwork_edit_materials_hint = 'artwork_edit_materials_hint';
+  static const artwork_edit_materials_label = 'artwork_edit_materials_label';
+  static const artwork_edit_medium_error = 'artwork_edit_medium_error';
+  static const artwork_edit_medium_label = 'artwork_edit_medium_label';
+  static const artwork_edit_medium_styles = 'artwork_edit_medium_styles';
+  static const artwork_edit_not_found = 'artwork_edit_not_found';
+  static const artwork_edit_price_error_invalid = 'artwork_edit_price_error_invalid';
+  static const artwork_edit_price_error_required = 'artwork_edit_price_error_required';
+  static const artwork_edit_price_label = 'artwork_edit_price_label';
+  static const artwork_edit_privacy = 'artwork_edit_privacy';
+  static const artwork_edit_public_artwork = 'artwork_edit_public_artwork';
+  static const artwork_edit_public_subtitle = 'artwork_edit_public_subtitle';
+  static const artwork_edit_sale_info = 'artwork_edit_sale_info';
+  static const artwork_edit_save_button = 'artwork_edit_save_button';
+  static const artwork_edit_save_success = 'artwork_edit_save_success';
+  static const artwork_edit_styles_label = 'artwork_edit_styles_label';
+  static const artwork_edit_tags_hint = 'artwork_edit_tags_hint';
+  static const artwork_edit_tags_input = 'artwork_edit_tags_input';
+  static const artwork_edit_tags_label = 'artwork_edit_tags_label';
+  static const artwork_edit_title = 'artwork_edit_title';
+  static const artwork_edit_title_error = 'artwork_edit_title_error';
+  static const artwork_edit_title_label = 'artwork_edit_title_label';
+  static const artwork_edit_year_error = 'artwork_edit_year_error';
+  static const artwork_edit_year_label = 'artwork_edit_year_label';
+  static const artwork_enter_search_name = 'artwork_enter_search_name';
+  static const artwork_error_loading = 'artwork_error_loading';
+  static const artwork_error_prefix = 'artwork_error_prefix';
+  static const artwork_filter_date_range = 'artwork_filter_date_range';
+  static const artwork_filter_featured = 'artwork_filter_featured';
+  static const artwork_filter_for_sale = 'artwork_filter_for_sale';
+  static const artwork_filter_location = 'artwork_filter_location';
+  static const artwork_filter_medium = 'artwork_filter_medium';
+  static const artwork_filter_price_range = 'artwork_filter_price_range';
+  static const artwork_filters = 'artwork_filters';
+  static const artwork_for_sale = 'artwork_for_sale';
+  static const artwork_location_label = 'artwork_location_label';
+  static const artwork_materials_label = 'artwork_materials_label';
+  static const artwork_medium_label = 'artwork_medium_label';
+  static const artwork_my_artwork = 'artwork_my_artwork';
+  static const artwork_no_artwork = 'artwork_no_artwork';
+  static const artwork_no_results = 'artwork_no_results';
+  static const artwork_personalized_tab = 'artwork_personalized_tab';
+  static const artwork_popular_searches = 'artwork_popular_searches';
+  static const artwork_price_label = 'artwork_price_label';
+  static const artwork_retry_button = 'artwork_retry_button';
+  static const artwork_save_search = 'artwork_save_search';
+  static const artwork_saved_searches = 'artwork_saved_searches';
+  static const artwork_search_error = 'artwork_search_error';
+  static const artwork_search_filters = 'artwork_search_filters';
+  static const artwork_search_hint = 'artwork_search_hint';
+  static const artwork_search_hint_advanced = 'artwork_search_hint_advanced';
+  static const artwork_search_save_failed = 'artwork_search_save_failed';
+  static const artwork_search_saved = 'artwork_search_saved';
+  static const artwork_search_title = 'artwork_search_title';
+  static const artwork_similar_tab = 'artwork_similar_tab';
+  static const artwork_style_label = 'artwork_style_label';
+  static const artwork_title_label = 'artwork_title_label';
+  static const artwork_trending_tab = 'artwork_trending_tab';
+  static const artwork_upload_artwork = 'artwork_upload_artwork';
+  static const artwork_upload_button = 'artwork_upload_button';
+  static const artwork_upload_title = 'artwork_upload_title';
+  static const artwork_year_label = 'artwork_year_label';
+
+  // auth (85 keys)
+  static const auth_already_have_account = 'auth_already_have_account';
+  static const auth_confirm_password = 'auth_confirm_password';
+  static const auth_create_account = 'auth_create_account';
+  static const auth_dont_have_account = 'auth_dont_have_account';
+  static const auth_email = 'auth_email';
+  static const auth_email_verification_cancel = 'auth_email_verification_cancel';
+  static const auth_email_verification_error_too_many_requests = 'auth_email_verification_error_too_many_requests';
+  static const auth_email_verification_error_unexpected = 'auth_email_verification_error_unexpected';
+  static const auth_email_verification_error_user_disabled = 'auth_email_verification_error_user_disabled';
+  static const auth_email_verification_error_user_not_found = 'auth_email_verification_error_user_not_found';
+  static const auth_email_verification_help_text = 'auth_email_verification_help_text';
+  static const auth_email_verification_instructions = 'auth_email_verification_instructions';
+  static const auth_email_verification_resend_button = 'auth_email_verification_resend_button';
+  static const auth_email_verification_resend_cooldown = 'auth_email_verification_resend_cooldown';
+  static const auth_email_verification_sent_to = 'auth_email_verification_sent_to';
+  static const auth_email_verification_skip = 'auth_email_verification_skip';
+  static const auth_email_verification_skip_desc = 'auth_email_verification_skip_desc';
+  static const auth_email_verification_skip_now = 'auth_email_verification_skip_now';
+  static const auth_email_verification_skip_title = 'auth_email_verification_skip_title';
+  static const auth_email_verification_success = 'auth_email_verification_success';
+  static const auth_email_verification_title = 'auth_email_verification_title';
+  static const auth_email_verification_verify_title = 'auth_email_verification_verify_title';
+  static const auth_error_email_required = 'auth_error_email_required';
+  static const auth_error_invalid_email = 'auth_error_invalid_email';
+  static const auth_error_password_required = 'auth_error_password_required';
+  static const auth_error_user_not_found = 'auth_error_user_not_found';
+  static const auth_error_weak_password = 'auth_error_weak_password';
+  static const auth_error_wrong_password = 'auth_error_wrong_password';
+  static const auth_forgot_password = 'auth_forgot_password';
+  static const auth_forgot_password_back_to_login = 'auth_forgot_password_back_to_login';
+  static const auth_forgot_password_button = 'auth_forgot_password_button';
+  static const auth_forgot_password_email = 'auth_forgot_password_email';
+  static const auth_forgot_password_email_invalid = 'auth_forgot_password_email_invalid';
+  static const auth_forgot_password_email_required = 'auth_forgot_password_email_required';
+  static const auth_forgot_password_error_failed = 'auth_forgot_password_error_failed';
+  static const auth_forgot_password_error_invalid_email = 'auth_forgot_password_error_invalid_email';
+  static const auth_forgot_password_error_user_not_found = 'auth_forgot_password_error_user_not_found';
+  static const auth_forgot_password_reset_sent = 'auth_forgot_password_reset_sent';
+  static const auth_forgot_password_subtitle = 'auth_forgot_password_subtitle';
+  static const auth_forgot_password_title = 'auth_forgot_password_title';
+  static const auth_password = 'auth_password';
+  static const auth_prompt_browse = 'auth_prompt_browse';
+  static const auth_prompt_login = 'auth_prompt_login';
+  static const auth_prompt_no_account = 'auth_prompt_no_account';
+  static const auth_register_agree_prefix = 'auth_register_agree_prefix';
+  static const auth_register_and = 'auth_register_and';
+  static const auth_register_button = 'auth_register_button';
+  static const auth_register_confirm_password = 'auth_register_confirm_password';
+  static const auth_register_confirm_password_required = 'auth_register_confirm_password_required';
+  static const auth_register_email = 'auth_register_email';
+  static const auth_register_email_invalid = 'auth_register_email_invalid';
+  static const auth_register_email_required = 'auth_register_email_required';
+  static const auth_register_error_agree_terms = 'auth_register_error_agree_terms';
+  static const auth_register_error_email_exists = 'auth_register_error_email_exists';
+  static const auth_register_error_failed = 'auth_register_error_failed';
+  static const auth_register_error_invalid_email = 'auth_register_error_invalid_email';
+  static const auth_register_error_unexpected = 'auth_register_error_unexpected';
+  static const auth_register_error_weak_password = 'auth_register_error_weak_password';
+  static const auth_register_first_name = 'auth_register_first_name';
+  static const auth_register_first_name_required = 'auth_register_first_name_required';
+  static const auth_register_last_name = 'auth_register_last_name';
+  static const auth_register_last_name_required = 'auth_register_last_name_required';
+  static const auth_register_login_link = 'auth_register_login_link';
+  static const auth_register_password = 'auth_register_password';
+  static const auth_register_password_min_length = 'auth_register_password_min_length';
+  static const auth_register_password_required = 'auth_register_password_required';
+  static const auth_register_passwords_mismatch = 'auth_register_passwords_mismatch';
+  static const auth_register_privacy_link = 'auth_register_privacy_link';
+  static const auth_register_privacy_title = 'auth_register_privacy_title';
+  static const auth_register_subtitle = 'auth_register_subtitle';
+  static const auth_register_terms_link = 'auth_register_terms_link';
+  static const auth_register_terms_title = 'auth_register_terms_title';
+  static const auth_register_title = 'auth_register_title';
+  static const auth_required_button = 'auth_required_button';
+  static const auth_required_feature_message = 'auth_required_feature_message';
+  static const auth_required_message = 'auth_required_message';
+  static const auth_required_title = 'auth_required_title';
+  static const auth_reset_password = 'auth_reset_password';
+  static const auth_sign_in = 'auth_sign_in';
+  static const auth_sign_in_continue = 'auth_sign_in_continue';
+  static const auth_sign_in_with_apple = 'auth_sign_in_with_apple';
+  static const auth_sign_in_with_google = 'auth_sign_in_with_google';
+  static const auth_sign_out = 'auth_sign_out';
+  static const auth_sign_up = 'auth_sign_up';
+  static const auth_welcome = 'auth_welcome';
+
+  // capture (234 keys)
+  static const capture_admin_content_moderation_error_error_loading_captures = 'capture_admin_content_moderation_error_error_loading_captures';
+  static const capture_admin_content_moderation_error_error_loading_captures_2 = 'capture_admin_content_moderation_error_error_loading_captures_2';
+  static const capture_admin_content_moderation_error_failed_to_approve = 'capture_admin_content_moderation_error_failed_to_approve';
+  static const capture_admin_content_moderation_error_failed_to_clear = 'capture_admin_content_moderation_error_failed_to_clear';
+  static const capture_admin_content_moderation_error_failed_to_delete = 'capture_admin_content_moderation_error_failed_to_delete';
+  static const capture_admin_content_moderation_error_failed_to_reject = 'capture_admin_content_moderation_error_failed_to_reject';
+  static const capture_admin_content_moderation_hint_type_capturearttype = 'capture_admin_content_moderation_hint_type_capturearttype';
+  static const capture_admin_content_moderation_label_artist_captureartistname = 'capture_admin_content_moderation_label_artist_captureartistname';
+  static const capture_admin_content_moderation_success_capture_approved_successfully = 'capture_admin_content_moderation_success_capture_approved_successfully';
+  static const capture_admin_content_moderation_success_reports_cleared_successfully = 'capture_admin_content_moderation_success_reports_cleared_successfully';
+  static const capture_admin_content_moderation_text_approve = 'capture_admin_content_moderation_text_approve';
+  static const capture_admin_content_moderation_text_approve_10 = 'capture_admin_content_moderation_text_approve_10';
+  static const capture_admin_content_moderation_text_approve_capture = 'capture_admin_content_moderation_text_approve_capture';
+  static const capture_admin_content_moderation_text_approve_capture_4 = 'capture_admin_content_moderation_text_approve_capture_4';
+  static const capture_admin_content_moderation_text_approved = 'capture_admin_content_moderation_text_approved';
+  static const capture_admin_content_moderation_text_approved_43 = 'capture_admin_content_moderation_text_approved_43';
+  static const capture_admin_content_moderation_text_are_you_sure = 'capture_admin_content_moderation_text_are_you_sure';
+  static const capture_admin_content_moderation_text_are_you_sure_15 = 'capture_admin_content_moderation_text_are_you_sure_15';
+  static const capture_admin_content_moderation_text_are_you_sure_16 = 'capture_admin_content_moderation_text_are_you_sure_16';
+  static const capture_admin_content_moderation_text_are_you_sure_6 = 'capture_admin_content_moderation_text_are_you_sure_6';
+  static const capture_admin_content_moderation_text_cancel = 'capture_admin_content_moderation_text_cancel';
+  static const capture_admin_content_moderation_text_cancel_17 = 'capture_admin_content_moderation_text_cancel_17';
+  static const capture_admin_content_moderation_text_cancel_18 = 'capture_admin_content_moderation_text_cancel_18';
+  static const capture_admin_content_moderation_text_cancel_25 = 'capture_admin_content_moderation_text_cancel_25';
+  static const capture_admin_content_moderation_text_cancel_26 = 'capture_admin_content_moderation_text_cancel_26';
+  static const capture_admin_content_moderation_text_cancel_33 = 'capture_admin_content_moderation_text_cancel_33';
+  static const capture_admin_content_moderation_text_cancel_34 = 'capture_admin_content_moderation_text_cancel_34';
+  static const capture_admin_content_moderation_text_cancel_8 = 'capture_admin_content_moderation_text_cancel_8';
+  static const capture_admin_content_moderation_text_capture_deleted_permanently = 'capture_admin_content_moderation_text_capture_deleted_permanently';
+  static const capture_admin_content_moderation_text_capture_rejected = 'capture_admin_content_moderation_text_capture_rejected';
+  static const capture_admin_content_moderation_text_clear_reports = 'capture_admin_content_moderation_text_clear_reports';
+  static const capture_admin_content_moderation_text_clear_reports_32 = 'capture_admin_content_moderation_text_clear_reports_32';
+  static const capture_admin_content_moderation_text_clear_reports_35 = 'capture_admin_content_moderation_text_clear_reports_35';
+  static const capture_admin_content_moderation_text_clear_reports_36 = 'capture_admin_content_moderation_text_clear_reports_36';
+  static const capture_admin_content_moderation_text_content_moderation = 'capture_admin_content_moderation_text_content_moderation';
+  static const capture_admin_content_moderation_text_delete = 'capture_admin_content_moderation_text_delete';
+  static const capture_admin_content_moderation_text_delete_28 = 'capture_admin_content_moderation_text_delete_28';
+  static const capture_admin_content_moderation_text_delete_capture = 'capture_admin_content_moderation_text_delete_capture';
+  static const capture_admin_content_moderation_text_delete_capture_24 = 'capture_admin_content_moderation_text_delete_capture_24';
+  static const capture_admin_content_moderation_text_pending = 'capture_admin_content_moderation_text_pending';
+  static const capture_admin_content_moderation_text_pending_41 = 'capture_admin_content_moderation_text_pending_41';
+  static const capture_admin_content_moderation_text_reject = 'capture_admin_content_moderation_text_reject';
+  static const capture_admin_content_moderation_text_reject_20 = 'capture_admin_content_moderation_text_reject_20';
+  static const capture_admin_content_moderation_text_reject_capture = 'capture_admin_content_moderation_text_reject_capture';
+  static const capture_admin_content_moderation_text_reject_capture_14 = 'capture_admin_content_moderation_text_reject_capture_14';
+  static const capture_admin_content_moderation_text_rejected = 'capture_admin_content_moderation_text_rejected';
+  static const capture_admin_content_moderation_text_rejected_45 = 'capture_admin_content_moderation_text_rejected_45';
+  static const capture_admin_content_moderation_text_reported = 'capture_admin_content_moderation_text_reported';
+  static const capture_admin_content_moderation_text_reported_47 = 'capture_admin_content_moderation_text_reported_47';
+  static const capture_album = 'capture_album';
+  static const capture_capture_detail_text_capture_details = 'capture_capture_detail_text_capture_details';
+  static const capture_capture_detail_text_capture_details_2 = 'capture_capture_detail_text_capture_details_2';
+  static const capture_capture_detail_text_save_capture = 'capture_capture_detail_text_save_capture';
+  static const capture_capture_detail_text_save_capture_4 = 'capture_capture_detail_text_save_capture_4';
+  static const capture_capture_detail_viewer_error_failed_to_delete = 'capture_capture_detail_viewer_error_failed_to_delete';
+  static const capture_capture_detail_viewer_success_capture_deleted_successfully = 'capture_capture_detail_viewer_success_capture_deleted_successfully';
+  static const capture_capture_detail_viewer_text_are_you_sure = 'capture_capture_detail_viewer_text_are_you_sure';
+  static const capture_capture_detail_viewer_text_are_you_sure_4 = 'capture_capture_detail_viewer_text_are_you_sure_4';
+  static const capture_capture_detail_viewer_text_cancel = 'capture_capture_detail_viewer_text_cancel';
+  static const capture_capture_detail_viewer_text_cancel_6 = 'capture_capture_detail_viewer_text_cancel_6';
+  static const capture_capture_detail_viewer_text_delete = 'capture_capture_detail_viewer_text_delete';
+  static const capture_capture_detail_viewer_text_delete_8 = 'capture_capture_detail_viewer_text_delete_8';
+  static const capture_capture_detail_viewer_text_delete_capture = 'capture_capture_detail_viewer_text_delete_capture';
+  static const capture_capture_detail_viewer_text_delete_capture_2 = 'capture_capture_detail_viewer_text_delete_capture_2';
+  static const capture_capture_detail_viewer_text_no_capture_found = 'capture_capture_detail_viewer_text_no_capture_found';
+  static const capture_capture_detail_viewer_text_retry = 'capture_capture_detail_viewer_text_retry';
+  static const capture_capture_detail_viewer_text_retry_12 = 'capture_capture_detail_viewer_text_retry_12';
+  static const capture_capture_edit_error_error_etostring = 'capture_capture_edit_error_error_etostring';
+  static const capture_capture_edit_error_failed_to_update = 'capture_capture_edit_error_failed_to_update';
+  static const capture_capture_edit_success_capture_updated_successfully = 'capture_capture_edit_success_capture_updated_successfully';
+  static const capture_capture_edit_text_cancel = 'capture_capture_edit_text_cancel';
+  static const capture_capture_edit_text_cancel_7 = 'capture_capture_edit_text_cancel_7';
+  static const capture_capture_edit_text_edit_capture = 'capture_capture_edit_text_edit_capture';
+  static const capture_capture_edit_text_edit_capture_5 = 'capture_capture_edit_text_edit_capture_5';
+  static const capture_capture_upload_button_gesturedetector_was_tapped = 'capture_capture_upload_button_gesturedetector_was_tapped';
+  static const capture_capture_upload_error_failed_to_get = 'capture_capture_upload_error_failed_to_get';
+  static const capture_capture_upload_text_art_captured = 'capture_capture_upload_text_art_captured';
+  static const capture_capture_upload_text_art_captured_5 = 'capture_capture_upload_text_art_captured_5';
+  static const capture_capture_upload_text_create_art_walk = 'capture_capture_upload_text_create_art_walk';
+  static const capture_capture_upload_text_create_art_walk_10 = 'capture_capture_upload_text_create_art_walk_10';
+  static const capture_capture_upload_text_create_art_walk_9 = 'capture_capture_upload_text_create_art_walk_9';
+  static const capture_capture_upload_text_go_to_dashboard = 'capture_capture_upload_text_go_to_dashboard';
+  static const capture_capture_upload_text_go_to_dashboard_7 = 'capture_capture_upload_text_go_to_dashboard_7';
+  static const capture_capture_upload_text_location_permissions_are = 'capture_capture_upload_text_location_permissions_are';
+  static const capture_capture_upload_text_location_services_are = 'capture_capture_upload_text_location_services_are';
+  static const capture_capture_upload_text_please_accept_the = 'capture_capture_upload_text_please_accept_the';
+  static const capture_capture_upload_text_public_art_disclaimer = 'capture_capture_upload_text_public_art_disclaimer';
+  static const capture_capture_upload_text_public_art_disclaimer_16 = 'capture_capture_upload_text_public_art_disclaimer_16';
+  static const capture_capture_upload_text_submit = 'capture_capture_upload_text_submit';
+  static const capture_capture_upload_text_submit_14 = 'capture_capture_upload_text_submit_14';
+  static const capture_capture_upload_text_upload_capture = 'capture_capture_upload_text_upload_capture';
+  static const capture_captures_list_text_local_captures = 'capture_captures_list_text_local_captures';
+  static const capture_captures_list_text_retry = 'capture_captures_list_text_retry';
+  static const capture_captures_list_text_retry_3 = 'capture_captures_list_text_retry_3';
+  static const capture_dashboard_button_explore = 'capture_dashboard_button_explore';
+  static const capture_dashboard_discover_document = 'capture_dashboard_discover_document';
+  static const capture_dashboard_find_art = 'capture_dashboard_find_art';
+  static const capture_dashboard_find_artists = 'capture_dashboard_find_artists';
+  static const capture_dashboard_find_artists_subtitle = 'capture_dashboard_find_artists_subtitle';
+  static const capture_dashboard_label_community_pulse = 'capture_dashboard_label_community_pulse';
+  static const capture_dashboard_label_trending_location = 'capture_dashboard_label_trending_location';
+  static const capture_dashboard_label_xp = 'capture_dashboard_label_xp';
+  static const capture_dashboard_mission_community_scout_desc = 'capture_dashboard_mission_community_scout_desc';
+  static const capture_dashboard_mission_community_scout_title = 'capture_dashboard_mission_community_scout_title';
+  static const capture_dashboard_mission_daily_drop_desc = 'capture_dashboard_mission_daily_drop_desc';
+  static const capture_dashboard_mission_daily_drop_title = 'capture_dashboard_mission_daily_drop_title';
+  static const capture_dashboard_mission_map_block_desc = 'capture_dashboard_mission_map_block_desc';
+  static const capture_dashboard_mission_map_block_title = 'capture_dashboard_mission_map_block_title';
+  static const capture_dashboard_nearby_art = 'capture_dashboard_nearby_art';
+  static const capture_dashboard_nearby_art_subtitle = 'capture_dashboard_nearby_art_subtitle';
+  static const capture_dashboard_popular_captures = 'capture_dashboard_popular_captures';
+  static const capture_dashboard_popular_captures_subtitle = 'capture_dashboard_popular_captures_subtitle';
+  static const capture_dashboard_quick_capture_now_subtitle = 'capture_dashboard_quick_capture_now_subtitle';
+  static const capture_dashboard_quick_capture_now_title = 'capture_dashboard_quick_capture_now_title';
+  static const capture_dashboard_quick_community_heat_subtitle = 'capture_dashboard_quick_community_heat_subtitle';
+  static const capture_dashboard_quick_community_heat_title = 'capture_dashboard_quick_community_heat_title';
+  static const capture_dashboard_quick_guidelines_subtitle = 'capture_dashboard_quick_guidelines_subtitle';
+  static const capture_dashboard_quick_guidelines_title = 'capture_dashboard_quick_guidelines_title';
+  static const capture_dashboard_quick_my_drops_subtitle = 'capture_dashboard_quick_my_drops_subtitle';
+  static const capture_dashboard_quick_my_drops_title = 'capture_dashboard_quick_my_drops_title';
+  static const capture_dashboard_ready_capture = 'capture_dashboard_ready_capture';
+  static const capture_dashboard_search_captures = 'capture_dashboard_search_captures';
+  static const capture_dashboard_search_captures_subtitle = 'capture_dashboard_search_captures_subtitle';
+  static const capture_dashboard_section_inspiration_subtitle = 'capture_dashboard_section_inspiration_subtitle';
+  static const capture_dashboard_section_inspiration_title = 'capture_dashboard_section_inspiration_title';
+  static const capture_dashboard_section_quest_tracker_subtitle = 'capture_dashboard_section_quest_tracker_subtitle';
+  static const capture_dashboard_section_quest_tracker_title = 'capture_dashboard_section_quest_tracker_title';
+  static const capture_dashboard_section_recent_loot_subtitle = 'capture_dashboard_section_recent_loot_subtitle';
+  static const capture_dashboard_section_recent_loot_title = 'capture_dashboard_section_recent_loot_title';
+  static const capture_dashboard_start_capture = 'capture_dashboard_start_capture';
+  static const capture_dashboard_stat_active_hunters = 'capture_dashboard_stat_active_hunters';
+  static const capture_dashboard_stat_captures = 'capture_dashboard_stat_captures';
+  static const capture_dashboard_stat_community_views = 'capture_dashboard_stat_community_views';
+  static const capture_dashboard_stat_community_xp_label = 'capture_dashboard_stat_community_xp_label';
+  static const capture_dashboard_stat_new_drops = 'capture_dashboard_stat_new_drops';
+  static const capture_dashboard_stat_total_xp_label = 'capture_dashboard_stat_total_xp_label';
+  static const capture_dashboard_stat_xp_shared = 'capture_dashboard_stat_xp_shared';
+  static const capture_dashboard_subtitle_capture = 'capture_dashboard_subtitle_capture';
+  static const capture_dashboard_tag_primary_quest = 'capture_dashboard_tag_primary_quest';
+  static const capture_dashboard_tag_spotted = 'capture_dashboard_tag_spotted';
+  static const capture_dashboard_title_capture = 'capture_dashboard_title_capture';
+  static const capture_dashboard_unknown_artist = 'capture_dashboard_unknown_artist';
+  static const capture_detail_status = 'capture_detail_status';
+  static const capture_detail_submitted_on = 'capture_detail_submitted_on';
+  static const capture_detail_subtitle = 'capture_detail_subtitle';
+  static const capture_detail_title = 'capture_detail_title';
+  static const capture_detail_viewer_default_title = 'capture_detail_viewer_default_title';
+  static const capture_detail_xp_awarded = 'capture_detail_xp_awarded';
+  static const capture_drawer_approved_captures = 'capture_drawer_approved_captures';
+  static const capture_drawer_art_capture = 'capture_drawer_art_capture';
+  static const capture_drawer_art_walk = 'capture_drawer_art_walk';
+  static const capture_drawer_browse_captures = 'capture_drawer_browse_captures';
+  static const capture_drawer_capture_map = 'capture_drawer_capture_map';
+  static const capture_drawer_capture_settings = 'capture_drawer_capture_settings';
+  static const capture_drawer_community = 'capture_drawer_community';
+  static const capture_drawer_main_dashboard = 'capture_drawer_main_dashboard';
+  static const capture_drawer_my_captures = 'capture_drawer_my_captures';
+  static const capture_drawer_my_captures_item = 'capture_drawer_my_captures_item';
+  static const capture_drawer_navigation = 'capture_drawer_navigation';
+  static const capture_drawer_nearby_art = 'capture_drawer_nearby_art';
+  static const capture_drawer_pending_review = 'capture_drawer_pending_review';
+  static const capture_drawer_popular_captures = 'capture_drawer_popular_captures';
+  static const capture_drawer_profile = 'capture_drawer_profile';
+  static const capture_drawer_public_captures = 'capture_drawer_public_captures';
+  static const capture_drawer_quick_actions = 'capture_drawer_quick_actions';
+  static const capture_drawer_ready_to_capture = 'capture_drawer_ready_to_capture';
+  static const capture_drawer_search_captures = 'capture_drawer_search_captures';
+  static const capture_drawer_sign_out = 'capture_drawer_sign_out';
+  static const capture_drawer_take_photo = 'capture_drawer_take_photo';
+  static const capture_drawer_tools = 'capture_drawer_tools';
+  static const capture_edit_error_generic = 'capture_edit_error_generic';
+  static const capture_edit_error_title_required = 'capture_edit_error_title_required';
+  static const capture_edit_field_description = 'capture_edit_field_description';
+  static const capture_edit_field_title = 'capture_edit_field_title';
+  static const capture_edit_save = 'capture_edit_save';
+  static const capture_edit_saving = 'capture_edit_saving';
+  static const capture_edit_subtitle = 'capture_edit_subtitle';
+  static const capture_edit_tap_replace = 'capture_edit_tap_replace';
+  static const capture_edit_title = 'capture_edit_title';
+  static const capture_enhanced_capture_dashboard_hint_find_art_captures = 'capture_enhanced_capture_dashboard_hint_find_art_captures';
+  static const capture_enhanced_capture_dashboard_hint_search_captures = 'capture_enhanced_capture_dashboard_hint_search_captures';
+  static const capture_enhanced_capture_dashboard_hint_search_for_artists = 'capture_enhanced_capture_dashboard_hint_search_for_artists';
+  static const capture_enhanced_capture_dashboard_text_art_capture = 'capture_enhanced_capture_dashboard_text_art_capture';
+  static const capture_enhanced_capture_dashboard_text_captures = 'capture_enhanced_capture_dashboard_text_captures';
+  static const capture_enhanced_capture_dashboard_text_community_views = 'capture_enhanced_capture_dashboard_text_community_views';
+  static const capture_enhanced_capture_dashboard_text_discover_art_captures = 'capture_enhanced_capture_dashboard_text_discover_art_captures';
+  static const capture_enhanced_capture_dashboard_text_find_artists = 'capture_enhanced_capture_dashboard_text_find_artists';
+  static const capture_enhanced_capture_dashboard_text_nearby_art = 'capture_enhanced_capture_dashboard_text_nearby_art';
+  static const capture_enhanced_capture_dashboard_text_popular_captures = 'capture_enhanced_capture_dashboard_text_popular_captures';
+  static const capture_enhanced_capture_dashboard_text_see_trending_art = 'capture_enhanced_capture_dashboard_text_see_trending_art';
+  static const capture_filters = 'capture_filters';
+  static const capture_library = 'capture_library';
+  static const capture_list_no_captures_nearby = 'capture_list_no_captures_nearby';
+  static const capture_list_no_captures_within_range = 'capture_list_no_captures_within_range';
+  static const capture_list_title = 'capture_list_title';
+  static const capture_my_captures_hint_clear_search = 'capture_my_captures_hint_clear_search';
+  static const capture_my_captures_hint_clear_search_8 = 'capture_my_captures_hint_clear_search_8';
+  static const capture_my_captures_no_captures_yet = 'capture_my_captures_no_captures_yet';
+  static const capture_my_captures_start_capturing_description = 'capture_my_captures_start_capturing_description';
+  static const capture_my_captures_status = 'capture_my_captures_status';
+  static const capture_my_captures_text_my_captures = 'capture_my_captures_text_my_captures';
+  static const capture_my_captures_text_retry = 'capture_my_captures_text_retry';
+  static const capture_my_captures_text_retry_3 = 'capture_my_captures_text_retry_3';
+  static const capture_my_captures_text_take_photo = 'capture_my_captures_text_take_photo';
+  static const capture_my_captures_text_take_photo_5 = 'capture_my_captures_text_take_photo_5';
+  static const capture_my_captures_text_take_photo_6 = 'capture_my_captures_text_take_photo_6';
+  static const capture_photo = 'capture_photo';
+  static const capture_screen_opening_camera = 'capture_screen_opening_camera';
+  static const capture_share = 'capture_share';
+  static const capture_submitted_done = 'capture_submitted_done';
+  static const capture_submitted_message = 'capture_submitted_message';
+  static const capture_submitted_title = 'capture_submitted_title';
+  static const capture_terms_agreement_text = 'capture_terms_agreement_text';
+  static const capture_terms_and_conditions_text_accept_continue = 'capture_terms_and_conditions_text_accept_continue';
+  static const capture_terms_and_conditions_text_accept_continue_5 = 'capture_terms_and_conditions_text_accept_continue_5';
+  static const capture_terms_and_conditions_text_accept_continue_6 = 'capture_terms_and_conditions_text_accept_continue_6';
+  static const capture_terms_and_conditions_text_cancel = 'capture_terms_and_conditions_text_cancel';
+  static const capture_terms_and_conditions_text_cancel_3 = 'capture_terms_and_conditions_text_cancel_3';
+  static const capture_terms_and_conditions_text_terms_conditions = 'capture_terms_and_conditions_text_terms_conditions';
+  static const capture_terms_before_you_capture = 'capture_terms_before_you_capture';
+  static const capture_terms_community_contribution = 'capture_terms_community_contribution';
+  static const capture_terms_community_description = 'capture_terms_community_description';
+  static const capture_terms_legal_bullets = 'capture_terms_legal_bullets';
+  static const capture_terms_legal_guidelines = 'capture_terms_legal_guidelines';
+  static const capture_terms_read_and_accept = 'capture_terms_read_and_accept';
+  static const capture_terms_safety_bullets = 'capture_terms_safety_bullets';
+  static const capture_terms_safety_guidelines = 'capture_terms_safety_guidelines';
+  static const capture_title = 'capture_title';
+  static const capture_upload = 'capture_upload';
+  static const capture_video = 'capture_video';
+  static const capture_view_edit = 'capture_view_edit';
+  static const capture_view_submit = 'capture_view_submit';
+  static const capture_view_subtitle = 'capture_view_subtitle';
+  static const capture_view_title = 'capture_view_title';
+
+  // community (68 keys)
+  static const community_artist_community_feed_error_error_loading_feed = 'community_artist_community_feed_error_error_loading_feed';
+  static const community_artist_community_feed_loading_loading_artist_feed = 'community_artist_community_feed_loading_loading_artist_feed';
+  static const community_artist_community_feed_text_load_more = 'community_artist_community_feed_text_load_more';
+  static const community_artist_community_feed_text_load_more_4 = 'community_artist_community_feed_text_load_more_4';
+  static const community_artists = 'community_artists';
+  static const community_comment = 'community_comment';
+  static const community_community_artists_text_unable_to_load = 'community_community_artists_text_unable_to_load';
+  static const community_create_post = 'community_create_post';
+  static const community_discussions = 'community_discussions';
+  static const community_drawer_admin = 'community_drawer_admin';
+  static const community_drawer_art_feed = 'community_drawer_art_feed';
+  static const community_drawer_artist = 'community_drawer_artist';
+  static const community_drawer_artist_portfolios = 'community_drawer_artist_portfolios';
+  static const community_drawer_commissions = 'community_drawer_commissions';
+  static const community_drawer_community_hub = 'community_drawer_community_hub';
+  static const community_drawer_community_member = 'community_drawer_community_member';
+  static const community_drawer_community_settings = 'community_drawer_community_settings';
+  static const community_drawer_gallery = 'community_drawer_gallery';
+  static const community_drawer_gifts = 'community_drawer_gifts';
+  static const community_drawer_loading = 'community_drawer_loading';
+  static const community_drawer_member = 'community_drawer_member';
+  static const community_drawer_moderation = 'community_drawer_moderation';
+  static const community_drawer_moderator = 'community_drawer_moderator';
+  static const community_drawer_search_community = 'community_drawer_search_community';
+  static const community_drawer_studios = 'community_drawer_studios';
+  static const community_drawer_trending = 'community_drawer_trending';
+  static const community_drawer_version = 'community_drawer_version';
+  static const community_feed = 'community_feed';
+  static const community_galleries = 'community_galleries';
+  static const community_hub_activities_filter = 'community_hub_activities_filter';
+  static const community_hub_commission_tab_active = 'community_hub_commission_tab_active';
+  static const community_hub_commission_tab_completed = 'community_hub_commission_tab_completed';
+  static const community_hub_commission_tab_pending = 'community_hub_commission_tab_pending';
+  static const community_hub_error_like = 'community_hub_error_like';
+  static const community_hub_error_loading_commissions = 'community_hub_error_loading_commissions';
+  static const community_hub_like_failed = 'community_hub_like_failed';
+  static const community_hub_like_success = 'community_hub_like_success';
+  static const community_hub_no_commissions = 'community_hub_no_commissions';
+  static const community_hub_no_posts = 'community_hub_no_posts';
+  static const community_hub_no_posts_subtitle = 'community_hub_no_posts_subtitle';
+  static const community_hub_post_action_comment = 'community_hub_post_action_comment';
+  static const community_hub_post_action_like = 'community_hub_post_action_like';
+  static const community_hub_post_action_share = 'community_hub_post_action_share';
+  static const community_hub_share_failed = 'community_hub_share_failed';
+  static const community_hub_share_intro = 'community_hub_share_intro';
+  static const community_hub_share_original = 'community_hub_share_original';
+  static const community_hub_share_success = 'community_hub_share_success';
+  static const community_hub_show_activities = 'community_hub_show_activities';
+  static const community_hub_sign_in_comment = 'community_hub_sign_in_comment';
+  static const community_hub_sign_in_like = 'community_hub_sign_in_like';
+  static const community_hub_sign_in_share = 'community_hub_sign_in_share';
+  static const community_hub_subtitle = 'community_hub_subtitle';
+  static const community_hub_tab_artists = 'community_hub_tab_artists';
+  static const community_hub_tab_feed = 'community_hub_tab_feed';
+  static const community_hub_tab_groups = 'community_hub_tab_groups';
+  static const community_hub_time_days_ago = 'community_hub_time_days_ago';
+  static const community_hub_time_hours_ago = 'community_hub_time_hours_ago';
+  static const community_hub_time_just_now = 'community_hub_time_just_now';
+  static const community_hub_time_minutes_ago = 'community_hub_time_minutes_ago';
+  static const community_hub_time_months_ago = 'community_hub_time_months_ago';
+  static const community_hub_time_years_ago = 'community_hub_time_years_ago';
+  static const community_hub_title = 'community_hub_title';
+  static const community_join = 'community_join';
+  static const community_leave = 'community_leave';
+  static const community_like = 'community_like';
+  static const community_members = 'community_members';
+  static const community_share = 'community_share';
+  static const community_title = 'community_title';
+
+  // core (208 keys)
+  static const app_settings_subtitle = 'app_settings_subtitle';
+  static const app_settings_title = 'app_settings_title';
+  static const app_title = 'app_title';
+  static const common_back = 'common_back';
+  static const common_cancel = 'common_cancel';
+  static const common_close = 'common_close';
+  static const common_delete = 'common_delete';
+  static const common_edit = 'common_edit';
+  static const common_empty = 'common_empty';
+  static const common_error = 'common_error';
+  static const common_filter = 'common_filter';
+  static const common_language = 'common_language';
+  static const common_loading = 'common_loading';
+  static const common_no = 'common_no';
+  static const common_ok = 'common_ok';
+  static const common_or = 'common_or';
+  static const common_refresh = 'common_refresh';
+  static const common_retry = 'common_retry';
+  static const common_save = 'common_save';
+  static const common_search = 'common_search';
+  static const common_see_all = 'common_see_all';
+  static const common_sort = 'common_sort';
+  static const common_success = 'common_success';
+  static const common_welcome_back = 'common_welcome_back';
+  static const common_yes = 'common_yes';
+  static const core_analytics_last24h = 'core_analytics_last24h';
+  static const core_analytics_last30d = 'core_analytics_last30d';
+  static const core_analytics_last7d = 'core_analytics_last7d';
+  static const core_analytics_last90d = 'core_analytics_last90d';
+  static const core_analytics_title = 'core_analytics_title';
+  static const core_coupon_cancel = 'core_coupon_cancel';
+  static const core_coupon_create = 'core_coupon_create';
+  static const core_coupon_create_button = 'core_coupon_create_button';
+  static const core_coupon_delete = 'core_coupon_delete';
+  static const core_coupon_delete_button = 'core_coupon_delete_button';
+  static const core_coupon_description_hint = 'core_coupon_description_hint';
+  static const core_coupon_success_created = 'core_coupon_success_created';
+  static const core_coupon_success_deleted = 'core_coupon_success_deleted';
+  static const core_coupon_success_updated = 'core_coupon_success_updated';
+  static const core_coupon_title = 'core_coupon_title';
+  static const core_settings_actions = 'core_settings_actions';
+  static const core_settings_app_info = 'core_settings_app_info';
+  static const core_settings_app_logs = 'core_settings_app_logs';
+  static const core_settings_cache_cleared = 'core_settings_cache_cleared';
+  static const core_settings_cancel = 'core_settings_cancel';
+  static const core_settings_clear = 'core_settings_clear';
+  static const core_settings_clear_cache = 'core_settings_clear_cache';
+  static const core_settings_close = 'core_settings_close';
+  static const core_settings_connectivity = 'core_settings_connectivity';
+  static const core_settings_state_refreshed = 'core_settings_state_refreshed';
+  static const core_settings_title = 'core_settings_title';
+  static const core_subscription_cancel = 'core_subscription_cancel';
+  static const core_subscription_choose_plan = 'core_subscription_choose_plan';
+  static const dashboard_achievement_unlocked = 'dashboard_achievement_unlocked';
+  static const dashboard_anonymous_button = 'dashboard_anonymous_button';
+  static const dashboard_anonymous_message = 'dashboard_anonymous_message';
+  static const dashboard_anonymous_title = 'dashboard_anonymous_title';
+  static const dashboard_artist_cta_benefit_1_desc = 'dashboard_artist_cta_benefit_1_desc';
+  static const dashboard_artist_cta_benefit_1_title = 'dashboard_artist_cta_benefit_1_title';
+  static const dashboard_artist_cta_benefit_2_desc = 'dashboard_artist_cta_benefit_2_desc';
+  static const dashboard_artist_cta_benefit_2_title = 'dashboard_artist_cta_benefit_2_title';
+  static const dashboard_artist_cta_benefit_3_desc = 'dashboard_artist_cta_benefit_3_desc';
+  static const dashboard_artist_cta_benefit_3_title = 'dashboard_artist_cta_benefit_3_title';
+  static const dashboard_artist_cta_button_primary = 'dashboard_artist_cta_button_primary';
+  static const dashboard_artist_cta_button_secondary = 'dashboard_artist_cta_button_secondary';
+  static const dashboard_artist_cta_subtitle = 'dashboard_artist_cta_subtitle';
+  static const dashboard_artist_cta_title = 'dashboard_artist_cta_title';
+  static const dashboard_artists_subtitle = 'dashboard_artists_subtitle';
+  static const dashboard_artists_title = 'dashboard_artists_title';
+  static const dashboard_artwork_appreciated = 'dashboard_artwork_appreciated';
+  static const dashboard_artwork_subtitle = 'dashboard_artwork_subtitle';
+  static const dashboard_artwork_title = 'dashboard_artwork_title';
+  static const dashboard_browse_all = 'dashboard_browse_all';
+  static const dashboard_browse_all_desc = 'dashboard_browse_all_desc';
+  static const dashboard_browse_artists = 'dashboard_browse_artists';
+  static const dashboard_browse_artists_desc = 'dashboard_browse_artists_desc';
+  static const dashboard_browse_artwalks = 'dashboard_browse_artwalks';
+  static const dashboard_browse_artwalks_desc = 'dashboard_browse_artwalks_desc';
+  static const dashboard_browse_artwork = 'dashboard_browse_artwork';
+  static const dashboard_browse_artwork_desc = 'dashboard_browse_artwork_desc';
+  static const dashboard_browse_captures = 'dashboard_browse_captures';
+  static const dashboard_browse_captures_desc = 'dashboard_browse_captures_desc';
+  static const dashboard_browse_subtitle = 'dashboard_browse_subtitle';
+  static const dashboard_browse_title = 'dashboard_browse_title';
+  static const dashboard_captures_subtitle = 'dashboard_captures_subtitle';
+  static const dashboard_captures_title = 'dashboard_captures_title';
+  static const dashboard_celebration_7_day_streak = 'dashboard_celebration_7_day_streak';
+  static const dashboard_celebration_discoveries = 'dashboard_celebration_discoveries';
+  static const dashboard_community = 'dashboard_community';
+  static const dashboard_community_subtitle = 'dashboard_community_subtitle';
+  static const dashboard_community_title = 'dashboard_community_title';
+  static const dashboard_create = 'dashboard_create';
+  static const dashboard_create_art_walk = 'dashboard_create_art_walk';
+  static const dashboard_create_event = 'dashboard_create_event';
+  static const dashboard_error = 'dashboard_error';
+  static const dashboard_error_sharing = 'dashboard_error_sharing';
+  static const dashboard_error_something_wrong_retry = 'dashboard_error_something_wrong_retry';
+  static const dashboard_error_unable_load_artists = 'dashboard_error_unable_load_artists';
+  static const dashboard_error_unable_load_artwork = 'dashboard_error_unable_load_artwork';
+  static const dashboard_error_unable_load_events = 'dashboard_error_unable_load_events';
+  static const dashboard_events_subtitle = 'dashboard_events_subtitle';
+  static const dashboard_events_title = 'dashboard_events_title';
+  static const dashboard_explore = 'dashboard_explore';
+  static const dashboard_failed_to_follow = 'dashboard_failed_to_follow';
+  static const dashboard_failed_to_share = 'dashboard_failed_to_share';
+  static const dashboard_failed_to_update_like = 'dashboard_failed_to_update_like';
+  static const dashboard_find_artists = 'dashboard_find_artists';
+  static const dashboard_full_leaderboard = 'dashboard_full_leaderboard';
+  static const dashboard_hero_find_art = 'dashboard_hero_find_art';
+  static const dashboard_hero_interactive_map = 'dashboard_hero_interactive_map';
+  static const dashboard_hero_loading_location = 'dashboard_hero_loading_location';
+  static const dashboard_hero_mobile_only = 'dashboard_hero_mobile_only';
+  static const dashboard_hero_subtitle = 'dashboard_hero_subtitle';
+  static const dashboard_hero_tagline = 'dashboard_hero_tagline';
+  static const dashboard_loading = 'dashboard_loading';
+  static const dashboard_messaging_error = 'dashboard_messaging_error';
+  static const dashboard_no_artists_found = 'dashboard_no_artists_found';
+  static const dashboard_no_artwork_found = 'dashboard_no_artwork_found';
+  static const dashboard_no_captures_found = 'dashboard_no_captures_found';
+  static const dashboard_opening_messages = 'dashboard_opening_messages';
+  static const dashboard_preparing_experience = 'dashboard_preparing_experience';
+  static const dashboard_recent_achievements = 'dashboard_recent_achievements';
+  static const dashboard_search_placeholder = 'dashboard_search_placeholder';
+  static const dashboard_start_quest = 'dashboard_start_quest';
+  static const dashboard_tab_community = 'dashboard_tab_community';
+  static const dashboard_tab_explore = 'dashboard_tab_explore';
+  static const dashboard_tab_for_you = 'dashboard_tab_for_you';
+  static const dashboard_title = 'dashboard_title';
+  static const dashboard_view_weekly_details = 'dashboard_view_weekly_details';
+  static const drawer_achievements = 'drawer_achievements';
+  static const drawer_ad_performance = 'drawer_ad_performance';
+  static const drawer_ad_statistics = 'drawer_ad_statistics';
+  static const drawer_admin_dashboard = 'drawer_admin_dashboard';
+  static const drawer_admin_settings = 'drawer_admin_settings';
+  static const drawer_advanced_search = 'drawer_advanced_search';
+  static const drawer_advertise = 'drawer_advertise';
+  static const drawer_analytics = 'drawer_analytics';
+  static const drawer_approved_ads = 'drawer_approved_ads';
+  static const drawer_art_walk = 'drawer_art_walk';
+  static const drawer_art_walk_moderation = 'drawer_art_walk_moderation';
+  static const drawer_artbeat_store = 'drawer_artbeat_store';
+  static const drawer_artist_dashboard = 'drawer_artist_dashboard';
+  static const drawer_browse = 'drawer_browse';
+  static const drawer_browse_artists = 'drawer_browse_artists';
+  static const drawer_capture_moderation = 'drawer_capture_moderation';
+  static const drawer_coming_soon = 'drawer_coming_soon';
+  static const drawer_coming_soon_message = 'drawer_coming_soon_message';
+  static const drawer_commission_hub = 'drawer_commission_hub';
+  static const drawer_commission_requests = 'drawer_commission_requests';
+  static const drawer_commissions = 'drawer_commissions';
+  static const drawer_community = 'drawer_community';
+  static const drawer_community_hub = 'drawer_community_hub';
+  static const drawer_create_ad = 'drawer_create_ad';
+  static const drawer_create_art_walk = 'drawer_create_art_walk';
+  static const drawer_create_event = 'drawer_create_event';
+  static const drawer_daily_quests = 'drawer_daily_quests';
+  static const drawer_dashboard = 'drawer_dashboard';
+  static const drawer_earnings = 'drawer_earnings';
+  static const drawer_edit_profile = 'drawer_edit_profile';
+  static const drawer_events = 'drawer_events';
+  static const drawer_favorites = 'drawer_favorites';
+  static const drawer_featured_artists = 'drawer_featured_artists';
+  static const drawer_followers = 'drawer_followers';
+  static const drawer_following = 'drawer_following';
+  static const drawer_gallery_analytics = 'drawer_gallery_analytics';
+  static const drawer_gallery_dashboard = 'drawer_gallery_dashboard';
+  static const drawer_help = 'drawer_help';
+  static const drawer_help_support = 'drawer_help_support';
+  static const drawer_manage_ads = 'drawer_manage_ads';
+  static const drawer_manage_artists = 'drawer_manage_artists';
+  static const drawer_messages = 'drawer_messages';
+  static const drawer_moderation_dashboard = 'drawer_moderation_dashboard';
+  static const drawer_my_ads = 'drawer_my_ads';
+  static const drawer_my_artwork = 'drawer_my_artwork';
+  static const drawer_my_events = 'drawer_my_events';
+  static const drawer_navigation_error = 'drawer_navigation_error';
+  static const drawer_notifications = 'drawer_notifications';
+  static const drawer_ok = 'drawer_ok';
+  static const drawer_payment_methods = 'drawer_payment_methods';
+  static const drawer_payment_screen = 'drawer_payment_screen';
+  static const drawer_payout_accounts = 'drawer_payout_accounts';
+  static const drawer_payout_request = 'drawer_payout_request';
+  static const drawer_profile = 'drawer_profile';
+  static const drawer_public_profile = 'drawer_public_profile';
+  static const drawer_refund_request = 'drawer_refund_request';
+  static const drawer_section_admin = 'drawer_section_admin';
+  static const drawer_section_artist = 'drawer_section_artist';
+  static const drawer_section_create = 'drawer_section_create';
+  static const drawer_section_gallery = 'drawer_section_gallery';
+  static const drawer_section_moderation = 'drawer_section_moderation';
+  static const drawer_section_navigation = 'drawer_section_navigation';
+  static const drawer_section_personal = 'drawer_section_personal';
+  static const drawer_section_settings = 'drawer_section_settings';
+  static const drawer_settings = 'drawer_settings';
+  static const drawer_sign_out = 'drawer_sign_out';
+  static const drawer_subscription_plans = 'drawer_subscription_plans';
+  static const drawer_upload_artwork = 'drawer_upload_artwork';
+  static const drawer_weekly_goals = 'drawer_weekly_goals';
+  static const error_generic = 'error_generic';
+  static const error_navigation = 'error_navigation';
+  static const error_network = 'error_network';
+  static const error_not_found = 'error_not_found';
+  static const error_server = 'error_server';
+  static const error_something_wrong = 'error_something_wrong';
+  static const error_try_again = 'error_try_again';
+  static const error_unauthorized = 'error_unauthorized';
+  static const splash_loading = 'splash_loading';
+  static const splash_offline = 'splash_offline';
+
+  // events (236 keys)
+  static const event_analytics_engagement = 'event_analytics_engagement';
+  static const event_analytics_error_loading = 'event_analytics_error_loading';
+  static const event_analytics_my = 'event_analytics_my';
+  static const event_analytics_overview = 'event_analytics_overview';
+  static const event_analytics_platform = 'event_analytics_platform';
+  static const event_analytics_retry = 'event_analytics_retry';
+  static const event_analytics_revenue = 'event_analytics_revenue';
+  static const event_analytics_total_events = 'event_analytics_total_events';
+  static const event_analytics_total_views = 'event_analytics_total_views';
+  static const event_bulk_active = 'event_bulk_active';
+  static const event_bulk_all_categories = 'event_bulk_all_categories';
+  static const event_bulk_all_statuses = 'event_bulk_all_statuses';
+  static const event_bulk_art_show = 'event_bulk_art_show';
+  static const event_bulk_assign_category = 'event_bulk_assign_category';
+  static const event_bulk_bulk_actions = 'event_bulk_bulk_actions';
+  static const event_bulk_cancel = 'event_bulk_cancel';
+  static const event_bulk_cancelled = 'event_bulk_cancelled';
+  static const event_bulk_category_label = 'event_bulk_category_label';
+  static const event_bulk_clear = 'event_bulk_clear';
+  static const event_bulk_clear_selection = 'event_bulk_clear_selection';
+  static const event_bulk_confirm_delete = 'event_bulk_confirm_delete';
+  static const event_bulk_confirm_delete_message = 'event_bulk_confirm_delete_message';
+  static const event_bulk_delete = 'event_bulk_delete';
+  static const event_bulk_delete_events = 'event_bulk_delete_events';
+  static const event_bulk_draft = 'event_bulk_draft';
+  static const event_bulk_end_date = 'event_bulk_end_date';
+  static const event_bulk_error = 'event_bulk_error';
+  static const event_bulk_error_loading = 'event_bulk_error_loading';
+  static const event_bulk_exhibition = 'event_bulk_exhibition';
+  static const event_bulk_filters = 'event_bulk_filters';
+  static const event_bulk_inactive = 'event_bulk_inactive';
+  static const event_bulk_make_private = 'event_bulk_make_private';
+  static const event_bulk_make_public = 'event_bulk_make_public';
+  static const event_bulk_no_events = 'event_bulk_no_events';
+  static const event_bulk_no_events_hint = 'event_bulk_no_events_hint';
+  static const event_bulk_of_selected = 'event_bulk_of_selected';
+  static const event_bulk_other = 'event_bulk_other';
+  static const event_bulk_postponed = 'event_bulk_postponed';
+  static const event_bulk_retry = 'event_bulk_retry';
+  static const event_bulk_sale = 'event_bulk_sale';
+  static const event_bulk_select_category = 'event_bulk_select_category';
+  static const event_bulk_select_events = 'event_bulk_select_events';
+  static const event_bulk_select_status = 'event_bulk_select_status';
+  static const event_bulk_selected_label = 'event_bulk_selected_label';
+  static const event_bulk_start_date = 'event_bulk_start_date';
+  static const event_bulk_status_label = 'event_bulk_status_label';
+  static const event_bulk_success = 'event_bulk_success';
+  static const event_bulk_title = 'event_bulk_title';
+  static const event_bulk_update_status = 'event_bulk_update_status';
+  static const event_bulk_workshop = 'event_bulk_workshop';
+  static const event_mod_all_clear = 'event_mod_all_clear';
+  static const event_mod_analytics = 'event_mod_analytics';
+  static const event_mod_approve = 'event_mod_approve';
+  static const event_mod_cancel = 'event_mod_cancel';
+  static const event_mod_close = 'event_mod_close';
+  static const event_mod_date_label = 'event_mod_date_label';
+  static const event_mod_description_label = 'event_mod_description_label';
+  static const event_mod_dismiss = 'event_mod_dismiss';
+  static const event_mod_dismiss_flag = 'event_mod_dismiss_flag';
+  static const event_mod_dismiss_reason_hint = 'event_mod_dismiss_reason_hint';
+  static const event_mod_dismissal_reason = 'event_mod_dismissal_reason';
+  static const event_mod_error_loading = 'event_mod_error_loading';
+  static const event_mod_flagged_events = 'event_mod_flagged_events';
+  static const event_mod_flagged_label = 'event_mod_flagged_label';
+  static const event_mod_location_label = 'event_mod_location_label';
+  static const event_mod_no_flagged = 'event_mod_no_flagged';
+  static const event_mod_pending_review = 'event_mod_pending_review';
+  static const event_mod_reason_label = 'event_mod_reason_label';
+  static const event_mod_reject = 'event_mod_reject';
+  static const event_mod_retry = 'event_mod_retry';
+  static const event_mod_review = 'event_mod_review';
+  static const event_mod_status_label = 'event_mod_status_label';
+  static const event_mod_title = 'event_mod_title';
+  static const event_wrap_go_back = 'event_wrap_go_back';
+  static const event_wrap_load_error = 'event_wrap_load_error';
+  static const event_wrap_loading = 'event_wrap_loading';
+  static const event_wrap_not_found = 'event_wrap_not_found';
+  static const event_wrap_unavailable = 'event_wrap_unavailable';
+  static const events_add = 'events_add';
+  static const events_add_ticket = 'events_add_ticket';
+  static const events_additional_images = 'events_additional_images';
+  static const events_all_categories = 'events_all_categories';
+  static const events_artist_headshot = 'events_artist_headshot';
+  static const events_attendees = 'events_attendees';
+  static const events_attending = 'events_attending';
+  static const events_attending_count = 'events_attending_count';
+  static const events_basic_information = 'events_basic_information';
+  static const events_browse_category = 'events_browse_category';
+  static const events_clear_filters = 'events_clear_filters';
+  static const events_concert = 'events_concert';
+  static const events_create = 'events_create';
+  static const events_create_button = 'events_create_button';
+  static const events_create_event = 'events_create_event';
+  static const events_create_recurring = 'events_create_recurring';
+  static const events_created_success = 'events_created_success';
+  static const events_created_title = 'events_created_title';
+  static const events_creating = 'events_creating';
+  static const events_dashboard_title = 'events_dashboard_title';
+  static const events_date = 'events_date';
+  static const events_describe_event = 'events_describe_event';
+  static const events_description = 'events_description';
+  static const events_details_title = 'events_details_title';
+  static const events_discover_subtitle = 'events_discover_subtitle';
+  static const events_discover_title = 'events_discover_title';
+  static const events_done_button = 'events_done_button';
+  static const events_drawer_attendee = 'events_drawer_attendee';
+  static const events_drawer_calendar = 'events_drawer_calendar';
+  static const events_drawer_create_event = 'events_drawer_create_event';
+  static const events_drawer_event_admin = 'events_drawer_event_admin';
+  static const events_drawer_event_artist = 'events_drawer_event_artist';
+  static const events_drawer_event_attendee = 'events_drawer_event_attendee';
+  static const events_drawer_event_moderator = 'events_drawer_event_moderator';
+  static const events_drawer_event_organizer = 'events_drawer_event_organizer';
+  static const events_drawer_events_dashboard = 'events_drawer_events_dashboard';
+  static const events_drawer_help = 'events_drawer_help';
+  static const events_drawer_home = 'events_drawer_home';
+  static const events_drawer_loading = 'events_drawer_loading';
+  static const events_drawer_messages = 'events_drawer_messages';
+  static const events_drawer_my_events = 'events_drawer_my_events';
+  static const events_drawer_my_events_stat = 'events_drawer_my_events_stat';
+  static const events_drawer_my_tickets = 'events_drawer_my_tickets';
+  static const events_drawer_nearby_events = 'events_drawer_nearby_events';
+  static const events_drawer_notifications = 'events_drawer_notifications';
+  static const events_drawer_profile = 'events_drawer_profile';
+  static const events_drawer_search = 'events_drawer_search';
+  static const events_drawer_section_events = 'events_drawer_section_events';
+  static const events_drawer_section_main = 'events_drawer_section_main';
+  static const events_drawer_section_settings = 'events_drawer_section_settings';
+  static const events_drawer_settings = 'events_drawer_settings';
+  static const events_drawer_upcoming_stat = 'events_drawer_upcoming_stat';
+  static const events_drawer_version = 'events_drawer_version';
+  static const events_empty_message = 'events_empty_message';
+  static const events_empty_title = 'events_empty_title';
+  static const events_enable_reminders = 'events_enable_reminders';
+  static const events_enter_event_title = 'events_enter_event_title';
+  static const events_error_loading = 'events_error_loading';
+  static const events_error_title = 'events_error_title';
+  static const events_error_unknown = 'events_error_unknown';
+  static const events_event_banner = 'events_event_banner';
+  static const events_event_description = 'events_event_description';
+  static const events_event_images = 'events_event_images';
+  static const events_event_name = 'events_event_name';
+  static const events_event_title = 'events_event_title';
+  static const events_exhibition = 'events_exhibition';
+  static const events_failed_save = 'events_failed_save';
+  static const events_featured_subtitle = 'events_featured_subtitle';
+  static const events_featured_title = 'events_featured_title';
+  static const events_gallery = 'events_gallery';
+  static const events_gallery_all = 'events_gallery_all';
+  static const events_greeting_afternoon = 'events_greeting_afternoon';
+  static const events_greeting_evening = 'events_greeting_evening';
+  static const events_greeting_morning = 'events_greeting_morning';
+  static const events_header_subtitle = 'events_header_subtitle';
+  static const events_list_empty_msg_near_you = 'events_list_empty_msg_near_you';
+  static const events_list_empty_msg_trending = 'events_list_empty_msg_trending';
+  static const events_list_empty_msg_weekend = 'events_list_empty_msg_weekend';
+  static const events_list_empty_near_you = 'events_list_empty_near_you';
+  static const events_list_empty_trending = 'events_list_empty_trending';
+  static const events_list_empty_weekend = 'events_list_empty_weekend';
+  static const events_list_tab_this_week = 'events_list_tab_this_week';
+  static const events_list_tab_today = 'events_list_tab_today';
+  static const events_list_tab_upcoming = 'events_list_tab_upcoming';
+  static const events_list_tabs_all = 'events_list_tabs_all';
+  static const events_list_tabs_today = 'events_list_tabs_today';
+  static const events_list_tabs_upcoming = 'events_list_tabs_upcoming';
+  static const events_list_tabs_week = 'events_list_tabs_week';
+  static const events_list_view_all_events = 'events_list_view_all_events';
+  static const events_loading = 'events_loading';
+  static const events_location = 'events_location';
+  static const events_month_apr = 'events_month_apr';
+  static const events_month_aug = 'events_month_aug';
+  static const events_month_dec = 'events_month_dec';
+  static const events_month_feb = 'events_month_feb';
+  static const events_month_jan = 'events_month_jan';
+  static const events_month_jul = 'events_month_jul';
+  static const events_month_jun = 'events_month_jun';
+  static const events_month_mar = 'events_month_mar';
+  static const events_month_may = 'events_month_may';
+  static const events_month_nov = 'events_month_nov';
+  static const events_month_oct = 'events_month_oct';
+  static const events_month_sep = 'events_month_sep';
+  static const events_my_events = 'events_my_events';
+  static const events_my_tickets_title = 'events_my_tickets_title';
+  static const events_next_action = 'events_next_action';
+  static const events_no_results = 'events_no_results';
+  static const events_other = 'events_other';
+  static const events_past = 'events_past';
+  static const events_permission_denied = 'events_permission_denied';
+  static const events_public_event = 'events_public_event';
+  static const events_quick_my_tickets = 'events_quick_my_tickets';
+  static const events_quick_near_me = 'events_quick_near_me';
+  static const events_quick_this_weekend = 'events_quick_this_weekend';
+  static const events_quick_trending = 'events_quick_trending';
+  static const events_repeat_event = 'events_repeat_event';
+  static const events_search_date_filter = 'events_search_date_filter';
+  static const events_search_find_events = 'events_search_find_events';
+  static const events_search_find_events_subtitle = 'events_search_find_events_subtitle';
+  static const events_search_hint = 'events_search_hint';
+  static const events_search_modal_subtitle = 'events_search_modal_subtitle';
+  static const events_search_modal_title = 'events_search_modal_title';
+  static const events_search_nearby = 'events_search_nearby';
+  static const events_search_nearby_subtitle = 'events_search_nearby_subtitle';
+  static const events_search_placeholder = 'events_search_placeholder';
+  static const events_search_popular = 'events_search_popular';
+  static const events_search_popular_events = 'events_search_popular_events';
+  static const events_search_popular_subtitle = 'events_search_popular_subtitle';
+  static const events_search_title = 'events_search_title';
+  static const events_search_venues = 'events_search_venues';
+  static const events_search_venues_subtitle = 'events_search_venues_subtitle';
+  static const events_send_reminders = 'events_send_reminders';
+  static const events_share = 'events_share';
+  static const events_share_button = 'events_share_button';
+  static const events_show_in_feed = 'events_show_in_feed';
+  static const events_stat_this_week = 'events_stat_this_week';
+  static const events_stat_today = 'events_stat_today';
+  static const events_stat_upcoming = 'events_stat_upcoming';
+  static const events_tap_to_select_image = 'events_tap_to_select_image';
+  static const events_tickets_all = 'events_tickets_all';
+  static const events_tickets_past = 'events_tickets_past';
+  static const events_tickets_upcoming = 'events_tickets_upcoming';
+  static const events_time = 'events_time';
+  static const events_time_am = 'events_time_am';
+  static const events_time_pm = 'events_time_pm';
+  static const events_time_today = 'events_time_today';
+  static const events_time_tomorrow = 'events_time_tomorrow';
+  static const events_title = 'events_title';
+  static const events_tour = 'events_tour';
+  static const events_unexpected_error = 'events_unexpected_error';
+  static const events_unsaved_changes = 'events_unsaved_changes';
+  static const events_upcoming = 'events_upcoming';
+  static const events_upcoming_subtitle = 'events_upcoming_subtitle';
+  static const events_upcoming_title = 'events_upcoming_title';
+  static const events_updated_success = 'events_updated_success';
+  static const events_updated_title = 'events_updated_title';
+  static const events_view_button = 'events_view_button';
+  static const events_workshop = 'events_workshop';
+
+  // messaging (295 keys)
+  static const messaging_add_attachment = 'messaging_add_attachment';
+  static const messaging_add_member = 'messaging_add_member';
+  static const messaging_add_members = 'messaging_add_members';
+  static const messaging_add_members_button = 'messaging_add_members_button';
+  static const messaging_allow_messages = 'messaging_allow_messages';
+  static const messaging_archive_chat = 'messaging_archive_chat';
+  static const messaging_artistic_messaging_hint_search_conversations = 'messaging_artistic_messaging_hint_search_conversations';
+  static const messaging_artistic_messaging_hint_search_for_artists = 'messaging_artistic_messaging_hint_search_for_artists';
+  static const messaging_artistic_messaging_message_find_messages_and = 'messaging_artistic_messaging_message_find_messages_and';
+  static const messaging_artistic_messaging_message_message_settings = 'messaging_artistic_messaging_message_message_settings';
+  static const messaging_artistic_messaging_message_messages = 'messaging_artistic_messaging_message_messages';
+  static const messaging_artistic_messaging_text_blocked_users = 'messaging_artistic_messaging_text_blocked_users';
+  static const messaging_artistic_messaging_text_discover_and_join = 'messaging_artistic_messaging_text_discover_and_join';
+  static const messaging_artistic_messaging_text_find_people = 'messaging_artistic_messaging_text_find_people';
+  static const messaging_artistic_messaging_text_join_groups = 'messaging_artistic_messaging_text_join_groups';
+  static const messaging_artistic_messaging_text_manage_blocked_contacts = 'messaging_artistic_messaging_text_manage_blocked_contacts';
+  static const messaging_artistic_messaging_text_messaging_help = 'messaging_artistic_messaging_text_messaging_help';
+  static const messaging_artistic_messaging_text_my_profile = 'messaging_artistic_messaging_text_my_profile';
+  static const messaging_artistic_messaging_text_popular_chats = 'messaging_artistic_messaging_text_popular_chats';
+  static const messaging_artistic_messaging_text_privacy_and_notification = 'messaging_artistic_messaging_text_privacy_and_notification';
+  static const messaging_artistic_messaging_text_see_trending_conversations = 'messaging_artistic_messaging_text_see_trending_conversations';
+  static const messaging_artistic_messaging_text_tips_and_support = 'messaging_artistic_messaging_text_tips_and_support';
+  static const messaging_artistic_messaging_text_view_and_edit = 'messaging_artistic_messaging_text_view_and_edit';
+  static const messaging_badges = 'messaging_badges';
+  static const messaging_block_confirm = 'messaging_block_confirm';
+  static const messaging_block_user = 'messaging_block_user';
+  static const messaging_blocked_title = 'messaging_blocked_title';
+  static const messaging_blocked_users = 'messaging_blocked_users';
+  static const messaging_blocked_users_error_error_loading_blocked = 'messaging_blocked_users_error_error_loading_blocked';
+  static const messaging_blocked_users_error_error_unblocking_user = 'messaging_blocked_users_error_error_unblocking_user';
+  static const messaging_blocked_users_error_failed_to_report = 'messaging_blocked_users_error_failed_to_report';
+  static const messaging_blocked_users_label_report_userdisplayname_for = 'messaging_blocked_users_label_report_userdisplayname_for';
+  static const messaging_blocked_users_success_user_reported_successfully = 'messaging_blocked_users_success_user_reported_successfully';
+  static const messaging_blocked_users_text_cancel = 'messaging_blocked_users_text_cancel';
+  static const messaging_blocked_users_text_cancel_18 = 'messaging_blocked_users_text_cancel_18';
+  static const messaging_blocked_users_text_cancel_19 = 'messaging_blocked_users_text_cancel_19';
+  static const messaging_blocked_users_text_cancel_5 = 'messaging_blocked_users_text_cancel_5';
+  static const messaging_blocked_users_text_report = 'messaging_blocked_users_text_report';
+  static const messaging_blocked_users_text_report_23 = 'messaging_blocked_users_text_report_23';
+  static const messaging_blocked_users_text_report_user = 'messaging_blocked_users_text_report_user';
+  static const messaging_blocked_users_text_report_user_14 = 'messaging_blocked_users_text_report_user_14';
+  static const messaging_blocked_users_text_report_user_15 = 'messaging_blocked_users_text_report_user_15';
+  static const messaging_blocked_users_text_report_user_16 = 'messaging_blocked_users_text_report_user_16';
+  static const messaging_blocked_users_text_unblock = 'messaging_blocked_users_text_unblock';
+  static const messaging_blocked_users_text_unblock_11 = 'messaging_blocked_users_text_unblock_11';
+  static const messaging_blocked_users_text_unblock_12 = 'messaging_blocked_users_text_unblock_12';
+  static const messaging_blocked_users_text_unblock_7 = 'messaging_blocked_users_text_unblock_7';
+  static const messaging_blocked_users_text_unblock_user = 'messaging_blocked_users_text_unblock_user';
+  static const messaging_blocked_users_text_unblock_user_3 = 'messaging_blocked_users_text_unblock_user_3';
+  static const messaging_blocked_users_text_view_profile = 'messaging_blocked_users_text_view_profile';
+  static const messaging_blocked_users_text_view_profile_10 = 'messaging_blocked_users_text_view_profile_10';
+  static const messaging_chat_archived = 'messaging_chat_archived';
+  static const messaging_chat_error_failed_to_send = 'messaging_chat_error_failed_to_send';
+  static const messaging_chat_error_failed_to_send_2 = 'messaging_chat_error_failed_to_send_2';
+  static const messaging_chat_error_failed_to_send_3 = 'messaging_chat_error_failed_to_send_3';
+  static const messaging_chat_error_failed_to_send_7 = 'messaging_chat_error_failed_to_send_7';
+  static const messaging_chat_info = 'messaging_chat_info';
+  static const messaging_chat_info_error_error_loading_participants = 'messaging_chat_info_error_error_loading_participants';
+  static const messaging_chat_info_error_failed_to_delete = 'messaging_chat_info_error_failed_to_delete';
+  static const messaging_chat_info_text_are_you_sure = 'messaging_chat_info_text_are_you_sure';
+  static const messaging_chat_info_text_are_you_sure_5 = 'messaging_chat_info_text_are_you_sure_5';
+  static const messaging_chat_info_text_cancel = 'messaging_chat_info_text_cancel';
+  static const messaging_chat_info_text_cancel_7 = 'messaging_chat_info_text_cancel_7';
+  static const messaging_chat_info_text_chat_deleted = 'messaging_chat_info_text_chat_deleted';
+  static const messaging_chat_info_text_delete = 'messaging_chat_info_text_delete';
+  static const messaging_chat_info_text_delete_11 = 'messaging_chat_info_text_delete_11';
+  static const messaging_chat_info_text_delete_chat = 'messaging_chat_info_text_delete_chat';
+  static const messaging_chat_info_text_delete_chat_14 = 'messaging_chat_info_text_delete_chat_14';
+  static const messaging_chat_info_text_delete_chat_15 = 'messaging_chat_info_text_delete_chat_15';
+  static const messaging_chat_info_text_delete_chat_3 = 'messaging_chat_info_text_delete_chat_3';
+  static const messaging_chat_info_text_participants = 'messaging_chat_info_text_participants';
+  static const messaging_chat_info_text_participants_13 = 'messaging_chat_info_text_participants_13';
+  static const messaging_chat_list_error_failed_to_archive = 'messaging_chat_list_error_failed_to_archive';
+  static const messaging_chat_list_error_failed_to_restore = 'messaging_chat_list_error_failed_to_restore';
+  static const messaging_chat_list_message_messages = 'messaging_chat_list_message_messages';
+  static const messaging_chat_list_message_new_message = 'messaging_chat_list_message_new_message';
+  static const messaging_chat_list_message_new_message_6 = 'messaging_chat_list_message_new_message_6';
+  static const messaging_chat_list_message_new_message_7 = 'messaging_chat_list_message_new_message_7';
+  static const messaging_chat_list_text_chat_settings = 'messaging_chat_list_text_chat_settings';
+  static const messaging_chat_list_text_chat_settings_16 = 'messaging_chat_list_text_chat_settings_16';
+  static const messaging_chat_list_text_new_chat = 'messaging_chat_list_text_new_chat';
+  static const messaging_chat_list_text_new_chat_10 = 'messaging_chat_list_text_new_chat_10';
+  static const messaging_chat_list_text_new_chat_9 = 'messaging_chat_list_text_new_chat_9';
+  static const messaging_chat_list_text_new_group = 'messaging_chat_list_text_new_group';
+  static const messaging_chat_list_text_new_group_14 = 'messaging_chat_list_text_new_group_14';
+  static const messaging_chat_list_text_try_again = 'messaging_chat_list_text_try_again';
+  static const messaging_chat_list_text_try_again_3 = 'messaging_chat_list_text_try_again_3';
+  static const messaging_chat_list_text_try_again_4 = 'messaging_chat_list_text_try_again_4';
+  static const messaging_chat_not_found = 'messaging_chat_not_found';
+  static const messaging_chat_notification_settings_message_show_message_previews = 'messaging_chat_notification_settings_message_show_message_previews';
+  static const messaging_chat_notification_settings_message_show_message_previews_6 = 'messaging_chat_notification_settings_message_show_message_previews_6';
+  static const messaging_chat_notification_settings_text_mute_notifications = 'messaging_chat_notification_settings_text_mute_notifications';
+  static const messaging_chat_notification_settings_text_mute_notifications_4 = 'messaging_chat_notification_settings_text_mute_notifications_4';
+  static const messaging_chat_notification_settings_text_notification_settings = 'messaging_chat_notification_settings_text_notification_settings';
+  static const messaging_chat_notification_settings_text_notification_settings_2 = 'messaging_chat_notification_settings_text_notification_settings_2';
+  static const messaging_chat_search_message_no_messages_found = 'messaging_chat_search_message_no_messages_found';
+  static const messaging_chat_search_text_no_results = 'messaging_chat_search_text_no_results';
+  static const messaging_chat_settings_error_failed_to_clear = 'messaging_chat_settings_error_failed_to_clear';
+  static const messaging_chat_settings_message_get_notified_about = 'messaging_chat_settings_message_get_notified_about';
+  static const messaging_chat_settings_message_get_notified_about_5 = 'messaging_chat_settings_message_get_notified_about_5';
+  static const messaging_chat_settings_text_autodownload_media = 'messaging_chat_settings_text_autodownload_media';
+  static const messaging_chat_settings_text_autodownload_media_7 = 'messaging_chat_settings_text_autodownload_media_7';
+  static const messaging_chat_settings_text_automatically_download_photos = 'messaging_chat_settings_text_automatically_download_photos';
+  static const messaging_chat_settings_text_automatically_download_photos_9 = 'messaging_chat_settings_text_automatically_download_photos_9';
+  static const messaging_chat_settings_text_blocked_users = 'messaging_chat_settings_text_blocked_users';
+  static const messaging_chat_settings_text_blocked_users_29 = 'messaging_chat_settings_text_blocked_users_29';
+  static const messaging_chat_settings_text_cancel = 'messaging_chat_settings_text_cancel';
+  static const messaging_chat_settings_text_cancel_25 = 'messaging_chat_settings_text_cancel_25';
+  static const messaging_chat_settings_text_chat_history_cleared = 'messaging_chat_settings_text_chat_history_cleared';
+  static const messaging_chat_settings_text_chat_notifications = 'messaging_chat_settings_text_chat_notifications';
+  static const messaging_chat_settings_text_chat_notifications_3 = 'messaging_chat_settings_text_chat_notifications_3';
+  static const messaging_chat_settings_text_chat_settings = 'messaging_chat_settings_text_chat_settings';
+  static const messaging_chat_settings_text_chat_theme = 'messaging_chat_settings_text_chat_theme';
+  static const messaging_chat_settings_text_chat_theme_11 = 'messaging_chat_settings_text_chat_theme_11';
+  static const messaging_chat_settings_text_clear_chat_history = 'messaging_chat_settings_text_clear_chat_history';
+  static const messaging_chat_settings_text_clear_chat_history_21 = 'messaging_chat_settings_text_clear_chat_history_21';
+  static const messaging_chat_settings_text_clear_chat_history_22 = 'messaging_chat_settings_text_clear_chat_history_22';
+  static const messaging_chat_settings_text_clear_chat_history_23 = 'messaging_chat_settings_text_clear_chat_history_23';
+  static const messaging_chat_settings_text_dark = 'messaging_chat_settings_text_dark';
+  static const messaging_chat_settings_text_dark_19 = 'messaging_chat_settings_text_dark_19';
+  static const messaging_chat_settings_text_light = 'messaging_chat_settings_text_light';
+  static const messaging_chat_settings_text_light_17 = 'messaging_chat_settings_text_light_17';
+  static const messaging_chat_settings_text_select_theme = 'messaging_chat_settings_text_select_theme';
+  static const messaging_chat_settings_text_select_theme_13 = 'messaging_chat_settings_text_select_theme_13';
+  static const messaging_chat_settings_text_system = 'messaging_chat_settings_text_system';
+  static const messaging_chat_settings_text_system_15 = 'messaging_chat_settings_text_system_15';
+  static const messaging_chat_text_close = 'messaging_chat_text_close';
+  static const messaging_chat_text_close_6 = 'messaging_chat_text_close_6';
+  static const messaging_chat_text_initializing_voice_recorder = 'messaging_chat_text_initializing_voice_recorder';
+  static const messaging_chat_text_sending_media = 'messaging_chat_text_sending_media';
+  static const messaging_chat_text_try_again = 'messaging_chat_text_try_again';
+  static const messaging_chat_text_try_again_10 = 'messaging_chat_text_try_again_10';
+  static const messaging_chat_text_try_again_11 = 'messaging_chat_text_try_again_11';
+  static const messaging_chat_wallpaper_selection_text_select_wallpaper = 'messaging_chat_wallpaper_selection_text_select_wallpaper';
+  static const messaging_chat_wallpaper_selection_text_select_wallpaper_2 = 'messaging_chat_wallpaper_selection_text_select_wallpaper_2';
+  static const messaging_clear_search = 'messaging_clear_search';
+  static const messaging_contact_selection_message_new_message = 'messaging_contact_selection_message_new_message';
+  static const messaging_create_button = 'messaging_create_button';
+  static const messaging_create_group = 'messaging_create_group';
+  static const messaging_delete_chat = 'messaging_delete_chat';
+  static const messaging_delete_media = 'messaging_delete_media';
+  static const messaging_empty_description = 'messaging_empty_description';
+  static const messaging_enable_notifications = 'messaging_enable_notifications';
+  static const messaging_enhanced_messaging_dashboard_error_error_snapshoterror = 'messaging_enhanced_messaging_dashboard_error_error_snapshoterror';
+  static const messaging_enhanced_messaging_dashboard_error_error_snapshoterror_13 = 'messaging_enhanced_messaging_dashboard_error_error_snapshoterror_13';
+  static const messaging_enhanced_messaging_dashboard_message_send_broadcast_message = 'messaging_enhanced_messaging_dashboard_message_send_broadcast_message';
+  static const messaging_enhanced_messaging_dashboard_message_send_broadcast_message_26 = 'messaging_enhanced_messaging_dashboard_message_send_broadcast_message_26';
+  static const messaging_enhanced_messaging_dashboard_message_send_message = 'messaging_enhanced_messaging_dashboard_message_send_message';
+  static const messaging_enhanced_messaging_dashboard_success_broadcast_message_sent = 'messaging_enhanced_messaging_dashboard_success_broadcast_message_sent';
+  static const messaging_enhanced_messaging_dashboard_text_autodelete_spam = 'messaging_enhanced_messaging_dashboard_text_autodelete_spam';
+  static const messaging_enhanced_messaging_dashboard_text_broadcast = 'messaging_enhanced_messaging_dashboard_text_broadcast';
+  static const messaging_enhanced_messaging_dashboard_text_broadcast_2 = 'messaging_enhanced_messaging_dashboard_text_broadcast_2';
+  static const messaging_enhanced_messaging_dashboard_text_broadcast_3 = 'messaging_enhanced_messaging_dashboard_text_broadcast_3';
+  static const messaging_enhanced_messaging_dashboard_text_cancel = 'messaging_enhanced_messaging_dashboard_text_cancel';
+  static const messaging_enhanced_messaging_dashboard_text_cancel_28 = 'messaging_enhanced_messaging_dashboard_text_cancel_28';
+  static const messaging_enhanced_messaging_dashboard_text_close = 'messaging_enhanced_messaging_dashboard_text_close';
+  static const messaging_enhanced_messaging_dashboard_text_close_24 = 'messaging_enhanced_messaging_dashboard_text_close_24';
+  static const messaging_enhanced_messaging_dashboard_text_messaging_dashboard = 'messaging_enhanced_messaging_dashboard_text_messaging_dashboard';
+  static const messaging_enhanced_messaging_dashboard_text_messaging_dashboard_5 = 'messaging_enhanced_messaging_dashboard_text_messaging_dashboard_5';
+  static const messaging_enhanced_messaging_dashboard_text_messaging_settings = 'messaging_enhanced_messaging_dashboard_text_messaging_settings';
+  static const messaging_enhanced_messaging_dashboard_text_messaging_settings_19 = 'messaging_enhanced_messaging_dashboard_text_messaging_settings_19';
+  static const messaging_enhanced_messaging_dashboard_text_moderate = 'messaging_enhanced_messaging_dashboard_text_moderate';
+  static const messaging_enhanced_messaging_dashboard_text_moderation_features_coming = 'messaging_enhanced_messaging_dashboard_text_moderation_features_coming';
+  static const messaging_enhanced_messaging_dashboard_text_no_recent_activity = 'messaging_enhanced_messaging_dashboard_text_no_recent_activity';
+  static const messaging_enhanced_messaging_dashboard_text_no_users_online = 'messaging_enhanced_messaging_dashboard_text_no_users_online';
+  static const messaging_enhanced_messaging_dashboard_text_push_notifications = 'messaging_enhanced_messaging_dashboard_text_push_notifications';
+  static const messaging_enhanced_messaging_dashboard_text_quiet_hours = 'messaging_enhanced_messaging_dashboard_text_quiet_hours';
+  static const messaging_enhanced_messaging_dashboard_text_refresh = 'messaging_enhanced_messaging_dashboard_text_refresh';
+  static const messaging_enhanced_messaging_dashboard_text_refresh_10 = 'messaging_enhanced_messaging_dashboard_text_refresh_10';
+  static const messaging_enhanced_messaging_dashboard_text_refresh_9 = 'messaging_enhanced_messaging_dashboard_text_refresh_9';
+  static const messaging_enhanced_messaging_dashboard_text_retry = 'messaging_enhanced_messaging_dashboard_text_retry';
+  static const messaging_enhanced_messaging_dashboard_text_retry_7 = 'messaging_enhanced_messaging_dashboard_text_retry_7';
+  static const messaging_enhanced_messaging_dashboard_text_send = 'messaging_enhanced_messaging_dashboard_text_send';
+  static const messaging_enhanced_messaging_dashboard_text_send_30 = 'messaging_enhanced_messaging_dashboard_text_send_30';
+  static const messaging_enhanced_messaging_dashboard_text_unable_to_start = 'messaging_enhanced_messaging_dashboard_text_unable_to_start';
+  static const messaging_enhanced_messaging_dashboard_text_view_profile = 'messaging_enhanced_messaging_dashboard_text_view_profile';
+  static const messaging_error_block_user = 'messaging_error_block_user';
+  static const messaging_error_chat = 'messaging_error_chat';
+  static const messaging_error_create_group = 'messaging_error_create_group';
+  static const messaging_error_leave_group = 'messaging_error_leave_group';
+  static const messaging_error_load_contacts = 'messaging_error_load_contacts';
+  static const messaging_error_load_messages = 'messaging_error_load_messages';
+  static const messaging_error_loading = 'messaging_error_loading';
+  static const messaging_error_send_message = 'messaging_error_send_message';
+  static const messaging_error_unblock_user = 'messaging_error_unblock_user';
+  static const messaging_failed_send = 'messaging_failed_send';
+  static const messaging_files_title = 'messaging_files_title';
+  static const messaging_filter_all = 'messaging_filter_all';
+  static const messaging_filter_artists = 'messaging_filter_artists';
+  static const messaging_filter_collectors = 'messaging_filter_collectors';
+  static const messaging_filter_galleries = 'messaging_filter_galleries';
+  static const messaging_group_chat = 'messaging_group_chat';
+  static const messaging_group_chat_error_error_snapshoterror = 'messaging_group_chat_error_error_snapshoterror';
+  static const messaging_group_chat_text_create_group_chat = 'messaging_group_chat_text_create_group_chat';
+  static const messaging_group_chat_text_create_group_chat_3 = 'messaging_group_chat_text_create_group_chat_3';
+  static const messaging_group_chat_text_create_group_chat_4 = 'messaging_group_chat_text_create_group_chat_4';
+  static const messaging_group_created = 'messaging_group_created';
+  static const messaging_group_created_success = 'messaging_group_created_success';
+  static const messaging_group_creation_error_failed_to_create = 'messaging_group_creation_error_failed_to_create';
+  static const messaging_group_creation_text_create = 'messaging_group_creation_text_create';
+  static const messaging_group_creation_text_create_5 = 'messaging_group_creation_text_create_5';
+  static const messaging_group_creation_text_new_group = 'messaging_group_creation_text_new_group';
+  static const messaging_group_creation_text_new_group_2 = 'messaging_group_creation_text_new_group_2';
+  static const messaging_group_creation_title = 'messaging_group_creation_title';
+  static const messaging_group_description = 'messaging_group_description';
+  static const messaging_group_edit_label_feed_name = 'messaging_group_edit_label_feed_name';
+  static const messaging_group_edit_label_feed_name_4 = 'messaging_group_edit_label_feed_name_4';
+  static const messaging_group_edit_success_feed_settings_saved = 'messaging_group_edit_success_feed_settings_saved';
+  static const messaging_group_edit_text_edit_artist_feed = 'messaging_group_edit_text_edit_artist_feed';
+  static const messaging_group_edit_text_edit_artist_feed_2 = 'messaging_group_edit_text_edit_artist_feed_2';
+  static const messaging_group_edit_text_feed_image_coming = 'messaging_group_edit_text_feed_image_coming';
+  static const messaging_group_edit_text_feed_image_coming_6 = 'messaging_group_edit_text_feed_image_coming_6';
+  static const messaging_group_edit_text_posts_management_coming = 'messaging_group_edit_text_posts_management_coming';
+  static const messaging_group_edit_text_posts_management_coming_8 = 'messaging_group_edit_text_posts_management_coming_8';
+  static const messaging_group_edit_text_save_changes = 'messaging_group_edit_text_save_changes';
+  static const messaging_group_edit_text_save_changes_11 = 'messaging_group_edit_text_save_changes_11';
+  static const messaging_group_info = 'messaging_group_info';
+  static const messaging_group_left = 'messaging_group_left';
+  static const messaging_group_members = 'messaging_group_members';
+  static const messaging_group_name = 'messaging_group_name';
+  static const messaging_group_name_hint = 'messaging_group_name_hint';
+  static const messaging_group_name_label = 'messaging_group_name_label';
+  static const messaging_groups = 'messaging_groups';
+  static const messaging_leave_group = 'messaging_leave_group';
+  static const messaging_loading = 'messaging_loading';
+  static const messaging_media_saved = 'messaging_media_saved';
+  static const messaging_media_title = 'messaging_media_title';
+  static const messaging_media_viewer_error_failed_to_download = 'messaging_media_viewer_error_failed_to_download';
+  static const messaging_media_viewer_success_media_saved_to = 'messaging_media_viewer_success_media_saved_to';
+  static const messaging_members_title = 'messaging_members_title';
+  static const messaging_message_sent = 'messaging_message_sent';
+  static const messaging_message_thread_view_error_failed_to_send = 'messaging_message_thread_view_error_failed_to_send';
+  static const messaging_message_thread_view_message_no_messages_in = 'messaging_message_thread_view_message_no_messages_in';
+  static const messaging_message_user = 'messaging_message_user';
+  static const messaging_mute_chat = 'messaging_mute_chat';
+  static const messaging_new_chat = 'messaging_new_chat';
+  static const messaging_new_message = 'messaging_new_message';
+  static const messaging_no_blocked_users = 'messaging_no_blocked_users';
+  static const messaging_no_contacts = 'messaging_no_contacts';
+  static const messaging_no_messages = 'messaging_no_messages';
+  static const messaging_no_online_users = 'messaging_no_online_users';
+  static const messaging_no_results = 'messaging_no_results';
+  static const messaging_notifications_title = 'messaging_notifications_title';
+  static const messaging_online_users = 'messaging_online_users';
+  static const messaging_privacy_title = 'messaging_privacy_title';
+  static const messaging_recent_chats = 'messaging_recent_chats';
+  static const messaging_recent_searches = 'messaging_recent_searches';
+  static const messaging_remove_member = 'messaging_remove_member';
+  static const messaging_save_media = 'messaging_save_media';
+  static const messaging_search_contacts = 'messaging_search_contacts';
+  static const messaging_search_hint = 'messaging_search_hint';
+  static const messaging_search_placeholder = 'messaging_search_placeholder';
+  static const messaging_search_title = 'messaging_search_title';
+  static const messaging_select_at_least_one = 'messaging_select_at_least_one';
+  static const messaging_select_contact = 'messaging_select_contact';
+  static const messaging_select_contacts = 'messaging_select_contacts';
+  static const messaging_select_members = 'messaging_select_members';
+  static const messaging_select_members_title = 'messaging_select_members_title';
+  static const messaging_send = 'messaging_send';
+  static const messaging_settings_title = 'messaging_settings_title';
+  static const messaging_share_media = 'messaging_share_media';
+  static const messaging_sound = 'messaging_sound';
+  static const messaging_starred_messages_error_error_e = 'messaging_starred_messages_error_error_e';
+  static const messaging_starred_messages_message_go_to_message = 'messaging_starred_messages_message_go_to_message';
+  static const messaging_starred_messages_message_message_unstarred = 'messaging_starred_messages_message_message_unstarred';
+  static const messaging_starred_messages_message_navigate_to_message = 'messaging_starred_messages_message_navigate_to_message';
+  static const messaging_starred_messages_message_starred_messages = 'messaging_starred_messages_message_starred_messages';
+  static const messaging_starred_messages_message_starred_messages_2 = 'messaging_starred_messages_message_starred_messages_2';
+  static const messaging_starred_messages_text_remove_star = 'messaging_starred_messages_text_remove_star';
+  static const messaging_title = 'messaging_title';
+  static const messaging_try_again = 'messaging_try_again';
+  static const messaging_type_message = 'messaging_type_message';
+  static const messaging_unblock_confirm = 'messaging_unblock_confirm';
+  static const messaging_unblock_user = 'messaging_unblock_user';
+  static const messaging_unmute_chat = 'messaging_unmute_chat';
+  static const messaging_user_blocked = 'messaging_user_blocked';
+  static const messaging_user_profile_error_failed_to_block = 'messaging_user_profile_error_failed_to_block';
+  static const messaging_user_profile_message_message = 'messaging_user_profile_message_message';
+  static const messaging_user_profile_message_message_2 = 'messaging_user_profile_message_message_2';
+  static const messaging_user_profile_message_message_3 = 'messaging_user_profile_message_message_3';
+  static const messaging_user_profile_text_block_user = 'messaging_user_profile_text_block_user';
+  static const messaging_user_profile_text_block_user_5 = 'messaging_user_profile_text_block_user_5';
+  static const messaging_user_profile_text_report_user = 'messaging_user_profile_text_report_user';
+  static const messaging_user_profile_text_report_user_10 = 'messaging_user_profile_text_report_user_10';
+  static const messaging_user_profile_text_report_user_11 = 'messaging_user_profile_text_report_user_11';
+  static const messaging_user_profile_text_report_user_9 = 'messaging_user_profile_text_report_user_9';
+  static const messaging_user_profile_text_reporting_functionality_coming = 'messaging_user_profile_text_reporting_functionality_coming';
+  static const messaging_user_profile_text_reporting_functionality_coming_13 = 'messaging_user_profile_text_reporting_functionality_coming_13';
+  static const messaging_user_profile_text_user_blocked = 'messaging_user_profile_text_user_blocked';
+  static const messaging_user_unblocked = 'messaging_user_unblocked';
+  static const messaging_vibration = 'messaging_vibration';
+  static const messaging_video_message = 'messaging_video_message';
+  static const messaging_view_media = 'messaging_view_media';
+  static const messaging_view_profile = 'messaging_view_profile';
+  static const messaging_voice_message = 'messaging_voice_message';
+
+  // misc (774 keys)
+  static const animated_dashboard_artist_label = 'animated_dashboard_artist_label';
+  static const animated_dashboard_business_label = 'animated_dashboard_business_label';
+  static const animated_dashboard_capture_subtitle = 'animated_dashboard_capture_subtitle';
+  static const animated_dashboard_capture_tag = 'animated_dashboard_capture_tag';
+  static const animated_dashboard_capture_title = 'animated_dashboard_capture_title';
+  static const animated_dashboard_connect_subtitle = 'animated_dashboard_connect_subtitle';
+  static const animated_dashboard_connect_tag = 'animated_dashboard_connect_tag';
+  static const animated_dashboard_connect_title = 'animated_dashboard_connect_title';
+  static const animated_dashboard_discover_subtitle = 'animated_dashboard_discover_subtitle';
+  static const animated_dashboard_discover_tag = 'animated_dashboard_discover_tag';
+  static const animated_dashboard_discover_title = 'animated_dashboard_discover_title';
+  static const animated_dashboard_explore_subtitle = 'animated_dashboard_explore_subtitle';
+  static const animated_dashboard_explore_tag = 'animated_dashboard_explore_tag';
+  static const animated_dashboard_explore_title = 'animated_dashboard_explore_title';
+  static const animated_dashboard_level_prefix = 'animated_dashboard_level_prefix';
+  static const animated_dashboard_quest_hub = 'animated_dashboard_quest_hub';
+  static const animated_dashboard_streak_suffix = 'animated_dashboard_streak_suffix';
+  static const animated_dashboard_title_art = 'animated_dashboard_title_art';
+  static const animated_dashboard_title_beat = 'animated_dashboard_title_beat';
+  static const animated_dashboard_title_local = 'animated_dashboard_title_local';
+  static const animated_dashboard_xp_label = 'animated_dashboard_xp_label';
+  static const artbeat_settings_change_photo = 'artbeat_settings_change_photo';
+  static const artbeat_settings_language_arabic = 'artbeat_settings_language_arabic';
+  static const artbeat_settings_language_changed = 'artbeat_settings_language_changed';
+  static const artbeat_settings_language_chinese = 'artbeat_settings_language_chinese';
+  static const artbeat_settings_language_english = 'artbeat_settings_language_english';
+  static const artbeat_settings_language_french = 'artbeat_settings_language_french';
+  static const artbeat_settings_language_german = 'artbeat_settings_language_german';
+  static const artbeat_settings_language_portuguese = 'artbeat_settings_language_portuguese';
+  static const artbeat_settings_language_spanish = 'artbeat_settings_language_spanish';
+  static const audio_content_upload_album_checkbox = 'audio_content_upload_album_checkbox';
+  static const audio_content_upload_album_description_label = 'audio_content_upload_album_description_label';
+  static const audio_content_upload_album_hint = 'audio_content_upload_album_hint';
+  static const audio_content_upload_album_title_label = 'audio_content_upload_album_title_label';
+  static const audio_content_upload_ambient = 'audio_content_upload_ambient';
+  static const audio_content_upload_artist_note_label = 'audio_content_upload_artist_note_label';
+  static const audio_content_upload_audio_error = 'audio_content_upload_audio_error';
+  static const audio_content_upload_audio_genres = 'audio_content_upload_audio_genres';
+  static const audio_content_upload_audio_quality_label = 'audio_content_upload_audio_quality_label';
+  static const audio_content_upload_audio_ready = 'audio_content_upload_audio_ready';
+  static const audio_content_upload_audio_upload_complete = 'audio_content_upload_audio_upload_complete';
+  static const audio_content_upload_audio_upload_failed = 'audio_content_upload_audio_upload_failed';
+  static const audio_content_upload_audio_validated = 'audio_content_upload_audio_validated';
+  static const audio_content_upload_audiobook = 'audio_content_upload_audiobook';
+  static const audio_content_upload_back = 'audio_content_upload_back';
+  static const audio_content_upload_bandwidth_optimized = 'audio_content_upload_bandwidth_optimized';
+  static const audio_content_upload_basic_info_step_description = 'audio_content_upload_basic_info_step_description';
+  static const audio_content_upload_basic_info_step_title = 'audio_content_upload_basic_info_step_title';
+  static const audio_content_upload_basic_info_summary = 'audio_content_upload_basic_info_summary';
+  static const audio_content_upload_bitrate_label = 'audio_content_upload_bitrate_label';
+  static const audio_content_upload_blues = 'audio_content_upload_blues';
+  static const audio_content_upload_button = 'audio_content_upload_button';
+  static const audio_content_upload_cancel_upload = 'audio_content_upload_cancel_upload';
+  static const audio_content_upload_chapter_hint = 'audio_content_upload_chapter_hint';
+  static const audio_content_upload_chapter_label = 'audio_content_upload_chapter_label';
+  static const audio_content_upload_classical = 'audio_content_upload_classical';
+  static const audio_content_upload_composer_label = 'audio_content_upload_composer_label';
+  static const audio_content_upload_compressed_version = 'audio_content_upload_compressed_version';
+  static const audio_content_upload_compressing_audio = 'audio_content_upload_compressing_audio';
+  static const audio_content_upload_compression_label = 'audio_content_upload_compression_label';
+  static const audio_content_upload_content_preview = 'audio_content_upload_content_preview';
+  static const audio_content_upload_content_published = 'audio_content_upload_content_published';
+  static const audio_content_upload_content_section = 'audio_content_upload_content_section';
+  static const audio_content_upload_content_step_description = 'audio_content_upload_content_step_description';
+  static const audio_content_upload_content_step_title = 'audio_content_upload_content_step_title';
+  static const audio_content_upload_content_type_label = 'audio_content_upload_content_type_label';
+  static const audio_content_upload_continue = 'audio_content_upload_continue';
+  static const audio_content_upload_country = 'audio_content_upload_country';
+  static const audio_content_upload_cover_image_hint = 'audio_content_upload_cover_image_hint';
+  static const audio_content_upload_cover_image_label = 'audio_content_upload_cover_image_label';
+  static const audio_content_upload_create_more_audio = 'audio_content_upload_create_more_audio';
+  static const audio_content_upload_creating_database_entry = 'audio_content_upload_creating_database_entry';
+  static const audio_content_upload_description_label = 'audio_content_upload_description_label';
+  static const audio_content_upload_description_required = 'audio_content_upload_description_required';
+  static const audio_content_upload_details_step_description = 'audio_content_upload_details_step_description';
+  static const audio_content_upload_details_step_title = 'audio_content_upload_details_step_title';
+  static const audio_content_upload_details_summary = 'audio_content_upload_details_summary';
+  static const audio_content_upload_download_available = 'audio_content_upload_download_available';
+  static const audio_content_upload_duplicate_warning = 'audio_content_upload_duplicate_warning';
+  static const audio_content_upload_duration_label = 'audio_content_upload_duration_label';
+  static const audio_content_upload_duration_too_long = 'audio_content_upload_duration_too_long';
+  static const audio_content_upload_duration_too_short = 'audio_content_upload_duration_too_short';
+  static const audio_content_upload_electronic = 'audio_content_upload_electronic';
+  static const audio_content_upload_error = 'audio_content_upload_error';
+  static const audio_content_upload_estimated_time = 'audio_content_upload_estimated_time';
+  static const audio_content_upload_experimental = 'audio_content_upload_experimental';
+  static const audio_content_upload_explore_similar = 'audio_content_upload_explore_similar';
+  static const audio_content_upload_extracting_metadata = 'audio_content_upload_extracting_metadata';
+  static const audio_content_upload_file_error = 'audio_content_upload_file_error';
+  static const audio_content_upload_file_mode = 'audio_content_upload_file_mode';
+  static const audio_content_upload_file_size_label = 'audio_content_upload_file_size_label';
+  static const audio_content_upload_file_too_large = 'audio_content_upload_file_too_large';
+  static const audio_content_upload_folk = 'audio_content_upload_folk';
+  static const audio_content_upload_for_sale_checkbox = 'audio_content_upload_for_sale_checkbox';
+  static const audio_content_upload_format_label = 'audio_content_upload_format_label';
+  static const audio_content_upload_full_quality = 'audio_content_upload_full_quality';
+  static const audio_content_upload_generating_waveform = 'audio_content_upload_generating_waveform';
+  static const audio_content_upload_genres_label = 'audio_content_upload_genres_label';
+  static const audio_content_upload_high_quality_preserved = 'audio_content_upload_high_quality_preserved';
+  static const audio_content_upload_hip_hop = 'audio_content_upload_hip_hop';
+  static const audio_content_upload_identifiers_label = 'audio_content_upload_identifiers_label';
+  static const audio_content_upload_invalid_content = 'audio_content_upload_invalid_content';
+  static const audio_content_upload_isrc_hint = 'audio_content_upload_isrc_hint';
+  static const audio_content_upload_isrc_label = 'audio_content_upload_isrc_label';
+  static const audio_content_upload_jazz = 'audio_content_upload_jazz';
+  static const audio_content_upload_limit = 'audio_content_upload_limit';
+  static const audio_content_upload_lyrics_hint = 'audio_content_upload_lyrics_hint';
+  static const audio_content_upload_lyrics_label = 'audio_content_upload_lyrics_label';
+  static const audio_content_upload_metadata_extracted = 'audio_content_upload_metadata_extracted';
+  static const audio_content_upload_no_audio_error = 'audio_content_upload_no_audio_error';
+  static const audio_content_upload_original_upload = 'audio_content_upload_original_upload';
+  static const audio_content_upload_other = 'audio_content_upload_other';
+  static const audio_content_upload_pause_preview = 'audio_content_upload_pause_preview';
+  static const audio_content_upload_plain_text_mode = 'audio_content_upload_plain_text_mode';
+  static const audio_content_upload_play_preview = 'audio_content_upload_play_preview';
+  static const audio_content_upload_podcast = 'audio_content_upload_podcast';
+  static const audio_content_upload_pop = 'audio_content_upload_pop';
+  static const audio_content_upload_preview_not_available = 'audio_content_upload_preview_not_available';
+  static const audio_content_upload_preview_streaming = 'audio_content_upload_preview_streaming';
+  static const audio_content_upload_price_label = 'audio_content_upload_price_label';
+  static const audio_content_upload_price_required = 'audio_content_upload_price_required';
+  static const audio_content_upload_process_error = 'audio_content_upload_process_error';
+  static const audio_content_upload_processing_audio = 'audio_content_upload_processing_audio';
+  static const audio_content_upload_processing_complete = 'audio_content_upload_processing_complete';
+  static const audio_content_upload_producer_label = 'audio_content_upload_producer_label';
+  static const audio_content_upload_r_and_b = 'audio_content_upload_r_and_b';
+  static const audio_content_upload_ready_for_upload = 'audio_content_upload_ready_for_upload';
+  static const audio_content_upload_recording_date_label = 'audio_content_upload_recording_date_label';
+  static const audio_content_upload_recording_failed = 'audio_content_upload_recording_failed';
+  static const audio_content_upload_recording_hint = 'audio_content_upload_recording_hint';
+  static const audio_content_upload_recording_mode = 'audio_content_upload_recording_mode';
+  static const audio_content_upload_recording_permission_denied = 'audio_content_upload_recording_permission_denied';
+  static const audio_content_upload_recording_time = 'audio_content_upload_recording_time';
+  static const audio_content_upload_reggae = 'audio_content_upload_reggae';
+  static const audio_content_upload_retry_upload = 'audio_content_upload_retry_upload';
+  static const audio_content_upload_review_step_description = 'audio_content_upload_review_step_description';
+  static const audio_content_upload_review_step_title = 'audio_content_upload_review_step_title';
+  static const audio_content_upload_rich_text_mode = 'audio_content_upload_rich_text_mode';
+  static const audio_content_upload_rock = 'audio_content_upload_rock';
+  static const audio_content_upload_sample_rate_label = 'audio_content_upload_sample_rate_label';
+  static const audio_content_upload_saving_metadata = 'audio_content_upload_saving_metadata';
+  static const audio_content_upload_schedule_label = 'audio_content_upload_schedule_label';
+  static const audio_content_upload_select_file = 'audio_content_upload_select_file';
+  static const audio_content_upload_series_hint = 'audio_content_upload_series_hint';
+  static const audio_content_upload_series_label = 'audio_content_upload_series_label';
+  static const audio_content_upload_share_content = 'audio_content_upload_share_content';
+  static const audio_content_upload_soundtrack = 'audio_content_upload_soundtrack';
+  static const audio_content_upload_spoken_word = 'audio_content_upload_spoken_word';
+  static const audio_content_upload_start_recording = 'audio_content_upload_start_recording';
+  static const audio_content_upload_step_basic_info = 'audio_content_upload_step_basic_info';
+  static const audio_content_upload_step_basic_info_desc = 'audio_content_upload_step_basic_info_desc';
+  static const audio_content_upload_step_content = 'audio_content_upload_step_content';
+  static const audio_content_upload_step_content_desc = 'audio_content_upload_step_content_desc';
+  static const audio_content_upload_step_details = 'audio_content_upload_step_details';
+  static const audio_content_upload_step_details_desc = 'audio_content_upload_step_details_desc';
+  static const audio_content_upload_step_review = 'audio_content_upload_step_review';
+  static const audio_content_upload_step_review_desc = 'audio_content_upload_step_review_desc';
+  static const audio_content_upload_stop_preview = 'audio_content_upload_stop_preview';
+  static const audio_content_upload_stop_recording = 'audio_content_upload_stop_recording';
+  static const audio_content_upload_streaming_optimized = 'audio_content_upload_streaming_optimized';
+  static const audio_content_upload_studio_label = 'audio_content_upload_studio_label';
+  static const audio_content_upload_success = 'audio_content_upload_success';
+  static const audio_content_upload_text_mode = 'audio_content_upload_text_mode';
+  static const audio_content_upload_title = 'audio_content_upload_title';
+  static const audio_content_upload_title_label = 'audio_content_upload_title_label';
+  static const audio_content_upload_title_required = 'audio_content_upload_title_required';
+  static const audio_content_upload_track_number_label = 'audio_content_upload_track_number_label';
+  static const audio_content_upload_tracks_label = 'audio_content_upload_tracks_label';
+  static const audio_content_upload_unsupported_format = 'audio_content_upload_unsupported_format';
+  static const audio_content_upload_upload_progress = 'audio_content_upload_upload_progress';
+  static const audio_content_upload_uploading_audio = 'audio_content_upload_uploading_audio';
+  static const audio_content_upload_uploading_to_storage = 'audio_content_upload_uploading_to_storage';
+  static const audio_content_upload_validating_audio = 'audio_content_upload_validating_audio';
+  static const audio_content_upload_view_in_profile = 'audio_content_upload_view_in_profile';
+  static const audio_content_upload_volume_hint = 'audio_content_upload_volume_hint';
+  static const audio_content_upload_volume_label = 'audio_content_upload_volume_label';
+  static const audio_content_upload_waveform_generated = 'audio_content_upload_waveform_generated';
+  static const audio_content_upload_waveform_loading = 'audio_content_upload_waveform_loading';
+  static const audio_content_upload_world = 'audio_content_upload_world';
+  static const become_artist_description = 'become_artist_description';
+  static const become_artist_feature_analytics_desc = 'become_artist_feature_analytics_desc';
+  static const become_artist_feature_analytics_title = 'become_artist_feature_analytics_title';
+  static const become_artist_feature_events_desc = 'become_artist_feature_events_desc';
+  static const become_artist_feature_events_title = 'become_artist_feature_events_title';
+  static const become_artist_feature_gallery_desc = 'become_artist_feature_gallery_desc';
+  static const become_artist_feature_gallery_title = 'become_artist_feature_gallery_title';
+  static const become_artist_feature_profile_desc = 'become_artist_feature_profile_desc';
+  static const become_artist_feature_profile_title = 'become_artist_feature_profile_title';
+  static const become_artist_get_started_button = 'become_artist_get_started_button';
+  static const become_artist_title = 'become_artist_title';
+  static const become_artist_welcome = 'become_artist_welcome';
+  static const brand_art = 'brand_art';
+  static const brand_beat = 'brand_beat';
+  static const brand_local = 'brand_local';
+  static const browse_art_walks = 'browse_art_walks';
+  static const browse_artists = 'browse_artists';
+  static const browse_artwork = 'browse_artwork';
+  static const browse_captures = 'browse_captures';
+  static const browse_title = 'browse_title';
+  static const business_cta_label = 'business_cta_label';
+  static const captures_list_subtitle = 'captures_list_subtitle';
+  static const captures_list_title = 'captures_list_title';
+  static const k_continue = 'continue';
+  static const curated_gallery_all_collections = 'curated_gallery_all_collections';
+  static const curated_gallery_empty_message = 'curated_gallery_empty_message';
+  static const curated_gallery_empty_title = 'curated_gallery_empty_title';
+  static const curated_gallery_error_loading = 'curated_gallery_error_loading';
+  static const curated_gallery_error_unknown = 'curated_gallery_error_unknown';
+  static const curated_gallery_featured_badge = 'curated_gallery_featured_badge';
+  static const curated_gallery_featured_section = 'curated_gallery_featured_section';
+  static const curated_gallery_filter_all = 'curated_gallery_filter_all';
+  static const curated_gallery_no_collections = 'curated_gallery_no_collections';
+  static const curated_gallery_refresh_button = 'curated_gallery_refresh_button';
+  static const curated_gallery_retry_button = 'curated_gallery_retry_button';
+  static const curated_gallery_title = 'curated_gallery_title';
+  static const daily_quest_complete = 'daily_quest_complete';
+  static const daily_quest_how_to_complete = 'daily_quest_how_to_complete';
+  static const daily_quest_label = 'daily_quest_label';
+  static const description = 'description';
+  static const engagement_activities_left = 'engagement_activities_left';
+  static const engagement_badges = 'engagement_badges';
+  static const engagement_day_streak = 'engagement_day_streak';
+  static const engagement_discoveries = 'engagement_discoveries';
+  static const engagement_expires_in = 'engagement_expires_in';
+  static const engagement_level = 'engagement_level';
+  static const engagement_no_contributors = 'engagement_no_contributors';
+  static const engagement_on_fire = 'engagement_on_fire';
+  static const engagement_percent_complete = 'engagement_percent_complete';
+  static const engagement_progress_complete = 'engagement_progress_complete';
+  static const engagement_reward = 'engagement_reward';
+  static const engagement_tab_daily = 'engagement_tab_daily';
+  static const engagement_tab_leaders = 'engagement_tab_leaders';
+  static const engagement_tab_streak = 'engagement_tab_streak';
+  static const engagement_tab_weekly = 'engagement_tab_weekly';
+  static const engagement_to_complete_goal = 'engagement_to_complete_goal';
+  static const engagement_top_contributors = 'engagement_top_contributors';
+  static const engagement_view_all = 'engagement_view_all';
+  static const engagement_weekly_goal = 'engagement_weekly_goal';
+  static const engagement_weekly_goal_percent = 'engagement_weekly_goal_percent';
+  static const engagement_xp = 'engagement_xp';
+  static const enhanced_upload_add_audio_button = 'enhanced_upload_add_audio_button';
+  static const enhanced_upload_add_images_button = 'enhanced_upload_add_images_button';
+  static const enhanced_upload_add_videos_button = 'enhanced_upload_add_videos_button';
+  static const enhanced_upload_additional_images_label = 'enhanced_upload_additional_images_label';
+  static const enhanced_upload_audio_label = 'enhanced_upload_audio_label';
+  static const enhanced_upload_basic_info_step_description = 'enhanced_upload_basic_info_step_description';
+  static const enhanced_upload_basic_info_step_title = 'enhanced_upload_basic_info_step_title';
+  static const enhanced_upload_color_palette_label = 'enhanced_upload_color_palette_label';
+  static const enhanced_upload_continue = 'enhanced_upload_continue';
+  static const enhanced_upload_creation_process_hint = 'enhanced_upload_creation_process_hint';
+  static const enhanced_upload_creation_process_label = 'enhanced_upload_creation_process_label';
+  static const enhanced_upload_description_label = 'enhanced_upload_description_label';
+  static const enhanced_upload_details_step_description = 'enhanced_upload_details_step_description';
+  static const enhanced_upload_details_step_title = 'enhanced_upload_details_step_title';
+  static const enhanced_upload_dimensions_label = 'enhanced_upload_dimensions_label';
+  static const enhanced_upload_draft_save_error = 'enhanced_upload_draft_save_error';
+  static const enhanced_upload_draft_saved = 'enhanced_upload_draft_saved';
+  static const enhanced_upload_for_sale_description = 'enhanced_upload_for_sale_description';
+  static const enhanced_upload_for_sale_label = 'enhanced_upload_for_sale_label';
+  static const enhanced_upload_hashtags_label = 'enhanced_upload_hashtags_label';
+  static const enhanced_upload_inspiration_hint = 'enhanced_upload_inspiration_hint';
+  static const enhanced_upload_inspiration_label = 'enhanced_upload_inspiration_label';
+  static const enhanced_upload_keywords_label = 'enhanced_upload_keywords_label';
+  static const enhanced_upload_limit_message = 'enhanced_upload_limit_message';
+  static const enhanced_upload_limit_title = 'enhanced_upload_limit_title';
+  static const enhanced_upload_location_label = 'enhanced_upload_location_label';
+  static const enhanced_upload_main_image_description = 'enhanced_upload_main_image_description';
+  static const enhanced_upload_main_image_placeholder = 'enhanced_upload_main_image_placeholder';
+  static const enhanced_upload_main_image_title = 'enhanced_upload_main_image_title';
+  static const enhanced_upload_materials_label = 'enhanced_upload_materials_label';
+  static const enhanced_upload_media_description = 'enhanced_upload_media_description';
+  static const enhanced_upload_media_styles_title = 'enhanced_upload_media_styles_title';
+  static const enhanced_upload_media_title = 'enhanced_upload_media_title';
+  static const enhanced_upload_medium_label = 'enhanced_upload_medium_label';
+  static const enhanced_upload_no_additional_images_text = 'enhanced_upload_no_additional_images_text';
+  static const enhanced_upload_no_audio_text = 'enhanced_upload_no_audio_text';
+  static const enhanced_upload_no_description = 'enhanced_upload_no_description';
+  static const enhanced_upload_no_title = 'enhanced_upload_no_title';
+  static const enhanced_upload_no_videos_text = 'enhanced_upload_no_videos_text';
+  static const enhanced_upload_not_found = 'enhanced_upload_not_found';
+  static const enhanced_upload_pricing_step_description = 'enhanced_upload_pricing_step_description';
+  static const enhanced_upload_pricing_step_title = 'enhanced_upload_pricing_step_title';
+  static const enhanced_upload_review_step_description = 'enhanced_upload_review_step_description';
+  static const enhanced_upload_review_step_title = 'enhanced_upload_review_step_title';
+  static const enhanced_upload_rich_metadata_title = 'enhanced_upload_rich_metadata_title';
+  static const enhanced_upload_save_draft = 'enhanced_upload_save_draft';
+  static const enhanced_upload_select_image = 'enhanced_upload_select_image';
+  static const enhanced_upload_select_main_image = 'enhanced_upload_select_main_image';
+  static const enhanced_upload_select_medium = 'enhanced_upload_select_medium';
+  static const enhanced_upload_select_style = 'enhanced_upload_select_style';
+  static const enhanced_upload_step_basic_info = 'enhanced_upload_step_basic_info';
+  static const enhanced_upload_step_basic_info_desc = 'enhanced_upload_step_basic_info_desc';
+  static const enhanced_upload_step_details = 'enhanced_upload_step_details';
+  static const enhanced_upload_step_details_desc = 'enhanced_upload_step_details_desc';
+  static const enhanced_upload_step_media = 'enhanced_upload_step_media';
+  static const enhanced_upload_step_media_desc = 'enhanced_upload_step_media_desc';
+  static const enhanced_upload_step_pricing = 'enhanced_upload_step_pricing';
+  static const enhanced_upload_step_pricing_desc = 'enhanced_upload_step_pricing_desc';
+  static const enhanced_upload_step_review = 'enhanced_upload_step_review';
+  static const enhanced_upload_step_review_desc = 'enhanced_upload_step_review_desc';
+  static const enhanced_upload_styles_label = 'enhanced_upload_styles_label';
+  static const enhanced_upload_success = 'enhanced_upload_success';
+  static const enhanced_upload_tags_label = 'enhanced_upload_tags_label';
+  static const enhanced_upload_tags_title = 'enhanced_upload_tags_title';
+  static const enhanced_upload_technique_hint = 'enhanced_upload_technique_hint';
+  static const enhanced_upload_technique_label = 'enhanced_upload_technique_label';
+  static const enhanced_upload_title = 'enhanced_upload_title';
+  static const enhanced_upload_title_edit = 'enhanced_upload_title_edit';
+  static const enhanced_upload_title_label = 'enhanced_upload_title_label';
+  static const enhanced_upload_upgrade_button = 'enhanced_upload_upgrade_button';
+  static const enhanced_upload_videos_label = 'enhanced_upload_videos_label';
+  static const enhanced_upload_year_label = 'enhanced_upload_year_label';
+  static const explore_artists_subtitle = 'explore_artists_subtitle';
+  static const explore_artists_title = 'explore_artists_title';
+  static const explore_artwork_subtitle = 'explore_artwork_subtitle';
+  static const explore_artwork_title = 'explore_artwork_title';
+  static const explore_community_highlights = 'explore_community_highlights';
+  static const explore_community_highlights_subtitle = 'explore_community_highlights_subtitle';
+  static const explore_community_subtitle = 'explore_community_subtitle';
+  static const explore_community_title = 'explore_community_title';
+  static const explore_empty_artists_subtitle = 'explore_empty_artists_subtitle';
+  static const explore_empty_artists_title = 'explore_empty_artists_title';
+  static const explore_empty_artwork_subtitle = 'explore_empty_artwork_subtitle';
+  static const explore_empty_artwork_title = 'explore_empty_artwork_title';
+  static const explore_empty_events_subtitle = 'explore_empty_events_subtitle';
+  static const explore_empty_events_title = 'explore_empty_events_title';
+  static const explore_events_subtitle = 'explore_events_subtitle';
+  static const explore_events_title = 'explore_events_title';
+  static const explore_featured = 'explore_featured';
+  static const explore_featured_artists = 'explore_featured_artists';
+  static const explore_featured_artists_subtitle = 'explore_featured_artists_subtitle';
+  static const explore_featured_artwork = 'explore_featured_artwork';
+  static const explore_featured_artwork_subtitle = 'explore_featured_artwork_subtitle';
+  static const explore_for_you_subtitle = 'explore_for_you_subtitle';
+  static const explore_for_you_title = 'explore_for_you_title';
+  static const explore_nearby = 'explore_nearby';
+  static const explore_new = 'explore_new';
+  static const explore_popular = 'explore_popular';
+  static const explore_search = 'explore_search';
+  static const explore_tab_artists = 'explore_tab_artists';
+  static const explore_tab_artwork = 'explore_tab_artwork';
+  static const explore_tab_community = 'explore_tab_community';
+  static const explore_tab_events = 'explore_tab_events';
+  static const explore_tab_for_you = 'explore_tab_for_you';
+  static const explore_title = 'explore_title';
+  static const explore_upcoming_events = 'explore_upcoming_events';
+  static const explore_upcoming_events_subtitle = 'explore_upcoming_events_subtitle';
+  static const genres = 'genres';
+  static const goal_artist_fan_desc = 'goal_artist_fan_desc';
+  static const goal_artist_fan_milestone_1 = 'goal_artist_fan_milestone_1';
+  static const goal_artist_fan_milestone_2 = 'goal_artist_fan_milestone_2';
+  static const goal_artist_fan_milestone_3 = 'goal_artist_fan_milestone_3';
+  static const goal_artist_fan_reward = 'goal_artist_fan_reward';
+  static const goal_artist_fan_title = 'goal_artist_fan_title';
+  static const goal_community_builder_desc = 'goal_community_builder_desc';
+  static const goal_community_builder_milestone_1 = 'goal_community_builder_milestone_1';
+  static const goal_community_builder_milestone_2 = 'goal_community_builder_milestone_2';
+  static const goal_community_builder_milestone_3 = 'goal_community_builder_milestone_3';
+  static const goal_community_builder_reward = 'goal_community_builder_reward';
+  static const goal_community_builder_title = 'goal_community_builder_title';
+  static const goal_golden_hour_master_desc = 'goal_golden_hour_master_desc';
+  static const goal_golden_hour_master_milestone_1 = 'goal_golden_hour_master_milestone_1';
+  static const goal_golden_hour_master_milestone_2 = 'goal_golden_hour_master_milestone_2';
+  static const goal_golden_hour_master_milestone_3 = 'goal_golden_hour_master_milestone_3';
+  static const goal_golden_hour_master_reward = 'goal_golden_hour_master_reward';
+  static const goal_golden_hour_master_title = 'goal_golden_hour_master_title';
+  static const goal_master_photographer_desc = 'goal_master_photographer_desc';
+  static const goal_master_photographer_milestone_1 = 'goal_master_photographer_milestone_1';
+  static const goal_master_photographer_milestone_2 = 'goal_master_photographer_milestone_2';
+  static const goal_master_photographer_milestone_3 = 'goal_master_photographer_milestone_3';
+  static const goal_master_photographer_reward = 'goal_master_photographer_reward';
+  static const goal_master_photographer_title = 'goal_master_photographer_title';
+  static const goal_neighborhood_navigator_desc = 'goal_neighborhood_navigator_desc';
+  static const goal_neighborhood_navigator_milestone_1 = 'goal_neighborhood_navigator_milestone_1';
+  static const goal_neighborhood_navigator_milestone_2 = 'goal_neighborhood_navigator_milestone_2';
+  static const goal_neighborhood_navigator_milestone_3 = 'goal_neighborhood_navigator_milestone_3';
+  static const goal_neighborhood_navigator_reward = 'goal_neighborhood_navigator_reward';
+  static const goal_neighborhood_navigator_title = 'goal_neighborhood_navigator_title';
+  static const goal_quest_master_desc = 'goal_quest_master_desc';
+  static const goal_quest_master_milestone_1 = 'goal_quest_master_milestone_1';
+  static const goal_quest_master_milestone_2 = 'goal_quest_master_milestone_2';
+  static const goal_quest_master_milestone_3 = 'goal_quest_master_milestone_3';
+  static const goal_quest_master_reward = 'goal_quest_master_reward';
+  static const goal_quest_master_title = 'goal_quest_master_title';
+  static const goal_social_butterfly_desc = 'goal_social_butterfly_desc';
+  static const goal_social_butterfly_milestone_1 = 'goal_social_butterfly_milestone_1';
+  static const goal_social_butterfly_milestone_2 = 'goal_social_butterfly_milestone_2';
+  static const goal_social_butterfly_milestone_3 = 'goal_social_butterfly_milestone_3';
+  static const goal_social_butterfly_reward = 'goal_social_butterfly_reward';
+  static const goal_social_butterfly_title = 'goal_social_butterfly_title';
+  static const goal_step_champion_desc = 'goal_step_champion_desc';
+  static const goal_step_champion_milestone_1 = 'goal_step_champion_milestone_1';
+  static const goal_step_champion_milestone_2 = 'goal_step_champion_milestone_2';
+  static const goal_step_champion_milestone_3 = 'goal_step_champion_milestone_3';
+  static const goal_step_champion_reward = 'goal_step_champion_reward';
+  static const goal_step_champion_title = 'goal_step_champion_title';
+  static const goal_streak_keeper_desc = 'goal_streak_keeper_desc';
+  static const goal_streak_keeper_milestone_1 = 'goal_streak_keeper_milestone_1';
+  static const goal_streak_keeper_milestone_2 = 'goal_streak_keeper_milestone_2';
+  static const goal_streak_keeper_milestone_3 = 'goal_streak_keeper_milestone_3';
+  static const goal_streak_keeper_reward = 'goal_streak_keeper_reward';
+  static const goal_streak_keeper_title = 'goal_streak_keeper_title';
+  static const goal_style_collector_desc = 'goal_style_collector_desc';
+  static const goal_style_collector_milestone_1 = 'goal_style_collector_milestone_1';
+  static const goal_style_collector_milestone_2 = 'goal_style_collector_milestone_2';
+  static const goal_style_collector_milestone_3 = 'goal_style_collector_milestone_3';
+  static const goal_style_collector_reward = 'goal_style_collector_reward';
+  static const goal_style_collector_title = 'goal_style_collector_title';
+  static const goal_urban_walker_desc = 'goal_urban_walker_desc';
+  static const goal_urban_walker_milestone_1 = 'goal_urban_walker_milestone_1';
+  static const goal_urban_walker_milestone_2 = 'goal_urban_walker_milestone_2';
+  static const goal_urban_walker_milestone_3 = 'goal_urban_walker_milestone_3';
+  static const goal_urban_walker_reward = 'goal_urban_walker_reward';
+  static const goal_urban_walker_title = 'goal_urban_walker_title';
+  static const goal_weekly_art_explorer_desc = 'goal_weekly_art_explorer_desc';
+  static const goal_weekly_art_explorer_milestone_1 = 'goal_weekly_art_explorer_milestone_1';
+  static const goal_weekly_art_explorer_milestone_2 = 'goal_weekly_art_explorer_milestone_2';
+  static const goal_weekly_art_explorer_milestone_3 = 'goal_weekly_art_explorer_milestone_3';
+  static const goal_weekly_art_explorer_reward = 'goal_weekly_art_explorer_reward';
+  static const goal_weekly_art_explorer_title = 'goal_weekly_art_explorer_title';
+  static const header_tooltip_back = 'header_tooltip_back';
+  static const header_tooltip_developer_tools = 'header_tooltip_developer_tools';
+  static const header_tooltip_menu = 'header_tooltip_menu';
+  static const header_tooltip_messages = 'header_tooltip_messages';
+  static const header_tooltip_profile = 'header_tooltip_profile';
+  static const header_tooltip_search = 'header_tooltip_search';
+  static const leaderboard_title = 'leaderboard_title';
+  static const level_prefix = 'level_prefix';
+  static const live_activity_achieved = 'live_activity_achieved';
+  static const live_activity_artwork = 'live_activity_artwork';
+  static const live_activity_captured = 'live_activity_captured';
+  static const live_activity_completed = 'live_activity_completed';
+  static const live_activity_discovered = 'live_activity_discovered';
+  static const live_activity_empty = 'live_activity_empty';
+  static const live_activity_joined = 'live_activity_joined';
+  static const live_activity_reached = 'live_activity_reached';
+  static const live_activity_title = 'live_activity_title';
+  static const my_captures_empty = 'my_captures_empty';
+  static const my_captures_subtitle = 'my_captures_subtitle';
+  static const my_captures_title = 'my_captures_title';
+  static const notification_settings_subtitle = 'notification_settings_subtitle';
+  static const notification_settings_title = 'notification_settings_title';
+  static const notifications_add_test = 'notifications_add_test';
+  static const notifications_all_marked_read = 'notifications_all_marked_read';
+  static const notifications_days_ago = 'notifications_days_ago';
+  static const notifications_default_title = 'notifications_default_title';
+  static const notifications_empty_subtitle = 'notifications_empty_subtitle';
+  static const notifications_empty_title = 'notifications_empty_title';
+  static const notifications_fix_images = 'notifications_fix_images';
+  static const notifications_hours_ago = 'notifications_hours_ago';
+  static const notifications_just_now = 'notifications_just_now';
+  static const notifications_login_required = 'notifications_login_required';
+  static const notifications_mark_all_read = 'notifications_mark_all_read';
+  static const notifications_minutes_ago = 'notifications_minutes_ago';
+  static const notifications_test_created = 'notifications_test_created';
+  static const notifications_test_message = 'notifications_test_message';
+  static const notifications_test_title = 'notifications_test_title';
+  static const notifications_title = 'notifications_title';
+  static const onboarding_add_bio_photo = 'onboarding_add_bio_photo';
+  static const onboarding_art_walks = 'onboarding_art_walks';
+  static const onboarding_art_walks_desc = 'onboarding_art_walks_desc';
+  static const onboarding_artists_online = 'onboarding_artists_online';
+  static const onboarding_begin_journey = 'onboarding_begin_journey';
+  static const onboarding_capture_moment = 'onboarding_capture_moment';
+  static const onboarding_captures = 'onboarding_captures';
+  static const onboarding_captures_desc = 'onboarding_captures_desc';
+  static const onboarding_community = 'onboarding_community';
+  static const onboarding_community_desc = 'onboarding_community_desc';
+  static const onboarding_community_description = 'onboarding_community_description';
+  static const onboarding_complete_profile = 'onboarding_complete_profile';
+  static const onboarding_connect_artists = 'onboarding_connect_artists';
+  static const onboarding_connect_description = 'onboarding_connect_description';
+  static const onboarding_connect_title = 'onboarding_connect_title';
+  static const onboarding_continue = 'onboarding_continue';
+  static const onboarding_create_description = 'onboarding_create_description';
+  static const onboarding_create_title = 'onboarding_create_title';
+  static const onboarding_discover_create_connect = 'onboarding_discover_create_connect';
+  static const onboarding_discover_features = 'onboarding_discover_features';
+  static const onboarding_explore_description = 'onboarding_explore_description';
+  static const onboarding_explore_nearby = 'onboarding_explore_nearby';
+  static const onboarding_explore_title = 'onboarding_explore_title';
+  static const onboarding_find_friends = 'onboarding_find_friends';
+  static const onboarding_get_started = 'onboarding_get_started';
+  static const onboarding_join_community = 'onboarding_join_community';
+  static const onboarding_members_joined = 'onboarding_members_joined';
+  static const onboarding_profile_description = 'onboarding_profile_description';
+  static const onboarding_profile_title = 'onboarding_profile_title';
+  static const onboarding_quick_setup = 'onboarding_quick_setup';
+  static const onboarding_ready_to_start = 'onboarding_ready_to_start';
+  static const onboarding_setup_progress = 'onboarding_setup_progress';
+  static const onboarding_start_art_walk = 'onboarding_start_art_walk';
+  static const onboarding_step_progress = 'onboarding_step_progress';
+  static const onboarding_take_first_photo = 'onboarding_take_first_photo';
+  static const onboarding_welcome_description = 'onboarding_welcome_description';
+  static const onboarding_welcome_title = 'onboarding_welcome_title';
+  static const onboarding_welcome_to_artbeat = 'onboarding_welcome_to_artbeat';
+  static const onboarding_welcome_user = 'onboarding_welcome_user';
+  static const onboarding_your_journey = 'onboarding_your_journey';
+  static const privacy_settings_subtitle = 'privacy_settings_subtitle';
+  static const privacy_settings_title = 'privacy_settings_title';
+  static const quest_art_critic_desc = 'quest_art_critic_desc';
+  static const quest_art_critic_reward = 'quest_art_critic_reward';
+  static const quest_art_critic_title = 'quest_art_critic_title';
+  static const quest_art_explorer_desc = 'quest_art_explorer_desc';
+  static const quest_art_explorer_reward = 'quest_art_explorer_reward';
+  static const quest_art_explorer_title = 'quest_art_explorer_title';
+  static const quest_art_sharer_desc = 'quest_art_sharer_desc';
+  static const quest_art_sharer_reward = 'quest_art_sharer_reward';
+  static const quest_art_sharer_title = 'quest_art_sharer_title';
+  static const quest_artwalks_subtitle = 'quest_artwalks_subtitle';
+  static const quest_artwalks_tag = 'quest_artwalks_tag';
+  static const quest_artwalks_title = 'quest_artwalks_title';
+  static const quest_capture_subtitle = 'quest_capture_subtitle';
+  static const quest_capture_tag = 'quest_capture_tag';
+  static const quest_capture_title = 'quest_capture_title';
+  static const quest_community_connector_desc = 'quest_community_connector_desc';
+  static const quest_community_connector_reward = 'quest_community_connector_reward';
+  static const quest_community_connector_title = 'quest_community_connector_title';
+  static const quest_connect_subtitle = 'quest_connect_subtitle';
+  static const quest_connect_tag = 'quest_connect_tag';
+  static const quest_connect_title = 'quest_connect_title';
+  static const quest_discover_subtitle = 'quest_discover_subtitle';
+  static const quest_discover_tag = 'quest_discover_tag';
+  static const quest_discover_title = 'quest_discover_title';
+  static const quest_early_bird_desc = 'quest_early_bird_desc';
+  static const quest_early_bird_reward = 'quest_early_bird_reward';
+  static const quest_early_bird_title = 'quest_early_bird_title';
+  static const quest_golden_hour_artist_desc = 'quest_golden_hour_artist_desc';
+  static const quest_golden_hour_artist_reward = 'quest_golden_hour_artist_reward';
+  static const quest_golden_hour_artist_title = 'quest_golden_hour_artist_title';
+  static const quest_hub_label = 'quest_hub_label';
+  static const quest_neighborhood_scout_desc = 'quest_neighborhood_scout_desc';
+  static const quest_neighborhood_scout_reward = 'quest_neighborhood_scout_reward';
+  static const quest_neighborhood_scout_title = 'quest_neighborhood_scout_title';
+  static const quest_night_owl_desc = 'quest_night_owl_desc';
+  static const quest_night_owl_reward = 'quest_night_owl_reward';
+  static const quest_night_owl_title = 'quest_night_owl_title';
+  static const quest_photo_hunter_desc = 'quest_photo_hunter_desc';
+  static const quest_photo_hunter_reward = 'quest_photo_hunter_reward';
+  static const quest_photo_hunter_title = 'quest_photo_hunter_title';
+  static const quest_step_master_desc = 'quest_step_master_desc';
+  static const quest_step_master_reward = 'quest_step_master_reward';
+  static const quest_step_master_title = 'quest_step_master_title';
+  static const quest_streak_warrior_desc = 'quest_streak_warrior_desc';
+  static const quest_streak_warrior_reward = 'quest_streak_warrior_reward';
+  static const quest_streak_warrior_title = 'quest_streak_warrior_title';
+  static const quest_style_collector_desc = 'quest_style_collector_desc';
+  static const quest_style_collector_reward = 'quest_style_collector_reward';
+  static const quest_style_collector_title = 'quest_style_collector_title';
+  static const quest_urban_wanderer_desc = 'quest_urban_wanderer_desc';
+  static const quest_urban_wanderer_reward = 'quest_urban_wanderer_reward';
+  static const quest_urban_wanderer_title = 'quest_urban_wanderer_title';
+  static const screen_title_artist_portfolios = 'screen_title_artist_portfolios';
+  static const screen_title_commissions = 'screen_title_commissions';
+  static const screen_title_community_feed = 'screen_title_community_feed';
+  static const screen_title_community_hub = 'screen_title_community_hub';
+  static const screen_title_create_post = 'screen_title_create_post';
+  static const screen_title_discover_studios = 'screen_title_discover_studios';
+  static const screen_title_gifts = 'screen_title_gifts';
+  static const screen_title_moderation = 'screen_title_moderation';
+  static const screen_title_my_posts = 'screen_title_my_posts';
+  static const screen_title_quiet_mode = 'screen_title_quiet_mode';
+  static const screen_title_search_community = 'screen_title_search_community';
+  static const screen_title_studios = 'screen_title_studios';
+  static const screen_title_trending_content = 'screen_title_trending_content';
+  static const search_empty_desc = 'search_empty_desc';
+  static const search_empty_title = 'search_empty_title';
+  static const search_error_title = 'search_error_title';
+  static const search_filter_all = 'search_filter_all';
+  static const search_hint = 'search_hint';
+  static const search_loading = 'search_loading';
+  static const search_no_results = 'search_no_results';
+  static const search_no_results_hint = 'search_no_results_hint';
+  static const search_recent_searches = 'search_recent_searches';
+  static const search_sort_popular = 'search_sort_popular';
+  static const search_sort_recent = 'search_sort_recent';
+  static const search_sort_relevant = 'search_sort_relevant';
+  static const search_try_again = 'search_try_again';
+  static const social_links_subtitle = 'social_links_subtitle';
+  static const social_links_title = 'social_links_title';
+  static const subscription_plans_cta = 'subscription_plans_cta';
+  static const subscription_plans_nav_working = 'subscription_plans_nav_working';
+  static const subscription_plans_title = 'subscription_plans_title';
+  static const system_settings_account_created = 'system_settings_account_created';
+  static const system_settings_app_info = 'system_settings_app_info';
+  static const system_settings_app_name = 'system_settings_app_name';
+  static const system_settings_build_number = 'system_settings_build_number';
+  static const system_settings_email = 'system_settings_email';
+  static const system_settings_last_signin = 'system_settings_last_signin';
+  static const system_settings_not_authenticated = 'system_settings_not_authenticated';
+  static const system_settings_not_provided = 'system_settings_not_provided';
+  static const system_settings_package_name = 'system_settings_package_name';
+  static const system_settings_system_info = 'system_settings_system_info';
+  static const system_settings_unknown = 'system_settings_unknown';
+  static const system_settings_user_id = 'system_settings_user_id';
+  static const system_settings_user_info = 'system_settings_user_info';
+  static const system_settings_version = 'system_settings_version';
+  static const terms_subtitle = 'terms_subtitle';
+  static const terms_title = 'terms_title';
+  static const tickets_empty_default = 'tickets_empty_default';
+  static const tickets_empty_default_desc = 'tickets_empty_default_desc';
+  static const tickets_empty_past = 'tickets_empty_past';
+  static const tickets_empty_past_desc = 'tickets_empty_past_desc';
+  static const tickets_empty_upcoming = 'tickets_empty_upcoming';
+  static const tickets_empty_upcoming_desc = 'tickets_empty_upcoming_desc';
+  static const tickets_tab_all = 'tickets_tab_all';
+  static const tickets_tab_past = 'tickets_tab_past';
+  static const tickets_tab_upcoming = 'tickets_tab_upcoming';
+  static const tickets_title = 'tickets_title';
+  static const title = 'title';
+  static const upload_choice_audio_coming_soon = 'upload_choice_audio_coming_soon';
+  static const upload_choice_audio_desc = 'upload_choice_audio_desc';
+  static const upload_choice_audio_title = 'upload_choice_audio_title';
+  static const upload_choice_title = 'upload_choice_title';
+  static const upload_choice_video_coming_soon = 'upload_choice_video_coming_soon';
+  static const upload_choice_video_desc = 'upload_choice_video_desc';
+  static const upload_choice_video_title = 'upload_choice_video_title';
+  static const upload_choice_visual_desc = 'upload_choice_visual_desc';
+  static const upload_choice_visual_title = 'upload_choice_visual_title';
+  static const upload_choice_written_desc = 'upload_choice_written_desc';
+  static const upload_choice_written_title = 'upload_choice_written_title';
+  static const user_dashboard_achievements = 'user_dashboard_achievements';
+  static const user_dashboard_art_walks = 'user_dashboard_art_walks';
+  static const user_dashboard_browse = 'user_dashboard_browse';
+  static const user_dashboard_captures = 'user_dashboard_captures';
+  static const user_dashboard_community = 'user_dashboard_community';
+  static const user_dashboard_community_feed = 'user_dashboard_community_feed';
+  static const user_dashboard_completed = 'user_dashboard_completed';
+  static const user_dashboard_connect_artists = 'user_dashboard_connect_artists';
+  static const user_dashboard_connect_with_artists = 'user_dashboard_connect_with_artists';
+  static const user_dashboard_daily_challenge = 'user_dashboard_daily_challenge';
+  static const user_dashboard_discover_art = 'user_dashboard_discover_art';
+  static const user_dashboard_discover_description = 'user_dashboard_discover_description';
+  static const user_dashboard_discover_new_art = 'user_dashboard_discover_new_art';
+  static const user_dashboard_events = 'user_dashboard_events';
+  static const user_dashboard_explore_more = 'user_dashboard_explore_more';
+  static const user_dashboard_explore_nearby = 'user_dashboard_explore_nearby';
+  static const user_dashboard_find_art = 'user_dashboard_find_art';
+  static const user_dashboard_join_conversation = 'user_dashboard_join_conversation';
+  static const user_dashboard_join_events = 'user_dashboard_join_events';
+  static const user_dashboard_level = 'user_dashboard_level';
+  static const user_dashboard_loading = 'user_dashboard_loading';
+  static const user_dashboard_nearby_walks = 'user_dashboard_nearby_walks';
+  static const user_dashboard_quick_actions = 'user_dashboard_quick_actions';
+  static const user_dashboard_ready_to_explore = 'user_dashboard_ready_to_explore';
+  static const user_dashboard_recent_captures = 'user_dashboard_recent_captures';
+  static const user_dashboard_start_capturing = 'user_dashboard_start_capturing';
+  static const user_dashboard_view_all = 'user_dashboard_view_all';
+  static const user_dashboard_walks = 'user_dashboard_walks';
+  static const user_dashboard_welcome = 'user_dashboard_welcome';
+  static const user_dashboard_welcome_local_artbeat = 'user_dashboard_welcome_local_artbeat';
+  static const user_dashboard_your_journey = 'user_dashboard_your_journey';
+  static const user_dashboard_your_progress = 'user_dashboard_your_progress';
+  static const user_events_discover_title = 'user_events_discover_title';
+  static const user_events_empty_subtitle = 'user_events_empty_subtitle';
+  static const user_events_empty_title = 'user_events_empty_title';
+  static const video_content_upload_aspect_ratio = 'video_content_upload_aspect_ratio';
+  static const video_content_upload_choose_file = 'video_content_upload_choose_file';
+  static const video_content_upload_choose_thumbnail = 'video_content_upload_choose_thumbnail';
+  static const video_content_upload_cinematographer = 'video_content_upload_cinematographer';
+  static const video_content_upload_content_desc = 'video_content_upload_content_desc';
+  static const video_content_upload_content_type = 'video_content_upload_content_type';
+  static const video_content_upload_description_required = 'video_content_upload_description_required';
+  static const video_content_upload_director = 'video_content_upload_director';
+  static const video_content_upload_editor = 'video_content_upload_editor';
+  static const video_content_upload_equipment = 'video_content_upload_equipment';
+  static const video_content_upload_error = 'video_content_upload_error';
+  static const video_content_upload_file_error = 'video_content_upload_file_error';
+  static const video_content_upload_file_too_large = 'video_content_upload_file_too_large';
+  static const video_content_upload_for_sale = 'video_content_upload_for_sale';
+  static const video_content_upload_frame_rate = 'video_content_upload_frame_rate';
+  static const video_content_upload_invalid_content = 'video_content_upload_invalid_content';
+  static const video_content_upload_limit = 'video_content_upload_limit';
+  static const video_content_upload_location = 'video_content_upload_location';
+  static const video_content_upload_no_video_error = 'video_content_upload_no_video_error';
+  static const video_content_upload_price_required = 'video_content_upload_price_required';
+  static const video_content_upload_pricing = 'video_content_upload_pricing';
+  static const video_content_upload_process_error = 'video_content_upload_process_error';
+  static const video_content_upload_producer = 'video_content_upload_producer';
+  static const video_content_upload_production_company = 'video_content_upload_production_company';
+  static const video_content_upload_production_info = 'video_content_upload_production_info';
+  static const video_content_upload_release_schedule = 'video_content_upload_release_schedule';
+  static const video_content_upload_review = 'video_content_upload_review';
+  static const video_content_upload_review_note = 'video_content_upload_review_note';
+  static const video_content_upload_schedule_bi_weekly = 'video_content_upload_schedule_bi-weekly';
+  static const video_content_upload_schedule_custom = 'video_content_upload_schedule_custom';
+  static const video_content_upload_schedule_immediate = 'video_content_upload_schedule_immediate';
+  static const video_content_upload_schedule_monthly = 'video_content_upload_schedule_monthly';
+  static const video_content_upload_schedule_weekly = 'video_content_upload_schedule_weekly';
+  static const video_content_upload_select_thumbnail = 'video_content_upload_select_thumbnail';
+  static const video_content_upload_select_video = 'video_content_upload_select_video';
+  static const video_content_upload_step_basic_info = 'video_content_upload_step_basic_info';
+  static const video_content_upload_step_basic_info_desc = 'video_content_upload_step_basic_info_desc';
+  static const video_content_upload_step_content = 'video_content_upload_step_content';
+  static const video_content_upload_step_content_desc = 'video_content_upload_step_content_desc';
+  static const video_content_upload_step_details = 'video_content_upload_step_details';
+  static const video_content_upload_step_details_desc = 'video_content_upload_step_details_desc';
+  static const video_content_upload_step_review = 'video_content_upload_step_review';
+  static const video_content_upload_step_review_desc = 'video_content_upload_step_review_desc';
+  static const video_content_upload_success = 'video_content_upload_success';
+  static const video_content_upload_supported_formats = 'video_content_upload_supported_formats';
+  static const video_content_upload_technical_specs = 'video_content_upload_technical_specs';
+  static const video_content_upload_thumbnail = 'video_content_upload_thumbnail';
+  static const video_content_upload_thumbnail_error = 'video_content_upload_thumbnail_error';
+  static const video_content_upload_title = 'video_content_upload_title';
+  static const video_content_upload_title_required = 'video_content_upload_title_required';
+  static const video_content_upload_unsupported_format = 'video_content_upload_unsupported_format';
+  static const weekly_goals_completed = 'weekly_goals_completed';
+  static const weekly_goals_days_left = 'weekly_goals_days_left';
+  static const weekly_goals_milestones = 'weekly_goals_milestones';
+  static const weekly_goals_title = 'weekly_goals_title';
+  static const weekly_goals_view_all = 'weekly_goals_view_all';
+  static const written_content_upload_author_note_label = 'written_content_upload_author_note_label';
+  static const written_content_upload_back = 'written_content_upload_back';
+  static const written_content_upload_basic_info_step_description = 'written_content_upload_basic_info_step_description';
+  static const written_content_upload_basic_info_step_title = 'written_content_upload_basic_info_step_title';
+  static const written_content_upload_basic_info_summary = 'written_content_upload_basic_info_summary';
+  static const written_content_upload_button = 'written_content_upload_button';
+  static const written_content_upload_chapter_hint = 'written_content_upload_chapter_hint';
+  static const written_content_upload_chapter_label = 'written_content_upload_chapter_label';
+  static const written_content_upload_chapters_label = 'written_content_upload_chapters_label';
+  static const written_content_upload_content_preview = 'written_content_upload_content_preview';
+  static const written_content_upload_content_section = 'written_content_upload_content_section';
+  static const written_content_upload_content_step_description = 'written_content_upload_content_step_description';
+  static const written_content_upload_content_step_title = 'written_content_upload_content_step_title';
+  static const written_content_upload_content_type_label = 'written_content_upload_content_type_label';
+  static const written_content_upload_continue = 'written_content_upload_continue';
+  static const written_content_upload_cover_image_hint = 'written_content_upload_cover_image_hint';
+  static const written_content_upload_cover_image_label = 'written_content_upload_cover_image_label';
+  static const written_content_upload_description_label = 'written_content_upload_description_label';
+  static const written_content_upload_description_required = 'written_content_upload_description_required';
+  static const written_content_upload_details_step_description = 'written_content_upload_details_step_description';
+  static const written_content_upload_details_step_title = 'written_content_upload_details_step_title';
+  static const written_content_upload_details_summary = 'written_content_upload_details_summary';
+  static const written_content_upload_duplicate_warning = 'written_content_upload_duplicate_warning';
+  static const written_content_upload_error = 'written_content_upload_error';
+  static const written_content_upload_file_error = 'written_content_upload_file_error';
+  static const written_content_upload_file_mode = 'written_content_upload_file_mode';
+  static const written_content_upload_for_sale_checkbox = 'written_content_upload_for_sale_checkbox';
+  static const written_content_upload_genres_label = 'written_content_upload_genres_label';
+  static const written_content_upload_identifiers_label = 'written_content_upload_identifiers_label';
+  static const written_content_upload_image_error = 'written_content_upload_image_error';
+  static const written_content_upload_invalid_content = 'written_content_upload_invalid_content';
+  static const written_content_upload_limit = 'written_content_upload_limit';
+  static const written_content_upload_no_image_error = 'written_content_upload_no_image_error';
+  static const written_content_upload_plain_text_mode = 'written_content_upload_plain_text_mode';
+  static const written_content_upload_price_label = 'written_content_upload_price_label';
+  static const written_content_upload_price_required = 'written_content_upload_price_required';
+  static const written_content_upload_process_error = 'written_content_upload_process_error';
+  static const written_content_upload_review_step_description = 'written_content_upload_review_step_description';
+  static const written_content_upload_review_step_title = 'written_content_upload_review_step_title';
+  static const written_content_upload_rich_text_mode = 'written_content_upload_rich_text_mode';
+  static const written_content_upload_schedule_label = 'written_content_upload_schedule_label';
+  static const written_content_upload_select_file = 'written_content_upload_select_file';
+  static const written_content_upload_serialized_checkbox = 'written_content_upload_serialized_checkbox';
+  static const written_content_upload_serialized_hint = 'written_content_upload_serialized_hint';
+  static const written_content_upload_series_hint = 'written_content_upload_series_hint';
+  static const written_content_upload_series_label = 'written_content_upload_series_label';
+  static const written_content_upload_step_basic_info = 'written_content_upload_step_basic_info';
+  static const written_content_upload_step_basic_info_desc = 'written_content_upload_step_basic_info_desc';
+  static const written_content_upload_step_content = 'written_content_upload_step_content';
+  static const written_content_upload_step_content_desc = 'written_content_upload_step_content_desc';
+  static const written_content_upload_step_details = 'written_content_upload_step_details';
+  static const written_content_upload_step_details_desc = 'written_content_upload_step_details_desc';
+  static const written_content_upload_step_review = 'written_content_upload_step_review';
+  static const written_content_upload_step_review_desc = 'written_content_upload_step_review_desc';
+  static const written_content_upload_success = 'written_content_upload_success';
+  static const written_content_upload_text_mode = 'written_content_upload_text_mode';
+  static const written_content_upload_title = 'written_content_upload_title';
+  static const written_content_upload_title_label = 'written_content_upload_title_label';
+  static const written_content_upload_title_required = 'written_content_upload_title_required';
+  static const written_content_upload_volume_hint = 'written_content_upload_volume_hint';
+  static const written_content_upload_volume_label = 'written_content_upload_volume_label';
+  static const xp_label = 'xp_label';
+
+  // profile (169 keys)
+  static const profile_achievement_explore = 'profile_achievement_explore';
+  static const profile_achievement_intro_subtitle = 'profile_achievement_intro_subtitle';
+  static const profile_achievement_intro_title = 'profile_achievement_intro_title';
+  static const profile_achievement_level = 'profile_achievement_level';
+  static const profile_achievement_perks = 'profile_achievement_perks';
+  static const profile_achievement_title = 'profile_achievement_title';
+  static const profile_achievement_xp = 'profile_achievement_xp';
+  static const profile_achievements_close = 'profile_achievements_close';
+  static const profile_achievements_refreshed = 'profile_achievements_refreshed';
+  static const profile_achievements_title = 'profile_achievements_title';
+  static const profile_activity_close = 'profile_activity_close';
+  static const profile_activity_mark_read = 'profile_activity_mark_read';
+  static const profile_analytics_refresh = 'profile_analytics_refresh';
+  static const profile_analytics_title = 'profile_analytics_title';
+  static const profile_analytics_viewer = 'profile_analytics_viewer';
+  static const profile_artwork = 'profile_artwork';
+  static const profile_bin_main_text_artbeat_profile_module = 'profile_bin_main_text_artbeat_profile_module';
+  static const profile_bin_main_text_edit_profile = 'profile_bin_main_text_edit_profile';
+  static const profile_bin_main_text_favorites = 'profile_bin_main_text_favorites';
+  static const profile_bin_main_text_followers = 'profile_bin_main_text_followers';
+  static const profile_bin_main_text_following = 'profile_bin_main_text_following';
+  static const profile_bin_main_text_profile_module_demo = 'profile_bin_main_text_profile_module_demo';
+  static const profile_bin_main_text_view_profile = 'profile_bin_main_text_view_profile';
+  static const profile_bio = 'profile_bio';
+  static const profile_bio_hint = 'profile_bio_hint';
+  static const profile_block_failed = 'profile_block_failed';
+  static const profile_blocked_success = 'profile_blocked_success';
+  static const profile_celebration_modals_text_awesome = 'profile_celebration_modals_text_awesome';
+  static const profile_celebration_modals_text_continue = 'profile_celebration_modals_text_continue';
+  static const profile_celebration_modals_text_lets_go = 'profile_celebration_modals_text_lets_go';
+  static const profile_connections_cancel = 'profile_connections_cancel';
+  static const profile_connections_connect = 'profile_connections_connect';
+  static const profile_connections_request_sent = 'profile_connections_request_sent';
+  static const profile_connections_title = 'profile_connections_title';
+  static const profile_create_title = 'profile_create_title';
+  static const profile_customization_badges = 'profile_customization_badges';
+  static const profile_customization_bio = 'profile_customization_bio';
+  static const profile_customization_compact = 'profile_customization_compact';
+  static const profile_customization_location = 'profile_customization_location';
+  static const profile_customization_title = 'profile_customization_title';
+  static const profile_discover_no_artists = 'profile_discover_no_artists';
+  static const profile_discover_no_artwork = 'profile_discover_no_artwork';
+  static const profile_discover_no_events = 'profile_discover_no_events';
+  static const profile_discover_no_feed = 'profile_discover_no_feed';
+  static const profile_discover_no_users = 'profile_discover_no_users';
+  static const profile_discover_offline_artists = 'profile_discover_offline_artists';
+  static const profile_discover_offline_users = 'profile_discover_offline_users';
+  static const profile_display_name = 'profile_display_name';
+  static const profile_dynamic_achievements_tab_text_close = 'profile_dynamic_achievements_tab_text_close';
+  static const profile_edit = 'profile_edit';
+  static const profile_edit_button = 'profile_edit_button';
+  static const profile_edit_image_success = 'profile_edit_image_success';
+  static const profile_edit_saved = 'profile_edit_saved';
+  static const profile_edit_title = 'profile_edit_title';
+  static const profile_error_followers = 'profile_error_followers';
+  static const profile_error_loading = 'profile_error_loading';
+  static const profile_error_unfollow = 'profile_error_unfollow';
+  static const profile_events = 'profile_events';
+  static const profile_favorite_cancel = 'profile_favorite_cancel';
+  static const profile_favorite_confirm_unlike = 'profile_favorite_confirm_unlike';
+  static const profile_favorite_discover = 'profile_favorite_discover';
+  static const profile_favorite_go_back = 'profile_favorite_go_back';
+  static const profile_favorites_screen_text_cancel = 'profile_favorites_screen_text_cancel';
+  static const profile_favorites_screen_text_remove_like = 'profile_favorites_screen_text_remove_like';
+  static const profile_favorites_screen_text_unlike = 'profile_favorites_screen_text_unlike';
+  static const profile_follow = 'profile_follow';
+  static const profile_followed_artists_screen_text_cancel = 'profile_followed_artists_screen_text_cancel';
+  static const profile_followers = 'profile_followers';
+  static const profile_followers_cancel = 'profile_followers_cancel';
+  static const profile_followers_confirm_unfollow = 'profile_followers_confirm_unfollow';
+  static const profile_followers_unfollow_button = 'profile_followers_unfollow_button';
+  static const profile_following = 'profile_following';
+  static const profile_following_cancel = 'profile_following_cancel';
+  static const profile_following_confirm_unfollow = 'profile_following_confirm_unfollow';
+  static const profile_following_list_screen_text_cancel = 'profile_following_list_screen_text_cancel';
+  static const profile_following_list_screen_text_unfollow_user = 'profile_following_list_screen_text_unfollow_user';
+  static const profile_following_unfollow_button = 'profile_following_unfollow_button';
+  static const profile_galleries = 'profile_galleries';
+  static const profile_header_text_clear_profile_cache = 'profile_header_text_clear_profile_cache';
+  static const profile_header_text_close = 'profile_header_text_close';
+  static const profile_header_text_edit_profile = 'profile_header_text_edit_profile';
+  static const profile_header_text_my_profile = 'profile_header_text_my_profile';
+  static const profile_header_text_profile_developer_tools = 'profile_header_text_profile_developer_tools';
+  static const profile_header_text_profile_settings = 'profile_header_text_profile_settings';
+  static const profile_header_text_test_profile_updates = 'profile_header_text_test_profile_updates';
+  static const profile_history_cancel = 'profile_history_cancel';
+  static const profile_history_clear_all = 'profile_history_clear_all';
+  static const profile_history_cleared = 'profile_history_cleared';
+  static const profile_history_title = 'profile_history_title';
+  static const profile_invalid_user = 'profile_invalid_user';
+  static const profile_location = 'profile_location';
+  static const profile_main_text_hello_world = 'profile_main_text_hello_world';
+  static const profile_mentions_all_read = 'profile_mentions_all_read';
+  static const profile_mentions_title = 'profile_mentions_title';
+  static const profile_menu_about_artbeat = 'profile_menu_about_artbeat';
+  static const profile_menu_about_artbeat_subtitle = 'profile_menu_about_artbeat_subtitle';
+  static const profile_menu_account_actions = 'profile_menu_account_actions';
+  static const profile_menu_account_settings = 'profile_menu_account_settings';
+  static const profile_menu_account_settings_subtitle = 'profile_menu_account_settings_subtitle';
+  static const profile_menu_account_settings_title = 'profile_menu_account_settings_title';
+  static const profile_menu_achievements = 'profile_menu_achievements';
+  static const profile_menu_achievements_rewards = 'profile_menu_achievements_rewards';
+  static const profile_menu_achievements_subtitle = 'profile_menu_achievements_subtitle';
+  static const profile_menu_activity_history = 'profile_menu_activity_history';
+  static const profile_menu_activity_history_subtitle = 'profile_menu_activity_history_subtitle';
+  static const profile_menu_activity_social = 'profile_menu_activity_social';
+  static const profile_menu_artbeat_user = 'profile_menu_artbeat_user';
+  static const profile_menu_become_artist = 'profile_menu_become_artist';
+  static const profile_menu_become_artist_subtitle = 'profile_menu_become_artist_subtitle';
+  static const profile_menu_billing_payments = 'profile_menu_billing_payments';
+  static const profile_menu_billing_payments_subtitle = 'profile_menu_billing_payments_subtitle';
+  static const profile_menu_cancel = 'profile_menu_cancel';
+  static const profile_menu_edit_profile = 'profile_menu_edit_profile';
+  static const profile_menu_edit_profile_subtitle = 'profile_menu_edit_profile_subtitle';
+  static const profile_menu_following = 'profile_menu_following';
+  static const profile_menu_following_subtitle = 'profile_menu_following_subtitle';
+  static const profile_menu_help_support = 'profile_menu_help_support';
+  static const profile_menu_help_support_subtitle = 'profile_menu_help_support_subtitle';
+  static const profile_menu_liked_items = 'profile_menu_liked_items';
+  static const profile_menu_liked_items_subtitle = 'profile_menu_liked_items_subtitle';
+  static const profile_menu_my_art_walks = 'profile_menu_my_art_walks';
+  static const profile_menu_my_art_walks_subtitle = 'profile_menu_my_art_walks_subtitle';
+  static const profile_menu_my_captures = 'profile_menu_my_captures';
+  static const profile_menu_my_captures_subtitle = 'profile_menu_my_captures_subtitle';
+  static const profile_menu_no_email = 'profile_menu_no_email';
+  static const profile_menu_notifications = 'profile_menu_notifications';
+  static const profile_menu_notifications_settings = 'profile_menu_notifications_settings';
+  static const profile_menu_notifications_settings_subtitle = 'profile_menu_notifications_settings_subtitle';
+  static const profile_menu_notifications_subtitle = 'profile_menu_notifications_subtitle';
+  static const profile_menu_privacy_security = 'profile_menu_privacy_security';
+  static const profile_menu_privacy_security_subtitle = 'profile_menu_privacy_security_subtitle';
+  static const profile_menu_profile_analytics = 'profile_menu_profile_analytics';
+  static const profile_menu_profile_analytics_subtitle = 'profile_menu_profile_analytics_subtitle';
+  static const profile_menu_profile_management = 'profile_menu_profile_management';
+  static const profile_menu_rewards = 'profile_menu_rewards';
+  static const profile_menu_rewards_subtitle = 'profile_menu_rewards_subtitle';
+  static const profile_menu_send_feedback = 'profile_menu_send_feedback';
+  static const profile_menu_send_feedback_subtitle = 'profile_menu_send_feedback_subtitle';
+  static const profile_menu_sign_in = 'profile_menu_sign_in';
+  static const profile_menu_sign_in_message = 'profile_menu_sign_in_message';
+  static const profile_menu_sign_out = 'profile_menu_sign_out';
+  static const profile_menu_sign_out_dialog_message = 'profile_menu_sign_out_dialog_message';
+  static const profile_menu_sign_out_dialog_title = 'profile_menu_sign_out_dialog_title';
+  static const profile_menu_sign_out_subtitle = 'profile_menu_sign_out_subtitle';
+  static const profile_menu_sign_up = 'profile_menu_sign_up';
+  static const profile_menu_subscription_billing = 'profile_menu_subscription_billing';
+  static const profile_menu_support_help = 'profile_menu_support_help';
+  static const profile_menu_view_profile = 'profile_menu_view_profile';
+  static const profile_menu_view_profile_subtitle = 'profile_menu_view_profile_subtitle';
+  static const profile_menu_welcome_artbeat = 'profile_menu_welcome_artbeat';
+  static const profile_my_profile = 'profile_my_profile';
+  static const profile_no_followers = 'profile_no_followers';
+  static const profile_not_found = 'profile_not_found';
+  static const profile_now_following = 'profile_now_following';
+  static const profile_picture_title = 'profile_picture_title';
+  static const profile_save_button = 'profile_save_button';
+  static const profile_save_changes = 'profile_save_changes';
+  static const profile_save_failed = 'profile_save_failed';
+  static const profile_saved_success = 'profile_saved_success';
+  static const profile_saving = 'profile_saving';
+  static const profile_settings = 'profile_settings';
+  static const profile_settings_subtitle = 'profile_settings_subtitle';
+  static const profile_settings_title = 'profile_settings_title';
+  static const profile_tab_title = 'profile_tab_title';
+  static const profile_title = 'profile_title';
+  static const profile_unfollow = 'profile_unfollow';
+  static const profile_unfollowed = 'profile_unfollowed';
+  static const profile_username = 'profile_username';
+  static const profile_view_captures = 'profile_view_captures';
+
+  // settings (216 keys)
+  static const settings_2fa_authenticator = 'settings_2fa_authenticator';
+  static const settings_2fa_email = 'settings_2fa_email';
+  static const settings_2fa_sms = 'settings_2fa_sms';
+  static const settings_account_actions = 'settings_account_actions';
+  static const settings_account_deleted = 'settings_account_deleted';
+  static const settings_account_title = 'settings_account_title';
+  static const settings_allow_comments = 'settings_allow_comments';
+  static const settings_allow_comments_desc = 'settings_allow_comments_desc';
+  static const settings_allow_likes = 'settings_allow_likes';
+  static const settings_allow_likes_desc = 'settings_allow_likes_desc';
+  static const settings_allow_messages = 'settings_allow_messages';
+  static const settings_allow_messages_desc = 'settings_allow_messages_desc';
+  static const settings_allow_multiple_sessions = 'settings_allow_multiple_sessions';
+  static const settings_allow_multiple_sessions_desc = 'settings_allow_multiple_sessions_desc';
+  static const settings_allow_sharing = 'settings_allow_sharing';
+  static const settings_allow_sharing_desc = 'settings_allow_sharing_desc';
+  static const settings_analytics = 'settings_analytics';
+  static const settings_analytics_desc = 'settings_analytics_desc';
+  static const settings_approved_devices = 'settings_approved_devices';
+  static const settings_backup_codes = 'settings_backup_codes';
+  static const settings_backup_codes_desc = 'settings_backup_codes_desc';
+  static const settings_backup_codes_save = 'settings_backup_codes_save';
+  static const settings_backup_codes_saved = 'settings_backup_codes_saved';
+  static const settings_badges = 'settings_badges';
+  static const settings_basic_info = 'settings_basic_info';
+  static const settings_bio = 'settings_bio';
+  static const settings_bio_hint = 'settings_bio_hint';
+  static const settings_blocked_users = 'settings_blocked_users';
+  static const settings_blocked_users_blocked_date = 'settings_blocked_users_blocked_date';
+  static const settings_blocked_users_cancel = 'settings_blocked_users_cancel';
+  static const settings_blocked_users_cannot_message = 'settings_blocked_users_cannot_message';
+  static const settings_blocked_users_count_multiple = 'settings_blocked_users_count_multiple';
+  static const settings_blocked_users_count_one = 'settings_blocked_users_count_one';
+  static const settings_blocked_users_desc = 'settings_blocked_users_desc';
+  static const settings_blocked_users_empty_desc = 'settings_blocked_users_empty_desc';
+  static const settings_blocked_users_empty_title = 'settings_blocked_users_empty_title';
+  static const settings_blocked_users_error_load = 'settings_blocked_users_error_load';
+  static const settings_blocked_users_error_unblock = 'settings_blocked_users_error_unblock';
+  static const settings_blocked_users_reason = 'settings_blocked_users_reason';
+  static const settings_blocked_users_title = 'settings_blocked_users_title';
+  static const settings_blocked_users_unblock_button = 'settings_blocked_users_unblock_button';
+  static const settings_blocked_users_unblock_confirm = 'settings_blocked_users_unblock_confirm';
+  static const settings_blocked_users_unblock_title = 'settings_blocked_users_unblock_title';
+  static const settings_blocked_users_unblocked_success = 'settings_blocked_users_unblocked_success';
+  static const settings_blocked_users_unknown_user = 'settings_blocked_users_unknown_user';
+  static const settings_category_account = 'settings_category_account';
+  static const settings_category_account_desc = 'settings_category_account_desc';
+  static const settings_category_notifications = 'settings_category_notifications';
+  static const settings_category_notifications_desc = 'settings_category_notifications_desc';
+  static const settings_category_privacy = 'settings_category_privacy';
+  static const settings_category_privacy_desc = 'settings_category_privacy_desc';
+  static const settings_category_security = 'settings_category_security';
+  static const settings_category_security_desc = 'settings_category_security_desc';
+  static const settings_change_password = 'settings_change_password';
+  static const settings_change_password_desc = 'settings_change_password_desc';
+  static const settings_change_password_hint = 'settings_change_password_hint';
+  static const settings_confirm_delete = 'settings_confirm_delete';
+  static const settings_confirm_new_password = 'settings_confirm_new_password';
+  static const settings_confirm_signout = 'settings_confirm_signout';
+  static const settings_contact_info = 'settings_contact_info';
+  static const settings_content_privacy = 'settings_content_privacy';
+  static const settings_content_privacy_desc = 'settings_content_privacy_desc';
+  static const settings_current_password = 'settings_current_password';
+  static const settings_current_password_incorrect = 'settings_current_password_incorrect';
+  static const settings_currently = 'settings_currently';
+  static const settings_data_controls = 'settings_data_controls';
+  static const settings_data_deletion_failed = 'settings_data_deletion_failed';
+  static const settings_data_deletion_success = 'settings_data_deletion_success';
+  static const settings_data_download_failed = 'settings_data_download_failed';
+  static const settings_data_download_success = 'settings_data_download_success';
+  static const settings_data_privacy = 'settings_data_privacy';
+  static const settings_data_privacy_desc = 'settings_data_privacy_desc';
+  static const settings_delete_account = 'settings_delete_account';
+  static const settings_delete_data = 'settings_delete_data';
+  static const settings_delete_data_confirm = 'settings_delete_data_confirm';
+  static const settings_delete_data_desc = 'settings_delete_data_desc';
+  static const settings_delete_data_dialog = 'settings_delete_data_dialog';
+  static const settings_device_security_desc = 'settings_device_security_desc';
+  static const settings_device_security_title = 'settings_device_security_title';
+  static const settings_display_name = 'settings_display_name';
+  static const settings_display_name_hint = 'settings_display_name_hint';
+  static const settings_display_name_required = 'settings_display_name_required';
+  static const settings_download_data = 'settings_download_data';
+  static const settings_download_data_desc = 'settings_download_data_desc';
+  static const settings_download_data_dialog = 'settings_download_data_dialog';
+  static const settings_email = 'settings_email';
+  static const settings_email_in_use = 'settings_email_in_use';
+  static const settings_email_invalid = 'settings_email_invalid';
+  static const settings_email_invalid_format = 'settings_email_invalid_format';
+  static const settings_email_not_verified = 'settings_email_not_verified';
+  static const settings_email_notifications = 'settings_email_notifications';
+  static const settings_email_required = 'settings_email_required';
+  static const settings_email_verification_required = 'settings_email_verification_required';
+  static const settings_email_verification_required_desc = 'settings_email_verification_required_desc';
+  static const settings_email_verified = 'settings_email_verified';
+  static const settings_enable_2fa = 'settings_enable_2fa';
+  static const settings_enable_2fa_desc = 'settings_enable_2fa_desc';
+  static const settings_enable_email_notifications = 'settings_enable_email_notifications';
+  static const settings_enable_in_app_notifications = 'settings_enable_in_app_notifications';
+  static const settings_enable_push_notifications = 'settings_enable_push_notifications';
+  static const settings_enable_quiet_hours = 'settings_enable_quiet_hours';
+  static const settings_end_time = 'settings_end_time';
+  static const settings_fill_all_fields = 'settings_fill_all_fields';
+  static const settings_frequency = 'settings_frequency';
+  static const settings_frequency_daily = 'settings_frequency_daily';
+  static const settings_frequency_immediate = 'settings_frequency_immediate';
+  static const settings_frequency_weekly = 'settings_frequency_weekly';
+  static const settings_in_app_notifications = 'settings_in_app_notifications';
+  static const settings_load_failed = 'settings_load_failed';
+  static const settings_location_privacy = 'settings_location_privacy';
+  static const settings_location_privacy_desc = 'settings_location_privacy_desc';
+  static const settings_location_profile = 'settings_location_profile';
+  static const settings_location_profile_desc = 'settings_location_profile_desc';
+  static const settings_location_recommendations = 'settings_location_recommendations';
+  static const settings_location_recommendations_desc = 'settings_location_recommendations_desc';
+  static const settings_location_sharing = 'settings_location_sharing';
+  static const settings_location_sharing_desc = 'settings_location_sharing_desc';
+  static const settings_login_alerts = 'settings_login_alerts';
+  static const settings_login_alerts_desc = 'settings_login_alerts_desc';
+  static const settings_login_history = 'settings_login_history';
+  static const settings_login_history_desc = 'settings_login_history_desc';
+  static const settings_login_security_desc = 'settings_login_security_desc';
+  static const settings_login_security_title = 'settings_login_security_title';
+  static const settings_manage_blocked_users = 'settings_manage_blocked_users';
+  static const settings_manage_blocked_users_desc = 'settings_manage_blocked_users_desc';
+  static const settings_manage_devices = 'settings_manage_devices';
+  static const settings_manage_profile = 'settings_manage_profile';
+  static const settings_marketing = 'settings_marketing';
+  static const settings_marketing_desc = 'settings_marketing_desc';
+  static const settings_never = 'settings_never';
+  static const settings_new_password = 'settings_new_password';
+  static const settings_new_password_weak = 'settings_new_password_weak';
+  static const settings_no_settings = 'settings_no_settings';
+  static const settings_no_user_signed_in = 'settings_no_user_signed_in';
+  static const settings_password_change_failed = 'settings_password_change_failed';
+  static const settings_password_changed_success = 'settings_password_changed_success';
+  static const settings_password_last_changed = 'settings_password_last_changed';
+  static const settings_password_not_meet_requirements = 'settings_password_not_meet_requirements';
+  static const settings_password_requirements = 'settings_password_requirements';
+  static const settings_password_security_title = 'settings_password_security_title';
+  static const settings_passwords_do_not_match = 'settings_passwords_do_not_match';
+  static const settings_personalization = 'settings_personalization';
+  static const settings_personalization_desc = 'settings_personalization_desc';
+  static const settings_phone = 'settings_phone';
+  static const settings_phone_not_verified = 'settings_phone_not_verified';
+  static const settings_phone_verified = 'settings_phone_verified';
+  static const settings_play_sound_notifications = 'settings_play_sound_notifications';
+  static const settings_privacy_profile_desc = 'settings_privacy_profile_desc';
+  static const settings_privacy_title = 'settings_privacy_title';
+  static const settings_push_notifications = 'settings_push_notifications';
+  static const settings_quick_actions = 'settings_quick_actions';
+  static const settings_quiet_hours = 'settings_quiet_hours';
+  static const settings_reauth_message = 'settings_reauth_message';
+  static const settings_reauth_needed = 'settings_reauth_needed';
+  static const settings_reauth_required = 'settings_reauth_required';
+  static const settings_receive_notifications_device = 'settings_receive_notifications_device';
+  static const settings_receive_notifications_email = 'settings_receive_notifications_email';
+  static const settings_reduce_notifications_hours = 'settings_reduce_notifications_hours';
+  static const settings_remember_device = 'settings_remember_device';
+  static const settings_remember_device_desc = 'settings_remember_device_desc';
+  static const settings_request_download = 'settings_request_download';
+  static const settings_require_password_change = 'settings_require_password_change';
+  static const settings_require_password_change_desc = 'settings_require_password_change_desc';
+  static const settings_requires_recent_login = 'settings_requires_recent_login';
+  static const settings_save_changes = 'settings_save_changes';
+  static const settings_security_actions_title = 'settings_security_actions_title';
+  static const settings_security_checkup = 'settings_security_checkup';
+  static const settings_security_checkup_desc = 'settings_security_checkup_desc';
+  static const settings_security_status = 'settings_security_status';
+  static const settings_security_title = 'settings_security_title';
+  static const settings_show_followers = 'settings_show_followers';
+  static const settings_show_followers_desc = 'settings_show_followers_desc';
+  static const settings_show_following = 'settings_show_following';
+  static const settings_show_following_desc = 'settings_show_following_desc';
+  static const settings_show_in_search = 'settings_show_in_search';
+  static const settings_show_in_search_desc = 'settings_show_in_search_desc';
+  static const settings_show_last_seen = 'settings_show_last_seen';
+  static const settings_show_last_seen_desc = 'settings_show_last_seen_desc';
+  static const settings_show_notification_count = 'settings_show_notification_count';
+  static const settings_show_notifications_using_app = 'settings_show_notifications_using_app';
+  static const settings_show_online_status = 'settings_show_online_status';
+  static const settings_show_online_status_desc = 'settings_show_online_status_desc';
+  static const settings_sign_out = 'settings_sign_out';
+  static const settings_sign_out_everywhere = 'settings_sign_out_everywhere';
+  static const settings_sign_out_everywhere_desc = 'settings_sign_out_everywhere_desc';
+  static const settings_sign_out_everywhere_msg = 'settings_sign_out_everywhere_msg';
+  static const settings_signed_out_everywhere = 'settings_signed_out_everywhere';
+  static const settings_signout_failed = 'settings_signout_failed';
+  static const settings_sound = 'settings_sound';
+  static const settings_start_time = 'settings_start_time';
+  static const settings_third_party = 'settings_third_party';
+  static const settings_third_party_desc = 'settings_third_party_desc';
+  static const settings_track_device_location = 'settings_track_device_location';
+  static const settings_track_device_location_desc = 'settings_track_device_location_desc';
+  static const settings_trusted_devices = 'settings_trusted_devices';
+  static const settings_two_factor_desc = 'settings_two_factor_desc';
+  static const settings_two_factor_method = 'settings_two_factor_method';
+  static const settings_two_factor_title = 'settings_two_factor_title';
+  static const settings_update_failed = 'settings_update_failed';
+  static const settings_updated = 'settings_updated';
+  static const settings_updated_success = 'settings_updated_success';
+  static const settings_username = 'settings_username';
+  static const settings_username_hint = 'settings_username_hint';
+  static const settings_username_min_length = 'settings_username_min_length';
+  static const settings_username_required = 'settings_username_required';
+  static const settings_verify_email = 'settings_verify_email';
+  static const settings_verify_email_hint = 'settings_verify_email_hint';
+  static const settings_verify_phone = 'settings_verify_phone';
+  static const settings_verify_phone_hint = 'settings_verify_phone_hint';
+  static const settings_vibrate_notifications = 'settings_vibrate_notifications';
+  static const settings_vibration = 'settings_vibration';
+  static const settings_visibility = 'settings_visibility';
+  static const settings_visibility_friends = 'settings_visibility_friends';
+  static const settings_visibility_private = 'settings_visibility_private';
+  static const settings_visibility_public = 'settings_visibility_public';
+  static const settings_your_account = 'settings_your_account';
+}
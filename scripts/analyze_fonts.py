@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Font Usage Analyzer
+Cross-references the font families declared in pubspec.yaml (and the files
+bundled from assets/fonts) with the fontFamily/fontWeight/fontStyle usage in
+the Dart sources, and produces a prune plan with byte savings.
+
+Requires PyYAML (pip install pyyaml).
+"""
+
+import re
+import json
+import argparse
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from dart_source import find_dart_files, matching_paren, scan_dart, string_constants
+
+FONT_SUFFIXES = ('.ttf', '.otf')
+
+WEIGHT_NAMES = {
+    'thin': 100, 'extralight': 200, 'ultralight': 200, 'light': 300,
+    'regular': 400, 'normal': 400, 'book': 400, 'medium': 500,
+    'semibold': 600, 'demibold': 600, 'bold': 700, 'bd': 700,
+    'extrabold': 800, 'ultrabold': 800, 'black': 900, 'heavy': 900,
+}
+
+FONT_WEIGHT_CONSTANTS = {'normal': 400, 'bold': 700}
+FONT_WEIGHT_CONSTANTS.update({f"w{w}": w for w in range(100, 1000, 100)})
+
+STYLE_CALL = re.compile(r"\b(TextStyle|copyWith|GoogleFonts\.\w+)\s*\(")
+
+
+def parse_font_filename(path: Path) -> Tuple[int, str]:
+    """Guess (weight, style) from names like Roboto_Condensed-SemiBoldItalic.ttf"""
+    stem = path.stem
+    descriptor = stem.split('-', 1)[1] if '-' in stem else re.sub(r'^[A-Z][a-z]+[A-Z][a-z]+', '', stem)
+    descriptor = descriptor.lower()
+    style = 'italic' if 'italic' in descriptor else 'normal'
+    descriptor = descriptor.replace('italic', '')
+    if 'variablefont' in descriptor:
+        return 0, style
+    for name in sorted(WEIGHT_NAMES, key=len, reverse=True):
+        if descriptor.startswith(name) or descriptor.endswith(name):
+            return WEIGHT_NAMES[name], style
+    return 400, style
+
+
+def nearest_weight(requested: int, available: List[int]) -> Optional[int]:
+    """Pick the face Flutter would use for a weight (CSS font-matching order)"""
+    if not available:
+        return None
+    if requested in available:
+        return requested
+    above = sorted(w for w in available if w > requested)
+    below = sorted((w for w in available if w < requested), reverse=True)
+    if 400 <= requested <= 500:
+        up_to_500 = [w for w in above if w <= 500]
+        order = up_to_500 + below + [w for w in above if w > 500]
+    elif requested < 400:
+        order = below + above
+    else:
+        order = above + below
+    return order[0]
+
+
+class FontUsageAnalyzer:
+    def __init__(self, root_path: str, default_family: str = 'Roboto'):
+        self.root_path = Path(root_path)
+        self.fonts_dir = self.root_path / "assets" / "fonts"
+        self.default_family = default_family
+        self.declared: Dict[str, List[Dict]] = defaultdict(list)
+        self.bundled_dirs: Set[str] = set()
+        # (family, weight, style) -> number of TextStyle sites
+        self.usage: Counter = Counter()
+        self.runtime_families: Counter = Counter()
+        self.dart_files: List[Path] = []
+
+    def load_pubspecs(self):
+        """Collect flutter.fonts declarations and bundled asset dirs from every pubspec"""
+        import yaml
+
+        pubspecs = [self.root_path / 'pubspec.yaml'] + sorted(self.root_path.glob('packages/*/pubspec.yaml'))
+        for pubspec in pubspecs:
+            if not pubspec.exists():
+                continue
+            with open(pubspec, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+            flutter = data.get('flutter') or {}
+            base = pubspec.parent
+            for asset in flutter.get('assets') or []:
+                if isinstance(asset, str) and asset.endswith('/'):
+                    self.bundled_dirs.add(str((base / asset).resolve().relative_to(self.root_path.resolve())))
+            for family in flutter.get('fonts') or []:
+                for font in family.get('fonts') or []:
+                    self.declared[family['family']].append({
+                        'asset': str((base / font['asset']).resolve().relative_to(self.root_path.resolve())),
+                        'weight': int(font.get('weight', 400)),
+                        'style': font.get('style', 'normal'),
+                    })
+
+    def resolve_family(self, expression: str, constants: Dict[str, str]) -> Optional[str]:
+        expression = expression.strip()
+        match = re.match(r"^['\"]([^'\"]+)['\"]$", expression)
+        if match:
+            return match.group(1)
+        return constants.get(expression.split('.')[-1])
+
+    def scan_file(self, file_path: Path):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return
+
+        masked, strings = scan_dart(content)
+        constants = string_constants(masked, strings)
+
+        for match in STYLE_CALL.finditer(masked):
+            end = matching_paren(masked, match.end() - 1)
+            # Read arguments from the original text; masked offsets are identical
+            args = content[match.end():end]
+            masked_args = masked[match.end():end]
+
+            callee = match.group(1)
+            family_match = re.search(r"\bfontFamily\s*:\s*([^,)]+)", masked_args)
+            weight_match = re.search(r"\bfontWeight\s*:\s*FontWeight\.(\w+)", masked_args)
+            style_match = re.search(r"\bfontStyle\s*:\s*FontStyle\.(\w+)", masked_args)
+
+            if callee.startswith('GoogleFonts.'):
+                self.runtime_families[callee.split('.', 1)[1]] += 1
+                continue
+            if family_match:
+                family = self.resolve_family(args[family_match.start(1):family_match.end(1)], constants)
+            elif callee == 'copyWith' and not weight_match and not style_match:
+                continue
+            else:
+                family = self.default_family
+            if family is None:
+                continue
+            weight = FONT_WEIGHT_CONSTANTS.get(weight_match.group(1), 400) if weight_match else 400
+            style = style_match.group(1) if style_match else 'normal'
+            self.usage[(family, weight, style)] += 1
+
+    def scan_all(self):
+        self.dart_files = find_dart_files(self.root_path)
+        print(f"Scanning {len(self.dart_files)} Dart files for font usage")
+        for file_path in self.dart_files:
+            self.scan_file(file_path)
+
+    def selected_assets(self) -> Set[str]:
+        """Declared assets Flutter would actually pick for the weights/styles in use"""
+        selected = set()
+        for (family, weight, style), _ in self.usage.items():
+            faces = self.declared.get(family)
+            if not faces:
+                continue
+            same_style = [f for f in faces if f['style'] == style] or faces
+            chosen = nearest_weight(weight, [f['weight'] for f in same_style])
+            selected.update(f['asset'] for f in same_style if f['weight'] == chosen)
+        return selected
+
+    def missing_faces(self) -> List[Dict]:
+        """Weights/styles in use with no exact declared face (Flutter substitutes or synthesizes)"""
+        missing = []
+        for (family, weight, style), sites in sorted(self.usage.items()):
+            faces = self.declared.get(family)
+            if faces and not any(f['weight'] == weight and f['style'] == style for f in faces):
+                missing.append({'family': family, 'weight': weight, 'style': style, 'sites': sites})
+        return missing
+
+    def is_bundled(self, relative: str) -> bool:
+        return any(relative.startswith(d.rstrip('/') + '/') and '/' not in relative[len(d.rstrip('/')) + 1:]
+                   for d in self.bundled_dirs)
+
+    def prune_plan(self) -> Dict:
+        declared_assets = {f['asset'] for faces in self.declared.values() for f in faces}
+        selected = self.selected_assets()
+        used_families = {family for family, _, _ in self.usage}
+        plan = {'undeclared': [], 'unreferenced_family': [], 'unreferenced_weight': [], 'keep': []}
+
+        for path in sorted(p for p in self.fonts_dir.rglob('*') if p.suffix.lower() in FONT_SUFFIXES):
+            relative = str(path.relative_to(self.root_path))
+            weight, style = parse_font_filename(path)
+            entry = {
+                'asset': relative,
+                'bytes': path.stat().st_size,
+                'weight': weight,
+                'style': style,
+                'bundled': self.is_bundled(relative) or relative in declared_assets,
+            }
+            if relative not in declared_assets:
+                plan['undeclared'].append(entry)
+                continue
+            family = next(name for name, faces in self.declared.items() if any(f['asset'] == relative for f in faces))
+            entry['family'] = family
+            if family not in used_families:
+                plan['unreferenced_family'].append(entry)
+            elif relative not in selected:
+                plan['unreferenced_weight'].append(entry)
+            else:
+                plan['keep'].append(entry)
+        return plan
+
+    def save_json_output(self, output_path: str, plan: Dict):
+        prunable = plan['undeclared'] + plan['unreferenced_family'] + plan['unreferenced_weight']
+        output_data = {
+            'metadata': {
+                'total_files': len(self.dart_files),
+                'declared_families': sorted(self.declared),
+                'used_families': sorted({f for f, _, _ in self.usage}),
+                'runtime_google_fonts': dict(self.runtime_families),
+                'prunable_files': len(prunable),
+                'prunable_bytes': sum(e['bytes'] for e in prunable),
+                'bundled_prunable_bytes': sum(e['bytes'] for e in prunable if e['bundled']),
+            },
+            'usage': [
+                {'family': f, 'weight': w, 'style': s, 'sites': n}
+                for (f, w, s), n in sorted(self.usage.items(), key=lambda kv: -kv[1])
+            ],
+            'plan': plan,
+            'missing_faces': self.missing_faces(),
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find unused font families and weights in assets/fonts')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--default-family', default='Roboto', help='Family used by TextStyles without fontFamily')
+    parser.add_argument('--json', default='font_usage_report.json', help='Output JSON file')
+
+    args = parser.parse_args()
+
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        print("PyYAML is required: pip install pyyaml")
+        raise SystemExit(1)
+
+    analyzer = FontUsageAnalyzer(args.root, args.default_family)
+    analyzer.load_pubspecs()
+    analyzer.scan_all()
+    plan = analyzer.prune_plan()
+    analyzer.save_json_output(args.json, plan)
+
+    print(f"\n{'='*60}")
+    print("FONT PRUNE PLAN")
+    print(f"{'='*60}")
+    for section, label in [
+        ('undeclared', 'Not declared in any pubspec (bundled via assets/fonts/ only)'),
+        ('unreferenced_family', 'Declared family never used'),
+        ('unreferenced_weight', 'Declared weight/style never selected'),
+    ]:
+        entries = plan[section]
+        print(f"{label}: {len(entries)} files, {sum(e['bytes'] for e in entries):,} bytes")
+    prunable = plan['undeclared'] + plan['unreferenced_family'] + plan['unreferenced_weight']
+    print(f"Keep: {len(plan['keep'])} files")
+    print(f"Total savings: {sum(e['bytes'] for e in prunable):,} bytes")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Import Graph Analyzer
+Builds the import/export/part graph of lib/ and every packages/*/lib,
+finds import cycles (Tarjan's strongly connected components), computes the
+libraries main.dart loads eagerly and ranks the screens that would take the
+most source out of the startup closure if they were imported `deferred as`.
+
+A screen's weight is the source it pulls in exclusively: the files that
+drop out of the eager closure once the screen itself is no longer reached.
+"""
+
+import re
+import json
+import bisect
+import argparse
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from dart_source import find_dart_files, line_number, scan_dart
+
+DIRECTIVE = re.compile(r"^[ \t]*(import|export|part)\b(?!\s+of\b)", re.MULTILINE)
+DEFERRED = re.compile(r"\bdeferred\s+as\b")
+
+
+def library_files(root_path: Path) -> List[Path]:
+    """Dart sources that can be imported: lib/ and packages/*/lib only"""
+    files = []
+    for file_path in find_dart_files(root_path):
+        parts = file_path.relative_to(root_path).parts
+        if parts[0] == 'lib' or (parts[0] == 'packages' and len(parts) > 2 and parts[2] == 'lib'):
+            files.append(file_path)
+    return files
+
+
+def is_screen(relative: str) -> bool:
+    return '/screens/' in relative or relative.endswith('_screen.dart')
+
+
+def package_of(relative: str) -> str:
+    return relative.split('/')[1] if relative.startswith('packages/') else 'main_app'
+
+
+class ImportGraphAnalyzer:
+    def __init__(self, project_root: str, entries: Optional[List[str]] = None):
+        self.project_root = Path(project_root)
+        self.entries = entries or ['lib/main.dart']
+        self.package_dirs: Dict[str, Path] = {}
+        self.sizes: Dict[str, int] = {}
+        self.barrels: Set[str] = set()
+        # (source, target, kind, deferred, line); kind is import / export / part
+        self.edges: List[Tuple[str, str, str, bool, int]] = []
+        self.external: Dict[str, int] = defaultdict(int)
+        self.unresolved: List[Dict] = []
+        self.components: List[List[str]] = []
+        self.eager: Set[str] = set()
+        self.reachable: Set[str] = set()
+        self.candidates: List[Dict] = []
+
+    def load_packages(self):
+        """Map pubspec package names to their lib/ directories"""
+        pubspecs = [self.project_root / 'pubspec.yaml'] + sorted(self.project_root.glob('packages/*/pubspec.yaml'))
+        for pubspec in pubspecs:
+            try:
+                with open(pubspec, 'r', encoding='utf-8') as f:
+                    name = (yaml.safe_load(f) or {}).get('name')
+            except Exception as e:
+                print(f"Error reading {pubspec}: {e}")
+                continue
+            if name:
+                self.package_dirs[name] = pubspec.parent / 'lib'
+
+    def resolve(self, source: Path, uri: str) -> Optional[str]:
+        """Relative path of the file a URI points to, or None for SDK/third-party libraries"""
+        if uri.startswith('dart:'):
+            self.external['dart:' + uri[5:].split('/')[0]] += 1
+            return None
+        if uri.startswith('package:'):
+            name, _, path = uri[8:].partition('/')
+            if name not in self.package_dirs:
+                self.external[name] += 1
+                return None
+            target = self.package_dirs[name] / path
+        else:
+            target = source.parent / uri
+        return str(target.resolve().relative_to(self.project_root.resolve()))
+
+    def scan_file(self, file_path: Path):
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return
+        relative = str(file_path.relative_to(self.project_root))
+        self.sizes[relative] = len(content.encode('utf-8'))
+
+        masked, strings = scan_dart(content)
+        starts = [s.start for s in strings]
+        declarations = masked
+        for match in DIRECTIVE.finditer(masked):
+            end = masked.find(';', match.end())
+            if end < 0:
+                continue
+            declarations = declarations.replace(masked[match.start():end + 1], '', 1)
+            # Conditional imports list one URI per configuration; all of them are edges
+            first = bisect.bisect_left(starts, match.end())
+            last = bisect.bisect_left(starts, end)
+            uris = [strings[k].text for k in range(first, last)]
+            if not uris:
+                continue
+            kind = match.group(1)
+            deferred = kind == 'import' and DEFERRED.search(masked, match.end(), end) is not None
+            line = line_number(content, match.start())
+            for uri in uris:
+                target = self.resolve(file_path, uri)
+                if target is None:
+                    continue
+                if not (self.project_root / target).exists():
+                    self.unresolved.append({'file': relative, 'line': line, 'uri': uri})
+                    continue
+                self.edges.append((relative, target, kind, deferred, line))
+
+        # Files with nothing but directives (screens.dart, index.dart) only re-export
+        if not re.sub(r"\blibrary\s+[\w.]*\s*;", '', declarations).strip():
+            self.barrels.add(relative)
+
+    def adjacency(self, eager_only: bool = False) -> Dict[str, List[str]]:
+        graph: Dict[str, List[str]] = {node: [] for node in self.sizes}
+        for source, target, _, deferred, _ in self.edges:
+            if not (eager_only and deferred):
+                graph[source].append(target)
+        return graph
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Tarjan's algorithm, iterative so deep import chains don't hit the recursion limit"""
+        graph = self.adjacency()
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components = []
+        counter = 0
+
+        for root in sorted(graph):
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+                recurse = False
+                for i in range(child, len(graph[node])):
+                    target = graph[node][i]
+                    if target not in index:
+                        work.append((node, i + 1))
+                        work.append((target, 0))
+                        recurse = True
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                if recurse:
+                    continue
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+        return components
+
+    def closure(self, graph: Dict[str, List[str]], blocked: Iterable[str] = ()) -> Set[str]:
+        seen = set(blocked)
+        queue = deque(e for e in self.entries if e in graph and e not in seen)
+        seen.update(queue)
+        while queue:
+            for target in graph[queue.popleft()]:
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen - set(blocked)
+
+    def rank_deferred_candidates(self):
+        """Screens in the eager closure, weighted by the source only they pull in"""
+        graph = self.adjacency(eager_only=True)
+        importers = defaultdict(list)
+        for source, target, kind, deferred, line in self.edges:
+            if not deferred and source in self.eager:
+                importers[target].append({'file': source, 'line': line, 'kind': kind})
+        cyclic = {node for component in self.components if len(component) > 1 for node in component}
+
+        screens = [n for n in self.eager if is_screen(n) and n not in self.barrels and n not in self.entries]
+        for screen in sorted(screens):
+            remaining = self.closure(graph, blocked=[screen])
+            exclusive = self.eager - remaining
+            self.candidates.append({
+                'file': screen,
+                'package': package_of(screen),
+                'size': self.sizes[screen],
+                'exclusive_files': len(exclusive),
+                'exclusive_bytes': sum(self.sizes[n] for n in exclusive),
+                'in_cycle': screen in cyclic,
+                # A screen re-exported by a barrel can only be deferred once the export is dropped
+                'exported_by': sorted(i['file'] for i in importers[screen] if i['kind'] == 'export'),
+                'imported_by': importers[screen],
+            })
+        self.candidates.sort(key=lambda c: -c['exclusive_bytes'])
+
+    def analyze(self):
+        self.load_packages()
+        files = library_files(self.project_root)
+        print(f"Scanning {len(files)} Dart libraries")
+        for file_path in files:
+            self.scan_file(file_path)
+
+        self.components = self.strongly_connected_components()
+        self.reachable = self.closure(self.adjacency())
+        self.eager = self.closure(self.adjacency(eager_only=True))
+        self.rank_deferred_candidates()
+
+    def cycles(self) -> List[List[str]]:
+        self_imports = {s for s, t, _, _, _ in self.edges if s == t}
+        return sorted((c for c in self.components if len(c) > 1 or c[0] in self_imports), key=len, reverse=True)
+
+    def package_summary(self) -> List[Dict]:
+        totals = defaultdict(lambda: {'files': 0, 'bytes': 0, 'eager_files': 0, 'eager_bytes': 0})
+        for node, size in self.sizes.items():
+            row = totals[package_of(node)]
+            row['files'] += 1
+            row['bytes'] += size
+            if node in self.eager:
+                row['eager_files'] += 1
+                row['eager_bytes'] += size
+        return sorted(({'package': name, **row} for name, row in totals.items()), key=lambda r: -r['eager_bytes'])
+
+    def write_dot(self, output_path: str, granularity: str = 'file'):
+        """Import graph in Graphviz format; cycle members are red, deferred edges dashed"""
+        cyclic = {node for component in self.cycles() for node in component}
+        lines = ['digraph imports {', '  rankdir=LR;', '  node [shape=box, fontsize=10];']
+
+        if granularity == 'package':
+            edges = defaultdict(int)
+            for source, target, _, _, _ in self.edges:
+                if package_of(source) != package_of(target):
+                    edges[(package_of(source), package_of(target))] += 1
+            for row in self.package_summary():
+                label = f"{row['package']}\\n{row['eager_bytes'] // 1024} KB eager"
+                lines.append(f'  "{row["package"]}" [label="{label}"];')
+            for (source, target), count in sorted(edges.items()):
+                lines.append(f'  "{source}" -> "{target}" [label="{count}"];')
+        else:
+            by_package = defaultdict(list)
+            for node in sorted(self.sizes):
+                by_package[package_of(node)].append(node)
+            for cluster, (package, nodes) in enumerate(sorted(by_package.items())):
+                lines.append(f'  subgraph cluster_{cluster} {{')
+                lines.append(f'    label="{package}";')
+                for node in nodes:
+                    style = []
+                    if node in cyclic:
+                        style.append('color=red')
+                    if node not in self.eager:
+                        style.append('style=dashed')
+                    attributes = f' [{", ".join(style)}]' if style else ''
+                    lines.append(f'    "{node}"{attributes};')
+                lines.append('  }')
+            for source, target, kind, deferred, _ in self.edges:
+                style = []
+                if deferred:
+                    style.append('style=dashed')
+                if kind != 'import':
+                    style.append(f'label="{kind}"')
+                attributes = f' [{", ".join(style)}]' if style else ''
+                lines.append(f'  "{source}" -> "{target}"{attributes};')
+        lines.append('}')
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def save_json_output(self, output_path: str):
+        cycles = self.cycles()
+        output_data = {
+            'metadata': {
+                'entries': self.entries,
+                'libraries': len(self.sizes),
+                'edges': len(self.edges),
+                'cycles': len(cycles),
+                'reachable_files': len(self.reachable),
+                'eager_files': len(self.eager),
+                'eager_bytes': sum(self.sizes[n] for n in self.eager),
+                'barrel_files': len(self.barrels),
+                'deferred_candidates': len(self.candidates),
+            },
+            'packages': self.package_summary(),
+            'cycles': [{'size': len(c), 'bytes': sum(self.sizes[n] for n in c), 'files': c} for c in cycles],
+            'deferred_candidates': self.candidates,
+            'unreachable': sorted(set(self.sizes) - self.reachable),
+            'external_packages': dict(sorted(self.external.items(), key=lambda kv: -kv[1])),
+            'unresolved': self.unresolved,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze the Dart import graph for cycles and deferred-import candidates')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--entry', action='append', help='Entry library relative to the root (default: lib/main.dart)')
+    parser.add_argument('--json', default='import_graph_report.json', help='Output JSON file')
+    parser.add_argument('--dot', default='import_graph.dot', help='Output Graphviz file')
+    parser.add_argument('--granularity', choices=['file', 'package'], default='file', help='Nodes of the DOT graph')
+    parser.add_argument('--top', type=int, default=20, help='Deferred-import candidates to print')
+
+    args = parser.parse_args()
+
+    analyzer = ImportGraphAnalyzer(args.root, args.entry)
+    analyzer.analyze()
+    analyzer.save_json_output(args.json)
+    analyzer.write_dot(args.dot, args.granularity)
+
+    cycles = analyzer.cycles()
+    eager_bytes = sum(analyzer.sizes[n] for n in analyzer.eager)
+    print(f"\n{'='*60}")
+    print("IMPORT GRAPH")
+    print(f"{'='*60}")
+    print(f"Libraries: {len(analyzer.sizes)}  Edges: {len(analyzer.edges)}")
+    print(f"Eager closure of {', '.join(analyzer.entries)}: {len(analyzer.eager)} files, {eager_bytes / 1024:,.0f} KB")
+    print(f"Unreachable from entries: {len(analyzer.sizes) - len(analyzer.reachable)} files")
+    print(f"Unresolved relative imports: {len(analyzer.unresolved)}")
+    print(f"Import cycles: {len(cycles)}")
+    for component in cycles[:5]:
+        print(f"  ✗ {len(component)} files: {', '.join(component[:3])}{' ...' if len(component) > 3 else ''}")
+
+    print("\nTop deferred-import candidates (exclusive source):")
+    for candidate in analyzer.candidates[:args.top]:
+        via = ' (barrel export)' if candidate['exported_by'] else ''
+        print(f"  {candidate['exclusive_bytes'] / 1024:>7,.1f} KB  {candidate['exclusive_files']:>3} files  "
+              f"{candidate['file']}{via}")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+    print(f"📊 Graph saved to: {args.dot}")
+
+
+if __name__ == '__main__':
+    main()
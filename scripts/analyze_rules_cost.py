@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Firestore Rules Read-Cost Analyzer
+Parses firestore.rules into its match-path tree and, for every operation on
+every path, counts the get()/exists() document reads a request can trigger
+in the worst case (every condition evaluated, helper functions expanded with
+their arguments). Overlapping matches such as `/{document=**}` are included,
+since Firestore evaluates every match statement that covers a path.
+
+Rules evaluation caches documents within one request, so the billed cost is
+the number of distinct documents; repeated calls on the same document are
+still reported as consolidation candidates. The Dart query sites are then
+matched to rule paths to show which screens pay the most.
+"""
+
+import re
+import json
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dart_source import line_number, matching_paren
+from find_unbounded_reads import package_of, site_kind
+from firestore_queries import scan_query_chains
+
+DOCUMENT_ACCESS = re.compile(r"(?<![.\w])(get|exists|getAfter|existsAfter)\s*\(")
+CALL = re.compile(r"(?<![.\w])([A-Za-z_]\w*)\s*\(")
+DATABASE_PREFIX = re.compile(r"^/databases/\$\(\s*database\s*\)/documents")
+OPERATIONS = {
+    'read': ('get', 'list'),
+    'write': ('create', 'update', 'delete'),
+    'get': ('get',), 'list': ('list',), 'create': ('create',), 'update': ('update',), 'delete': ('delete',),
+}
+ALL_OPERATIONS = ('get', 'list', 'create', 'update', 'delete')
+# Document access calls allowed per request (20 for batched writes and transactions)
+ACCESS_CALL_LIMIT = 10
+
+
+def mask_rules(content: str) -> str:
+    """Blank comments and string bodies, keeping offsets and line breaks"""
+    chars = list(content)
+    i = 0
+    while i < len(content):
+        c = content[i]
+        if content.startswith('//', i):
+            end = content.find('\n', i)
+            end = len(content) if end < 0 else end
+            for k in range(i, end):
+                chars[k] = ' '
+            i = end
+        elif content.startswith('/*', i):
+            end = content.find('*/', i + 2)
+            end = len(content) if end < 0 else end + 2
+            for k in range(i, end):
+                if chars[k] != '\n':
+                    chars[k] = ' '
+            i = end
+        elif c in '\'"':
+            k = i + 1
+            while k < len(content) and content[k] != c and content[k] != '\n':
+                k += 2 if content[k] == '\\' else 1
+            for j in range(i + 1, min(k, len(content))):
+                chars[j] = ' '
+            i = k + 1
+        else:
+            i += 1
+    return ''.join(chars)
+
+
+def split_arguments(text: str) -> List[str]:
+    args, depth, start = [], 0, 0
+    for i, c in enumerate(text):
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            args.append(text[start:i].strip())
+            start = i + 1
+    if text[start:].strip():
+        args.append(text[start:].strip())
+    return args
+
+
+def normalize_path(path: str) -> str:
+    path = re.sub(r"\s+", '', path)
+    return DATABASE_PREFIX.sub('', path) or '/'
+
+
+@dataclass
+class RuleFunction:
+    name: str
+    params: List[str]
+    body: str           # masked body: let bindings and return expression
+    offset: int         # offset of the body in firestore.rules
+    line: int
+
+
+@dataclass
+class Access:
+    kind: str           # get / exists / getAfter / existsAfter
+    path: str           # document path with arguments substituted, database prefix removed
+    line: int           # line of the call in firestore.rules
+    via: List[str]      # helper functions it was reached through
+
+
+@dataclass
+class MatchNode:
+    segments: List[str]                 # path below /databases/{database}/documents
+    line: int
+    parent: Optional['MatchNode'] = None
+    functions: Dict[str, RuleFunction] = field(default_factory=dict)
+    allows: List[Tuple[Tuple[str, ...], str, int]] = field(default_factory=list)  # (operations, condition, offset)
+    children: List['MatchNode'] = field(default_factory=list)
+
+    @property
+    def path(self) -> str:
+        return '/' + '/'.join(self.segments)
+
+    @property
+    def recursive(self) -> bool:
+        return bool(self.segments) and self.segments[-1].endswith('=**}')
+
+    @property
+    def collection(self) -> Optional[str]:
+        literals = [s for s in self.segments if not s.startswith('{')]
+        return literals[-1] if literals else None
+
+    @property
+    def parent_collection(self) -> Optional[str]:
+        literals = [s for s in self.segments if not s.startswith('{')]
+        return literals[-2] if len(literals) > 1 else None
+
+    def lookup(self, name: str) -> Optional[RuleFunction]:
+        node = self
+        while node is not None:
+            if name in node.functions:
+                return node.functions[name]
+            node = node.parent
+        return None
+
+
+class RulesParser:
+    """Builds the match tree of a firestore.rules file"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.masked = mask_rules(content)
+        self.root = MatchNode([], 1)
+
+    def skip_space(self, i: int) -> int:
+        while i < len(self.masked) and self.masked[i].isspace():
+            i += 1
+        return i
+
+    def parse(self) -> MatchNode:
+        service = re.search(r"\bservice\s+cloud\.firestore\s*\{", self.masked)
+        if service is None:
+            raise ValueError('No `service cloud.firestore` block found')
+        self.parse_block(service.end(), self.root)
+        return self.root
+
+    def parse_block(self, i: int, node: MatchNode) -> int:
+        """Parse statements until the '}' closing this block; returns the offset after it"""
+        masked = self.masked
+        while True:
+            i = self.skip_space(i)
+            if i >= len(masked) or masked[i] == '}':
+                return i + 1
+            if masked.startswith('match', i):
+                # Wildcards use braces too; the block opens at the first '{' not starting a segment
+                open_brace = i + 5
+                while masked[open_brace] != '{' or masked[open_brace - 1] == '/':
+                    open_brace += 1
+                path = masked[i + 5:open_brace].strip()
+                segments = node.segments + [s for s in path.split('/') if s]
+                if segments[:3] == ['databases', '{database}', 'documents']:
+                    segments = segments[3:]
+                child = MatchNode(segments, line_number(self.content, i), node)
+                node.children.append(child)
+                i = self.parse_block(open_brace + 1, child)
+            elif masked.startswith('function', i):
+                header = re.compile(r"function\s+(\w+)\s*\(([^)]*)\)\s*\{").match(masked, i)
+                close = matching_paren(masked, header.end() - 1)
+                params = [p.strip() for p in header.group(2).split(',') if p.strip()]
+                node.functions[header.group(1)] = RuleFunction(
+                    header.group(1), params, masked[header.end():close], header.end(), line_number(self.content, i))
+                i = close + 1
+            elif masked.startswith('allow', i):
+                end = masked.index(';', i)
+                statement = masked[i + 5:end]
+                operations, _, condition = statement.partition(':')
+                ops = tuple(op for name in re.findall(r"\w+", operations) for op in OPERATIONS.get(name, ()))
+                node.allows.append((ops, condition, i + 5 + len(operations) + 1))
+                i = end + 1
+            else:
+                # rules_version, stray tokens: skip to the end of the statement
+                end = re.compile(r"[;{}]").search(masked, i)
+                i = end.end() if end and masked[end.start()] == ';' else (end.start() if end else len(masked))
+                if end and masked[end.start()] == '{':
+                    i = matching_paren(masked, end.start()) + 1
+
+
+class RulesCostAnalyzer:
+    def __init__(self, project_root: str, rules_path: Optional[str] = None):
+        self.project_root = Path(project_root)
+        self.rules_path = Path(rules_path) if rules_path else self.project_root / 'firestore.rules'
+        self.content = ''
+        self.root: Optional[MatchNode] = None
+        self.nodes: List[MatchNode] = []
+        self.costs: List[Dict] = []
+        self.sites: List[Dict] = []
+
+    def accesses(self, expression: str, offset: int, node: MatchNode,
+                 arguments: Optional[Dict[str, str]] = None, via: Tuple[str, ...] = ()) -> List[Access]:
+        """Every document access an expression can make, helper calls expanded with their arguments"""
+        arguments = arguments or {}
+
+        def substitute(text: str) -> str:
+            for param, value in arguments.items():
+                text = re.sub(r"(?<![.\w])" + re.escape(param) + r"\b", lambda _: value, text)
+            return re.sub(r"\s+", ' ', text.strip())
+
+        found = []
+        for match in DOCUMENT_ACCESS.finditer(expression):
+            close = matching_paren(expression, match.end() - 1)
+            path = normalize_path(substitute(expression[match.end():close]))
+            found.append(Access(match.group(1), path, line_number(self.content, offset + match.start()), list(via)))
+
+        for match in CALL.finditer(expression):
+            function = node.lookup(match.group(1))
+            if function is None or function.name in via:
+                continue
+            close = matching_paren(expression, match.end() - 1)
+            values = [substitute(arg) for arg in split_arguments(expression[match.end():close])]
+            found.extend(self.accesses(function.body, function.offset, node,
+                                       dict(zip(function.params, values)), via + (function.name,)))
+        return found
+
+    @staticmethod
+    def covers(recursive: MatchNode, node: MatchNode) -> bool:
+        """Whether a {name=**} match applies below node's path: its prefix must match segment by segment"""
+        prefix = recursive.segments[:-1]
+        if len(node.segments) <= len(prefix):
+            return False
+        for pattern, segment in zip(prefix, node.segments):
+            if pattern.startswith('{'):
+                continue  # single-segment wildcard
+            if pattern != segment:
+                return False  # includes a literal against a wildcard: not every document matches
+        return True
+
+    def applicable(self, node: MatchNode) -> List[MatchNode]:
+        """The node plus every recursive-wildcard match that also covers its path"""
+        covering = [n for n in self.nodes if n.recursive and n is not node and self.covers(n, node)]
+        return [node] + covering
+
+    def analyze(self):
+        with open(self.rules_path, 'r', encoding='utf-8') as f:
+            self.content = f.read()
+        self.root = RulesParser(self.content).parse()
+
+        pending = list(self.root.children)
+        while pending:
+            node = pending.pop(0)
+            self.nodes.append(node)
+            pending.extend(node.children)
+
+        for node in self.nodes:
+            for operation in ALL_OPERATIONS:
+                found = []
+                allows = 0
+                for match_node in self.applicable(node):
+                    for ops, condition, offset in match_node.allows:
+                        if operation in ops:
+                            allows += 1
+                            found.extend(self.accesses(condition, offset, match_node))
+                if not allows:
+                    continue
+                documents = defaultdict(list)
+                for access in found:
+                    documents[access.path].append(access)
+                self.costs.append({
+                    'path': node.path,
+                    'line': node.line,
+                    'collection': node.collection,
+                    'parent_collection': node.parent_collection,
+                    'operation': operation,
+                    'allow_statements': allows,
+                    'access_calls': len(found),
+                    'worst_case_reads': len(documents),
+                    # Cached calls on the same document do not count toward the limit
+                    'over_access_limit': len(documents) > ACCESS_CALL_LIMIT,
+                    'documents': sorted(documents),
+                    'repeated': [
+                        {'path': path, 'calls': len(calls), 'lines': sorted({a.line for a in calls}),
+                         'via': sorted({' > '.join(a.via) for a in calls if a.via})}
+                        for path, calls in sorted(documents.items()) if len(calls) > 1
+                    ],
+                })
+        self.costs.sort(key=lambda c: (-c['worst_case_reads'], -c['access_calls']))
+
+    def match_sites(self):
+        """Attach the rules cost to every Firestore call site in the Dart sources"""
+        by_key = {(c['path'], c['operation']): c for c in self.costs}
+        for chain in scan_query_chains(self.project_root):
+            if not chain.collection:
+                continue
+            if chain.terminal in ('add', 'set'):
+                operation = 'create' if chain.terminal == 'add' else 'update'
+            elif chain.terminal in ('update', 'delete'):
+                operation = chain.terminal
+            elif chain.document:
+                if chain.terminal not in ('get', 'snapshots'):
+                    continue
+                operation = 'get'
+            else:
+                operation = 'list'
+
+            nodes = [n for n in self.nodes if n.collection == chain.collection and not n.recursive
+                     and (chain.parent is None or n.parent_collection in (chain.parent, None))]
+            if not nodes:
+                nodes = [n for n in self.nodes if n.collection == chain.collection]
+            cost = next((by_key[(n.path, operation)] for n in nodes if (n.path, operation) in by_key), None)
+            if cost is None:
+                continue
+            self.sites.append({
+                'file': chain.file,
+                'line': chain.line,
+                'package': package_of(chain.file),
+                'site': site_kind(chain.file),
+                'collection': chain.collection,
+                'operation': operation,
+                'listener': chain.terminal == 'snapshots',
+                'rule_path': cost['path'],
+                'rule_reads': cost['worst_case_reads'],
+            })
+        self.sites.sort(key=lambda s: -s['rule_reads'])
+
+    def file_hotspots(self) -> List[Dict]:
+        totals = defaultdict(lambda: {'sites': 0, 'rule_reads': 0})
+        for site in self.sites:
+            row = totals[site['file']]
+            row['sites'] += 1
+            row['rule_reads'] += site['rule_reads']
+        return sorted(({'file': name, 'site': site_kind(name), **row} for name, row in totals.items()),
+                      key=lambda r: -r['rule_reads'])
+
+    def functions(self) -> List[Dict]:
+        functions = []
+        for node in [self.root] + self.nodes:
+            for function in node.functions.values():
+                reads = self.accesses(function.body, function.offset, node, via=(function.name,))
+                functions.append({
+                    'name': function.name,
+                    'line': function.line,
+                    'scope': node.path,
+                    'params': function.params,
+                    'access_calls': len(reads),
+                    'documents': sorted({a.path for a in reads}),
+                })
+        return functions
+
+    def save_json_output(self, output_path: str):
+        repeated = [c for c in self.costs if c['repeated']]
+        output_data = {
+            'metadata': {
+                'rules_file': str(self.rules_path.relative_to(self.project_root))
+                if self.rules_path.is_relative_to(self.project_root) else str(self.rules_path),
+                'match_paths': len(self.nodes),
+                'access_calls_in_source': len(DOCUMENT_ACCESS.findall(mask_rules(self.content))),
+                'rules_with_reads': sum(1 for c in self.costs if c['worst_case_reads']),
+                'rules_with_repeated_reads': len(repeated),
+                'over_access_limit': sum(1 for c in self.costs if c['over_access_limit']),
+                'matched_sites': len(self.sites),
+            },
+            'functions': self.functions(),
+            'rules': self.costs,
+            'files': self.file_hotspots(),
+            'sites': self.sites,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count the document reads firestore.rules adds to each request')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--rules', help='Rules file (default: firestore.rules)')
+    parser.add_argument('--json', default='firestore_rules_cost_report.json', help='Output JSON file')
+    parser.add_argument('--no-sites', action='store_true', help='Skip matching Dart query sites to rule paths')
+    parser.add_argument('--top', type=int, default=15, help='Rules and screens to print')
+
+    args = parser.parse_args()
+
+    analyzer = RulesCostAnalyzer(args.root, args.rules)
+    analyzer.analyze()
+    if not args.no_sites:
+        analyzer.match_sites()
+    analyzer.save_json_output(args.json)
+
+    print(f"\n{'='*60}")
+    print("FIRESTORE RULES READ COST")
+    print(f"{'='*60}")
+    print(f"Match paths: {len(analyzer.nodes)}")
+    print(f"Operations with dependent reads: {sum(1 for c in analyzer.costs if c['worst_case_reads'])} "
+          f"of {len(analyzer.costs)}")
+
+    print("\nCostliest rules (distinct documents / access calls, worst case):")
+    for cost in analyzer.costs[:args.top]:
+        limit = ' ✗ over access limit' if cost['over_access_limit'] else ''
+        print(f"  {cost['worst_case_reads']:>2} / {cost['access_calls']:>2}  {cost['operation']:<6} {cost['path']}{limit}")
+
+    # The same calls repeat across operations and paths; group them by where they are written
+    repeated = defaultdict(set)
+    for cost in analyzer.costs:
+        for entry in cost['repeated']:
+            repeated[(entry['path'], tuple(entry['lines']))].add(cost['path'])
+    print(f"\nRepeated get()/exists() on the same document: {len(repeated)} call groups")
+    for (document, lines), paths in sorted(repeated.items(), key=lambda kv: -len(kv[1]))[:args.top]:
+        print(f"  {document}  lines {', '.join(map(str, lines))}  ({len(paths)} rule paths)")
+
+    if analyzer.sites:
+        print("\nScreens paying the most rule reads:")
+        screens = [row for row in analyzer.file_hotspots() if row['site'] != 'service']
+        for row in screens[:args.top]:
+            print(f"  {row['rule_reads']:>4} reads  {row['sites']:>3} sites  {row['file']}")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+ArtBeat i18n command line
+One entry point for the translation tooling:
+
+    artbeat-i18n extract artbeat_messaging     hardcoded strings -> catalog keys
+    artbeat-i18n update artbeat_messaging      rewrite screens to 'key'.tr()
+    artbeat-i18n fix-const artbeat_messaging   drop const around .tr() calls
+    artbeat-i18n translate --locales ar        apply the dictionary bundle
+    artbeat-i18n coverage                      per-locale translation status
+    artbeat-i18n validate --strict             JSON syntax + placeholder checks
+    artbeat-i18n compile                       rebuild the dictionary bundle
+
+Paths come from artbeat_i18n.json in the repository root (found by walking
+up from the current directory) instead of per-script absolute paths. Each
+subcommand imports its tool modules only when it runs, so --help and the
+quick checks do not pay for the others.
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, Optional
+
+CONFIG_NAME = 'artbeat_i18n.json'
+DEFAULT_CONFIG = {
+    'translations_dir': 'assets/translations',
+    'source_language': 'en',
+    'languages': ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh'],
+    'packages_dir': 'packages',
+    'reports_dir': 'build/i18n',
+}
+
+
+def find_root(start: Path) -> Path:
+    for directory in (start, *start.parents):
+        if (directory / CONFIG_NAME).exists():
+            return directory
+    return Path(__file__).resolve().parent.parent
+
+
+class Config:
+    def __init__(self, root: Path, values: Dict):
+        self.root = root
+        self.values = values
+
+    @classmethod
+    def load(cls, root: Optional[str] = None) -> 'Config':
+        root_path = Path(root).resolve() if root else find_root(Path.cwd().resolve())
+        values = dict(DEFAULT_CONFIG)
+        config_file = root_path / CONFIG_NAME
+        if config_file.exists():
+            with open(config_file, 'r', encoding='utf-8') as f:
+                values.update(json.load(f))
+        return cls(root_path, values)
+
+    def path(self, name: str) -> Path:
+        return self.root / self.values[name]
+
+    @property
+    def languages(self):
+        return self.values['languages']
+
+    def packages(self, names):
+        """Requested packages, or every package directory when none are given"""
+        if names:
+            return names
+        return sorted(p.name for p in self.path('packages_dir').iterdir() if (p / 'lib').is_dir())
+
+
+def command_extract(config: Config, args) -> int:
+    from batch_translation_extractor import TranslationExtractor
+
+    extractor = TranslationExtractor(str(config.root), config.path('translations_dir'), config.path('packages_dir'))
+    for package in config.packages(args.packages):
+        results = extractor.process_package(package)
+        extractor.generate_report(package, results)
+    if args.dry_run:
+        print(f"Dry run: {len(extractor.new_entries['en'])} new keys not saved")
+    else:
+        extractor.save_language_files()
+    return 0
+
+
+def command_update(config: Config, args) -> int:
+    from batch_translation_updater import TranslationUpdater
+
+    updater = TranslationUpdater(str(config.root), config.path('translations_dir'), config.path('packages_dir'))
+    total = sum(updater.process_package(package) for package in config.packages(args.packages))
+    updater.generate_report()
+    print(f"✓ Successfully updated {total} strings with .tr() calls")
+    return 0
+
+
+def command_fix_const(config: Config, args) -> int:
+    from fix_const_violations import fix_package
+
+    for package in config.packages(args.packages):
+        fix_package(config.root, package, config.path('packages_dir'))
+    return 0
+
+
+def command_translate(config: Config, args) -> int:
+    from contextlib import ExitStack
+
+    from catalog import Catalog, catalog_lock
+    from translation_bundle import load_bundle
+
+    bundle = load_bundle(str(config.root))
+    source = config.values['source_language']
+    locales = args.locales or [lang for lang in config.languages if lang != source]
+    with ExitStack() as locks:
+        if args.write:
+            # Sorted, so two writers never wait on each other's locales
+            for lang in sorted(locales):
+                locks.enter_context(catalog_lock(config.root, lang))
+        catalog = Catalog.load(config.path('translations_dir'), [source, *locales])
+        print(f"\n{'='*60}")
+        print("TRANSLATE FROM DICTIONARY BUNDLE")
+        print(f"{'='*60}")
+        for lang in locales:
+            pending = catalog.mask(lang, *args.statuses)
+            applied = catalog.apply_mapping(lang, bundle.languages.get(lang, {}), pending)
+            print(f"  {lang}: {applied} of {len(pending)} pending cells translated")
+        if args.write:
+            for file_path in catalog.save():
+                print(f"✓ Saved {file_path.relative_to(config.root)}")
+        else:
+            print("Dry run; pass --write to save the catalogs")
+    print(f"{'='*60}")
+    return 0
+
+
+def command_coverage(config: Config, args) -> int:
+    from catalog import BRACKET, EMPTY, IDENTICAL, MISSING, PREFIX, Catalog
+
+    catalog = Catalog.load(config.path('translations_dir'), config.languages)
+    source = config.values['source_language']
+    summary = {lang: catalog.counts(lang) for lang in catalog.languages if lang != source}
+
+    output_path = Path(args.json) if args.json else config.path('reports_dir') / 'coverage.json'
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': {'keys': len(catalog.keys), 'languages': catalog.languages},
+                   'locales': summary}, f, indent=2, ensure_ascii=False)
+
+    print(f"{'lang':<6}{'coverage':>9}{'bracket':>9}{'prefix':>8}{'identical':>11}{'empty':>7}{'missing':>9}")
+    for lang, counts in summary.items():
+        coverage = counts['translated'] / len(catalog.keys) * 100 if catalog.keys else 0
+        print(f"{lang:<6}{coverage:>8.1f}%{counts[BRACKET]:>9}{counts[PREFIX]:>8}"
+              f"{counts[IDENTICAL]:>11}{counts[EMPTY]:>7}{counts[MISSING]:>9}")
+    print(f"📊 Report saved to: {output_path}")
+    return 0
+
+
+def command_validate(config: Config, args) -> int:
+    # Syntax first: a broken catalog would otherwise surface as a traceback
+    broken = 0
+    for lang in args.locales or config.languages:
+        file_path = config.path('translations_dir') / f'{lang}.json'
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{file_path.relative_to(config.root)}: error: [syntax] {e}")
+            broken += 1
+    if broken:
+        return 1
+
+    from check_placeholders import PlaceholderChecker
+
+    checker = PlaceholderChecker(str(config.root), args.locales, config.path('translations_dir'))
+    checker.check_all()
+    for d in checker.diagnostics:
+        print(f"{d['file']}: {d['severity']}: [{d['kind']}] {d['key']}: {d['message']}")
+    errors = checker.error_count()
+    print(f"Checked {checker.cells_checked} cells: {errors} errors, {len(checker.diagnostics) - errors} warnings")
+    failures = len(checker.diagnostics) if args.strict else errors
+    return 1 if failures else 0
+
+
+def command_compile(config: Config, args) -> int:
+    from translation_bundle import BundleBuilder
+
+    builder = BundleBuilder(str(config.root))
+    if args.force or not builder.is_current(builder.read_bundle()):
+        data = builder.build()
+        builder.write(data)
+        print(f"✓ Bundle written: {builder.bundle_file.relative_to(config.root)} "
+              f"({len(data['tables'])} dictionaries)")
+    else:
+        print(f"✓ Bundle up to date: {builder.bundle_file.relative_to(config.root)}")
+
+    if args.locale_keys:
+        from generate_locale_keys import LocaleKeyGenerator
+
+        status = LocaleKeyGenerator(str(config.root)).generate(args.force)
+        print(f"✓ LocaleKeys {status}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='artbeat-i18n', description='ArtBeat translation tooling')
+    parser.add_argument('--root', help=f'Repository root (default: nearest directory with {CONFIG_NAME})')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    for name, handler, help_text in (
+        ('extract', command_extract, 'Extract hardcoded screen strings into catalog keys'),
+        ('update', command_update, "Rewrite screen strings to 'key'.tr() calls"),
+        ('fix-const', command_fix_const, 'Remove const around widgets that call .tr()'),
+    ):
+        sub = subcommands.add_parser(name, help=help_text)
+        sub.add_argument('packages', nargs='*', help='Package names (default: all packages)')
+        sub.set_defaults(handler=handler)
+    subcommands.choices['extract'].add_argument('--dry-run', action='store_true', help='Report without saving catalogs')
+
+    sub = subcommands.add_parser('translate', help='Fill pending cells from the compiled dictionary bundle')
+    sub.add_argument('--locales', nargs='*', help='Locales to translate (default: all but the source)')
+    sub.add_argument('--statuses', nargs='*', default=['bracket', 'prefix', 'missing'],
+                     choices=['bracket', 'prefix', 'identical', 'empty', 'missing'], help='Cells to fill')
+    sub.add_argument('--write', action='store_true', help='Save the updated catalogs')
+    sub.set_defaults(handler=command_translate)
+
+    sub = subcommands.add_parser('coverage', help='Per-locale translation status')
+    sub.add_argument('--json', help='Output JSON file (default: <reports_dir>/coverage.json)')
+    sub.set_defaults(handler=command_coverage)
+
+    sub = subcommands.add_parser('validate', help='Check catalog syntax and placeholders')
+    sub.add_argument('--locales', nargs='*', help='Locales to check (default: all)')
+    sub.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    sub.set_defaults(handler=command_validate)
+
+    sub = subcommands.add_parser('compile', help='Rebuild the translation dictionary bundle')
+    sub.add_argument('--force', action='store_true', help='Rebuild even if sources are unchanged')
+    sub.add_argument('--locale-keys', action='store_true', help='Also regenerate LocaleKeys from en.json')
+    sub.set_defaults(handler=command_compile)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    config = Config.load(args.root)
+    sys.exit(args.handler(config, args))
+
+
+if __name__ == '__main__':
+    main()
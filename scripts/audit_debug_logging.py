@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Debug Logging Audit
+Finds every print()/debugPrint() call with its enclosing function and scores
+how often it can run in a release build: inside build methods, list item
+builders, stream listeners, listeners and periodic timers. Calls already
+behind `if (kDebugMode)` or inside assert() are reported but not scored.
+
+With --fix guard the unguarded calls are wrapped in `if (kDebugMode) { }`
+(print becomes debugPrint, which avoid_print allows); with --fix strip they
+are removed. Files are rewritten in place like fix_const_violations.py does.
+The report also lists debug, test and example libraries that lib/main.dart
+still imports.
+"""
+
+import re
+import json
+import argparse
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from analyze_import_graph import ImportGraphAnalyzer
+from dart_source import class_members, find_classes, find_dart_files, line_number, matching_paren, scan_dart
+
+LOG_CALL = re.compile(r"(?<![\w.])(print|debugPrint)\s*\(")
+DEBUG_GUARD = re.compile(r"\bif\s*\(\s*(?:kDebugMode|!\s*kReleaseMode)\s*\)\s*")
+ASSERT_CALL = re.compile(r"(?<![\w.])assert\s*\(")
+# material/widgets/cupertino re-export debugPrint but not kDebugMode, so only an
+# unprefixed foundation import (without show/hide dropping kDebugMode) counts
+FOUNDATION_IMPORT = re.compile(r"""^import\s+['"]package:flutter/foundation\.dart['"]\s*"""
+                               r"""(?:;|show\b[^;]*\bkDebugMode\b[^;]*;|hide\b(?![^;]*\bkDebugMode\b)[^;]*;)""",
+                               re.MULTILINE)
+PACKAGE_IMPORT = re.compile(r"""^import\s+['"](package:[^'"]+)['"]""", re.MULTILINE)
+DEBUG_FILE = re.compile(r"(?:^|/)(?:debug|test|temp)_|_(?:debug|demo|example|examples)(?:_|\.dart$)|/(?:examples?|debug|tools)/")
+
+# Risk weight of the code path a call sits on; nested paths add up
+HOT_PATHS = {
+    'build': 3,
+    'builder': 3,
+    'item_builder': 5,
+    'stream_listen': 4,
+    'listener': 4,
+    'timer_periodic': 4,
+}
+HOT_PATH_PATTERNS = [
+    (re.compile(r"\b(?:itemBuilder|separatorBuilder)\s*:"), 'item_builder'),
+    (re.compile(r"\bbuilder\s*:"), 'builder'),
+    (re.compile(r"\bonNotification\s*:"), 'listener'),
+]
+HOT_PATH_CALLS = [
+    (re.compile(r"\.\s*listen\s*\("), 'stream_listen'),
+    (re.compile(r"\.\s*addListener\s*\("), 'listener'),
+    (re.compile(r"\bTimer\.periodic\s*\("), 'timer_periodic'),
+]
+
+
+def argument_end(masked: str, i: int) -> int:
+    """Offset of the ',' or closing bracket that ends the named argument starting at i"""
+    depth = 0
+    while i < len(masked):
+        c = masked[i]
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            if depth == 0:
+                return i
+            depth -= 1
+        elif c == ',' and depth == 0:
+            return i
+        i += 1
+    return i
+
+
+def previous_token(masked: str, i: int) -> str:
+    i -= 1
+    while i >= 0 and masked[i].isspace():
+        i -= 1
+    if i < 0:
+        return '{'
+    if masked[i].isalnum() or masked[i] == '_':
+        start = i
+        while start > 0 and (masked[start - 1].isalnum() or masked[start - 1] == '_'):
+            start -= 1
+        return masked[start:i + 1]
+    return masked[max(0, i - 1):i + 1] if masked[i] == '>' else masked[i]
+
+
+def package_of(relative: str) -> str:
+    return relative.split('/')[1] if relative.startswith('packages/') else 'main_app'
+
+
+class DebugLoggingAuditor:
+    def __init__(self, project_root: str, entries: Optional[List[str]] = None):
+        self.project_root = Path(project_root)
+        self.entries = entries or ['lib/main.dart']
+        self.calls: List[Dict] = []
+        self.reachable_debug_files: List[Dict] = []
+        self.dart_files: List[Path] = []
+        self.files_fixed = 0
+        self.calls_fixed = 0
+
+    def hot_paths(self, masked: str) -> List[Tuple[int, int, str]]:
+        spans = []
+        for pattern, kind in HOT_PATH_PATTERNS:
+            for match in pattern.finditer(masked):
+                spans.append((match.end(), argument_end(masked, match.end()), kind))
+        for pattern, kind in HOT_PATH_CALLS:
+            for match in pattern.finditer(masked):
+                spans.append((match.end(), matching_paren(masked, match.end() - 1), kind))
+        return spans
+
+    def guard_spans(self, masked: str) -> List[Tuple[int, int]]:
+        spans = []
+        for match in DEBUG_GUARD.finditer(masked):
+            if masked.startswith('{', match.end()):
+                spans.append((match.end(), matching_paren(masked, match.end())))
+            else:
+                spans.append((match.end(), masked.find(';', match.end())))
+        for match in ASSERT_CALL.finditer(masked):
+            spans.append((match.end(), matching_paren(masked, match.end() - 1)))
+        return spans
+
+    def functions(self, masked: str) -> List[Tuple[str, int, int]]:
+        """(qualified name, body start, body end) of methods and top-level functions"""
+        functions = []
+        for class_name, _, open_brace, close_brace in find_classes(masked):
+            for member in class_members(masked, open_brace, close_brace):
+                functions.append((f"{class_name}.{member.name}", member.start, member.end))
+        # The whole file parses like a class body; class declarations have no name
+        for member in class_members(masked, -1, len(masked)):
+            functions.append((member.name, member.start, member.end))
+        return functions
+
+    def scan_content(self, content: str, relative: str) -> List[Dict]:
+        masked, _ = scan_dart(content)
+        if not LOG_CALL.search(masked):
+            return []
+        spans = self.hot_paths(masked)
+        guards = self.guard_spans(masked)
+        functions = self.functions(masked)
+
+        calls = []
+        for match in LOG_CALL.finditer(masked):
+            before = previous_token(masked, match.start())
+            if before[-1:].isalnum() and before not in ('return', 'await', 'else'):
+                continue  # a declaration such as `void debugPrint(...)`
+            close = matching_paren(masked, match.end() - 1)
+            after = masked[close + 1:close + 80].lstrip()
+            # `case x:` / `default:` directly before the call also starts a statement
+            label_start = masked.rfind('\n', 0, masked.rfind(':', 0, match.start())) + 1
+            case_label = before == ':' and re.match(r"\s*(?:case\b|default\s*:)", masked[label_start:match.start()])
+            enclosing = min((f for f in functions if f[1] <= match.start() <= f[2]),
+                            key=lambda f: f[2] - f[1], default=None)
+
+            paths = sorted({kind for start, end, kind in spans if start <= match.start() <= end})
+            if enclosing and (enclosing[0].split('.')[-1] == 'build' or enclosing[0].split('.')[-1].startswith('_build')):
+                paths.insert(0, 'build')
+            guarded = any(start <= match.start() <= end for start, end in guards)
+            score = 0 if guarded else 1 + sum(HOT_PATHS[p] for p in paths)
+
+            calls.append({
+                'file': relative,
+                'line': line_number(content, match.start()),
+                'call': match.group(1),
+                'function': enclosing[0] if enclosing else None,
+                'hot_paths': paths,
+                'guarded': guarded,
+                'statement': (before in (';', '{', '}') or bool(case_label)) and after.startswith(';'),
+                'risk': score,
+                'start': match.start(),
+                'end': masked.index(';', close + 1) + 1 if after.startswith(';') else close + 1,
+            })
+        return calls
+
+    def scan_all(self, packages: Optional[List[str]] = None):
+        self.dart_files = find_dart_files(self.project_root)
+        if packages:
+            self.dart_files = [f for f in self.dart_files
+                               if package_of(str(f.relative_to(self.project_root))) in packages]
+        print(f"Scanning {len(self.dart_files)} Dart files for print/debugPrint calls")
+        for file_path in self.dart_files:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                print(f"Error reading {file_path}: {e}")
+                continue
+            self.calls.extend(self.scan_content(content, str(file_path.relative_to(self.project_root))))
+        self.calls.sort(key=lambda c: -c['risk'])
+
+    def find_reachable_debug_files(self):
+        """Debug/test/example libraries in the import closure of the entry points, with one import path each"""
+        graph = ImportGraphAnalyzer(str(self.project_root), self.entries)
+        graph.analyze()
+        adjacency = graph.adjacency()
+        parents: Dict[str, Optional[str]] = {e: None for e in self.entries if e in adjacency}
+        queue = deque(parents)
+        while queue:
+            node = queue.popleft()
+            for target in adjacency[node]:
+                if target not in parents:
+                    parents[target] = node
+                    queue.append(target)
+
+        for node in sorted(parents):
+            if node in self.entries or not DEBUG_FILE.search(node):
+                continue
+            chain, step = [], node
+            while step is not None:
+                chain.append(step)
+                step = parents[step]
+            self.reachable_debug_files.append({
+                'file': node,
+                'size': graph.sizes[node],
+                'eager': node in graph.eager,
+                'import_path': list(reversed(chain)),
+            })
+
+    def rewrite(self, content: str, calls: List[Dict], mode: str) -> Tuple[str, int]:
+        """Guard or strip whole-line log statements; inline calls are left alone"""
+        fixed = 0
+        for call in sorted(calls, key=lambda c: -c['start']):
+            if call['guarded'] or not call['statement']:
+                continue
+            line_start = content.rfind('\n', 0, call['start']) + 1
+            line_end = content.find('\n', call['end'])
+            line_end = len(content) if line_end < 0 else line_end
+            if content[line_start:call['start']].strip() or content[call['end']:line_end].strip():
+                continue
+            indent = content[line_start:call['start']]
+            statement = content[call['start']:call['end']]
+
+            if mode == 'strip':
+                content = content[:line_start] + content[line_end + 1:]
+            else:
+                if call['call'] == 'print':
+                    statement = self.as_debug_print(statement)
+                body = '\n'.join('  ' + line if line.strip() else line
+                                 for line in (indent + statement).split('\n'))
+                content = content[:line_start] + f"{indent}if (kDebugMode) {{\n{body}\n{indent}}}" + content[line_end:]
+            fixed += 1
+
+        if fixed and mode == 'guard' and not FOUNDATION_IMPORT.search(content):
+            content = self.add_foundation_import(content)
+        return content, fixed
+
+    @staticmethod
+    def as_debug_print(statement: str) -> str:
+        """print(x) -> debugPrint(x); debugPrint takes a String, so non-literals are interpolated"""
+        open_paren = statement.index('(')
+        argument = statement[open_paren + 1:statement.rindex(')')].strip().rstrip(',').strip()
+        if not re.match(r"""^r?['"]""", argument):
+            argument = f"'${argument}'" if re.fullmatch(r"\w+", argument) else f"'${{{argument}}}'"
+        return f"debugPrint({argument});"
+
+    @staticmethod
+    def add_foundation_import(content: str) -> str:
+        line = "import 'package:flutter/foundation.dart';\n"
+        for match in PACKAGE_IMPORT.finditer(content):
+            if match.group(1) > 'package:flutter/foundation.dart':
+                return content[:match.start()] + line + content[match.start():]
+        imports = list(re.finditer(r"^import\s[^;]*;\n", content, re.MULTILINE))
+        position = imports[-1].end() if imports else 0
+        return content[:position] + line + ('\n' if not imports else '') + content[position:]
+
+    def apply_fixes(self, mode: str, min_risk: int = 0):
+        by_file = defaultdict(list)
+        for call in self.calls:
+            if call['risk'] >= min_risk:
+                by_file[call['file']].append(call)
+        for relative, calls in sorted(by_file.items()):
+            file_path = self.project_root / relative
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                new_content, fixed = self.rewrite(content, calls, mode)
+                if new_content != content:
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(new_content)
+                    print(f"  ✓ {relative}: {fixed} calls")
+                    self.files_fixed += 1
+                    self.calls_fixed += fixed
+            except Exception as e:
+                print(f"Error fixing {file_path}: {e}")
+
+    def function_hotspots(self) -> List[Dict]:
+        totals = defaultdict(lambda: {'calls': 0, 'risk': 0})
+        for call in self.calls:
+            row = totals[(call['file'], call['function'])]
+            row['calls'] += 1
+            row['risk'] += call['risk']
+        return sorted(({'file': f, 'function': fn, **row} for (f, fn), row in totals.items()),
+                      key=lambda r: -r['risk'])
+
+    def save_json_output(self, output_path: str):
+        unguarded = [c for c in self.calls if not c['guarded']]
+        output_data = {
+            'metadata': {
+                'total_files': len(self.dart_files),
+                'calls': len(self.calls),
+                'print_calls': sum(1 for c in self.calls if c['call'] == 'print'),
+                'debug_print_calls': sum(1 for c in self.calls if c['call'] == 'debugPrint'),
+                'guarded': len(self.calls) - len(unguarded),
+                'hot_path_calls': sum(1 for c in unguarded if c['hot_paths']),
+                'reachable_debug_files': len(self.reachable_debug_files),
+            },
+            'functions': [row for row in self.function_hotspots() if row['risk']],
+            'calls': [{k: v for k, v in c.items() if k not in ('start', 'end')} for c in self.calls],
+            'reachable_debug_files': self.reachable_debug_files,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Audit print/debugPrint calls and debug-only libraries for release builds')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--entry', action='append', help='Entry library relative to the root (default: lib/main.dart)')
+    parser.add_argument('--packages', nargs='*', help='Only scan these packages (main_app for lib/)')
+    parser.add_argument('--fix', choices=['guard', 'strip'], help='Wrap unguarded calls in kDebugMode, or remove them')
+    parser.add_argument('--min-risk', type=int, default=0, help='Only fix calls with at least this risk score')
+    parser.add_argument('--json', default='debug_logging_report.json', help='Output JSON file')
+    parser.add_argument('--top', type=int, default=15, help='Functions to print')
+
+    args = parser.parse_args()
+
+    auditor = DebugLoggingAuditor(args.root, args.entry)
+    auditor.scan_all(args.packages)
+    auditor.find_reachable_debug_files()
+    auditor.save_json_output(args.json)
+
+    unguarded = [c for c in auditor.calls if not c['guarded']]
+    print(f"\n{'='*60}")
+    print("DEBUG LOGGING AUDIT")
+    print(f"{'='*60}")
+    print(f"print: {sum(1 for c in auditor.calls if c['call'] == 'print')}  "
+          f"debugPrint: {sum(1 for c in auditor.calls if c['call'] == 'debugPrint')}")
+    print(f"Guarded by kDebugMode/assert: {len(auditor.calls) - len(unguarded)}")
+    print(f"Unguarded on hot paths: {sum(1 for c in unguarded if c['hot_paths'])}")
+
+    print("\nRiskiest functions:")
+    for row in auditor.function_hotspots()[:args.top]:
+        if row['risk']:
+            print(f"  {row['risk']:>4}  {row['calls']:>3} calls  {row['function']}  ({row['file']})")
+
+    print(f"\nDebug-only libraries reachable from {', '.join(auditor.entries)}: {len(auditor.reachable_debug_files)}")
+    for entry in auditor.reachable_debug_files:
+        print(f"  ✗ {entry['file']}  via {' -> '.join(entry['import_path'][1:-1][-2:]) or 'entry'}")
+
+    if args.fix:
+        print(f"\nApplying --fix {args.fix} (risk >= {args.min_risk})...")
+        auditor.apply_fixes(args.fix, args.min_risk)
+        print(f"✅ Rewrote {auditor.calls_fixed} calls in {auditor.files_fixed} files")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -9,9 +9,11 @@ import re
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
+from catalog_transaction import CatalogTransaction
+
 @dataclass
 class TranslationEntry:
     key: str
@@ -27,9 +29,10 @@ class ScreenFile:
     strings: List[TranslationEntry] = field(default_factory=list)
 
 class TranslationExtractor:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, assets_dir: Optional[Path] = None, packages_dir: Optional[Path] = None):
         self.project_root = Path(project_root)
-        self.assets_dir = self.project_root / "assets" / "translations"
+        self.assets_dir = Path(assets_dir) if assets_dir else self.project_root / "assets" / "translations"
+        self.packages_dir = Path(packages_dir) if packages_dir else self.project_root / 'packages'
         self.language_files = {}
         self.existing_keys: Set[str] = set()
         self.new_entries: Dict[str, Dict[str, str]] = {
@@ -136,7 +139,7 @@ class TranslationExtractor:
     
     def process_package(self, package_name: str) -> Dict[str, List[str]]:
         """Process all screen files in a package"""
-        package_path = self.project_root / 'packages' / package_name / 'lib' / 'src' / 'screens'
+        package_path = self.packages_dir / package_name / 'lib' / 'src' / 'screens'
         
         if not package_path.exists():
             print(f"Package path not found: {package_path}")
@@ -172,7 +175,7 @@ class TranslationExtractor:
         return results
     
     def save_language_files(self):
-        """Save updated translation files"""
+        """Save updated translation files in one journaled commit"""
         languages = {
             'en': self.new_entries['en'],
             'es': self.new_entries['es'],
@@ -182,23 +185,13 @@ class TranslationExtractor:
             'zh': self.new_entries['zh'],
         }
         
+        # Either every locale gets the new keys or none does
+        with CatalogTransaction(self.assets_dir, lock_root=self.project_root, sort_keys=True,
+                                languages=list(languages)) as transaction:
+            for lang, new_keys in languages.items():
+                transaction.catalog(lang).update(new_keys)
+        
         for lang, new_keys in languages.items():
-            file_path = self.assets_dir / f"{lang}.json"
-            
-            # Load existing
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    existing = json.load(f)
-            else:
-                existing = {}
-            
-            # Merge new keys
-            existing.update(new_keys)
-            
-            # Save with pretty formatting
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(existing, f, ensure_ascii=False, indent=2, sort_keys=True)
-            
             print(f"✓ Updated {lang}.json ({len(new_keys)} new keys)")
     
     def generate_report(self, package_name: str, results: Dict[str, List[str]]):
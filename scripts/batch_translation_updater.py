@@ -9,12 +9,13 @@ import re
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 class TranslationUpdater:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, assets_dir: Optional[Path] = None, packages_dir: Optional[Path] = None):
         self.project_root = Path(project_root)
-        self.assets_dir = self.project_root / "assets" / "translations"
+        self.assets_dir = Path(assets_dir) if assets_dir else self.project_root / "assets" / "translations"
+        self.packages_dir = Path(packages_dir) if packages_dir else self.project_root / 'packages'
         self.translation_keys = self.load_translation_keys()
         self.updated_files = []
         
@@ -160,7 +161,7 @@ class TranslationUpdater:
     
     def process_package(self, package_name: str) -> int:
         """Process all screen files in a package"""
-        package_path = self.project_root / 'packages' / package_name / 'lib' / 'src' / 'screens'
+        package_path = self.packages_dir / package_name / 'lib' / 'src' / 'screens'
         
         if not package_path.exists():
             print(f"Package path not found: {package_path}")
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the ArtBeat i18n tools
+Times every stage (extraction, updating, const fixing, locale passes and
+the catalog checkers) on a synthetic corpus, records peak memory and
+stores results as JSON so runs can be compared between commits.
+"""
+
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from extract_english_text import EnglishTextExtractor, write_report_from_jsonl  # noqa: E402
+from batch_translation_updater import TranslationUpdater  # noqa: E402
+from fix_const_violations import find_const_block_for_tr, fix_const_violations_in_file, masked_lines_of  # noqa: E402
+from catalog import BRACKET, Catalog  # noqa: E402
+from check_placeholders import PlaceholderChecker  # noqa: E402
+from scan_translation_keys import TranslationKeyScanner  # noqa: E402
+from generate_bench_corpus import CorpusGenerator  # noqa: E402
+
+
+class Stage:
+    def __init__(self, name: str, run: Callable[[], int], setup: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+class BenchmarkHarness:
+    def __init__(self, corpus_dir: str, sample: Optional[int] = None, repeat: int = 1, memory: bool = True):
+        self.corpus_dir = Path(corpus_dir)
+        self.sample = sample
+        self.repeat = repeat
+        self.memory = memory
+        self.work_dir = Path(tempfile.mkdtemp(prefix='artbeat_bench_'))
+        self.scratch_dir = Path(tempfile.mkdtemp(prefix='artbeat_bench_out_'))  # report outputs
+        self.results: Dict[str, Dict] = {}
+
+    def dart_files(self, root: Path) -> List[Path]:
+        files = sorted(root.glob('packages/*/lib/src/screens/*.dart'))
+        return files[:self.sample] if self.sample else files
+
+    def load_catalog(self, lang: str) -> Dict:
+        with open(self.corpus_dir / 'assets' / 'translations' / f"{lang}.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def reset_work_copy(self):
+        """Stages that rewrite files in place run on a fresh copy of the corpus"""
+        if self.work_dir.exists():
+            shutil.rmtree(self.work_dir)
+        shutil.copytree(self.corpus_dir, self.work_dir)
+
+    # Stages
+
+    def stage_extract(self) -> int:
+        extractor = EnglishTextExtractor(str(self.corpus_dir))
+        return sum(len(extractor.extract_from_file(f)) for f in self.dart_files(self.corpus_dir))
+
+    def stage_extract_report(self) -> int:
+        """In-memory extraction plus markdown/JSON output, as extract_english_text.py runs"""
+        extractor = EnglishTextExtractor(str(self.corpus_dir))
+        for file_path in self.dart_files(self.corpus_dir):
+            texts = extractor.extract_from_file(file_path)
+            if texts:
+                extractor.english_texts[str(file_path.relative_to(self.corpus_dir))] = texts
+                extractor.total_texts_found += len(texts)
+        with open(self.scratch_dir / 'bench_extract.md', 'w', encoding='utf-8') as f:
+            f.write(extractor.generate_report())
+        extractor.save_json_output(str(self.scratch_dir / 'bench_extract.json'))
+        return extractor.total_texts_found
+
+    def stage_extract_stream(self) -> int:
+        """Same output through --stream: JSONL per file, report rendered from the JSONL"""
+        extractor = EnglishTextExtractor(str(self.corpus_dir), verbose=False)
+        jsonl_path = str(self.scratch_dir / 'bench_extract.jsonl')
+        extractor.stream_to_jsonl(jsonl_path, self.dart_files(self.corpus_dir))
+        write_report_from_jsonl(jsonl_path, str(self.scratch_dir / 'bench_extract_stream.md'))
+        return extractor.total_texts_found
+
+    def stage_update(self) -> int:
+        updater = TranslationUpdater(str(self.work_dir))
+        return sum(updater.update_file(str(f), '') for f in self.dart_files(self.work_dir))
+
+    def stage_fix_const(self) -> int:
+        return sum(fix_const_violations_in_file(str(f)) for f in self.dart_files(self.work_dir))
+
+    def stage_find_const_block(self) -> int:
+        found = 0
+        for file_path in self.dart_files(self.corpus_dir):
+            content = file_path.read_text(encoding='utf-8')
+            lines = content.split('\n')
+            masked_lines = masked_lines_of(content)
+            for i, line in enumerate(masked_lines):
+                if '.tr()' in line and find_const_block_for_tr(lines, i, masked_lines) >= 0:
+                    found += 1
+        return found
+
+    def stage_bracket_pass(self) -> int:
+        """The loop every translate_*_mega_N.py pass runs over its catalog"""
+        from translate_arabic_mega_5 import AR_MEGA_TRANSLATIONS_5
+
+        translations = self.load_catalog('ar')
+        english = self.load_catalog('en')
+        table = dict(AR_MEGA_TRANSLATIONS_5)
+        # Give the pass something to hit: one corpus value per dictionary entry
+        for english_text, value in zip(list(english.values())[:len(table)], list(table.values())):
+            table[english_text] = value
+        applied = 0
+        for english_text, arabic_text in table.items():
+            bracketed = f"[{english_text}]"
+            if bracketed in translations.values():
+                for key, value in translations.items():
+                    if value == bracketed:
+                        translations[key] = arabic_text
+                        applied += 1
+                        break
+        return applied
+
+    def stage_catalog_bracket_pass(self) -> int:
+        """Same dictionary as mega_bracket_pass, applied through the Catalog bracket mask"""
+        from translate_arabic_mega_5 import AR_MEGA_TRANSLATIONS_5
+
+        catalog = Catalog.load(self.corpus_dir / 'assets' / 'translations', ['en', 'ar'])
+        table = dict(AR_MEGA_TRANSLATIONS_5)
+        for english_text, value in zip(list(catalog.columns['en'])[:len(table)], list(table.values())):
+            table[english_text] = value
+        return catalog.apply_mapping('ar', table, catalog.mask('ar', BRACKET))
+
+    def stage_translate_placeholder(self) -> int:
+        from translate_de_comprehensive import translate_placeholder
+
+        data = self.load_catalog('de')
+        translated = 0
+        for key, value in data.items():
+            if isinstance(value, str) and value.startswith('[') and value.endswith(']'):
+                if translate_placeholder(value) != value:
+                    translated += 1
+        return translated
+
+    def stage_placeholder_check(self) -> int:
+        checker = PlaceholderChecker(str(self.corpus_dir))
+        checker.check_all()
+        return checker.cells_checked
+
+    def stage_key_scan(self) -> int:
+        scanner = TranslationKeyScanner(str(self.corpus_dir))
+        scanner.dart_files = self.dart_files(self.corpus_dir)
+        scanner.load_catalogs()
+        for file_path in scanner.dart_files:
+            scanner.scan_file(file_path)
+        return sum(len(refs) for refs in scanner.static_refs.values())
+
+    def stages(self) -> List[Stage]:
+        return [
+            Stage('extract_from_file', self.stage_extract),
+            Stage('extract_report', self.stage_extract_report),
+            Stage('extract_stream', self.stage_extract_stream),
+            Stage('update_file', self.stage_update, self.reset_work_copy),
+            Stage('fix_const_violations', self.stage_fix_const, self.reset_work_copy),
+            Stage('find_const_block_for_tr', self.stage_find_const_block),
+            Stage('mega_bracket_pass', self.stage_bracket_pass),
+            Stage('catalog_bracket_pass', self.stage_catalog_bracket_pass),
+            Stage('translate_placeholder', self.stage_translate_placeholder),
+            Stage('check_placeholders', self.stage_placeholder_check),
+            Stage('scan_translation_keys', self.stage_key_scan),
+        ]
+
+    def measure(self, stage: Stage) -> Dict:
+        timings = []
+        items = 0
+        for _ in range(self.repeat):
+            if stage.setup:
+                stage.setup()
+            start = time.perf_counter()
+            items = stage.run()
+            timings.append(time.perf_counter() - start)
+
+        result = {
+            'seconds': round(min(timings), 4),
+            'mean_seconds': round(sum(timings) / len(timings), 4),
+            'items': items,
+        }
+
+        if self.memory:
+            # Separate traced run: tracemalloc overhead must not skew the timings
+            if stage.setup:
+                stage.setup()
+            tracemalloc.start()
+            stage.run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result['peak_kb'] = round(peak / 1024, 1)
+        return result
+
+    def run(self, only: Optional[List[str]] = None) -> Dict[str, Dict]:
+        for stage in self.stages():
+            if only and stage.name not in only:
+                continue
+            print(f"  {stage.name}...", end=' ', flush=True)
+            self.results[stage.name] = self.measure(stage)
+            row = self.results[stage.name]
+            memory = f", peak {row['peak_kb']:,.0f} KB" if 'peak_kb' in row else ''
+            print(f"{row['seconds']:.3f}s ({row['items']} items{memory})")
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        shutil.rmtree(self.scratch_dir, ignore_errors=True)
+        return self.results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Print per-stage deltas against a previous run; returns regressed stage names"""
+    regressions = []
+    print(f"\nComparison with {baseline['metadata'].get('commit', '?')} "
+          f"({baseline['metadata'].get('scale', '?')}x):")
+    for name, row in current['stages'].items():
+        old = baseline['stages'].get(name)
+        if not old or not old['seconds']:
+            print(f"  {name}: new stage")
+            continue
+        delta = 100 * (row['seconds'] - old['seconds']) / old['seconds']
+        flag = ''
+        if delta > threshold:
+            regressions.append(name)
+            flag = '  ⚠ regression'
+        print(f"  {name}: {old['seconds']:.3f}s -> {row['seconds']:.3f}s ({delta:+.1f}%){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the i18n tools on a synthetic corpus')
+    parser.add_argument('--corpus', default='build/bench_corpus', help='Corpus directory (one subdirectory per scale)')
+    parser.add_argument('--scales', nargs='*', type=int, default=[1], help='Corpus scales to run')
+    parser.add_argument('--stages', nargs='*', help='Only run these stages')
+    parser.add_argument('--sample', type=int, help='Limit file-based stages to the first N files')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed repetitions per stage (best is reported)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory run')
+    parser.add_argument('--output-dir', default='build/benchmarks', help='Where to write result JSON')
+    parser.add_argument('--compare', help='Previous result JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Regression threshold in percent')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit non-zero on regressions')
+
+    args = parser.parse_args()
+
+    commit = git_commit()
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    regressions = []
+
+    # Load the baseline up front: this run may overwrite the same file
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    for scale in args.scales:
+        corpus_dir = Path(args.corpus) / f"{scale}x"
+        if not (corpus_dir / 'corpus.json').exists():
+            print(f"Generating {scale}x corpus in {corpus_dir}...")
+            CorpusGenerator(str(corpus_dir), scale).generate()
+
+        print(f"\nBenchmarking {scale}x corpus ({corpus_dir})")
+        harness = BenchmarkHarness(str(corpus_dir), args.sample, args.repeat, not args.no_memory)
+        stages = harness.run(args.stages)
+
+        result = {
+            'metadata': {
+                'commit': commit,
+                'generated_at': datetime.now().isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'scale': scale,
+                'sample': args.sample,
+                'repeat': args.repeat,
+            },
+            'stages': stages,
+        }
+        output_path = output_dir / f"bench-{commit}-{scale}x.json"
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"📊 Results saved to: {output_path}")
+
+        if baseline:
+            regressions.extend(compare(result, baseline, args.threshold))
+
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Translation Catalog
+Loads every locale into one aligned table: a shared key index, one value
+column per locale and precomputed status masks (bracketed placeholder,
+[XX] prefix, identical to English, empty, missing).
+
+Masks are integer bitsets over the key index, so filters combine with
+& | ~ - instead of re-walking each dict. copy() shares columns with the
+original and only copies a column on its first write, so a pass can stage
+its changes without duplicating every locale's strings.
+"""
+
+import re
+import json
+import fcntl
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+SOURCE_LANGUAGE = 'en'
+# Outside assets/: pubspec bundles everything under assets/translations/
+LOCK_DIR = Path('build/i18n/locks')
+LOCALE_PREFIX = re.compile(r"^\[[A-Z]{2}\]\s*")
+
+BRACKET = 'bracket'        # "[Save changes]": untranslated placeholder
+PREFIX = 'prefix'          # "[FR] Save changes": machine-prefixed English
+IDENTICAL = 'identical'    # same text as en.json
+EMPTY = 'empty'            # present but blank
+MISSING = 'missing'        # key absent from the locale file
+STATUSES = (BRACKET, PREFIX, IDENTICAL, EMPTY, MISSING)
+
+
+def value_status(value, english) -> Optional[str]:
+    """Status of a single cell, or None for a translated value"""
+    if value is None:
+        return MISSING
+    if not isinstance(value, str):
+        return None
+    if not value.strip():
+        return EMPTY
+    if LOCALE_PREFIX.match(value):
+        return PREFIX
+    if value.startswith('[') and value.endswith(']'):
+        return BRACKET
+    if value == english:
+        return IDENTICAL
+    return None
+
+
+def source_text(value, english) -> Optional[str]:
+    """The English a cell is waiting on: bracket/prefix contents, else the en value"""
+    if isinstance(value, str):
+        prefix = LOCALE_PREFIX.match(value)
+        if prefix:
+            return value[prefix.end():].strip()
+        if value.startswith('[') and value.endswith(']'):
+            return value[1:-1]
+    return english if isinstance(english, str) else None
+
+
+@contextmanager
+def catalog_lock(project_root, lang: str, blocking: bool = True):
+    """Advisory exclusive lock for a read-modify-write of one locale file"""
+    lock_dir = Path(project_root) / LOCK_DIR
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    with open(lock_dir / f'{lang}.json.lock', 'w') as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class Mask:
+    """Row selection over a catalog's key index, stored as an int bitset"""
+    __slots__ = ('bits', 'size')
+
+    def __init__(self, bits: int, size: int):
+        self.bits = bits
+        self.size = size
+
+    @classmethod
+    def from_flags(cls, flags: Iterable[bool], size: int) -> 'Mask':
+        # One int() over a bit string instead of n shifts on a growing int
+        text = ''.join('1' if flag else '0' for flag in flags)
+        return cls(int(text[::-1], 2) if text else 0, size)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[int], size: int) -> 'Mask':
+        bits = 0
+        for row in rows:
+            bits |= 1 << row
+        return cls(bits, size)
+
+    def __and__(self, other: 'Mask') -> 'Mask':
+        return Mask(self.bits & other.bits, self.size)
+
+    def __or__(self, other: 'Mask') -> 'Mask':
+        return Mask(self.bits | other.bits, self.size)
+
+    def __sub__(self, other: 'Mask') -> 'Mask':
+        return Mask(self.bits & ~other.bits, self.size)
+
+    def __invert__(self) -> 'Mask':
+        return Mask(~self.bits & ((1 << self.size) - 1), self.size)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+
+class Catalog:
+    def __init__(self, keys: List[str], columns: Dict[str, List], orders: Dict[str, List[int]],
+                 assets_dir: Optional[Path] = None):
+        self.keys = keys
+        self.index = {key: row for row, key in enumerate(keys)}
+        self.columns = columns
+        self.orders = orders                      # per-locale file order, as rows
+        self.assets_dir = assets_dir
+        self.dirty: set = set()
+        self._owned: set = set(columns)           # columns this instance may write in place
+        self._masks: Dict[str, Dict[str, Mask]] = {}
+
+    @classmethod
+    def load(cls, assets_dir, languages: Optional[List[str]] = None) -> 'Catalog':
+        assets_dir = Path(assets_dir)
+        data: Dict[str, Dict] = {}
+        for lang in languages or LANGUAGES:
+            file_path = assets_dir / f'{lang}.json'
+            if file_path.exists():
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data[lang] = json.load(f)
+
+        # en.json defines the index; keys only present in a locale are appended
+        keys: List[str] = list(data.get(SOURCE_LANGUAGE, {}))
+        index = {key: row for row, key in enumerate(keys)}
+        for catalog in data.values():
+            for key in catalog:
+                if key not in index:
+                    index[key] = len(keys)
+                    keys.append(key)
+
+        columns, orders = {}, {}
+        for lang, catalog in data.items():
+            column = [None] * len(keys)
+            for key, value in catalog.items():
+                column[index[key]] = value
+            columns[lang] = column
+            orders[lang] = [index[key] for key in catalog]
+        return cls(keys, columns, orders, assets_dir)
+
+    @property
+    def languages(self) -> List[str]:
+        return list(self.columns)
+
+    def copy(self) -> 'Catalog':
+        """Copy-on-write view: columns stay shared until one side writes"""
+        clone = Catalog(self.keys, self.columns.copy(), self.orders.copy(), self.assets_dir)
+        clone._owned = set()
+        clone._masks = {lang: masks for lang, masks in self._masks.items()}
+        self._owned = set()
+        return clone
+
+    def _writable(self, lang: str) -> List:
+        if lang not in self._owned:
+            self.columns[lang] = list(self.columns[lang])
+            self.orders[lang] = list(self.orders[lang])
+            self._owned.add(lang)
+        return self.columns[lang]
+
+    def get(self, lang: str, key: str):
+        row = self.index.get(key)
+        return None if row is None else self.columns[lang][row]
+
+    def english(self, row: int):
+        return self.columns[SOURCE_LANGUAGE][row] if SOURCE_LANGUAGE in self.columns else None
+
+    def status_masks(self, lang: str) -> Dict[str, Mask]:
+        """All status masks of a locale, computed in one pass and cached until it changes"""
+        if lang not in self._masks:
+            size = len(self.keys)
+            english = self.columns.get(SOURCE_LANGUAGE, [None] * size)
+            if lang == SOURCE_LANGUAGE:
+                english = [None] * size
+            statuses = [value_status(value, en) for value, en in zip(self.columns[lang], english)]
+            self._masks[lang] = {
+                status: Mask.from_flags((s == status for s in statuses), size) for status in STATUSES
+            }
+        return self._masks[lang]
+
+    def mask(self, lang: str, *statuses: str) -> Mask:
+        masks = self.status_masks(lang)
+        result = Mask(0, len(self.keys))
+        for status in statuses:
+            result = result | masks[status]
+        return result
+
+    def translated(self, lang: str) -> Mask:
+        """Rows with a real translation (string values only)"""
+        strings = Mask.from_flags((isinstance(v, str) for v in self.columns[lang]), len(self.keys))
+        return strings - self.mask(lang, *STATUSES)
+
+    def match(self, lang: str, predicate: Callable[[object], bool]) -> Mask:
+        return Mask.from_flags((predicate(value) for value in self.columns[lang]), len(self.keys))
+
+    def where(self, lang: str, mask: Mask) -> List[Tuple[str, object]]:
+        column = self.columns[lang]
+        return [(self.keys[row], column[row]) for row in mask]
+
+    def counts(self, lang: str) -> Dict[str, int]:
+        result = {status: len(mask) for status, mask in self.status_masks(lang).items()}
+        result['translated'] = len(self.translated(lang))
+        return result
+
+    def set_values(self, lang: str, updates: Dict[int, object]) -> int:
+        """Write {row: value}; returns how many cells actually changed"""
+        current = self.columns[lang]
+        changed = {row: value for row, value in updates.items() if current[row] != value}
+        if not changed:
+            return 0
+        column = self._writable(lang)
+        order = self.orders[lang]
+        for row, value in changed.items():
+            if column[row] is None:
+                order.append(row)
+            column[row] = value
+        self._masks.pop(lang, None)
+        self.dirty.add(lang)
+        return len(changed)
+
+    def apply_mapping(self, lang: str, mapping: Dict[str, str], mask: Optional[Mask] = None,
+                      lookup: Callable[[object, object], Optional[str]] = source_text) -> int:
+        """Replace cells whose source text is in mapping; defaults to bracket/prefix/missing rows"""
+        if mask is None:
+            mask = self.mask(lang, BRACKET, PREFIX, MISSING)
+        column = self.columns[lang]
+        updates = {}
+        for row in mask:
+            text = lookup(column[row], self.english(row))
+            if text is not None and text in mapping:
+                updates[row] = mapping[text]
+        return self.set_values(lang, updates)
+
+    def diff(self, other: 'Catalog', languages: Optional[List[str]] = None) -> Dict[str, List[Tuple[str, object, object]]]:
+        """(key, old, new) per locale between two catalogs sharing a key index"""
+        changes = {}
+        for lang in languages or self.languages:
+            before, after = self.columns.get(lang), other.columns.get(lang)
+            if before is after:
+                continue  # untouched shared column
+            before = before or [None] * len(self.keys)
+            after = after or [None] * len(other.keys)
+            rows = [(self.keys[row], old, new) for row, (old, new) in enumerate(zip(before, after)) if old != new]
+            if rows:
+                changes[lang] = rows
+        return changes
+
+    def to_dict(self, lang: str) -> Dict:
+        column = self.columns[lang]
+        return {self.keys[row]: column[row] for row in self.orders[lang] if column[row] is not None}
+
+    def save(self, languages: Optional[List[str]] = None, output_dir=None) -> List[Path]:
+        """Write locale files in their original key order; defaults to the changed ones.
+        All files go out in one journaled commit (callers hold the catalog locks)."""
+        from catalog_transaction import CatalogTransaction
+
+        output_dir = Path(output_dir) if output_dir else self.assets_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        languages = languages if languages is not None else sorted(self.dirty)
+        transaction = CatalogTransaction(output_dir)
+        for lang in languages:
+            transaction.set_catalog(lang, self.to_dict(lang))
+        transaction.commit()
+        self.dirty.difference_update(languages)
+        return [output_dir / f'{lang}.json' for lang in languages]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize translation status for every locale')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--json', default='catalog_status.json', help='Output JSON file')
+
+    args = parser.parse_args()
+
+    catalog = Catalog.load(Path(args.root) / 'assets' / 'translations')
+    summary = {lang: catalog.counts(lang) for lang in catalog.languages if lang != SOURCE_LANGUAGE}
+
+    with open(args.json, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': {'keys': len(catalog.keys), 'languages': catalog.languages},
+                   'locales': summary}, f, indent=2, ensure_ascii=False)
+
+    print(f"\n{'='*60}")
+    print("CATALOG STATUS")
+    print(f"{'='*60}")
+    print(f"Keys: {len(catalog.keys)}")
+    print(f"{'lang':<6}{'translated':>11}{'bracket':>9}{'prefix':>8}{'identical':>11}{'empty':>7}{'missing':>9}")
+    for lang, counts in summary.items():
+        print(f"{lang:<6}{counts['translated']:>11}{counts[BRACKET]:>9}{counts[PREFIX]:>8}"
+              f"{counts[IDENTICAL]:>11}{counts[EMPTY]:>7}{counts[MISSING]:>9}")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
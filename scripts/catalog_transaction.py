@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Catalog Transactions
+Crash-safe commit of several files at once (all locale catalogs, plus any
+Dart sources rewritten alongside them).
+
+Mutations are batched in memory; commit() stages every new file in the
+journal directory and fsyncs it, saves the originals, writes a journal
+record, then renames the staged files over their targets. A crash at any
+point leaves either the old or the new set of files once recover() has
+run: a journal whose staged files all survived is replayed, anything else
+is rolled back from the saved originals.
+"""
+
+import os
+import json
+import uuid
+import fcntl
+import hashlib
+import argparse
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from catalog import catalog_lock
+
+JOURNAL_DIR_NAME = '.journal'   # inside assets/translations/, which pubspec does not recurse into
+PREPARED = 'prepared'
+
+
+def fsync_directory(directory: Path):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def journal_lock(journal_dir: Path):
+    """Serializes commits and recovery on one journal, whichever catalogs they touch"""
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    with open(journal_dir / 'journal.lock', 'w') as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def write_synced(path: Path, data: bytes):
+    with open(path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def sha256_of(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def catalog_json(data: Dict, sort_keys: bool = False) -> bytes:
+    """The on-disk catalog format: two-space indent, raw UTF-8, trailing newline"""
+    return (json.dumps(data, ensure_ascii=False, indent=2, sort_keys=sort_keys) + '\n').encode('utf-8')
+
+
+class CatalogTransaction:
+    """
+    with CatalogTransaction(assets_dir, lock_root=project_root, languages=['de']) as tx:
+        tx.catalog('de')['key'] = 'Wert'     # many mutations ...
+        tx.stage(dart_file, new_source)      # ... and arbitrary files
+    # committed on clean exit, nothing written on an exception
+
+    With lock_root, each catalog's lock is taken before the catalog is read and
+    held until the transaction ends, so no other writer slips in between the
+    read and the commit. Locks for `languages` are taken in sorted order on
+    entry; anything else is locked on first use.
+    """
+
+    def __init__(self, assets_dir, lock_root=None, sort_keys: bool = False, languages: Optional[List[str]] = None):
+        self.assets_dir = Path(assets_dir)
+        self.journal_dir = self.assets_dir / JOURNAL_DIR_NAME
+        self.lock_root = lock_root      # None when the caller already holds the catalog locks
+        self.sort_keys = sort_keys
+        self.languages = sorted(languages or [])
+        self.id = uuid.uuid4().hex[:12]
+        self.catalogs: Dict[str, Dict] = {}
+        self.staged: Dict[Path, bytes] = {}
+        self.committed: List[Path] = []
+        self.locks = ExitStack()
+        self.locked: set = set()
+        self.entered = False
+
+    def __enter__(self) -> 'CatalogTransaction':
+        self.entered = True
+        try:
+            for lang in self.languages:
+                self.lock(lang)
+        except BaseException:
+            self.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.release()
+        return False
+
+    def lock(self, lang: str):
+        if self.lock_root is not None and lang not in self.locked:
+            self.locks.enter_context(catalog_lock(self.lock_root, lang))
+            self.locked.add(lang)
+
+    def release(self):
+        self.locks.close()
+        self.locked.clear()
+        self.entered = False
+
+    def catalog(self, lang: str) -> Dict:
+        """The locale's catalog for in-place edits; locked, then loaded once per transaction"""
+        if lang not in self.catalogs:
+            self.lock(lang)
+            file_path = self.assets_dir / f'{lang}.json'
+            if file_path.exists():
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    self.catalogs[lang] = json.load(f)
+            else:
+                self.catalogs[lang] = {}
+        return self.catalogs[lang]
+
+    def set_catalog(self, lang: str, data: Dict):
+        self.lock(lang)
+        self.catalogs[lang] = data
+
+    def stage(self, path, data):
+        path = Path(path).resolve()
+        if path.parent == self.assets_dir.resolve() and path.suffix == '.json':
+            self.lock(path.stem)
+        self.staged[path] = data.encode('utf-8') if isinstance(data, str) else data
+
+    def changes(self) -> Dict[Path, bytes]:
+        changes = dict(self.staged)
+        for lang, data in self.catalogs.items():
+            changes[(self.assets_dir / f'{lang}.json').resolve()] = catalog_json(data, self.sort_keys)
+        # Unchanged files are left alone (and keep their hand formatting)
+        return {path: data for path, data in changes.items()
+                if not path.exists() or path.read_bytes() != data}
+
+    def commit(self) -> List[Path]:
+        try:
+            changes = self.changes()
+            if not changes:
+                return []
+            with journal_lock(self.journal_dir):
+                recover(self.assets_dir, locked=True)
+                self._commit(changes)
+        finally:
+            if not self.entered:
+                self.release()
+        self.committed = sorted(changes)
+        return self.committed
+
+    def _commit(self, changes: Dict[Path, bytes]):
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for index, (target, data) in enumerate(sorted(changes.items())):
+            staged = self.journal_dir / f'{self.id}.{index}.new'
+            write_synced(staged, data)
+            backup = None
+            if target.exists():
+                backup = self.journal_dir / f'{self.id}.{index}.orig'
+                write_synced(backup, target.read_bytes())
+            entries.append({
+                'target': str(target),
+                'staged': str(staged),
+                'backup': str(backup) if backup else None,
+                'sha256': hashlib.sha256(data).hexdigest(),
+            })
+
+        # The journal record itself appears atomically
+        journal = self.journal_dir / f'{self.id}.json'
+        record = json.dumps({'id': self.id, 'state': PREPARED, 'entries': entries}, indent=2).encode('utf-8')
+        write_synced(journal.with_suffix('.json.tmp'), record)
+        os.replace(journal.with_suffix('.json.tmp'), journal)
+        fsync_directory(self.journal_dir)
+
+        try:
+            apply_entries(entries)
+        except Exception:
+            roll_back(entries)
+            finish(journal, entries)
+            raise
+        finish(journal, entries)
+
+
+def apply_entries(entries: List[Dict]):
+    directories = set()
+    for entry in entries:
+        staged, target = Path(entry['staged']), Path(entry['target'])
+        if staged.exists():
+            os.replace(staged, target)
+            directories.add(target.parent)
+    for directory in directories:
+        fsync_directory(directory)
+
+
+def roll_back(entries: List[Dict]):
+    for entry in entries:
+        target = Path(entry['target'])
+        if entry['backup']:
+            backup = Path(entry['backup'])
+            if backup.exists() and sha256_of(target) != sha256_of(backup):
+                write_synced(target, backup.read_bytes())
+        elif sha256_of(target) == entry['sha256']:
+            target.unlink()  # the transaction created it
+
+
+def finish(journal: Path, entries: List[Dict]):
+    """Drop the journal first: once it is gone, the leftovers are just garbage"""
+    journal.unlink(missing_ok=True)
+    fsync_directory(journal.parent)
+    for entry in entries:
+        for key in ('staged', 'backup'):
+            if entry[key]:
+                Path(entry[key]).unlink(missing_ok=True)
+
+
+def recover(assets_dir, locked: bool = False) -> List[Tuple[str, str]]:
+    """Complete or undo interrupted commits; returns (transaction id, 'replayed' | 'rolled back')"""
+    journal_dir = Path(assets_dir) / JOURNAL_DIR_NAME
+    if not journal_dir.is_dir():
+        return []
+    if not locked:
+        with journal_lock(journal_dir):
+            return recover(assets_dir, locked=True)
+    outcomes = []
+    referenced = set()
+    for journal in sorted(journal_dir.glob('*.json')):
+        try:
+            record = json.loads(journal.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            continue
+        entries = record['entries']
+        # Replayable when every file is either still staged or already in place
+        complete = all(Path(e['staged']).exists() or sha256_of(Path(e['target'])) == e['sha256'] for e in entries)
+        if complete:
+            apply_entries(entries)
+            outcomes.append((record['id'], 'replayed'))
+        else:
+            roll_back(entries)
+            outcomes.append((record['id'], 'rolled back'))
+        finish(journal, entries)
+        referenced.add(record['id'])
+
+    # Staged files without a journal record: the crash came before the commit point
+    for leftover in journal_dir.iterdir():
+        if leftover.name.split('.')[0] not in referenced and leftover.suffix in ('.new', '.orig', '.tmp'):
+            leftover.unlink(missing_ok=True)
+    return outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recover interrupted translation catalog commits')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+
+    args = parser.parse_args()
+
+    outcomes = recover(Path(args.root) / 'assets' / 'translations')
+    for transaction_id, action in outcomes:
+        print(f"✓ {transaction_id}: {action}")
+    if not outcomes:
+        print("✓ No interrupted commits")
+
+
+if __name__ == '__main__':
+    main()
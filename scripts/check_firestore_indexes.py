@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Firestore Index Checker
+Reconstructs every Firestore query chain in the Dart sources and compares
+them with firestore.indexes.json: queries that need a composite index that
+is not defined, composite indexes no query uses, and query reads without
+a .limit().
+
+Only exact index matches are considered; Firestore can sometimes merge
+smaller indexes for equality filters, so a "missing" entry may still run.
+"""
+
+import sys
+import json
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from firestore_queries import (
+    ARRAY_OPERATORS, EQUALITY_OPERATORS, RANGE_OPERATORS, QueryChain, scan_query_chains,
+)
+
+# (equality fields, array-contains fields, ordered (field, direction) tail)
+Requirement = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+
+def required_index(chain: QueryChain) -> Optional[Requirement]:
+    """The composite index a query needs, or None if single-field indexes serve it"""
+    filters = [(f, op) for f, op in chain.filters if f not in ('?', '__name__')]
+    equality = sorted({f for f, op in filters if op in EQUALITY_OPERATORS})
+    arrays = sorted({f for f, op in filters if op in ARRAY_OPERATORS})
+    ranges = list(dict.fromkeys(f for f, op in filters if op in RANGE_OPERATORS))
+
+    order: List[Tuple[str, str]] = []
+    for name, direction in chain.order_by:
+        if name not in ('?', '__name__') and name not in equality and name not in [o[0] for o in order]:
+            order.append((name, direction))
+    order.extend((name, 'ASCENDING') for name in ranges if name not in [o[0] for o in order])
+
+    fields = set(equality) | set(arrays) | {name for name, _ in order}
+    if len(fields) <= 1:
+        return None
+    if not arrays and not order:
+        return None  # equality-only queries are served by merging single-field indexes
+    return tuple(equality), tuple(arrays), tuple(order)
+
+
+def index_fields(index: Dict) -> List[Tuple[str, str]]:
+    fields = [(f['fieldPath'], f.get('order') or f.get('arrayConfig', 'ASCENDING')) for f in index['fields']]
+    while fields and fields[-1][0] == '__name__':
+        fields.pop()
+    return fields
+
+
+def index_matches(index: Dict, collection: str, group: bool, requirement: Requirement) -> bool:
+    if index['collectionGroup'] != collection:
+        return False
+    if (index.get('queryScope', 'COLLECTION') == 'COLLECTION_GROUP') != group:
+        return False
+    equality, arrays, order = requirement
+    fields = index_fields(index)
+    if sorted(f for f, mode in fields if mode == 'CONTAINS') != list(arrays):
+        return False
+    plain = [(f, mode) for f, mode in fields if mode != 'CONTAINS']
+    head, tail = plain[:len(equality)], plain[len(equality):]
+    return sorted(f for f, _ in head) == list(equality) and tuple(tail) == order
+
+
+def index_could_serve(index: Dict, chain: QueryChain) -> bool:
+    """For conditionally built queries: every index field is filtered or ordered on in some branch"""
+    if index['collectionGroup'] != chain.collection:
+        return False
+    used = {f for f, _ in chain.filters} | {f for f, _ in chain.order_by}
+    return all(f in used for f, _ in index_fields(index))
+
+
+def index_definition(collection: str, group: bool, requirement: Requirement) -> Dict:
+    """Entry in firestore.indexes.json format"""
+    equality, arrays, order = requirement
+    fields = [{'fieldPath': f, 'order': 'ASCENDING'} for f in equality]
+    fields += [{'fieldPath': f, 'arrayConfig': 'CONTAINS'} for f in arrays]
+    fields += [{'fieldPath': f, 'order': direction} for f, direction in order]
+    return {
+        'collectionGroup': collection,
+        'queryScope': 'COLLECTION_GROUP' if group else 'COLLECTION',
+        'fields': fields,
+    }
+
+
+class FirestoreIndexChecker:
+    def __init__(self, project_root: str, indexes_path: Optional[str] = None):
+        self.project_root = Path(project_root)
+        self.indexes_path = Path(indexes_path) if indexes_path else self.project_root / 'firestore.indexes.json'
+        self.indexes: List[Dict] = []
+        self.chains: List[QueryChain] = []
+        self.missing: Dict[Tuple, List[QueryChain]] = defaultdict(list)
+        self.needs_review: List[Dict] = []
+        self.used_indexes: set = set()
+        self.unbounded: List[QueryChain] = []
+
+    def load_indexes(self):
+        with open(self.indexes_path, 'r', encoding='utf-8') as f:
+            self.indexes = json.load(f).get('indexes', [])
+
+    def check(self):
+        self.load_indexes()
+        self.chains = scan_query_chains(self.project_root)
+        queries = [c for c in self.chains if c.is_query and c.collection]
+
+        for chain in queries:
+            if chain.terminal in ('get', 'snapshots') and chain.limit is None:
+                if not any(f == '__name__' for f, _ in chain.filters):
+                    self.unbounded.append(chain)
+
+            if chain.conditional:
+                # Filters from every branch are merged, so an exact check would
+                # be wrong; keep any index a branch could plausibly use.
+                candidates = [i for i, index in enumerate(self.indexes) if index_could_serve(index, chain)]
+                self.used_indexes.update(candidates)
+                if required_index(chain) is not None:
+                    self.needs_review.append({'chain': chain, 'candidate_indexes': len(candidates)})
+                continue
+
+            requirement = required_index(chain)
+            if requirement is None:
+                continue
+            matched = [i for i, index in enumerate(self.indexes)
+                       if index_matches(index, chain.collection, chain.group, requirement)]
+            if matched:
+                self.used_indexes.update(matched)
+            else:
+                self.missing[(chain.collection, chain.group, requirement)].append(chain)
+
+    def unused_indexes(self) -> List[Dict]:
+        return [index for i, index in enumerate(self.indexes) if i not in self.used_indexes]
+
+    def save_json_output(self, output_path: str):
+        queries = [c for c in self.chains if c.is_query]
+        output_data = {
+            'metadata': {
+                'indexes_file': str(self.indexes_path.relative_to(self.project_root))
+                if self.indexes_path.is_relative_to(self.project_root) else str(self.indexes_path),
+                'composite_indexes': len(self.indexes),
+                'query_chains': len(queries),
+                'unresolved_collections': sum(1 for c in queries if not c.collection),
+                'missing_indexes': len(self.missing),
+                'unused_indexes': len(self.unused_indexes()),
+                'needs_review': len(self.needs_review),
+                'queries_without_limit': len(self.unbounded),
+            },
+            'missing_indexes': [
+                {'index': index_definition(collection, group, requirement), 'sites': [c.to_dict() for c in chains]}
+                for (collection, group, requirement), chains in sorted(self.missing.items(), key=lambda kv: kv[0][0])
+            ],
+            'unused_indexes': self.unused_indexes(),
+            'needs_review': [
+                dict(entry['chain'].to_dict(), candidate_indexes=entry['candidate_indexes'])
+                for entry in self.needs_review
+            ],
+            'queries_without_limit': [c.to_dict() for c in self.unbounded],
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+    def write_missing_indexes(self, output_path: str):
+        """Missing indexes as a firestore.indexes.json fragment ready to merge"""
+        definitions = [index_definition(c, g, r) for c, g, r in sorted(self.missing, key=lambda k: k[0])]
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({'indexes': definitions, 'fieldOverrides': []}, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cross-check Firestore queries against firestore.indexes.json')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--indexes', help='Index definitions (default: firestore.indexes.json)')
+    parser.add_argument('--json', default='firestore_index_report.json', help='Output JSON file')
+    parser.add_argument('--write-missing', help='Write the missing indexes to this file (indexes.json format)')
+    parser.add_argument('--strict', action='store_true', help='Exit non-zero when an index is missing')
+
+    args = parser.parse_args()
+
+    checker = FirestoreIndexChecker(args.root, args.indexes)
+    checker.check()
+    checker.save_json_output(args.json)
+    if args.write_missing:
+        checker.write_missing_indexes(args.write_missing)
+
+    print(f"\n{'='*60}")
+    print("FIRESTORE INDEX CHECK")
+    print(f"{'='*60}")
+    print(f"Query chains: {sum(1 for c in checker.chains if c.is_query)}")
+    print(f"Composite indexes defined: {len(checker.indexes)}")
+    print(f"Missing composite indexes: {len(checker.missing)}")
+    for (collection, group, requirement), chains in sorted(checker.missing.items(), key=lambda kv: kv[0][0]):
+        fields = ', '.join(f['fieldPath'] + ' ' + (f.get('order') or f['arrayConfig'])
+                           for f in index_definition(collection, group, requirement)['fields'])
+        print(f"  ✗ {collection}: {fields}  ({chains[0].file}:{chains[0].line})")
+    print(f"Unused composite indexes: {len(checker.unused_indexes())}")
+    print(f"Conditional queries to review: {len(checker.needs_review)}")
+    print(f"Query reads without .limit(): {len(checker.unbounded)}")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+    if args.strict and checker.missing:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
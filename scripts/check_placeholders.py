@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Placeholder Integrity Checker for ArtBeat translations
+Validates that every locale keeps the interpolation variables of en.json
+($e, ${expr}, {count}, {{count}}) and reports missing, extra and renamed ones.
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Order matters: ${expr} and {{name}} must win over their shorter forms
+PLACEHOLDER_PATTERN = re.compile(
+    r"\$\{[^{}]*\}"        # ${expr}
+    r"|\{\{\s*\w+\s*\}\}"  # {{name}} (legacy double-brace args)
+    r"|\{\w*\}"            # {count}, {0}, {}
+    r"|\$\w+"              # $e, $_name
+)
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+
+
+def flatten_catalog(data: Dict, prefix: str = '') -> Iterator[Tuple[str, str]]:
+    """Yield (key, value) pairs, descending into plural/gender maps as dotted keys"""
+    for key, value in data.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten_catalog(value, f"{full_key}.")
+        elif isinstance(value, str):
+            yield full_key, value
+
+
+def extract_placeholders(value: str) -> Counter:
+    """Return the placeholder multiset of a single value"""
+    if '$' not in value and '{' not in value:
+        return Counter()
+    return Counter(PLACEHOLDER_PATTERN.findall(value))
+
+
+class PlaceholderChecker:
+    def __init__(self, project_root: str, languages: Optional[List[str]] = None, assets_dir: Optional[Path] = None):
+        self.project_root = Path(project_root)
+        self.assets_dir = Path(assets_dir) if assets_dir else self.project_root / "assets" / "translations"
+        self.languages = [lang for lang in (languages or LANGUAGES) if lang != 'en']
+        self.reference: Dict[str, Counter] = {}
+        self.reference_values: Dict[str, str] = {}
+        self.diagnostics: List[Dict] = []
+        self.cells_checked = 0
+
+    def catalog_name(self, lang: str) -> str:
+        file_path = self.assets_dir / f"{lang}.json"
+        try:
+            return str(file_path.relative_to(self.project_root))
+        except ValueError:
+            return str(file_path)
+
+    def load_catalog(self, lang: str) -> Dict:
+        file_path = self.assets_dir / f"{lang}.json"
+        if not file_path.exists():
+            return {}
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_reference(self):
+        """Extract the placeholder multiset of every en.json value once"""
+        for key, value in flatten_catalog(self.load_catalog('en')):
+            self.reference_values[key] = value
+            self.reference[key] = extract_placeholders(value)
+
+    def check_value(self, lang: str, key: str, value: str) -> List[Dict]:
+        """Compare one target value against the English placeholder multiset"""
+        expected = self.reference[key]
+        if not expected and '$' not in value and '{' not in value:
+            return []
+
+        found = extract_placeholders(value)
+        if found == expected:
+            issues = []
+            # translate_placeholder() re-appends variables it could not place
+            for placeholder in expected:
+                english = self.reference_values[key]
+                if (value.endswith(' ' + placeholder)
+                        and not english.endswith(placeholder)):
+                    issues.append(self.make_diagnostic(
+                        lang, key, 'appended', 'warning', placeholder=placeholder,
+                        message=f"'{placeholder}' moved to the end of the value"))
+            return issues
+
+        missing = list((expected - found).elements())
+        extra = list((found - expected).elements())
+        issues = []
+
+        # A missing and an extra variable in the same cell is most likely a rename
+        while missing and extra:
+            old, new = missing.pop(0), extra.pop(0)
+            issues.append(self.make_diagnostic(
+                lang, key, 'renamed', 'error', placeholder=old, replacement=new,
+                message=f"'{old}' renamed to '{new}'"))
+        for placeholder in missing:
+            issues.append(self.make_diagnostic(
+                lang, key, 'missing', 'error', placeholder=placeholder,
+                message=f"'{placeholder}' missing"))
+        for placeholder in extra:
+            issues.append(self.make_diagnostic(
+                lang, key, 'extra', 'error', placeholder=placeholder,
+                message=f"unexpected '{placeholder}'"))
+        return issues
+
+    def make_diagnostic(self, lang: str, key: str, kind: str, severity: str, **fields) -> Dict:
+        diagnostic = {
+            'file': self.catalog_name(lang),
+            'locale': lang,
+            'key': key,
+            'kind': kind,
+            'severity': severity,
+        }
+        diagnostic.update(fields)
+        return diagnostic
+
+    def check_all(self):
+        """Validate every target locale against en.json in a single pass"""
+        self.load_reference()
+        for lang in self.languages:
+            for key, value in flatten_catalog(self.load_catalog(lang)):
+                if key not in self.reference:
+                    continue
+                self.cells_checked += 1
+                self.diagnostics.extend(self.check_value(lang, key, value))
+
+    def error_count(self) -> int:
+        return sum(1 for d in self.diagnostics if d['severity'] == 'error')
+
+    def to_json(self, elapsed: float) -> Dict:
+        by_kind = Counter(d['kind'] for d in self.diagnostics)
+        by_locale = Counter(d['locale'] for d in self.diagnostics)
+        return {
+            'metadata': {
+                'reference_keys': len(self.reference),
+                'keys_with_placeholders': sum(1 for c in self.reference.values() if c),
+                'locales': self.languages,
+                'cells_checked': self.cells_checked,
+                'elapsed_ms': round(elapsed * 1000, 2),
+                'by_kind': dict(by_kind),
+                'by_locale': dict(by_locale),
+            },
+            'diagnostics': self.diagnostics,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check placeholder integrity across translation catalogs')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--locales', nargs='*', help='Locales to check (default: all)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='Diagnostics format')
+    parser.add_argument('--output', help='Write diagnostics to this file instead of stdout')
+    parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    checker = PlaceholderChecker(args.root, args.locales)
+    checker.check_all()
+    elapsed = time.perf_counter() - start
+
+    if args.format == 'json':
+        output = json.dumps(checker.to_json(elapsed), indent=2, ensure_ascii=False)
+    else:
+        lines = [
+            f"{d['file']}: {d['severity']}: [{d['kind']}] {d['key']}: {d['message']}"
+            for d in checker.diagnostics
+        ]
+        lines.append(
+            f"Checked {checker.cells_checked} cells in {elapsed * 1000:.0f} ms: "
+            f"{checker.error_count()} errors, "
+            f"{len(checker.diagnostics) - checker.error_count()} warnings"
+        )
+        output = "\n".join(lines)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    failures = len(checker.diagnostics) if args.strict else checker.error_count()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
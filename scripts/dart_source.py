@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Dart source helpers shared by the ArtBeat analysis scripts
+Lexes string literals and comments so scanners never match inside them.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+STRING_CONST = re.compile(r"\b(?:const|final)\s+(?:String\s+)?(\w+)\s*=\s*$")
+
+
+@dataclass
+class DartString:
+    start: int          # offset of the opening quote (or r prefix)
+    end: int            # offset just past the closing quote
+    text: str           # raw body between the quotes, interpolations kept as source
+    prefix: str         # body up to the first interpolation
+    interpolated: bool
+
+
+def _blank(chars: List[str], start: int, end: int):
+    """Replace a span with spaces, keeping newlines so offsets and line numbers hold"""
+    for i in range(start, end):
+        if chars[i] != '\n':
+            chars[i] = ' '
+
+
+def _scan_comment(content: str, i: int) -> int:
+    """Return the offset just past the comment starting at i (Dart block comments nest)"""
+    if content.startswith('//', i):
+        end = content.find('\n', i)
+        return len(content) if end == -1 else end
+    depth = 0
+    n = len(content)
+    while i < n:
+        if content.startswith('/*', i):
+            depth += 1
+            i += 2
+        elif content.startswith('*/', i):
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return i
+        else:
+            i += 1
+    return n
+
+
+def _scan_code(content: str, i: int, chars: List[str], strings: List[DartString], stop_at_brace: bool,
+               interpolations: bool = False) -> int:
+    """Scan code from i, collecting strings; with stop_at_brace, stop at the unmatched '}'"""
+    n = len(content)
+    depth = 0
+    while i < n:
+        c = content[i]
+        if c == '/' and i + 1 < n and content[i + 1] in '/*':
+            end = _scan_comment(content, i)
+            _blank(chars, i, end)
+            i = end
+        elif c in '\'"' or (c in 'rR' and i + 1 < n and content[i + 1] in '\'"'
+                             and (i == 0 or not (content[i - 1].isalnum() or content[i - 1] in '_$'))):
+            i = _scan_string(content, i, chars, strings, interpolations)
+        elif c == '{':
+            depth += 1
+            i += 1
+        elif c == '}':
+            if stop_at_brace and depth == 0:
+                return i
+            depth -= 1
+            i += 1
+        else:
+            i += 1
+    return n
+
+
+def _scan_string(content: str, i: int, chars: List[str], strings: List[DartString],
+                 interpolations: bool = False) -> int:
+    """Scan the string literal starting at i and return the offset past its closing quote"""
+    start = i
+    raw = content[i] in 'rR'
+    if raw:
+        i += 1
+    quote = content[i]
+    if content.startswith(quote * 3, i):
+        quote = quote * 3
+    i += len(quote)
+    body_start = i
+    n = len(content)
+    prefix_end: Optional[int] = None
+    expressions: List[Tuple[int, int]] = []   # ${...} code spans, kept when interpolations is set
+
+    while i < n:
+        if content.startswith(quote, i):
+            break
+        c = content[i]
+        if len(quote) == 1 and c == '\n':
+            break  # unterminated single-line string; recover at end of line
+        if c == '\\' and not raw:
+            i += 2
+        elif c == '$' and not raw and i + 1 < n and (content[i + 1] == '{' or content[i + 1].isalpha() or content[i + 1] == '_'):
+            if prefix_end is None:
+                prefix_end = i
+            if content[i + 1] == '{':
+                expression_end = _scan_code(content, i + 2, chars, strings, True, interpolations)
+                expressions.append((i + 2, expression_end))
+                i = expression_end + 1
+            else:
+                i += 1
+                while i < n and (content[i].isalnum() or content[i] == '_'):
+                    i += 1
+        else:
+            i += 1
+
+    body_end = min(i, n)
+    end = min(body_end + len(quote), n) if content.startswith(quote, body_end) else body_end
+    text = content[body_start:body_end]
+    strings.append(DartString(
+        start=start,
+        end=end,
+        text=text,
+        prefix=text if prefix_end is None else content[body_start:prefix_end],
+        interpolated=prefix_end is not None,
+    ))
+    if interpolations:
+        kept = body_start
+        for expression_start, expression_end in expressions:
+            _blank(chars, kept, expression_start)
+            kept = expression_end
+        _blank(chars, kept, body_end)
+    else:
+        _blank(chars, body_start, body_end)
+    return end
+
+
+def scan_dart(content: str, interpolations: bool = False) -> Tuple[str, List[DartString]]:
+    """
+    Lex a Dart file.
+    Returns the source with comments and string bodies blanked out (same length,
+    same line breaks) plus every string literal, ordered by start offset.
+    With interpolations, the code inside ${...} is left in place (its own strings
+    still blanked) so calls such as '${'key'.tr()}' can be found.
+    """
+    chars = list(content)
+    strings: List[DartString] = []
+    _scan_code(content, 0, chars, strings, stop_at_brace=False, interpolations=interpolations)
+    strings.sort(key=lambda s: s.start)
+    return ''.join(chars), strings
+
+
+BRACKET_PAIRS = {'(': ')', '[': ']', '{': '}'}
+
+
+def matching_paren(masked: str, open_index: int) -> int:
+    """Offset of the bracket closing the '(', '[' or '{' at open_index in masked source (len if unbalanced)"""
+    opener = masked[open_index]
+    closer = BRACKET_PAIRS[opener]
+    depth = 0
+    for i in range(open_index, len(masked)):
+        if masked[i] == opener:
+            depth += 1
+        elif masked[i] == closer:
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(masked)
+
+
+CLASS_DECLARATION = re.compile(r"\bclass\s+(\w+)(?:\s*<[^{]*?>)?([^{;]*)\{")
+MEMBER_SUFFIXES = ('async*', 'async', 'sync*')
+
+
+@dataclass
+class DartMember:
+    name: str
+    start: int          # offset of the body ('{' or '=>')
+    end: int            # offset of the closing '}' or ';'
+
+
+def find_classes(masked: str) -> List[Tuple[str, str, int, int]]:
+    """(name, extends/with/implements clause, '{' offset, '}' offset) for every class"""
+    classes = []
+    for match in CLASS_DECLARATION.finditer(masked):
+        open_brace = match.end() - 1
+        classes.append((match.group(1), match.group(2).strip(), open_brace, matching_paren(masked, open_brace)))
+    return classes
+
+
+def _member_name(header: str) -> Optional[str]:
+    # Strip before matching: masked string bodies leave long whitespace runs
+    header = header.rstrip()
+    for suffix in MEMBER_SUFFIXES:
+        if header.endswith(suffix):
+            header = header[:-len(suffix)].rstrip()
+            break
+    getter = re.search(r"\bget\s+(\w+)$", header)
+    if getter:
+        return getter.group(1)
+    if not header.endswith(')'):
+        return None
+    depth = 0
+    for i in range(len(header) - 1, -1, -1):
+        if header[i] == ')':
+            depth += 1
+        elif header[i] == '(':
+            depth -= 1
+            if depth == 0:
+                name = re.search(r"(\w+)\s*(?:<[^<>]*>)?$", header[:i].rstrip())
+                return name.group(1) if name else None
+    return None
+
+
+def class_members(masked: str, open_brace: int, close_brace: int) -> List[DartMember]:
+    """Methods, getters and constructors declared directly in a class body"""
+    members = []
+    i = open_brace + 1
+    header_start = i
+    while i < close_brace:
+        c = masked[i]
+        if c in '([':
+            i = matching_paren(masked, i) + 1
+            continue
+        if c == '{':
+            end = matching_paren(masked, i)
+            name = _member_name(masked[header_start:i])
+            if name:
+                members.append(DartMember(name, i, end))
+            i = header_start = end + 1
+            continue
+        if c == ';':
+            header = masked[header_start:i]
+            if '=>' in header:
+                arrow = header.index('=>')
+                name = _member_name(header[:arrow])
+                if name:
+                    members.append(DartMember(name, header_start + arrow, i))
+            header_start = i + 1
+        i += 1
+    return members
+
+
+def string_constants(masked: str, strings: List[DartString]) -> Dict[str, str]:
+    """String constants such as `static const String _usersCollection = 'users';`"""
+    constants = {}
+    for s in strings:
+        match = STRING_CONST.search(masked[max(0, s.start - 80):s.start])
+        if match and not s.interpolated:
+            constants[match.group(1)] = s.text
+    return constants
+
+
+def line_number(content: str, offset: int) -> int:
+    return content.count('\n', 0, offset) + 1
+
+
+def find_dart_files(root_path: Path, roots: Tuple[str, ...] = ('packages', 'lib')) -> List[Path]:
+    """Find all non-test Dart sources under packages/ and lib/"""
+    dart_files = []
+    for root in roots:
+        base = root_path / root
+        if base.exists():
+            dart_files.extend(base.glob('**/*.dart'))
+    return sorted(
+        f for f in set(dart_files)
+        if '/test/' not in str(f) and '_test.dart' not in str(f) and '/.dart_tool/' not in str(f)
+    )
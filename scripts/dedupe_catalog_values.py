@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Catalog Value Deduplicator
+Groups en.json keys by a hash of their normalized English value ("Cancel"
+is stored under ~100 screen-specific keys), checks that every locale
+translates each group the same way and proposes one shared common_* key.
+
+With --apply the merged catalogs, the rewritten Dart references ('key'.tr(),
+tr('key'), LocaleKeys.key) and the regenerated locale_keys.g.dart are
+written in one journaled CatalogTransaction, so an interrupted run leaves
+either the old or the new tree.
+"""
+
+import re
+import json
+import hashlib
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from catalog_transaction import CatalogTransaction, catalog_json
+from check_placeholders import PLACEHOLDER_PATTERN
+from dart_source import find_dart_files, scan_dart
+from generate_locale_keys import LocaleKeyGenerator, dart_identifier
+from scan_translation_keys import FUNCTION_CALL, METHOD_CALL, TranslationKeyScanner
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+COMMON_PREFIX = 'common_'
+LOCALE_KEYS_REFERENCE = re.compile(r"\bLocaleKeys\s*\.\s*(\w+)")
+
+
+def normalize(value: str) -> str:
+    return ' '.join(value.split())
+
+
+def value_hash(value: str) -> str:
+    return hashlib.sha1(normalize(value).encode('utf-8')).hexdigest()[:12]
+
+
+def slug(value: str, max_words: int = 5) -> str:
+    words = re.findall(r"[a-z0-9]+", PLACEHOLDER_PATTERN.sub(' ', value).lower())
+    return '_'.join(words[:max_words])[:40].strip('_')
+
+
+class CatalogValueDeduplicator:
+    def __init__(self, project_root: str, resolve_majority: bool = False, min_keys: int = 2):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'assets' / 'translations'
+        self.resolve_majority = resolve_majority
+        self.min_keys = min_keys
+        self.catalogs: Dict[str, Dict] = {}
+        self.groups: List[Dict] = []
+        self.renames: Dict[str, str] = {}          # removed key -> canonical key
+        self.kept: set = set()
+        self.references: Dict[Path, Tuple] = {}
+        self.new_catalogs: Dict[str, Dict] = {}
+        self.dart_changes: Dict[Path, Tuple[bytes, int]] = {}
+        self.locale_keys_change: Optional[Tuple[Path, bytes]] = None
+
+    def load_catalogs(self):
+        for lang in LANGUAGES:
+            file_path = self.assets_dir / f'{lang}.json'
+            if file_path.exists():
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    self.catalogs[lang] = json.load(f)
+
+    def locale_agreement(self, keys: List[str]) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, List[str]]]]:
+        """('agree' | 'conflict', value per locale, variants per conflicting locale)"""
+        values, conflicts = {}, {}
+        for lang, catalog in self.catalogs.items():
+            variants = defaultdict(list)
+            for key in keys:
+                if isinstance(catalog.get(key), str):
+                    variants[normalize(catalog[key])].append(key)
+            if not variants:
+                continue
+            if len(variants) > 1:
+                conflicts[lang] = dict(variants)
+            # Majority translation; ties go to the variant seen first in key order
+            best = max(variants.values(), key=len)
+            values[lang] = self.catalogs[lang][best[0]]
+        return ('conflict' if conflicts else 'agree'), values, conflicts
+
+    def canonical_key(self, keys: List[str], english: str, taken: set) -> str:
+        existing = sorted((k for k in keys if k.startswith(COMMON_PREFIX)), key=len)
+        if existing:
+            return existing[0]
+        base = COMMON_PREFIX + (slug(english) or f'text_{value_hash(english)[:6]}')
+        candidate, suffix = base, 2
+        while candidate in taken:
+            candidate = f'{base}_{suffix}'
+            suffix += 1
+        return candidate
+
+    def find_groups(self):
+        english = self.catalogs['en']
+        by_hash: Dict[str, List[str]] = defaultdict(list)
+        for key, value in english.items():
+            if isinstance(value, str) and normalize(value):
+                by_hash[value_hash(value)].append(key)
+
+        taken = set(english)
+        for digest, keys in by_hash.items():
+            if len(keys) < self.min_keys:
+                continue
+            status, values, conflicts = self.locale_agreement(keys)
+            canonical = self.canonical_key(keys, english[keys[0]], taken)
+            taken.add(canonical)
+            merged = status == 'agree' or self.resolve_majority
+            self.groups.append({
+                'hash': digest,
+                'value': normalize(english[keys[0]]),
+                'keys': keys,
+                'canonical': canonical,
+                'status': status,
+                'merged': merged,
+                'values': values,
+                'conflicts': conflicts,
+                'kept': [],
+            })
+            if merged:
+                self.renames.update({key: canonical for key in keys if key != canonical})
+        self.groups.sort(key=lambda g: -len(g['keys']))
+
+    def translation_literals(self, scanner: TranslationKeyScanner, content: str, masked: str, strings) -> List:
+        """Non-interpolated literals used directly as keys: 'key'.tr(), tr('key'), Text('key').tr()"""
+        literal_at_end = {s.end: s for s in strings}
+        literal_at_start = {s.start: s for s in strings}
+        found = []
+        for match in METHOD_CALL.finditer(masked):
+            receiver, expr_start = scanner.resolve_receiver(content, masked, literal_at_end, match.start())
+            if isinstance(receiver, str) and receiver.split('.')[-1] == 'Text':
+                receiver = scanner.first_argument(masked, literal_at_start, masked.find('(', expr_start))
+            if receiver is not None and not isinstance(receiver, str):
+                found.append(receiver)
+        for match in FUNCTION_CALL.finditer(masked):
+            found.append(scanner.first_argument(masked, literal_at_start, match.end() - 1))
+        return [s for s in found if s is not None and not s.interpolated]
+
+    def find_references(self, scanner: TranslationKeyScanner, skip: Path):
+        """Locate rewritable references; keys also used any other way stay in the catalogs"""
+        dynamic_prefixes = tuple(scanner.dynamic_prefixes())
+        other_mentions = set()
+        for file_path in find_dart_files(self.project_root):
+            if file_path == skip:
+                continue
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                print(f"Error reading {file_path}: {e}")
+                continue
+            masked, strings = scan_dart(content)
+            literals = [s for s in self.translation_literals(scanner, content, masked, strings) if s.text in self.renames]
+            starts = {s.start for s in literals}
+            other_mentions.update(s.text for s in strings
+                                  if not s.interpolated and s.text in self.renames and s.start not in starts)
+            identifiers = [(m.start(1), m.end(1), m.group(1)) for m in LOCALE_KEYS_REFERENCE.finditer(masked)]
+            if literals or identifiers:
+                self.references[file_path] = (content, literals, identifiers)
+
+        for group in self.groups:
+            for key in group['keys']:
+                if key not in self.renames:
+                    continue
+                if key in other_mentions:
+                    # Stored in a map/list or compared somewhere; its .tr() sites still move over
+                    group['kept'].append({'key': key, 'reason': 'literal_outside_tr'})
+                elif dynamic_prefixes and key.startswith(dynamic_prefixes):
+                    # Built at runtime from a prefix
+                    group['kept'].append({'key': key, 'reason': 'dynamic_prefix'})
+        self.kept = {entry['key'] for group in self.groups for entry in group['kept']}
+
+    def build_catalogs(self):
+        """Catalogs with each merged group collapsed onto its canonical key"""
+        removable = set(self.renames) - self.kept
+        for lang, catalog in self.catalogs.items():
+            # Canonical values this locale still lacks (new common_* keys, or missing translations)
+            additions = {g['canonical']: g['values'][lang] for g in self.groups
+                         if g['merged'] and lang in g['values'] and g['canonical'] not in catalog}
+            # New keys go straight after the existing common_* block, else where the group first appears
+            last_common = max((i for i, k in enumerate(catalog) if k.startswith(COMMON_PREFIX)), default=None)
+            merged = {}
+            for index, (key, value) in enumerate(catalog.items()):
+                target = self.renames.get(key)
+                if last_common is None and target in additions:
+                    merged[target] = additions.pop(target)
+                if key not in removable:
+                    merged[key] = value
+                if index == last_common:
+                    merged.update(additions)
+                    additions = {}
+            merged.update(additions)
+            self.new_catalogs[lang] = merged
+
+    def rewrite_dart(self, content: str, literals, identifiers, old_identifiers: Dict[str, str],
+                     new_identifiers: Dict[str, str]) -> Tuple[str, int]:
+        replacements = []
+        for s in literals:
+            opening = s.start + (1 if content[s.start] in 'rR' else 0)
+            quote = content[opening:opening + 3] if content[opening:opening + 3] in ("'''", '"""') else content[opening]
+            replacements.append((opening + len(quote), s.end - len(quote), self.renames[s.text]))
+
+        by_identifier = {ident: key for key, ident in old_identifiers.items()}
+        for start, end, identifier in identifiers:
+            key = by_identifier.get(identifier)
+            if key in self.renames and new_identifiers.get(self.renames[key]) != identifier:
+                replacements.append((start, end, new_identifiers[self.renames[key]]))
+
+        for start, end, replacement in sorted(replacements, reverse=True):
+            content = content[:start] + replacement + content[end:]
+        return content, len(replacements)
+
+    def plan(self):
+        self.load_catalogs()
+        scanner = TranslationKeyScanner(str(self.project_root))
+        scanner.scan_all()
+        generator = LocaleKeyGenerator(str(self.project_root))
+        self.find_groups()
+        self.find_references(scanner, generator.output_file)
+        self.build_catalogs()
+
+        taken: set = set()
+        old_identifiers = {key: dart_identifier(key, taken) for key in sorted(self.catalogs['en'])}
+        taken = set()
+        new_identifiers = {key: dart_identifier(key, taken) for key in sorted(self.new_catalogs['en'])}
+
+        for file_path, (content, literals, identifiers) in self.references.items():
+            new_content, count = self.rewrite_dart(content, literals, identifiers, old_identifiers, new_identifiers)
+            if count:
+                self.dart_changes[file_path] = (new_content.encode('utf-8'), count)
+
+        if generator.output_file.exists():
+            generator.identifiers = new_identifiers
+            source_hash = hashlib.sha256(catalog_json(self.new_catalogs['en'])).hexdigest()
+            self.locale_keys_change = (generator.output_file, generator.render(source_hash).encode('utf-8'))
+
+    def apply(self):
+        with CatalogTransaction(self.assets_dir, lock_root=self.project_root,
+                                languages=list(self.new_catalogs)) as transaction:
+            # The plan was made from an earlier read; refuse to overwrite newer edits
+            for lang in self.new_catalogs:
+                if transaction.catalog(lang) != self.catalogs[lang]:
+                    raise RuntimeError(f"{lang}.json changed since the plan was made; re-run the deduplication")
+            for lang, catalog in self.new_catalogs.items():
+                transaction.set_catalog(lang, catalog)
+            for path, (data, _) in self.dart_changes.items():
+                transaction.stage(path, data)
+            if self.locale_keys_change:
+                transaction.stage(*self.locale_keys_change)
+        return len(transaction.committed)
+
+    def savings(self) -> Dict:
+        before = {lang: len(catalog_json(c)) for lang, c in self.catalogs.items()}
+        after = {lang: len(catalog_json(c)) for lang, c in self.new_catalogs.items()}
+        rows_before = sum(len(c) for c in self.catalogs.values())
+        rows_after = sum(len(c) for c in self.new_catalogs.values())
+        return {
+            'bytes_before': sum(before.values()),
+            'bytes_after': sum(after.values()),
+            'bytes_eliminated': sum(before.values()) - sum(after.values()),
+            'rows_eliminated': rows_before - rows_after,
+            'by_locale': {lang: {'bytes_eliminated': before[lang] - after[lang],
+                                 'rows_eliminated': len(self.catalogs[lang]) - len(self.new_catalogs[lang])}
+                          for lang in self.catalogs},
+        }
+
+    def save_json_output(self, output_path: str):
+        output_data = {
+            'metadata': {
+                'keys': len(self.catalogs.get('en', {})),
+                'duplicate_groups': len(self.groups),
+                'merged_groups': sum(1 for g in self.groups if g['merged']),
+                'conflicting_groups': sum(1 for g in self.groups if g['status'] == 'conflict'),
+                'keys_renamed': len(self.renames),
+                'keys_kept': len(self.kept),
+                'dart_files_rewritten': len(self.dart_changes),
+                'dart_references_rewritten': sum(count for _, count in self.dart_changes.values()),
+                **{k: v for k, v in self.savings().items() if k != 'by_locale'},
+            },
+            'savings_by_locale': self.savings()['by_locale'],
+            'groups': [{k: v for k, v in g.items() if k != 'values'} for g in self.groups],
+            'dart_files': {str(p.relative_to(self.project_root)): count for p, (_, count) in sorted(self.dart_changes.items())},
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge catalog keys that share the same English value into common_* keys')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--apply', action='store_true', help='Rewrite catalogs, Dart references and LocaleKeys')
+    parser.add_argument('--majority', action='store_true',
+                        help='Also merge groups whose translations disagree, keeping the majority translation')
+    parser.add_argument('--min-keys', type=int, default=2, help='Smallest group to merge')
+    parser.add_argument('--json', default='catalog_dedupe_report.json', help='Output JSON file')
+    parser.add_argument('--top', type=int, default=15, help='Groups to print')
+
+    args = parser.parse_args()
+
+    deduplicator = CatalogValueDeduplicator(args.root, args.majority, args.min_keys)
+    deduplicator.plan()
+    deduplicator.save_json_output(args.json)
+
+    savings = deduplicator.savings()
+    merged = [g for g in deduplicator.groups if g['merged']]
+    print(f"\n{'='*60}")
+    print("CATALOG VALUE DEDUPLICATION")
+    print(f"{'='*60}")
+    print(f"Duplicate groups: {len(deduplicator.groups)}  "
+          f"(conflicting translations: {sum(1 for g in deduplicator.groups if g['status'] == 'conflict')})")
+    print(f"Groups merged: {len(merged)}  Keys renamed: {len(deduplicator.renames)}  "
+          f"(kept for non-.tr() uses: {len(deduplicator.kept)})")
+    for group in merged[:args.top]:
+        print(f"  {len(group['keys']):>3} keys -> {group['canonical']}  \"{group['value'][:40]}\"")
+    print(f"Dart references rewritten: {sum(c for _, c in deduplicator.dart_changes.values())} "
+          f"in {len(deduplicator.dart_changes)} files")
+    print(f"Translation rows eliminated: {savings['rows_eliminated']:,}")
+    print(f"Catalog bytes eliminated: {savings['bytes_eliminated']:,} of {savings['bytes_before']:,}")
+
+    if args.apply:
+        written = deduplicator.apply()
+        print(f"✅ Wrote {written} files in one transaction")
+    else:
+        print("Dry run; pass --apply to rewrite catalogs and call sites")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Find constructor calls that could be const
+The inverse of fix_const_violations.py: reports (and with --fix inserts)
+`const` on widget and value constructor calls whose arguments are all
+compile-time constants, at the outermost position where it is legal.
+Uses the same string/comment-aware lexer, so parens and `const` inside
+strings never count. Fixed files can additionally be checked with
+`dart analyze` (reverted if it reports new errors), but the constructor
+list itself must be right: the analyzer only runs where the SDK is installed.
+"""
+
+import re
+import json
+import shlex
+import shutil
+import argparse
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from dart_source import find_classes, find_dart_files, line_number, matching_paren, scan_dart
+
+CONSTRUCTOR_CALL = re.compile(r"(?<![\w.$])(const\s+|new\s+)?(_?[A-Z]\w*)(?:\.(\w+))?\s*(<[^()]*?>)?\s*\(")
+# What follows an explicit `const`: a (possibly import-prefixed) constructor call or a collection literal
+CONST_TARGET = re.compile(r"\s*(?:(?:[a-z_]\w*\.)?_?[A-Z]\w*(?:\.\w+)?\s*(?:<[^()]*?>)?\s*(\()|(?:<[^>]*>\s*)?([\[{]))")
+NUMBER = re.compile(r"^-?(?:0x[0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)$")
+STATIC_REFERENCE = re.compile(r"^([A-Z]\w*)\.(\w+)$")
+
+# Flutter/Dart constructors declared const in the SDK. Only list checked ones:
+# without the Dart SDK nothing else catches a wrong entry. Not const, so never
+# listed: GestureDetector, Semantics, ConstrainedBox, SizedBox.fromSize,
+# BorderRadius.circular, Border.all.
+SDK_CONST_CONSTRUCTORS = {
+    'Text', 'Text.rich', 'TextSpan', 'Icon', 'SizedBox', 'SizedBox.shrink', 'SizedBox.expand', 'SizedBox.square',
+    'Padding', 'Center', 'Align', 'Divider', 'VerticalDivider', 'Spacer', 'Expanded',
+    'Flexible', 'Column', 'Row', 'Wrap', 'Stack', 'Positioned', 'Positioned.fill', 'CircularProgressIndicator',
+    'LinearProgressIndicator', 'ListTile', 'Card', 'AspectRatio', 'FittedBox', 'ClipRRect', 'ClipOval',
+    'DecoratedBox', 'Opacity', 'Visibility', 'SafeArea', 'Placeholder', 'SliverToBoxAdapter',
+    'SnackBar', 'AlertDialog', 'Tooltip', 'CircleAvatar', 'DefaultTextStyle', 'ValueKey',
+    'Chip', 'Badge', 'IconButton', 'Hero', 'Material', 'InkWell', 'Scaffold',
+    'EdgeInsets.all', 'EdgeInsets.symmetric', 'EdgeInsets.only', 'EdgeInsets.fromLTRB',
+    'EdgeInsetsDirectional.only', 'EdgeInsetsDirectional.fromSTEB', 'Radius.circular', 'Radius.elliptical',
+    'BorderRadius.all', 'BorderRadius.only', 'BorderRadius.vertical', 'BorderRadius.horizontal',
+    'BorderSide', 'Border', 'Color', 'Color.fromARGB', 'Color.fromRGBO', 'Duration', 'Offset', 'Size',
+    'BoxConstraints', 'BoxConstraints.tightFor', 'BoxConstraints.expand', 'TextStyle', 'BoxDecoration',
+    'BoxShadow', 'Shadow', 'LinearGradient', 'RadialGradient', 'Alignment', 'RoundedRectangleBorder',
+    'CircleBorder', 'StadiumBorder', 'BeveledRectangleBorder', 'ContinuousRectangleBorder', 'InputDecoration',
+    'OutlineInputBorder', 'UnderlineInputBorder', 'NeverScrollableScrollPhysics', 'BouncingScrollPhysics',
+    'ClampingScrollPhysics', 'AlwaysScrollableScrollPhysics', 'Interval', 'Cubic', 'FontFeature',
+    'IconThemeData', 'VisualDensity', 'AlwaysStoppedAnimation',
+}
+
+# Classes whose static members / enum values are constants
+SDK_CONST_NAMESPACES = {
+    'Colors', 'Icons', 'CupertinoIcons', 'FontWeight', 'FontStyle', 'TextAlign', 'TextDirection', 'TextOverflow',
+    'TextBaseline', 'TextDecoration', 'TextDecorationStyle', 'TextInputType', 'TextInputAction',
+    'TextCapitalization', 'MainAxisAlignment', 'CrossAxisAlignment', 'MainAxisSize', 'Alignment',
+    'AlignmentDirectional', 'Axis', 'BoxFit', 'BoxShape', 'BorderStyle', 'BlendMode', 'Clip', 'StackFit',
+    'WrapAlignment', 'WrapCrossAlignment', 'VerticalDirection', 'FlexFit', 'Curves', 'FilterQuality',
+    'ImageRepeat', 'MaterialTapTargetSize', 'VisualDensity', 'ListTileStyle', 'ListTileControlAffinity',
+    'FloatingActionButtonLocation', 'SnackBarBehavior', 'BorderRadius', 'EdgeInsets', 'Offset', 'Size',
+    'Duration', 'Radius', 'BorderSide', 'TextAlignVertical', 'DismissDirection', 'ScrollViewKeyboardDismissBehavior',
+    'DragStartBehavior', 'HitTestBehavior', 'Brightness', 'TargetPlatform', 'StrokeCap', 'PaintingStyle',
+}
+
+
+def split_arguments(masked: str, start: int, end: int) -> List[Tuple[int, int]]:
+    """Top-level comma-separated argument spans of masked[start:end]"""
+    spans, depth, arg_start = [], 0, start
+    for i in range(start, end):
+        c = masked[i]
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            spans.append((arg_start, i))
+            arg_start = i + 1
+    if masked[arg_start:end].strip():
+        spans.append((arg_start, end))
+    return spans
+
+
+class ConstOpportunityFinder:
+    def __init__(self, project_root: str):
+        self.project_root = Path(project_root)
+        self.dart_files: List[Path] = []
+        self.sources: Dict[Path, Tuple[str, str, Dict]] = {}
+        self.const_constructors: Set[str] = set(SDK_CONST_CONSTRUCTORS)
+        self.const_namespaces: Set[str] = set(SDK_CONST_NAMESPACES)
+        self.const_members: Set[str] = set()
+        self.top_level_consts: Set[str] = set()
+        self.opportunities: Dict[str, List[Dict]] = {}
+
+    def load(self, file_path: Path) -> Optional[Tuple[str, str, Dict]]:
+        if file_path not in self.sources:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                print(f"Error reading {file_path}: {e}")
+                return None
+            masked, strings = scan_dart(content)
+            self.sources[file_path] = (content, masked, {s.start: s for s in strings})
+        return self.sources[file_path]
+
+    def collect_declarations(self):
+        """Const constructors, static const members, enums and top-level consts declared in the repo"""
+        for file_path in self.dart_files:
+            source = self.load(file_path)
+            if source is None:
+                continue
+            _, masked, _ = source
+            for name in re.findall(r"\benum\s+(\w+)", masked):
+                self.const_namespaces.add(name)
+            for name in re.findall(r"^const\s+(?:[\w<>?,]+\s+)?(\w+)\s*=", masked, re.MULTILINE):
+                self.top_level_consts.add(name)
+            for class_name, _, open_brace, close_brace in find_classes(masked):
+                body = masked[open_brace:close_brace]
+                for named in re.findall(r"\bconst\s+" + class_name + r"(?:\.(\w+))?\s*\(", body):
+                    self.const_constructors.add(f"{class_name}.{named}" if named else class_name)
+                for member in re.findall(r"\bstatic\s+const\s+(?:[\w<>?,]+\s+)?(\w+)\s*=", body):
+                    self.const_members.add(f"{class_name}.{member}")
+
+    def is_const_expression(self, masked: str, strings: Dict, start: int, end: int) -> bool:
+        text = masked[start:end].strip()
+        if not text:
+            return False
+        offset = start + (len(masked[start:end]) - len(masked[start:end].lstrip()))
+
+        named = re.match(r"(\w+)\s*:(?!:)", text)
+        if named:
+            return self.is_const_expression(masked, strings, offset + named.end(), end)
+
+        literal = strings.get(offset)
+        if literal is not None:
+            # Adjacent string literals concatenate; anything else (.tr(), +) is not const
+            i = literal.end
+            while True:
+                if literal.interpolated:
+                    return False
+                while i < end and masked[i].isspace():
+                    i += 1
+                if i >= end:
+                    return True
+                literal = strings.get(i)
+                if literal is None:
+                    return False
+                i = literal.end
+
+        if NUMBER.match(text) or text in ('true', 'false', 'null'):
+            return True
+        if text in self.top_level_consts:
+            return True
+        static = STATIC_REFERENCE.match(text)
+        if static:
+            return static.group(1) in self.const_namespaces or text in self.const_members
+        if re.match(r"const\b", text):
+            target = CONST_TARGET.match(masked, offset + len('const'))
+            if not target:
+                return False
+            close = matching_paren(masked, target.start(1) if target.group(1) else target.start(2))
+            return not masked[close + 1:end].strip()
+        if text[0] == '[' and masked[end - 1 - (len(masked[start:end]) - len(masked[start:end].rstrip()))] == ']':
+            close = matching_paren(masked, offset)
+            return all(self.is_const_expression(masked, strings, s, e) for s, e in split_arguments(masked, offset + 1, close))
+
+        call = CONSTRUCTOR_CALL.match(masked, offset)
+        if call and not call.group(1):
+            close = matching_paren(masked, call.end() - 1)
+            if masked[close + 1:end].strip():
+                return False  # something follows the call: .withOpacity(), [index], ...
+            return self.is_const_call(masked, strings, call, close)
+        return False
+
+    def is_const_call(self, masked: str, strings: Dict, call: re.Match, close: int) -> bool:
+        name = call.group(2) + (f".{call.group(3)}" if call.group(3) else '')
+        if name not in self.const_constructors:
+            return False
+        return all(self.is_const_expression(masked, strings, s, e)
+                   for s, e in split_arguments(masked, call.end(), close))
+
+    def const_spans(self, masked: str) -> List[Tuple[int, int]]:
+        """Spans already in a const context (const expressions and const declarations)"""
+        spans = []
+        for match in re.finditer(r"\bconst\b", masked):
+            i = match.end()
+            target = CONST_TARGET.match(masked, i)
+            if target:
+                spans.append((match.start(), matching_paren(masked, target.start(1) if target.group(1) else target.start(2))))
+                continue
+            declaration = re.compile(r"[^;=]*=").match(masked, i)
+            if declaration:
+                end = masked.find(';', declaration.end())
+                spans.append((match.start(), end if end != -1 else len(masked)))
+        return spans
+
+    def scan_file(self, file_path: Path) -> List[Dict]:
+        source = self.load(file_path)
+        if source is None:
+            return []
+        content, masked, strings = source
+        const_spans = self.const_spans(masked)
+        classes = find_classes(masked)
+        found = []
+        covered_until = -1
+
+        for call in CONSTRUCTOR_CALL.finditer(masked):
+            if call.start() < covered_until or call.group(1):
+                continue
+            if any(s <= call.start() <= e for s, e in const_spans):
+                continue
+            # A constructor declaration (`Foo(this.x);`), not a call
+            if any(name == call.group(2) and o < call.start() < c for name, _, o, c in classes):
+                continue
+            preceding = masked[max(0, call.start() - 12):call.start()]
+            if re.search(r"\b(factory|class|extends|with|implements|new)\s*$", preceding):
+                continue
+
+            close = matching_paren(masked, call.end() - 1)
+            if not self.is_const_call(masked, strings, call, close):
+                continue
+            # Skip a call that is immediately dereferenced: `Foo().bar`
+            if re.match(r"\s*[.\[]", masked[close + 1:close + 8]) and not masked[close + 1:close + 3] == '..':
+                continue
+
+            covered_until = close
+            inner_consts = [m.start() for m in re.finditer(r"\bconst\s+", masked[call.start():close])]
+            found.append({
+                'line': line_number(content, call.start()),
+                'offset': call.start(),
+                'end': close + 1,
+                'constructor': call.group(2) + (f".{call.group(3)}" if call.group(3) else ''),
+                'redundant_inner_const': len(inner_consts),
+            })
+        return found
+
+    def scan_all(self, packages: Optional[List[str]] = None):
+        self.dart_files = find_dart_files(self.project_root)
+        print(f"Collecting const declarations from {len(self.dart_files)} Dart files")
+        self.collect_declarations()
+        targets = self.dart_files
+        if packages:
+            targets = [f for f in targets if any(f"packages/{p}/" in str(f) for p in packages)]
+        for file_path in targets:
+            found = self.scan_file(file_path)
+            if found:
+                self.opportunities[str(file_path.relative_to(self.project_root))] = found
+
+    def fixed_content(self, relative: str) -> str:
+        """Source with `const` inserted and redundant inner `const` removed"""
+        content, masked, _ = self.sources[self.project_root / relative]
+        edits = []  # (start, end, replacement)
+        for site in self.opportunities[relative]:
+            edits.append((site['offset'], site['offset'], 'const '))
+            for match in re.finditer(r"\bconst\s+", masked[site['offset']:site['end']]):
+                edits.append((site['offset'] + match.start(), site['offset'] + match.end(), ''))
+        for start, end, replacement in sorted(edits, reverse=True):
+            content = content[:start] + replacement + content[end:]
+        return content
+
+    def apply_fixes(self, analyze_cmd: Optional[str] = None) -> Dict[str, str]:
+        """Write fixes; with analyze_cmd, revert files the analyzer rejects. Returns file -> status"""
+        status = {}
+        originals = {}
+        for relative in self.opportunities:
+            path = self.project_root / relative
+            originals[relative] = self.sources[path][0]
+            path.write_text(self.fixed_content(relative), encoding='utf-8')
+            status[relative] = 'fixed'
+
+        if analyze_cmd and originals:
+            command = shlex.split(analyze_cmd)
+            if shutil.which(command[0]) is None:
+                print(f"⚠ {command[0]} not found; fixes were not verified")
+                return status
+            result = subprocess.run(command + list(originals), cwd=self.project_root, capture_output=True, text=True)
+            for relative in originals:
+                if re.search(r"error\s+-\s+" + re.escape(relative), result.stdout) or \
+                        re.search(r"error .*" + re.escape(relative), result.stdout):
+                    (self.project_root / relative).write_text(originals[relative], encoding='utf-8')
+                    status[relative] = 'reverted'
+        return status
+
+    def package_counts(self) -> Dict[str, int]:
+        counts = defaultdict(int)
+        for relative, sites in self.opportunities.items():
+            package = relative.split('/')[1] if relative.startswith('packages/') else 'main_app'
+            counts[package] += len(sites)
+        return dict(sorted(counts.items(), key=lambda kv: -kv[1]))
+
+    def save_json_output(self, output_path: str, status: Optional[Dict[str, str]] = None):
+        constructors = defaultdict(int)
+        for sites in self.opportunities.values():
+            for site in sites:
+                constructors[site['constructor']] += 1
+        output_data = {
+            'metadata': {
+                'total_files': len(self.dart_files),
+                'files_with_opportunities': len(self.opportunities),
+                'opportunities': sum(len(s) for s in self.opportunities.values()),
+                'by_package': self.package_counts(),
+                'by_constructor': dict(sorted(constructors.items(), key=lambda kv: -kv[1])),
+            },
+            'files': {
+                relative: [{k: v for k, v in site.items() if k not in ('offset', 'end')} for site in sites]
+                for relative, sites in self.opportunities.items()
+            },
+        }
+        if status is not None:
+            output_data['fix_status'] = status
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find constructor calls that could be const')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--packages', nargs='*', help='Only these packages (e.g. artbeat_core)')
+    parser.add_argument('--json', default='const_opportunities.json', help='Output JSON file')
+    parser.add_argument('--fix', action='store_true', help='Insert const in place')
+    parser.add_argument('--analyze-cmd', default='dart analyze',
+                        help="Command run on fixed files; files with errors are reverted ('' to skip)")
+
+    args = parser.parse_args()
+
+    finder = ConstOpportunityFinder(args.root)
+    finder.scan_all(args.packages)
+    status = finder.apply_fixes(args.analyze_cmd or None) if args.fix else None
+    finder.save_json_output(args.json, status)
+
+    print(f"\n{'='*60}")
+    print("CONST OPPORTUNITIES")
+    print(f"{'='*60}")
+    for package, count in finder.package_counts().items():
+        print(f"{package}: {count}")
+    print(f"Total: {sum(len(s) for s in finder.opportunities.values())} in {len(finder.opportunities)} files")
+    if status is not None:
+        reverted = [f for f, s in status.items() if s == 'reverted']
+        print(f"✓ Fixed {len(status) - len(reverted)} files" + (f", reverted {len(reverted)}" if reverted else ''))
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
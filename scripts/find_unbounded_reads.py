@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Unbounded Firestore Read Detector
+Classifies every Firestore read in the Dart sources as a document get, a
+bounded query, an aggregate or an unbounded query, estimates the documents
+each one reads from the collection sizes in firestore_cardinality.json and
+ranks the hotspots by package and screen.
+"""
+
+import re
+import json
+import math
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dart_source import find_dart_files, line_number
+from firestore_queries import ARRAY_OPERATORS, EQUALITY_OPERATORS, RANGE_OPERATORS, QueryChain, QueryChainParser
+
+GET_CALL = re.compile(r"\.\s*get\s*\(")
+
+# Fraction of a collection left after one filter when no per-owner count applies
+EQUALITY_SELECTIVITY = 0.1
+RANGE_SELECTIVITY = 0.5
+
+
+def package_of(relative: str) -> str:
+    return relative.split('/')[1] if relative.startswith('packages/') else 'main_app'
+
+
+def site_kind(relative: str) -> str:
+    """Where a read runs: screens and widgets read on every build/visit"""
+    if '/screens/' in relative or relative.endswith('_screen.dart'):
+        return 'screen'
+    if '/widgets/' in relative:
+        return 'widget'
+    return 'service'
+
+
+class UnboundedReadDetector:
+    def __init__(self, project_root: str, cardinality_path: Optional[str] = None):
+        self.project_root = Path(project_root)
+        self.cardinality_path = Path(cardinality_path) if cardinality_path else Path(__file__).parent / 'firestore_cardinality.json'
+        self.cardinality: Dict = {}
+        self.reads: List[Dict] = []
+        self.unresolved: List[Dict] = []
+        self.dart_files: List[Path] = []
+
+    def load_cardinality(self):
+        with open(self.cardinality_path, 'r', encoding='utf-8') as f:
+            self.cardinality = json.load(f)
+
+    def page_size(self, limit: str) -> int:
+        return int(limit) if limit.isdigit() else self.cardinality.get('default_page_size', 50)
+
+    def per_parent(self, chain: QueryChain, info: Dict) -> float:
+        """Documents under one parent document of a subcollection"""
+        collections = self.cardinality.get('collections', {})
+        nested = self.cardinality.get('subcollections', {}).get(f"{chain.parent}/{chain.collection}", {})
+        if 'per_parent' in nested:
+            return nested['per_parent']
+        if 'per_parent' in info:
+            return info['per_parent']
+        parent = collections.get(chain.parent, {})
+        if 'documents' in info and parent.get('documents'):
+            return max(1.0, info['documents'] / parent['documents'])
+        return self.cardinality.get('default_per_parent', 50)
+
+    def estimate(self, chain: QueryChain) -> int:
+        """Documents one execution of the query reads"""
+        info = self.cardinality.get('collections', {}).get(chain.collection or '', {})
+        documents = info.get('documents', self.cardinality.get('default_documents', 1000))
+        owner_fields = set(self.cardinality.get('owner_fields', []))
+
+        by_owner = any(f in owner_fields and (op in EQUALITY_OPERATORS or op in ARRAY_OPERATORS)
+                       for f, op in chain.filters)
+        if by_owner and not chain.parent and 'per_owner' in info:
+            estimate = info['per_owner']
+        else:
+            # Subcollection query: only the documents under one parent, then its filters
+            base = self.per_parent(chain, info) if chain.parent else documents
+            equality = sum(1 for _, op in chain.filters if op in EQUALITY_OPERATORS | ARRAY_OPERATORS)
+            ranges = sum(1 for _, op in chain.filters if op in RANGE_OPERATORS)
+            estimate = base * EQUALITY_SELECTIVITY ** equality * RANGE_SELECTIVITY ** ranges
+        if chain.limit:
+            estimate = min(estimate, self.page_size(chain.limit))
+        return max(1, round(estimate))
+
+    def classify(self, chain: QueryChain) -> Dict:
+        entry = chain.to_dict()
+        entry['package'] = package_of(chain.file)
+        entry['site'] = site_kind(chain.file)
+        entry['listener'] = chain.terminal == 'snapshots'
+        if chain.document:
+            entry['kind'] = 'document'
+            entry['estimated_reads'] = 1
+            return entry
+
+        estimated = self.estimate(chain)
+        if chain.terminal == 'count':
+            # Aggregations bill one read per batch of up to 1000 index entries
+            entry['kind'] = 'aggregate'
+            entry['estimated_reads'] = max(1, math.ceil(estimated / 1000))
+        elif chain.limit or any(f == '__name__' and op == 'in' for f, op in chain.filters):
+            entry['kind'] = 'bounded'
+            entry['estimated_reads'] = estimated
+        else:
+            entry['kind'] = 'unbounded'
+            entry['estimated_reads'] = estimated
+        return entry
+
+    def scan_file(self, file_path: Path):
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return
+        if '.get(' not in content and '.snapshots(' not in content:
+            return
+
+        relative = str(file_path.relative_to(self.project_root))
+        parser = QueryChainParser(content, relative)
+        covered = set()
+        for chain in parser.parse():
+            if chain.terminal not in ('get', 'snapshots', 'count'):
+                continue
+            self.reads.append(self.classify(chain))
+            covered.update(range(chain.line, chain.end_line + 1))
+
+        # .get() on a reference passed in from elsewhere (parameter, field of another class)
+        for match in GET_CALL.finditer(parser.masked):
+            line = line_number(content, match.start())
+            if line not in covered:
+                self.unresolved.append({'file': relative, 'line': line, 'package': package_of(relative)})
+
+    def scan_all(self):
+        self.load_cardinality()
+        self.dart_files = find_dart_files(self.project_root)
+        print(f"Scanning {len(self.dart_files)} Dart files for Firestore reads")
+        for file_path in self.dart_files:
+            self.scan_file(file_path)
+        self.reads.sort(key=lambda r: (r['kind'] != 'unbounded', -r['estimated_reads']))
+
+    def hotspots(self, key: str) -> List[Dict]:
+        totals = defaultdict(lambda: {'reads': 0, 'unbounded': 0, 'estimated_reads': 0, 'unbounded_estimated_reads': 0})
+        for read in self.reads:
+            row = totals[read[key]]
+            row['reads'] += 1
+            row['estimated_reads'] += read['estimated_reads']
+            if read['kind'] == 'unbounded':
+                row['unbounded'] += 1
+                row['unbounded_estimated_reads'] += read['estimated_reads']
+        return sorted(({key: name, **row} for name, row in totals.items()),
+                      key=lambda r: -r['unbounded_estimated_reads'])
+
+    def kind_counts(self) -> Dict[str, int]:
+        counts = defaultdict(int)
+        for read in self.reads:
+            counts[read['kind']] += 1
+        return dict(counts)
+
+    def save_json_output(self, output_path: str):
+        output_data = {
+            'metadata': {
+                'total_files': len(self.dart_files),
+                'cardinality_fixture': str(self.cardinality_path),
+                'reads': len(self.reads),
+                'by_kind': self.kind_counts(),
+                'unresolved_get_sites': len(self.unresolved),
+            },
+            'packages': self.hotspots('package'),
+            'screens': [row for row in self.hotspots('file') if site_kind(row['file']) != 'service'],
+            'files': self.hotspots('file'),
+            'reads': self.reads,
+            'unresolved': self.unresolved,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find unbounded Firestore .get()/.snapshots() reads')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--cardinality', help='Collection size fixture (default: scripts/firestore_cardinality.json)')
+    parser.add_argument('--json', default='firestore_reads_report.json', help='Output JSON file')
+    parser.add_argument('--top', type=int, default=15, help='Hotspots to print')
+
+    args = parser.parse_args()
+
+    detector = UnboundedReadDetector(args.root, args.cardinality)
+    detector.scan_all()
+    detector.save_json_output(args.json)
+
+    counts = detector.kind_counts()
+    print(f"\n{'='*60}")
+    print("FIRESTORE READ HOTSPOTS")
+    print(f"{'='*60}")
+    for kind in ('document', 'bounded', 'aggregate', 'unbounded'):
+        print(f"{kind}: {counts.get(kind, 0)}")
+    print(f"unresolved .get() sites: {len(detector.unresolved)}")
+
+    print("\nTop unbounded reads:")
+    for read in [r for r in detector.reads if r['kind'] == 'unbounded'][:args.top]:
+        listener = ' (listener)' if read['listener'] else ''
+        print(f"  ~{read['estimated_reads']:>9,} docs  {read['collection']}{listener}  {read['file']}:{read['line']}")
+
+    print("\nBy package (estimated docs per pass over unbounded reads):")
+    for row in detector.hotspots('package'):
+        print(f"  {row['package']}: {row['unbounded']} unbounded / {row['reads']} reads, "
+              f"~{row['unbounded_estimated_reads']:,} docs")
+
+    print("\nTop screens:")
+    screens = [row for row in detector.hotspots('file') if site_kind(row['file']) != 'service']
+    for row in screens[:args.top]:
+        print(f"  {row['file']}: {row['unbounded']} unbounded, ~{row['unbounded_estimated_reads']:,} docs")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Firestore query chain reconstruction for the ArtBeat analysis scripts
+Rebuilds collection / where / orderBy / limit / get chains from Dart source,
+including queries built up through a variable (`query = query.where(...)`).
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dart_source import find_dart_files, line_number, matching_paren, scan_dart, string_constants
+
+COLLECTION_CALL = re.compile(r"\.\s*(collection|collectionGroup)\s*\(")
+BINDING = re.compile(r"(?:\bget\s+(\w+)\s*=>|(?<![=!<>])\b(\w+)\s*=(?![=>]))\s*(?:await\s+)?$")
+
+FILTER_OPERATORS = {
+    'isEqualTo': '==', 'isNotEqualTo': '!=', 'isLessThan': '<', 'isLessThanOrEqualTo': '<=',
+    'isGreaterThan': '>', 'isGreaterThanOrEqualTo': '>=', 'arrayContains': 'array-contains',
+    'arrayContainsAny': 'array-contains-any', 'whereIn': 'in', 'whereNotIn': 'not-in', 'isNull': '==',
+}
+EQUALITY_OPERATORS = {'==', 'in'}
+RANGE_OPERATORS = {'!=', '<', '<=', '>', '>=', 'not-in'}
+ARRAY_OPERATORS = {'array-contains', 'array-contains-any'}
+
+QUERY_METHODS = {'where', 'orderBy', 'limit', 'limitToLast', 'startAt', 'startAfter', 'startAfterDocument',
+                 'startAtDocument', 'endAt', 'endBefore', 'endAtDocument', 'endBeforeDocument', 'withConverter'}
+READ_TERMINALS = {'get', 'snapshots', 'count', 'aggregate'}
+WRITE_TERMINALS = {'add', 'set', 'update', 'delete'}
+CHAIN_METHODS = QUERY_METHODS | READ_TERMINALS | WRITE_TERMINALS | {'collection', 'collectionGroup', 'doc'}
+
+# Receivers that are the database itself (FirebaseFirestore.instance, _firestore, _getFirestore, db);
+# .collection() on anything else (messageDoc.reference, postRef, x.doc(id)) opens a subcollection
+FIRESTORE_RECEIVER = re.compile(r"(?i)firestore|^instance(?:For)?$|^_?db$")
+RECEIVER_NAME = re.compile(r"(\w+)[\s!?]*$")
+
+VARIABLE_CALL = re.compile(r"(?<![.\w])(\w+)\s*\??\.\s*(" + '|'.join(sorted(
+    QUERY_METHODS | READ_TERMINALS | {'doc'})) + r")\s*\(")
+
+
+@dataclass
+class QueryChain:
+    file: str
+    line: int
+    collection: Optional[str]           # collection id (last path segment); None if unresolved
+    group: bool = False                 # collectionGroup() query
+    document: bool = False              # chain ends on a DocumentReference
+    filters: List[Tuple[str, str]] = field(default_factory=list)     # (field, operator)
+    order_by: List[Tuple[str, str]] = field(default_factory=list)    # (field, ASCENDING|DESCENDING)
+    limit: Optional[str] = None
+    cursor: bool = False
+    terminal: Optional[str] = None      # get / snapshots / count / add / ... (None: handed off)
+    variable: Optional[str] = None      # built through this variable
+    conditional: bool = False           # filters added across reassignments (may not all apply)
+    end_line: int = 0                   # line of the last call in the chain
+    parent: Optional[str] = None        # parent collection of a subcollection query
+
+    @property
+    def is_query(self) -> bool:
+        return not self.document and self.terminal not in WRITE_TERMINALS
+
+    def derive(self) -> 'QueryChain':
+        return QueryChain(self.file, self.line, self.collection, self.group, self.document, list(self.filters),
+                          list(self.order_by), self.limit, self.cursor, self.terminal, self.variable, self.conditional,
+                          self.end_line, self.parent)
+
+    def to_dict(self) -> Dict:
+        return {
+            'file': self.file,
+            'line': self.line,
+            'collection': self.collection,
+            'group': self.group,
+            'document': self.document,
+            'filters': [list(f) for f in self.filters],
+            'order_by': [list(o) for o in self.order_by],
+            'limit': self.limit,
+            'terminal': self.terminal,
+            'variable': self.variable,
+            'conditional': self.conditional,
+            'end_line': self.end_line,
+            'parent': self.parent,
+        }
+
+
+class QueryChainParser:
+    """Reconstructs the Firestore query chains of one Dart file"""
+
+    def __init__(self, content: str, relative: str):
+        self.content = content
+        self.relative = relative
+        self.masked, strings = scan_dart(content)
+        self.strings = {s.start: s for s in strings}
+        self.constants = string_constants(self.masked, strings)
+        self.chains: List[QueryChain] = []
+
+    def literal(self, start: int, end: int):
+        i = start
+        while i < end and self.masked[i].isspace():
+            i += 1
+        return self.strings.get(i)
+
+    def first_argument(self, start: int, end: int) -> str:
+        """Source of the first positional argument (string literal or expression)"""
+        literal = self.literal(start, end)
+        if literal is not None:
+            return literal.text
+        depth, i = 0, start
+        while i < end:
+            c = self.masked[i]
+            if c in '([{':
+                depth += 1
+            elif c in ')]}':
+                depth -= 1
+            elif c == ',' and depth == 0:
+                break
+            i += 1
+        return self.masked[start:i].strip()
+
+    def resolve_name(self, start: int, end: int) -> Optional[str]:
+        """Collection id or field name from a literal, a string constant or FieldPath.documentId"""
+        literal = self.literal(start, end)
+        if literal is not None:
+            if not literal.interpolated:
+                return literal.text.split('/')[-1]
+            segments = literal.text.split('/')
+            return segments[-1] if '$' not in segments[-1] else None
+        expression = self.first_argument(start, end)
+        if expression == 'FieldPath.documentId' or expression == 'FieldPath.documentId()':
+            return '__name__'
+        return self.constants.get(expression.split('.')[-1])
+
+    def read_segments(self, i: int) -> Tuple[List[Tuple[str, int, int]], int]:
+        """Read `.method(args)` calls from i; stops before anything that is not a Firestore call"""
+        masked = self.masked
+        segments = []
+        while True:
+            j = i
+            while j < len(masked) and masked[j].isspace():
+                j += 1
+            if masked.startswith('?.', j):
+                j += 2
+            elif masked.startswith('.', j) and not masked.startswith('..', j):
+                j += 1
+            else:
+                break
+            name_match = re.compile(r"\s*(\w+)\s*(<[^()]*?>)?\s*\(").match(masked, j)
+            if not name_match or name_match.group(1) not in CHAIN_METHODS:
+                break
+            open_paren = name_match.end() - 1
+            close = matching_paren(masked, open_paren)
+            segments.append((name_match.group(1), open_paren + 1, close))
+            i = close + 1
+            if name_match.group(1) in READ_TERMINALS | WRITE_TERMINALS and name_match.group(1) != 'count':
+                break
+        return segments, i
+
+    def apply(self, chain: QueryChain, segments: List[Tuple[str, int, int]]) -> QueryChain:
+        for name, start, end in segments:
+            args = self.masked[start:end]
+            if name in ('collection', 'collectionGroup'):
+                chain.parent = (chain.collection or '?') if chain.document else None
+                chain.collection = self.resolve_name(start, end)
+                chain.group = name == 'collectionGroup'
+                chain.document = False
+                chain.filters, chain.order_by, chain.limit, chain.cursor = [], [], None, False
+            elif name == 'doc':
+                chain.document = True
+            elif name == 'where':
+                operator = re.search(r"\b(" + '|'.join(FILTER_OPERATORS) + r")\s*:", args)
+                if operator:
+                    chain.filters.append((self.resolve_name(start, end) or '?', FILTER_OPERATORS[operator.group(1)]))
+            elif name == 'orderBy':
+                descending = re.search(r"\bdescending\s*:\s*true\b", args)
+                chain.order_by.append((self.resolve_name(start, end) or '?',
+                                       'DESCENDING' if descending else 'ASCENDING'))
+            elif name in ('limit', 'limitToLast'):
+                chain.limit = self.content[start:end].strip()
+            elif name.startswith(('start', 'end')):
+                chain.cursor = True
+            elif name in READ_TERMINALS | WRITE_TERMINALS:
+                if chain.terminal != 'count':
+                    chain.terminal = name
+        return chain
+
+    def binding_before(self, offset: int) -> Optional[str]:
+        match = BINDING.search(self.masked[max(0, offset - 120):offset])
+        if not match:
+            return None
+        return match.group(1) or match.group(2)
+
+    def receiver_start(self, offset: int) -> int:
+        """Start of the receiver expression (`FirebaseFirestore.instance`, `_firestore`, ...)"""
+        i = offset
+        while i > 0 and (self.masked[i - 1].isalnum() or self.masked[i - 1] in '_.!?' or self.masked[i - 1].isspace()):
+            i -= 1
+        while i < offset and self.masked[i].isspace():
+            i += 1
+        return i
+
+    def receiver_name(self, offset: int) -> Optional[str]:
+        """Last identifier of the receiver ending at offset; the method name when it ends in a call"""
+        masked = self.masked
+        i = offset
+        while i > 0 and masked[i - 1].isspace():
+            i -= 1
+        if i > 0 and masked[i - 1] == ')':
+            depth = 0
+            while i > 0:
+                i -= 1
+                if masked[i] == ')':
+                    depth += 1
+                elif masked[i] == '(':
+                    depth -= 1
+                    if depth == 0:
+                        break
+        match = RECEIVER_NAME.search(masked, max(0, i - 80), i)
+        return match.group(1) if match else None
+
+    def new_chain(self, start: int, segments: List[Tuple[str, int, int]]) -> QueryChain:
+        """Chain for an expression call; a collection() on a DocumentReference starts as its subcollection"""
+        chain = QueryChain(self.relative, line_number(self.content, start), None)
+        name, args_start, _ = segments[0]
+        if name == 'collection':
+            receiver = self.receiver_name(self.masked.rfind('.', 0, args_start))
+            # Parent collection unknown ('?'), but the query only covers one parent's documents
+            chain.document = receiver is not None and not FIRESTORE_RECEIVER.search(receiver)
+        return self.apply(chain, segments)
+
+    def parse(self) -> List[QueryChain]:
+        events = []
+        covered_until = -1
+        for match in COLLECTION_CALL.finditer(self.masked):
+            if match.start() < covered_until:
+                continue
+            segments, end = self.read_segments(match.start())
+            if not segments:
+                continue
+            covered_until = end
+            start = self.receiver_start(match.start())
+            events.append((start, end, None, segments))
+
+        spans = [(s, e) for s, e, _, _ in events]
+        for match in VARIABLE_CALL.finditer(self.masked):
+            name = match.group(1)
+            if name in ('FirebaseFirestore', 'this', 'super') or any(s <= match.start() < e for s, e in spans):
+                continue
+            segments, end = self.read_segments(match.end(1))
+            if segments:
+                events.append((match.start(), end, name, segments))
+                spans.append((match.start(), end))
+        events.sort(key=lambda e: e[0])
+
+        # Getters and fields are usually declared before use; seed them so
+        # members declared further down still resolve.
+        bindings: Dict[str, QueryChain] = {}
+        for start, _, source, segments in events:
+            target = self.binding_before(start)
+            if source is None and target and target not in bindings:
+                chain = self.new_chain(start, segments)
+                if chain.terminal is None:
+                    bindings[target] = chain
+
+        consumed = set()
+        for start, end, source, segments in events:
+            target = self.binding_before(start)
+            if source is None:
+                chain = self.new_chain(start, segments)
+            else:
+                base = bindings.get(source)
+                if base is None:
+                    continue
+                consumed.add(source)
+                chain = self.apply(base.derive(), segments)
+                chain.line = line_number(self.content, start)
+                chain.variable = source
+                if target == source:
+                    chain.conditional = True
+            chain.end_line = line_number(self.content, end)
+
+            if target and chain.terminal is None:
+                chain.variable = chain.variable or target
+                bindings[target] = chain
+            elif chain.collection is not None or chain.terminal is not None:
+                self.chains.append(chain)
+
+        # Queries built in a variable and handed off (returned, passed to a builder)
+        for name, chain in bindings.items():
+            if name not in consumed and (chain.filters or chain.order_by) and not chain.document:
+                if not any(c is chain for c in self.chains):
+                    self.chains.append(chain)
+        self.chains.sort(key=lambda c: c.line)
+        return self.chains
+
+
+def scan_query_chains(root_path: Path) -> List[QueryChain]:
+    """Query chains of every Dart source under packages/ and lib/"""
+    chains = []
+    for file_path in find_dart_files(root_path):
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            continue
+        if 'collection' not in content and 'Query' not in content:
+            continue
+        chains.extend(QueryChainParser(content, str(file_path.relative_to(root_path))).parse())
+    return chains
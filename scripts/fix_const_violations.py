@@ -7,9 +7,27 @@ Removes const from const declarations that contain .tr() calls
 import re
 import sys
 from pathlib import Path
+from typing import Optional
 
-def find_const_block_for_tr(lines: list, tr_line_idx: int) -> int:
+from dart_source import scan_dart
+
+def masked_lines_of(content: str) -> list:
+    """Lines with comments and string bodies blanked, aligned with content.split('\\n')"""
+    # Keep ${...} code: '${'key'.tr()}' is a .tr() call inside the string
+    return scan_dart(content, interpolations=True)[0].split('\n')
+
+def remove_const(lines: list, masked_lines: list, idx: int):
+    """Drop the first const keyword of a line, found in code rather than in a string"""
+    match = re.search(r'\bconst\s+', masked_lines[idx])
+    if match:
+        lines[idx] = lines[idx][:match.start()] + lines[idx][match.end():]
+        masked_lines[idx] = masked_lines[idx][:match.start()] + masked_lines[idx][match.end():]
+
+def find_const_block_for_tr(lines: list, tr_line_idx: int, masked_lines: list = None) -> int:
     """Find the line with const that starts the block containing the .tr() call"""
+    # Parens and 'const' inside strings or comments must not count
+    if masked_lines is not None:
+        lines = masked_lines
     # Look backward from the .tr() line to find the opening const
     paren_depth = 0
     for i in range(tr_line_idx, -1, -1):
@@ -45,10 +63,11 @@ def fix_const_violations_in_file(file_path: str) -> int:
         fixed_count = 0
         
         lines = content.split('\n')
+        masked_lines = masked_lines_of(content)
         fixed_lines_set = set()  # Track which lines we've already fixed
         
         # First pass: Find all .tr() calls and fix their const containers
-        for i, line in enumerate(lines):
+        for i, line in enumerate(masked_lines):
             if '.tr()' not in line or i in fixed_lines_set:
                 continue
             
@@ -56,22 +75,22 @@ def fix_const_violations_in_file(file_path: str) -> int:
             if 'const ' in line and '.tr()' in line:
                 # Single-line const with .tr()
                 if re.search(r'const\s+\w+\(.*\.tr\(\).*\)', line):
-                    lines[i] = re.sub(r'const\s+', '', line, count=1)
+                    remove_const(lines, masked_lines, i)
                     fixed_count += 1
                     fixed_lines_set.add(i)
                     continue
             
             # Multi-line case: find the const block that this .tr() belongs to
-            const_line_idx = find_const_block_for_tr(lines, i)
+            const_line_idx = find_const_block_for_tr(lines, i, masked_lines)
             if const_line_idx >= 0 and const_line_idx not in fixed_lines_set:
                 # Remove const from that line
-                lines[const_line_idx] = re.sub(r'const\s+', '', lines[const_line_idx], count=1)
+                remove_const(lines, masked_lines, const_line_idx)
                 fixed_count += 1
                 fixed_lines_set.add(const_line_idx)
         
         # Second pass: Handle const IconButton, etc. with .tr() in label/tooltip
         for i, line in enumerate(lines):
-            if i in fixed_lines_set:
+            if i in fixed_lines_set or '.tr()' not in masked_lines[i]:
                 continue
             
             patterns = [
@@ -101,6 +120,32 @@ def fix_const_violations_in_file(file_path: str) -> int:
         print(f"Error fixing {file_path}: {e}")
         return 0
 
+def fix_package(project_root: Path, package: str, packages_dir: Optional[Path] = None) -> int:
+    """Fix const violations in one package's screens; returns the number fixed"""
+    packages_dir = Path(packages_dir) if packages_dir else Path(project_root) / 'packages'
+    package_path = packages_dir / package / 'lib' / 'src' / 'screens'
+
+    if not package_path.exists():
+        print(f"Package path not found: {package_path}")
+        return 0
+
+    print(f"\nFixing const violations in {package}...")
+
+    dart_files = list(package_path.glob('*.dart'))
+    total_fixed = 0
+
+    for dart_file in sorted(dart_files):
+        fixed = fix_const_violations_in_file(str(dart_file))
+        if fixed > 0:
+            print(f"  ✓ {dart_file.name}: {fixed} violations fixed")
+            total_fixed += fixed
+
+    if total_fixed == 0:
+        print("  - No const violations found")
+    else:
+        print(f"\n✓ Fixed {total_fixed} const violations in {package}")
+    return total_fixed
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python fix_const_violations.py <package_name>")
@@ -111,27 +156,7 @@ def main():
     project_root = Path(__file__).parent.parent
     
     for package in sys.argv[1:]:
-        package_path = project_root / 'packages' / package / 'lib' / 'src' / 'screens'
-        
-        if not package_path.exists():
-            print(f"Package path not found: {package_path}")
-            continue
-        
-        print(f"\nFixing const violations in {package}...")
-        
-        dart_files = list(package_path.glob('*.dart'))
-        total_fixed = 0
-        
-        for dart_file in sorted(dart_files):
-            fixed = fix_const_violations_in_file(str(dart_file))
-            if fixed > 0:
-                print(f"  ✓ {dart_file.name}: {fixed} violations fixed")
-                total_fixed += fixed
-        
-        if total_fixed == 0:
-            print("  - No const violations found")
-        else:
-            print(f"\n✓ Fixed {total_fixed} const violations in {package}")
+        fix_package(project_root, package)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Synthetic Benchmark Corpus Generator for the ArtBeat i18n tools
+Writes Dart screens and locale catalogs shaped like the real tree
+(1,020 files, 3,737 keys at 1x) at any scale, deterministically.
+"""
+
+import json
+import random
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+BASE_FILES = 1020
+BASE_KEYS = 3737
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+PACKAGES = [
+    'admin', 'ads', 'art_walk', 'artist', 'artwork', 'auth', 'capture',
+    'community', 'core', 'events', 'messaging', 'profile', 'settings',
+]
+COMPONENTS = ['title', 'label', 'button', 'hint', 'error', 'success', 'message', 'text', 'loading']
+WORDS = [
+    'artwork', 'artist', 'gallery', 'walk', 'capture', 'profile', 'settings', 'event',
+    'message', 'comment', 'upload', 'photo', 'review', 'payment', 'subscription', 'ticket',
+    'community', 'feed', 'post', 'like', 'share', 'follow', 'search', 'filter', 'map',
+    'location', 'route', 'achievement', 'badge', 'level', 'reward', 'account', 'email',
+    'password', 'notification', 'privacy', 'security', 'language', 'theme', 'details',
+]
+VERBS = ['Save', 'Delete', 'Load', 'Update', 'Create', 'Share', 'Upload', 'View', 'Edit', 'Remove']
+PLACEHOLDERS = ['$e', '${widget.title}', '{count}', '{error}', '$_selectedMedium', '{xp}']
+
+# Per-file averages of the real tree: 6.5 Text(, 2.9 .tr(), ~20 const, ~7 interpolations
+TEXT_WIDGETS_PER_FILE = 6.5
+LINES_PER_FILE = 328
+
+LOCALE_TAGS = {'ar': 'AR', 'de': 'DE', 'es': 'ES', 'fr': 'FR', 'pt': 'PT', 'zh': 'ZH'}
+
+
+class CorpusGenerator:
+    def __init__(self, output_dir: str, scale: int, seed: int = 42):
+        self.output_dir = Path(output_dir)
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.keys: List[str] = []
+        self.english: Dict[str, str] = {}
+
+    def phrase(self, min_words: int = 1, max_words: int = 5) -> str:
+        words = self.rng.sample(WORDS, self.rng.randint(min_words, max_words))
+        return ' '.join(words).capitalize()
+
+    def generate_catalogs(self):
+        total = BASE_KEYS * self.scale
+        for index in range(total):
+            package = PACKAGES[index % len(PACKAGES)]
+            words = self.phrase(1, 3)
+            key = f"{package}_screen{index % 97}_{self.rng.choice(COMPONENTS)}_{words.lower().replace(' ', '_')}_{index}"
+            value = f"{self.rng.choice(VERBS)} {words.lower()}"
+            if self.rng.random() < 0.09:
+                value = f"{value}: {self.rng.choice(PLACEHOLDERS)}"
+            self.keys.append(key)
+            self.english[key] = value
+
+        translations_dir = self.output_dir / 'assets' / 'translations'
+        translations_dir.mkdir(parents=True, exist_ok=True)
+        for lang in LANGUAGES:
+            catalog = {}
+            for key, value in self.english.items():
+                roll = self.rng.random()
+                if lang == 'en' or roll < 0.05:
+                    catalog[key] = value
+                elif roll < 0.15:
+                    catalog[key] = f"[{value}]"
+                elif roll < 0.20:
+                    catalog[key] = f"{LOCALE_TAGS[lang]}: {value}"
+                elif roll < 0.93:
+                    # Expanded translation that keeps its placeholder in place
+                    catalog[key] = f"{value} {self.rng.choice(WORDS)}"
+            with open(translations_dir / f"{lang}.json", 'w', encoding='utf-8') as f:
+                json.dump(catalog, f, ensure_ascii=False, indent=2)
+
+    def widget(self) -> str:
+        """One widget expression drawn from the shapes the real screens use"""
+        roll = self.rng.random()
+        key = self.rng.choice(self.keys)
+        if roll < 0.15 and '$' not in self.english[key] and '{' not in self.english[key]:
+            # Hardcoded copy of a catalog value: what update_file converts to .tr()
+            return f"Text('{self.english[key]}')"
+        if roll < 0.30:
+            return f"Text('{self.phrase(2, 6)}')"
+        if roll < 0.45:
+            return f"const Text('{self.phrase(2, 4)}')"
+        if roll < 0.65:
+            return f"Text('{key}'.tr())"
+        if roll < 0.75:
+            # Multi-line const block around a .tr() call (a const violation)
+            return (
+                "const Padding(\n"
+                "              padding: EdgeInsets.all(8),\n"
+                f"              child: Text('{key}'.tr()),\n"
+                "            )"
+            )
+        if roll < 0.85:
+            return f"Text('Error: ${{_error}} while loading {self.rng.choice(WORDS)}')"
+        if roll < 0.92:
+            return f"ElevatedButton(onPressed: _submit, child: Text('{self.rng.choice(VERBS)}'))"
+        return f"ListTile(title: Text('{self.phrase(2, 3)}'), subtitle: Text('$_count items'))"
+
+    def screen(self, index: int) -> str:
+        name = f"SyntheticScreen{index}"
+        widgets_count = max(1, round(self.rng.gauss(TEXT_WIDGETS_PER_FILE, 2)))
+        widgets = ',\n            '.join(self.widget() for _ in range(widgets_count))
+        lines = [
+            "import 'package:flutter/material.dart';",
+            "import 'package:easy_localization/easy_localization.dart';",
+            "",
+            f"/// Synthetic screen {index}",
+            f"class {name} extends StatefulWidget {{",
+            f"  const {name}({{super.key}});",
+            "",
+            "  @override",
+            f"  State<{name}> createState() => _{name}State();",
+            "}",
+            "",
+            f"class _{name}State extends State<{name}> {{",
+            "  String? _error;",
+            "  int _count = 0;",
+            "",
+            "  void _submit() {",
+            "    setState(() => _count++);",
+            "  }",
+            "",
+        ]
+        # Filler methods bring the const/interpolation density up to the real tree's
+        filler_methods = max(0, (LINES_PER_FILE - 40 - widgets_count * 2) // 8)
+        for m in range(filler_methods):
+            roll = self.rng.random()
+            lines.append(f"  // Helper {m}: formats {self.rng.choice(WORDS)} data")
+            if roll < 0.1:
+                lines.extend([
+                    f"  String _format{m}(int value) {{",
+                    f"    final label = '{self.rng.choice(WORDS)}_$value';",
+                    "    if (value > 10) {",
+                    f"      return '${{label.toUpperCase()}} ({self.rng.choice(WORDS)})';",
+                    "    }",
+                    "    return label;",
+                    "  }",
+                ])
+            elif roll < 0.4:
+                lines.extend([
+                    f"  Widget _spacer{m}(bool compact) {{",
+                    "    if (compact) {",
+                    f"      return const SizedBox(height: {self.rng.choice([4, 8, 12, 16])});",
+                    "    }",
+                    f"    return Padding(padding: const EdgeInsets.all({self.rng.choice([8, 16])}), child: Container());",
+                    "  }",
+                    "",
+                ])
+            else:
+                lines.extend([
+                    f"  int _compute{m}(int value) {{",
+                    "    var total = value;",
+                    f"    for (var i = 0; i < {self.rng.randint(2, 9)}; i++) {{",
+                    "      total += i * _count;",
+                    "    }",
+                    "    return total;",
+                    "  }",
+                ])
+        lines.extend([
+            "",
+            "  @override",
+            "  Widget build(BuildContext context) {",
+            "    return Scaffold(",
+            f"      appBar: AppBar(title: Text('{self.rng.choice(self.keys)}'.tr())),",
+            "      body: Column(",
+            "          children: [",
+            f"            {widgets},",
+            "          ],",
+            "      ),",
+            "    );",
+            "  }",
+            "}",
+            "",
+        ])
+        return '\n'.join(lines)
+
+    def generate_screens(self):
+        total = BASE_FILES * self.scale
+        for index in range(total):
+            package = PACKAGES[index % len(PACKAGES)]
+            screens_dir = self.output_dir / 'packages' / f"artbeat_{package}" / 'lib' / 'src' / 'screens'
+            screens_dir.mkdir(parents=True, exist_ok=True)
+            with open(screens_dir / f"synthetic_{index}_screen.dart", 'w', encoding='utf-8') as f:
+                f.write(self.screen(index))
+
+    def generate(self) -> Dict:
+        self.generate_catalogs()
+        self.generate_screens()
+        metadata = {
+            'scale': self.scale,
+            'files': BASE_FILES * self.scale,
+            'keys': BASE_KEYS * self.scale,
+            'locales': LANGUAGES,
+        }
+        with open(self.output_dir / 'corpus.json', 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+        return metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic Dart/catalog corpus for benchmarks')
+    parser.add_argument('--output', default='build/bench_corpus', help='Output directory (one subdirectory per scale)')
+    parser.add_argument('--scales', nargs='*', type=int, default=[1, 10, 100], help='Corpus sizes relative to today')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+
+    args = parser.parse_args()
+
+    for scale in args.scales:
+        output_dir = Path(args.output) / f"{scale}x"
+        print(f"Generating {scale}x corpus in {output_dir}...")
+        metadata = CorpusGenerator(str(output_dir), scale, args.seed).generate()
+        print(f"  ✓ {metadata['files']} Dart files, {metadata['keys']} keys x {len(metadata['locales'])} locales")
+
+
+if __name__ == '__main__':
+    main()
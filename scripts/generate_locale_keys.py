@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Locale Key Generator
+Generates Dart `static const` identifiers for every key in en.json and
+rewrites 'key'.tr() call sites to use them (LocaleKeys.key.tr()).
+"""
+
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dart_source import find_dart_files, scan_dart
+from shard_catalogs import key_namespace, package_namespaces
+
+OUTPUT_PATH = Path('packages/artbeat_core/lib/src/l10n/locale_keys.g.dart')
+# Only LocaleKeys: the whole barrel would pull every core export into the file's namespace
+CORE_IMPORT = "import 'package:artbeat_core/artbeat_core.dart' show LocaleKeys;"
+CORE_SELF_IMPORT = "import 'package:artbeat_core/src/l10n/locale_keys.g.dart';"
+SOURCE_HASH_PATTERN = re.compile(r"^// Source: en\.json sha256=([0-9a-f]{64})$", re.MULTILINE)
+CONSTANT_PATTERN = re.compile(r"^\s*static const (\w+) = '((?:[^'\\]|\\.)*)';$", re.MULTILINE)
+
+DART_RESERVED = {
+    'abstract', 'as', 'assert', 'async', 'await', 'break', 'case', 'catch', 'class',
+    'const', 'continue', 'covariant', 'default', 'deferred', 'do', 'dynamic', 'else',
+    'enum', 'export', 'extends', 'extension', 'external', 'factory', 'false', 'final',
+    'finally', 'for', 'get', 'if', 'implements', 'import', 'in', 'interface', 'is',
+    'late', 'library', 'mixin', 'new', 'null', 'operator', 'part', 'required',
+    'rethrow', 'return', 'set', 'static', 'super', 'switch', 'this', 'throw', 'true',
+    'try', 'typedef', 'var', 'void', 'while', 'with', 'yield',
+}
+
+
+def dart_identifier(key: str, taken: set) -> str:
+    """Turn a catalog key into a unique Dart identifier (keys are kept verbatim when valid)"""
+    name = re.sub(r'[^A-Za-z0-9_$]', '_', key)
+    if not re.match(r'^[A-Za-z_$]', name) or name in DART_RESERVED:
+        name = f"k_{name}"
+    candidate, suffix = name, 2
+    while candidate in taken:
+        candidate = f"{name}_{suffix}"
+        suffix += 1
+    taken.add(candidate)
+    return candidate
+
+
+def dart_string(value: str) -> str:
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'").replace('$', '\\$') + "'"
+
+
+class LocaleKeyGenerator:
+    def __init__(self, project_root: str, output_path: Path = OUTPUT_PATH):
+        self.project_root = Path(project_root)
+        self.en_file = self.project_root / "assets" / "translations" / "en.json"
+        self.output_file = self.project_root / output_path
+        self.namespaces = package_namespaces(self.project_root)
+        self.identifiers: Dict[str, str] = {}
+        self.updated_files: List[Tuple[str, int]] = []
+
+    def source_hash(self) -> str:
+        return hashlib.sha256(self.en_file.read_bytes()).hexdigest()
+
+    def load_keys(self) -> List[str]:
+        with open(self.en_file, 'r', encoding='utf-8') as f:
+            return list(json.load(f).keys())
+
+    def read_generated(self) -> Dict[str, str]:
+        """identifier -> key as declared in the generated file (what call sites compile against)"""
+        if not self.output_file.exists():
+            return {}
+        content = self.output_file.read_text(encoding='utf-8')
+        return {name: re.sub(r"\\(.)", r"\1", value) for name, value in CONSTANT_PATTERN.findall(content)}
+
+    def build_identifiers(self):
+        taken: set = set()
+        for key in sorted(self.load_keys()):
+            self.identifiers[key] = dart_identifier(key, taken)
+
+    def render(self, source_hash: str) -> str:
+        groups: Dict[str, List[str]] = {}
+        for key in self.identifiers:
+            groups.setdefault(key_namespace(key, self.namespaces), []).append(key)
+
+        lines = [
+            '// GENERATED CODE - DO NOT MODIFY BY HAND',
+            '// Generated by scripts/generate_locale_keys.py from assets/translations/en.json',
+            f'// Source: en.json sha256={source_hash}',
+            '',
+            '// ignore_for_file: constant_identifier_names, lines_longer_than_80_chars',
+            '',
+            '/// Translation keys from en.json, grouped by package namespace.',
+            'abstract class LocaleKeys {',
+        ]
+        for index, namespace in enumerate(sorted(groups)):
+            if index:
+                lines.append('')
+            lines.append(f'  // {namespace} ({len(groups[namespace])} keys)')
+            for key in sorted(groups[namespace]):
+                lines.append(f'  static const {self.identifiers[key]} = {dart_string(key)};')
+        lines.append('}')
+        lines.append('')
+        return '\n'.join(lines)
+
+    def generate(self, force: bool = False) -> str:
+        """Regenerate the keys file; returns 'skipped', 'unchanged' or 'written'"""
+        source_hash = self.source_hash()
+        existing: Optional[str] = None
+        if self.output_file.exists():
+            existing = self.output_file.read_text(encoding='utf-8')
+            match = SOURCE_HASH_PATTERN.search(existing)
+            if not force and match and match.group(1) == source_hash:
+                return 'skipped'
+
+        self.build_identifiers()
+        content = self.render(source_hash)
+        if existing is not None and hashlib.sha256(existing.encode('utf-8')).digest() == \
+                hashlib.sha256(content.encode('utf-8')).digest():
+            return 'unchanged'
+
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.output_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return 'written'
+
+    def find_key_literals(self, content: str) -> List[Tuple[int, int, str]]:
+        """Offsets of string literals that are used as translation keys"""
+        # Interpolation code stays visible so '${'key'.tr()}' is rewritten too
+        masked, strings = scan_dart(content, interpolations=True)
+        replacements = []
+        for s in strings:
+            if s.interpolated or s.text not in self.identifiers:
+                continue
+            after = masked[s.end:s.end + 40].lstrip()
+            before = masked[max(0, s.start - 40):s.start].rstrip()
+            is_method = re.match(r"\.\s*(tr|plural)\s*\(", after)
+            is_function = re.search(r"(?<![\w.$])(tr|plural)\s*\($", before)
+            is_text_widget = False
+            if re.search(r"\bText\s*\($", before):
+                # Text('key', style: ...).tr()
+                depth = 0
+                for i in range(s.start - 1, len(masked)):
+                    if masked[i] == '(':
+                        depth += 1
+                    elif masked[i] == ')':
+                        depth -= 1
+                        if depth == 0:
+                            is_text_widget = bool(re.match(r"\s*\.\s*tr\s*\(", masked[i + 1:i + 40]))
+                            break
+            if is_method or is_function or is_text_widget:
+                replacements.append((s.start, s.end, f"LocaleKeys.{self.identifiers[s.text]}"))
+        return replacements
+
+    def ensure_import(self, content: str, in_core: bool) -> str:
+        import_line = CORE_SELF_IMPORT if in_core else CORE_IMPORT
+        if import_line in content or (not in_core and re.search(
+                r"import 'package:artbeat_core/artbeat_core\.dart'\s*;", content)):
+            return content
+
+        lines = content.split('\n')
+        for i, line in enumerate(lines):
+            if line.startswith('import '):
+                j = i
+                while j < len(lines) and not lines[j].rstrip().endswith(';'):
+                    j += 1
+                lines.insert(j + 1, import_line)
+                return '\n'.join(lines)
+        return import_line + '\n' + content
+
+    def update_file(self, file_path: Path) -> int:
+        """Rewrite translation key literals in a single file to LocaleKeys constants"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            replacements = self.find_key_literals(content)
+            if not replacements:
+                return 0
+
+            for start, end, replacement in reversed(replacements):
+                content = content[:start] + replacement + content[end:]
+
+            in_core = 'packages/artbeat_core/' in str(file_path)
+            content = self.ensure_import(content, in_core)
+
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.updated_files.append((str(file_path), len(replacements)))
+            return len(replacements)
+
+        except Exception as e:
+            print(f"  ✗ Error updating {Path(file_path).name}: {e}")
+            return 0
+
+    def rewrite_call_sites(self, packages: List[str]) -> int:
+        if not self.identifiers:
+            self.build_identifiers()
+
+        roots = tuple(f"packages/{p}" for p in packages) if packages else ('packages', 'lib')
+        total = 0
+        for file_path in find_dart_files(self.project_root, roots):
+            if file_path == self.output_file:
+                continue
+            updated = self.update_file(file_path)
+            if updated:
+                print(f"  ✓ {file_path.relative_to(self.project_root)}: {updated} keys")
+                total += updated
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate Dart LocaleKeys constants from en.json')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if en.json is unchanged')
+    parser.add_argument('--rewrite', nargs='*', metavar='PACKAGE',
+                        help="Rewrite 'key'.tr() call sites to LocaleKeys (all of packages/ and lib/ if no package given)")
+
+    args = parser.parse_args()
+
+    generator = LocaleKeyGenerator(args.root)
+    status = generator.generate(force=args.force)
+    relative = generator.output_file.relative_to(generator.project_root)
+    if status == 'written':
+        print(f"✓ Wrote {relative} ({len(generator.identifiers)} keys)")
+    else:
+        print(f"- {relative} is up to date ({status})")
+
+    if args.rewrite is not None:
+        total = generator.rewrite_call_sites(args.rewrite)
+        print(f"\n✓ Rewrote {total} call sites in {len(generator.updated_files)} files")
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
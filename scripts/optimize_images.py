@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Image Asset Optimizer
+Produces lossless-optimized PNGs, WebP variants and Flutter 2.0x/3.0x
+resolution-aware variants for assets/images, sized from the width/height
+(logical pixels) and cacheWidth/cacheHeight (physical pixels) of the
+Image.asset call sites that display them. An asset with any call site of
+unknown size keeps its full resolution. Results are cached by content hash
+so reruns only touch changed images.
+
+Requires Pillow (pip install pillow).
+"""
+
+import io
+import re
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dart_source import find_dart_files, matching_paren, scan_dart
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg')
+ASSET_CALL = re.compile(r"\b(Image\.asset|AssetImage|ExactAssetImage)\s*\(")
+SIZE_ARG = re.compile(r"\b(width|height|cacheWidth|cacheHeight)\s*:\s*(\d+(?:\.\d+)?)\b")
+CACHE_VERSION = 1
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def fit_scale(width: float, height: float, source_size: Tuple[int, int]) -> Optional[float]:
+    """Scale that fits the source inside width x height (BoxFit.contain); None when neither is set"""
+    src_w, src_h = source_size
+    if width and height:
+        return min(width / src_w, height / src_h)
+    if width:
+        return width / src_w
+    if height:
+        return height / src_h
+    return None
+
+
+class ImageOptimizer:
+    def __init__(self, project_root: str, output_dir: str, image_dirs: List[str],
+                 webp_quality: int = 90, webp_lossless: bool = False, densities: Tuple[float, ...] = (2.0, 3.0)):
+        self.project_root = Path(project_root)
+        self.output_dir = Path(output_dir)
+        self.image_dirs = [self.project_root / d for d in image_dirs]
+        self.webp_quality = webp_quality
+        self.webp_lossless = webp_lossless
+        self.densities = densities
+        self.cache_path = self.output_dir / '.image_cache.json'
+        self.cache: Dict[str, Dict] = {}
+        self.display_sizes: Dict[str, Dict] = {}
+        self.results: List[Dict] = []
+
+    def load_cache(self):
+        if self.cache_path.exists():
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.cache = data.get('entries', {})
+
+    def save_cache(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': self.cache}, f, indent=2)
+
+    def scan_display_sizes(self):
+        """Largest width/height (logical) and cacheWidth/cacheHeight (physical) per asset, from call sites"""
+        for file_path in find_dart_files(self.project_root):
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                print(f"Error reading {file_path}: {e}")
+                continue
+            if 'asset' not in content.lower():
+                continue
+
+            masked, strings = scan_dart(content)
+            by_start = {s.start: s for s in strings}
+            for match in ASSET_CALL.finditer(masked):
+                i = match.end()
+                while i < len(masked) and masked[i].isspace():
+                    i += 1
+                literal = by_start.get(i)
+                if literal is None or literal.interpolated:
+                    continue
+
+                end = matching_paren(masked, match.end() - 1)
+
+                entry = self.display_sizes.setdefault(literal.text, {
+                    'width': 0.0, 'height': 0.0, 'cache_width': 0.0, 'cache_height': 0.0, 'unsized': False, 'sites': [],
+                })
+                entry['sites'].append(f"{file_path.relative_to(self.project_root)}:{content.count(chr(10), 0, match.start()) + 1}")
+                sizes = SIZE_ARG.findall(masked[literal.end:end])
+                if not sizes:
+                    # Sized by its parent or a variable: any resolution may be needed
+                    entry['unsized'] = True
+                for name, value in sizes:
+                    key = {'cacheWidth': 'cache_width', 'cacheHeight': 'cache_height'}.get(name, name)
+                    entry[key] = max(entry[key], float(value))
+
+    def find_images(self) -> List[Path]:
+        images = []
+        for image_dir in self.image_dirs:
+            if image_dir.exists():
+                images.extend(
+                    p for p in image_dir.rglob('*')
+                    if p.suffix.lower() in IMAGE_SUFFIXES and not re.match(r'^\d+(\.\d+)?x$', p.parent.name)
+                )
+        return sorted(images)
+
+    def target_size(self, relative: str, source_size: Tuple[int, int],
+                    density: float = 1.0) -> Optional[Tuple[int, int]]:
+        """Pixel size the asset needs on a device of this density, preserving the aspect ratio"""
+        display = self.display_sizes.get(relative)
+        if not display or display['unsized']:
+            return None
+        # width/height scale with the device pixel ratio; cacheWidth/cacheHeight are already physical
+        scales = []
+        logical = fit_scale(display['width'], display['height'], source_size)
+        if logical:
+            scales.append(logical * density)
+        physical = fit_scale(display['cache_width'], display['cache_height'], source_size)
+        if physical:
+            scales.append(physical)
+        if not scales:
+            return None
+        scale = max(scales)
+        return max(1, round(source_size[0] * scale)), max(1, round(source_size[1] * scale))
+
+    def encode_png(self, image) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
+
+    def encode_webp(self, image) -> bytes:
+        buffer = io.BytesIO()
+        if self.webp_lossless:
+            image.save(buffer, format='WEBP', lossless=True, method=6)
+        else:
+            image.save(buffer, format='WEBP', quality=self.webp_quality, method=6)
+        return buffer.getvalue()
+
+    def write(self, relative_out: Path, data: bytes) -> Dict:
+        out_path = self.output_dir / relative_out
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(data)
+        return {'file': str(relative_out), 'bytes': len(data), 'sha256': file_hash(data)}
+
+    def outputs_intact(self, outputs: List[Dict]) -> bool:
+        for output in outputs:
+            path = self.output_dir / output['file']
+            if not path.exists() or path.stat().st_size != output['bytes']:
+                return False
+        return True
+
+    def optimize(self, image_path: Path) -> Dict:
+        from PIL import Image
+
+        source = image_path.read_bytes()
+        relative = str(image_path.relative_to(self.project_root))
+        display = self.display_sizes.get(relative)
+        params = json.dumps([self.webp_quality, self.webp_lossless, self.densities,
+                             display and (display['width'], display['height'], display['cache_width'],
+                                          display['cache_height'], display['unsized'])])
+        cache_key = file_hash(source + params.encode('utf-8'))
+
+        cached = self.cache.get(relative)
+        if cached and cached['key'] == cache_key and self.outputs_intact(cached['outputs']):
+            return dict(cached['result'], cached=True)
+
+        result = {'image': relative, 'original_bytes': len(source), 'cached': False}
+        outputs = []
+        if not source:
+            result['skipped'] = 'empty file'
+            return result
+
+        with Image.open(io.BytesIO(source)) as opened:
+            image = opened.convert('RGBA') if opened.mode in ('P', 'LA') else opened.copy()
+        result['source_size'] = list(image.size)
+
+        rel_path = Path(relative)
+        target = self.target_size(relative, image.size)
+        result['display_size'] = list(target) if target else None
+
+        # 1.0x: resized only when a call site pins the size, otherwise full resolution
+        base = image.resize(target, Image.LANCZOS) if target and target[0] < image.size[0] else image
+        png = self.encode_png(base) if image_path.suffix.lower() == '.png' else None
+        if png is not None and (target or len(png) < len(source)):
+            outputs.append(self.write(rel_path, png))
+        else:
+            outputs.append(self.write(rel_path, source))
+        outputs.append(self.write(rel_path.with_suffix('.webp'), self.encode_webp(base)))
+
+        # Density variants only matter for a logical size; a cacheWidth alone decodes the same everywhere
+        if target and (display['width'] or display['height']):
+            for density in self.densities:
+                size = self.target_size(relative, image.size, density)
+                if size[0] > image.size[0]:
+                    size = image.size  # never upscale; the source is the best we have
+                variant = image.resize(size, Image.LANCZOS) if size != image.size else image
+                variant_dir = rel_path.parent / f"{density:.1f}x"
+                data = self.encode_png(variant) if png is not None else None
+                if data is None:
+                    buffer = io.BytesIO()
+                    variant.convert('RGB').save(buffer, format='JPEG', quality=90, optimize=True)
+                    data = buffer.getvalue()
+                outputs.append(self.write(variant_dir / rel_path.name, data))
+                outputs.append(self.write((variant_dir / rel_path.name).with_suffix('.webp'), self.encode_webp(variant)))
+
+        result['outputs'] = outputs
+        result['optimized_bytes'] = outputs[0]['bytes']
+        result['webp_bytes'] = outputs[1]['bytes']
+        self.cache[relative] = {'key': cache_key, 'outputs': outputs, 'result': result}
+        return result
+
+    def run(self):
+        self.load_cache()
+        self.scan_display_sizes()
+        images = self.find_images()
+        print(f"Optimizing {len(images)} images ({len(self.display_sizes)} assets referenced from Dart)")
+        for image_path in images:
+            try:
+                result = self.optimize(image_path)
+            except Exception as e:
+                print(f"  ✗ {image_path.name}: {e}")
+                continue
+            self.results.append(result)
+            if result.get('skipped'):
+                print(f"  - {result['image']}: {result['skipped']}")
+            elif result['cached']:
+                print(f"  = {result['image']}: cached")
+            else:
+                print(f"  ✓ {result['image']}: {result['original_bytes']:,} -> "
+                      f"png {result['optimized_bytes']:,} / webp {result['webp_bytes']:,} bytes")
+        self.save_cache()
+
+    def save_json_output(self, output_path: str):
+        done = [r for r in self.results if not r.get('skipped')]
+        output_data = {
+            'metadata': {
+                'images': len(self.results),
+                'cached': sum(1 for r in done if r['cached']),
+                'original_bytes': sum(r['original_bytes'] for r in done),
+                'optimized_png_bytes': sum(r['optimized_bytes'] for r in done),
+                'webp_bytes': sum(r['webp_bytes'] for r in done),
+            },
+            'display_sizes': self.display_sizes,
+            'images': self.results,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Optimize image assets and build resolution-aware variants')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--dirs', nargs='*', default=['assets/images'], help='Image directories to process')
+    parser.add_argument('--output', default='build/images_optimized', help='Output directory (mirrors asset paths)')
+    parser.add_argument('--json', default='image_optimization_report.json', help='Output JSON report')
+    parser.add_argument('--webp-quality', type=int, default=90, help='Lossy WebP quality')
+    parser.add_argument('--webp-lossless', action='store_true', help='Encode WebP losslessly')
+
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow is required: pip install pillow")
+        raise SystemExit(1)
+
+    output_dir = Path(args.output)
+    if not output_dir.is_absolute():
+        output_dir = Path(args.root) / output_dir
+
+    optimizer = ImageOptimizer(args.root, str(output_dir), args.dirs, args.webp_quality, args.webp_lossless)
+    optimizer.run()
+    optimizer.save_json_output(args.json)
+
+    done = [r for r in optimizer.results if not r.get('skipped')]
+    original = sum(r['original_bytes'] for r in done)
+    print("\n✅ Optimization complete!")
+    print(f"📦 PNG/JPEG: {original:,} -> {sum(r['optimized_bytes'] for r in done):,} bytes")
+    print(f"📦 WebP:     {original:,} -> {sum(r['webp_bytes'] for r in done):,} bytes")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+ArtBeat setState Hotspot Profiler
+Maps every setState call to its State class, estimates the subtree each
+call rebuilds (widget constructors in build and the _build helpers it
+calls) and weights it by how often the call can fire: animation ticks,
+scroll listeners, Timer.periodic, stream events or user events. The
+ranked report shows where ValueListenableBuilder/AnimatedBuilder or a
+widget split would pay off first.
+"""
+
+import re
+import json
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dart_source import class_members, find_classes, find_dart_files, line_number, matching_paren, scan_dart
+
+SET_STATE = re.compile(r"(?<![\w.])setState\s*\(")
+WIDGET_CALL = re.compile(r"(?<![\w.])(const\s+)?([A-Z]\w*)(?:\.\w+)?\s*(?:<[^()]*?>)?\s*\(")
+MEMBER_CALL = re.compile(r"(?<![\w.])(_?[a-z]\w*)\b(?!\s*:)")
+STATE_CLASS = re.compile(r"\bextends\s+(?:\w+)?State\s*<")
+
+# Constructors that are values, not widgets
+NON_WIDGETS = {
+    'EdgeInsets', 'EdgeInsetsDirectional', 'BorderRadius', 'Radius', 'Border', 'BorderSide', 'BoxDecoration',
+    'BoxShadow', 'BoxConstraints', 'TextStyle', 'Color', 'Colors', 'Duration', 'Offset', 'Size', 'Rect',
+    'LinearGradient', 'RadialGradient', 'Alignment', 'AlignmentDirectional', 'Matrix4', 'RoundedRectangleBorder',
+    'CircleBorder', 'StadiumBorder', 'OutlineInputBorder', 'UnderlineInputBorder', 'InputDecoration',
+    'ShapeDecoration', 'DecorationImage', 'NetworkImage', 'AssetImage', 'FileImage', 'ImageFilter',
+    'TextEditingController', 'ScrollController', 'FocusNode', 'GlobalKey', 'ValueKey', 'Key', 'ObjectKey',
+    'DateTime', 'Uri', 'List', 'Map', 'Set', 'String', 'Future', 'Stream', 'Exception', 'FormatException',
+    'MaterialPageRoute', 'PageRouteBuilder', 'RouteSettings', 'Tween', 'CurvedAnimation', 'Interval',
+    'ButtonStyle', 'ElevatedButton.styleFrom', 'TextButton.styleFrom', 'ThemeData', 'IconThemeData',
+    'Shadow', 'FontWeight', 'TextSpan', 'LatLng', 'Paint', 'Path', 'Icons', 'Theme', 'MediaQuery',
+    'Navigator', 'ScaffoldMessenger', 'Provider', 'Timer', 'AppLogger', 'Future.delayed',
+}
+
+# Worst-case calls per second for each trigger
+TRIGGER_RATES = {
+    'animation_tick': 60.0,
+    'scroll_listener': 30.0,
+    'listener': 10.0,
+    'stream': 5.0,
+    'timer_periodic': 1.0,      # refined from the Duration passed to Timer.periodic
+    'event': 1.0,
+}
+
+
+def timer_rate(args: str) -> float:
+    """Calls per second of Timer.periodic(Duration(...), ...)"""
+    units = {'microseconds': 1e-6, 'milliseconds': 1e-3, 'seconds': 1.0, 'minutes': 60.0, 'hours': 3600.0}
+    period = sum(float(value) * units[unit]
+                 for unit, value in re.findall(r"\b(\w+)\s*:\s*(\d+(?:\.\d+)?)", args.split(')')[0]) if unit in units)
+    return 1.0 / period if period else TRIGGER_RATES['timer_periodic']
+
+
+class SetStateProfiler:
+    def __init__(self, root_path: str):
+        self.root_path = Path(root_path)
+        self.sites: List[Dict] = []
+        self.dart_files: List[Path] = []
+        self.animation_controllers = 0
+        self.unattributed = 0
+
+    def widget_count(self, masked: str, start: int, end: int) -> Tuple[int, int]:
+        """(non-const, const) widget constructor calls in masked[start:end]"""
+        dynamic = constant = 0
+        const_until = -1
+        for match in WIDGET_CALL.finditer(masked, start, end):
+            name = match.group(2)
+            if name in NON_WIDGETS or match.group(0).split('(')[0].strip() in NON_WIDGETS:
+                continue
+            if match.start() < const_until:
+                constant += 1
+            elif match.group(1):
+                constant += 1
+                const_until = matching_paren(masked, match.end() - 1)
+            else:
+                dynamic += 1
+        return dynamic, constant
+
+    def rebuild_cost(self, masked: str, members: Dict, name: str, seen: Optional[set] = None) -> Tuple[int, int]:
+        """Widgets built by a member, following calls to other members (`_buildHeader()`)"""
+        seen = seen if seen is not None else set()
+        seen.add(name)
+        member = members[name]
+        dynamic, constant = self.widget_count(masked, member.start, member.end)
+        for match in MEMBER_CALL.finditer(masked, member.start, member.end):
+            callee = match.group(1)
+            if callee in members and callee not in seen and re.match(r"\s*\(", masked[match.end():]):
+                d, c = self.rebuild_cost(masked, members, callee, seen)
+                dynamic += d
+                constant += c
+        return dynamic, constant
+
+    def trigger_spans(self, masked: str, start: int, end: int, animations: set) -> List[Tuple[int, int, str, float]]:
+        """Argument spans whose callbacks fire repeatedly: (start, end, trigger, calls per second)"""
+        spans = []
+        for match in re.finditer(r"\bTimer\.periodic\s*\(", masked[:end]):
+            if match.start() >= start:
+                close = matching_paren(masked, match.end() - 1)
+                spans.append((match.end(), close, 'timer_periodic', timer_rate(masked[match.end():close])))
+        for match in re.finditer(r"(\w+)\s*(?:\?|!)?\s*\.\s*addListener\s*\(", masked[:end]):
+            if match.start() < start:
+                continue
+            receiver = match.group(1)
+            if 'scroll' in receiver.lower():
+                trigger = 'scroll_listener'
+            elif receiver in animations or 'animation' in receiver.lower():
+                trigger = 'animation_tick'
+            else:
+                trigger = 'listener'
+            close = matching_paren(masked, match.end() - 1)
+            spans.append((match.end(), close, trigger, TRIGGER_RATES[trigger]))
+        for pattern, trigger in [
+            (r"\b(?:createTicker|Ticker)\s*\(", 'animation_tick'),
+            (r"\bNotificationListener\s*<\s*\w*Scroll\w*\s*>\s*\(", 'scroll_listener'),
+            (r"\.\s*listen\s*\(", 'stream'),
+        ]:
+            for match in re.finditer(pattern, masked[:end]):
+                if match.start() >= start:
+                    close = matching_paren(masked, match.end() - 1)
+                    spans.append((match.end(), close, trigger, TRIGGER_RATES[trigger]))
+        return spans
+
+    def scan_file(self, file_path: Path):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return
+        if 'setState' not in content:
+            return
+
+        relative = str(file_path.relative_to(self.root_path))
+        masked, _ = scan_dart(content)
+        self.animation_controllers += len(re.findall(r"(?<![\w.])AnimationController\s*\(", masked))
+        attributed = set()
+
+        for class_name, clause, open_brace, close_brace in find_classes(masked):
+            if not STATE_CLASS.search(clause):
+                continue
+            members = {m.name: m for m in class_members(masked, open_brace, close_brace)}
+            if 'build' not in members:
+                continue
+            dynamic, constant = self.rebuild_cost(masked, members, 'build')
+            body = masked[open_brace:close_brace]
+            animations = set(re.findall(r"\b(?:AnimationController|Animation<[^>]*>)\??\s+(\w+)", body))
+
+            # Methods registered as callbacks (tear-offs or calls inside a trigger span)
+            spans = self.trigger_spans(masked, open_brace, close_brace, animations)
+            method_triggers: Dict[str, Tuple[str, float]] = {}
+            for start, end, trigger, rate in spans:
+                for match in MEMBER_CALL.finditer(masked, start, end):
+                    if match.group(1) in members and rate > method_triggers.get(match.group(1), ('', 0))[1]:
+                        method_triggers[match.group(1)] = (trigger, rate)
+            # Propagate to the members those callbacks call
+            pending = list(method_triggers)
+            while pending:
+                caller = pending.pop()
+                member = members[caller]
+                for match in MEMBER_CALL.finditer(masked, member.start, member.end):
+                    callee = match.group(1)
+                    if callee in members and callee not in method_triggers:
+                        method_triggers[callee] = method_triggers[caller]
+                        pending.append(callee)
+
+            for match in SET_STATE.finditer(masked, open_brace, close_brace):
+                attributed.add(match.start())
+                enclosing = next((m for m in members.values() if m.start <= match.start() <= m.end), None)
+                inside = [s for s in spans if s[0] <= match.start() <= s[1]]
+                if inside:
+                    _, _, trigger, rate = min(inside, key=lambda s: s[1] - s[0])
+                elif enclosing and enclosing.name in method_triggers:
+                    trigger, rate = method_triggers[enclosing.name]
+                else:
+                    trigger, rate = 'event', TRIGGER_RATES['event']
+                self.sites.append({
+                    'file': relative,
+                    'line': line_number(content, match.start()),
+                    'state_class': class_name,
+                    'method': enclosing.name if enclosing else None,
+                    'trigger': trigger,
+                    'calls_per_second': round(rate, 2),
+                    'rebuilt_widgets': dynamic,
+                    'const_widgets': constant,
+                    'cost': round(dynamic * rate, 1),
+                })
+
+        # setState from StatefulBuilder callbacks or State classes we could not parse
+        self.unattributed += sum(1 for m in SET_STATE.finditer(masked) if m.start() not in attributed)
+
+    def scan_all(self):
+        self.dart_files = find_dart_files(self.root_path)
+        print(f"Scanning {len(self.dart_files)} Dart files for setState calls")
+        for file_path in self.dart_files:
+            self.scan_file(file_path)
+        self.sites.sort(key=lambda s: -s['cost'])
+
+    def screens(self) -> List[Dict]:
+        by_file = defaultdict(lambda: {'sites': 0, 'cost': 0.0, 'hot_sites': 0, 'max_rebuilt_widgets': 0})
+        for site in self.sites:
+            row = by_file[site['file']]
+            row['sites'] += 1
+            row['cost'] += site['cost']
+            row['max_rebuilt_widgets'] = max(row['max_rebuilt_widgets'], site['rebuilt_widgets'])
+            if site['trigger'] != 'event':
+                row['hot_sites'] += 1
+        return sorted(({'file': f, **row, 'cost': round(row['cost'], 1)} for f, row in by_file.items()),
+                      key=lambda r: -r['cost'])
+
+    def save_json_output(self, output_path: str):
+        triggers = defaultdict(int)
+        for site in self.sites:
+            triggers[site['trigger']] += 1
+        output_data = {
+            'metadata': {
+                'total_files': len(self.dart_files),
+                'set_state_sites': len(self.sites),
+                'unattributed_sites': self.unattributed,
+                'animation_controllers': self.animation_controllers,
+                'by_trigger': dict(triggers),
+            },
+            'screens': self.screens(),
+            'sites': self.sites,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank setState calls by estimated rebuild cost')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--json', default='set_state_hotspots.json', help='Output JSON file')
+    parser.add_argument('--top', type=int, default=20, help='Hotspots to print')
+
+    args = parser.parse_args()
+
+    profiler = SetStateProfiler(args.root)
+    profiler.scan_all()
+    profiler.save_json_output(args.json)
+
+    print(f"\n{'='*60}")
+    print("SETSTATE HOTSPOTS")
+    print(f"{'='*60}")
+    print(f"setState sites in State classes: {len(profiler.sites)} ({profiler.unattributed} elsewhere)")
+    print(f"AnimationControllers: {profiler.animation_controllers}")
+    for trigger in TRIGGER_RATES:
+        count = sum(1 for s in profiler.sites if s['trigger'] == trigger)
+        if count:
+            print(f"  {trigger}: {count}")
+
+    print("\nMost expensive rebuild sites (widgets x calls/s):")
+    for site in profiler.sites[:args.top]:
+        print(f"  {site['cost']:>8,.0f}  {site['state_class']}.{site['method']} [{site['trigger']}] "
+              f"{site['rebuilt_widgets']} widgets  {site['file']}:{site['line']}")
+
+    print("\nScreens:")
+    for row in profiler.screens()[:args.top]:
+        print(f"  {row['cost']:>8,.0f}  {row['file']} ({row['hot_sites']} hot / {row['sites']} sites)")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Locale Pass Scheduler
+Runs the translation passes from a manifest, one worker process per locale.
+Each pass touches exactly one catalog, so locales run concurrently while the
+passes of a locale run in dependency order (explicit "after" entries, then
+natural file order: mega_2 before mega_10).
+
+A worker holds the advisory lock for its catalog for the whole
+load -> passes -> save cycle, so two runs (or a hand-run pass using
+catalog_lock) cannot interleave writes to the same file.
+
+Manifest entries (JSON list):
+    {"name": "ar_mega_5", "locale": "ar",
+     "table": "scripts/translate_arabic_mega_5.py:AR_MEGA_TRANSLATIONS_5",
+     "statuses": ["bracket"], "after": ["ar_mega_4"]}
+    {"name": "de_final", "locale": "de", "command": ["python3", "scripts/x.py"]}
+
+Without --manifest, one table pass per dictionary in the compiled bundle.
+"""
+
+import json
+import time
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from catalog import BRACKET, MISSING, PREFIX, Catalog, catalog_lock
+from translation_bundle import load_bundle, natural_key
+
+DEFAULT_STATUSES = [BRACKET, PREFIX, MISSING]
+
+
+class ManifestError(ValueError):
+    pass
+
+
+def bundle_manifest(project_root: str) -> List[Dict]:
+    """One table pass per dictionary the bundle found, in source order"""
+    bundle = load_bundle(project_root)
+    passes = []
+    for source, info in bundle.sources.items():
+        if not info['language']:
+            continue
+        for name in info['dictionaries']:
+            passes.append({
+                'name': f"{Path(source).stem}:{name}",
+                'locale': info['language'],
+                'table': f"{source}:{name}",
+            })
+    return passes
+
+
+def load_manifest(path: str) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        passes = json.load(f)
+    names = set()
+    for entry in passes:
+        if 'name' not in entry or 'locale' not in entry:
+            raise ManifestError(f"pass without name/locale: {entry}")
+        if ('table' in entry) == ('command' in entry):
+            raise ManifestError(f"{entry['name']}: give exactly one of 'table' or 'command'")
+        if entry['name'] in names:
+            raise ManifestError(f"duplicate pass name {entry['name']}")
+        names.add(entry['name'])
+    return passes
+
+
+def locale_order(passes: List[Dict]) -> List[Dict]:
+    """Topological order of one locale's passes; ties broken by natural name order"""
+    by_name = {p['name']: p for p in passes}
+    waiting = {p['name']: {d for d in p.get('after', []) if d in by_name} for p in passes}
+    for p in passes:
+        unknown = set(p.get('after', [])) - set(by_name)
+        if unknown:
+            raise ManifestError(f"{p['name']} runs after unknown or other-locale passes: {sorted(unknown)}")
+
+    ordered = []
+    ready = sorted((n for n, deps in waiting.items() if not deps), key=lambda n: natural_key(Path(n)))
+    while ready:
+        name = ready.pop(0)
+        ordered.append(by_name[name])
+        for other, deps in waiting.items():
+            if name in deps:
+                deps.discard(name)
+                if not deps:
+                    ready.append(other)
+        ready.sort(key=lambda n: natural_key(Path(n)))
+        waiting.pop(name)
+    if waiting:
+        raise ManifestError(f"dependency cycle between {sorted(waiting)}")
+    return ordered
+
+
+def run_locale(project_root: str, lang: str, passes: List[Dict], tables: Dict[str, Dict[str, str]],
+               write: bool) -> Dict:
+    """Worker: apply one locale's passes in order while holding its catalog lock.
+    tables maps each table pass's "source:NAME" to its dictionary, loaded once by the parent."""
+    root = Path(project_root)
+    assets_dir = root / 'assets' / 'translations'
+    results = []
+    start = time.perf_counter()
+    with catalog_lock(root, lang):
+        waited = time.perf_counter() - start
+        catalog: Optional[Catalog] = None
+        for entry in passes:
+            pass_start = time.perf_counter()
+            if 'command' in entry:
+                if not write:
+                    results.append({'name': entry['name'], 'skipped': 'dry run', 'seconds': 0.0})
+                    continue
+                # The command edits the file itself: flush ours first, reload after
+                if catalog is not None:
+                    catalog.save()
+                    catalog = None
+                completed = subprocess.run(entry['command'], cwd=root, capture_output=True, text=True)
+                results.append({
+                    'name': entry['name'],
+                    'returncode': completed.returncode,
+                    'seconds': round(time.perf_counter() - pass_start, 4),
+                })
+                if completed.returncode != 0:
+                    results[-1]['stderr'] = completed.stderr[-2000:]
+                    break
+                continue
+
+            if catalog is None:
+                catalog = Catalog.load(assets_dir, ['en', lang])
+            mask = catalog.mask(lang, *entry.get('statuses', DEFAULT_STATUSES))
+            applied = catalog.apply_mapping(lang, tables[entry['table']], mask)
+            results.append({
+                'name': entry['name'],
+                'pending': len(mask),
+                'applied': applied,
+                'seconds': round(time.perf_counter() - pass_start, 4),
+            })
+
+        if write and catalog is not None:
+            catalog.save()
+    return {
+        'locale': lang,
+        'passes': results,
+        'lock_wait_seconds': round(waited, 4),
+        'seconds': round(time.perf_counter() - start, 4),
+        'failed': any(r.get('returncode', 0) != 0 for r in results),
+    }
+
+
+class LocalePassScheduler:
+    def __init__(self, project_root: str, passes: List[Dict], workers: Optional[int] = None):
+        self.project_root = Path(project_root)
+        self.workers = workers
+        by_locale: Dict[str, List[Dict]] = {}
+        for entry in passes:
+            by_locale.setdefault(entry['locale'], []).append(entry)
+        self.plan = {lang: locale_order(entries) for lang, entries in sorted(by_locale.items())}
+        self.results: Dict[str, Dict] = {}
+        self.wall_seconds = 0.0
+
+    def run(self, write: bool = False, locales: Optional[List[str]] = None) -> Dict[str, Dict]:
+        plan = {lang: passes for lang, passes in self.plan.items() if not locales or lang in locales}
+        start = time.perf_counter()
+        # Load (and if stale, rebuild) the bundle once here: workers rebuilding it
+        # concurrently would race on the bundle file
+        needed = {entry['table'] for passes in plan.values() for entry in passes if 'table' in entry}
+        bundle = load_bundle(str(self.project_root)) if needed else None
+        unknown = needed - set(bundle.tables) if bundle else set()
+        if unknown:
+            raise ManifestError(f"tables not in the dictionary bundle: {sorted(unknown)}")
+        with ProcessPoolExecutor(max_workers=self.workers or len(plan) or 1) as pool:
+            futures = {
+                pool.submit(run_locale, str(self.project_root), lang, passes,
+                            {e['table']: bundle.tables[e['table']] for e in passes if 'table' in e}, write): lang
+                for lang, passes in plan.items()
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                self.results[result['locale']] = result
+                applied = sum(p.get('applied', 0) for p in result['passes'])
+                status = '✗' if result['failed'] else '✓'
+                print(f"  {status} {result['locale']}: {len(result['passes'])} passes, "
+                      f"{applied} cells, {result['seconds']:.2f}s")
+        self.wall_seconds = time.perf_counter() - start
+        return self.results
+
+    def save_json_output(self, output_path: str):
+        serial = sum(r['seconds'] for r in self.results.values())
+        output_data = {
+            'metadata': {
+                'locales': len(self.results),
+                'passes': sum(len(r['passes']) for r in self.results.values()),
+                'wall_seconds': round(self.wall_seconds, 4),
+                'sum_of_locale_seconds': round(serial, 4),
+                'slowest_locale_seconds': max((r['seconds'] for r in self.results.values()), default=0),
+            },
+            'plan': {lang: [p['name'] for p in passes] for lang, passes in self.plan.items()},
+            'locales': self.results,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run per-locale translation passes concurrently')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--manifest', help='Pass manifest (default: every dictionary in the bundle)')
+    parser.add_argument('--locales', nargs='*', help='Only run these locales')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: one per locale)')
+    parser.add_argument('--write', action='store_true', help='Save catalogs and run command passes')
+    parser.add_argument('--plan', action='store_true', help='Print the per-locale order and exit')
+    parser.add_argument('--json', default='locale_passes_report.json', help='Output JSON file')
+
+    args = parser.parse_args()
+
+    passes = load_manifest(args.manifest) if args.manifest else bundle_manifest(args.root)
+    scheduler = LocalePassScheduler(args.root, passes, args.workers)
+
+    if args.plan:
+        for lang, ordered in scheduler.plan.items():
+            print(f"{lang}: {' -> '.join(p['name'] for p in ordered)}")
+        return
+
+    print(f"\n{'='*60}")
+    print("LOCALE PASSES")
+    print(f"{'='*60}")
+    scheduler.run(args.write, args.locales)
+    scheduler.save_json_output(args.json)
+
+    serial = sum(r['seconds'] for r in scheduler.results.values())
+    slowest = max((r['seconds'] for r in scheduler.results.values()), default=0)
+    print(f"{'='*60}")
+    print(f"Wall time: {scheduler.wall_seconds:.2f}s  (slowest locale {slowest:.2f}s, sequential {serial:.2f}s)")
+    if not args.write:
+        print("Dry run; pass --write to save catalogs and run command passes")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
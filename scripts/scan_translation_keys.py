@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Translation Key Usage Scanner
+Collects every 'key'.tr() / tr('key') reference across packages/ and lib/,
+diffs them against the locale catalogs and optionally emits pruned catalogs.
+"""
+
+import re
+import json
+import bisect
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from dart_source import DartString, find_dart_files, line_number, scan_dart
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+
+# Run on the masked source, so these never match inside strings or comments
+METHOD_CALL = re.compile(r"\.\s*(tr|plural)\s*\(")
+FUNCTION_CALL = re.compile(r"(?<![\w.$])(tr|plural)\s*\(")
+KEY_SHAPE = re.compile(r"^[a-z][a-z0-9_.]*$")
+# LocaleKeys.settings_title, or prefixed: core.LocaleKeys.settings_title
+LOCALE_KEYS_REFERENCE = re.compile(r"^(?:\w+\.)?LocaleKeys\.(\w+)$")
+
+
+class TranslationKeyScanner:
+    def __init__(self, root_path: str):
+        self.root_path = Path(root_path)
+        self.assets_dir = self.root_path / "assets" / "translations"
+        self.dart_files: List[Path] = []
+        self.static_refs: Dict[str, List[Dict]] = {}
+        self.dynamic_refs: List[Dict] = []
+        self.literal_mentions: Set[str] = set()
+        self.catalogs: Dict[str, Dict] = {}
+        self.locale_keys: Dict[str, str] = {}    # LocaleKeys identifier -> key
+
+    def load_catalogs(self):
+        for lang in LANGUAGES:
+            file_path = self.assets_dir / f"{lang}.json"
+            if file_path.exists():
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    self.catalogs[lang] = json.load(f)
+
+    def add_static(self, key: str, file_path: str, line: int):
+        self.static_refs.setdefault(key, []).append({'file': file_path, 'line': line})
+
+    def add_dynamic(self, file_path: str, line: int, expression: str, prefix: str = ''):
+        self.dynamic_refs.append({
+            'file': file_path,
+            'line': line,
+            'expression': ' '.join(expression.split())[:120],
+            'prefix': prefix,
+        })
+
+    def locale_key(self, expression: str) -> Optional[str]:
+        """Key behind a generated LocaleKeys.<identifier> constant"""
+        match = LOCALE_KEYS_REFERENCE.match(''.join(expression.split()))
+        return self.locale_keys.get(match.group(1)) if match else None
+
+    def resolve_receiver(self, content: str, masked: str, literal_at_end: Dict[int, DartString], dot: int):
+        """Work out what a `.tr(` call is applied to; returns (literal, expression_start)"""
+        i = dot - 1
+        while i >= 0 and masked[i].isspace():
+            i -= 1
+        if i >= 0 and i + 1 in literal_at_end:
+            literal = literal_at_end[i + 1]
+            return literal, literal.start
+
+        if i >= 0 and masked[i] == ')':
+            # Text('key').tr() on the widget, or ('prefix_' + x).tr()
+            depth = 0
+            j = i
+            while j >= 0:
+                if masked[j] == ')':
+                    depth += 1
+                elif masked[j] == '(':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j -= 1
+            k = j - 1
+            while k >= 0 and (masked[k].isalnum() or masked[k] in '_.'):
+                k -= 1
+            callee = masked[k + 1:j]
+            return callee, max(k + 1, 0) if callee else max(j, 0)
+
+        k = i
+        while k >= 0:
+            if masked[k] == ']':
+                # lang['nameKey']!.tr(): skip the (blanked) index expression
+                k = masked.rfind('[', 0, k) - 1
+            elif masked[k].isalnum() or masked[k] in '_.$!?':
+                k -= 1
+            else:
+                break
+        return None, k + 1
+
+    def first_argument(self, masked: str, literal_at_start: Dict[int, DartString], open_paren: int):
+        i = open_paren + 1
+        while i < len(masked) and masked[i].isspace():
+            i += 1
+        return literal_at_start.get(i)
+
+    def scan_file(self, file_path: Path):
+        """Collect static and dynamic key references from a single Dart file"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return
+
+        relative_path = str(file_path.relative_to(self.root_path))
+        # Interpolation code stays visible: '${'key'.tr()}' is a static call site
+        masked, strings = scan_dart(content, interpolations=True)
+        literal_at_end = {s.end: s for s in strings}
+        literal_at_start = {s.start: s for s in strings}
+        starts = [s.start for s in strings]
+
+        # Generated code (LocaleKeys, json_serializable) mentions every key by construction
+        if not file_path.name.endswith('.g.dart'):
+            for s in strings:
+                if not s.interpolated and KEY_SHAPE.match(s.text):
+                    self.literal_mentions.add(s.text)
+
+        for match in METHOD_CALL.finditer(masked):
+            line = line_number(content, match.start())
+            receiver, expr_start = self.resolve_receiver(content, masked, literal_at_end, match.start())
+            if isinstance(receiver, DartString):
+                if receiver.interpolated:
+                    self.add_dynamic(relative_path, line, content[receiver.start:match.start()], receiver.prefix)
+                else:
+                    self.add_static(receiver.text, relative_path, line)
+                continue
+
+            if receiver:
+                # Widget extension form: Text('key').tr()
+                open_paren = masked.find('(', expr_start)
+                literal = self.first_argument(masked, literal_at_start, open_paren)
+                if receiver.split('.')[-1] == 'Text' and literal and not literal.interpolated:
+                    self.add_static(literal.text, relative_path, line)
+                    continue
+
+            # LocaleKeys.settings_title.tr(): a generated constant, so still a static key
+            key = self.locale_key(masked[expr_start:match.start()])
+            if key is not None:
+                self.add_static(key, relative_path, line)
+                continue
+
+            expression = content[expr_start:match.start()]
+            # ('prefix_' + value).tr(): the leading literal bounds the key space
+            index = bisect.bisect_left(starts, expr_start)
+            prefix = ''
+            if index < len(strings) and strings[index].end <= match.start() and '+' in masked[expr_start:match.start()]:
+                prefix = strings[index].prefix
+            self.add_dynamic(relative_path, line, expression, prefix)
+
+        for match in FUNCTION_CALL.finditer(masked):
+            line = line_number(content, match.start())
+            literal = self.first_argument(masked, literal_at_start, match.end() - 1)
+            if literal is None:
+                close = masked.find(')', match.end())
+                key = self.locale_key(masked[match.end():close].split(',')[0])
+                if key is not None:
+                    self.add_static(key, relative_path, line)
+                else:
+                    self.add_dynamic(relative_path, line, content[match.start():close + 1])
+            elif literal.interpolated:
+                self.add_dynamic(relative_path, line, content[match.start():literal.end], literal.prefix)
+            else:
+                self.add_static(literal.text, relative_path, line)
+
+    def scan_all(self):
+        from generate_locale_keys import LocaleKeyGenerator
+
+        self.load_catalogs()
+        self.locale_keys = LocaleKeyGenerator(str(self.root_path)).read_generated()
+        self.dart_files = find_dart_files(self.root_path)
+        print(f"Scanning {len(self.dart_files)} Dart files for translation keys")
+        for file_path in self.dart_files:
+            self.scan_file(file_path)
+
+    def dynamic_prefixes(self) -> List[str]:
+        return sorted({ref['prefix'] for ref in self.dynamic_refs if ref['prefix']})
+
+    def classify_keys(self) -> Dict[str, Set[str]]:
+        """Split catalog keys into used, possibly-used (dynamic/indirect) and unused"""
+        defined = set()
+        for catalog in self.catalogs.values():
+            defined.update(catalog.keys())
+
+        prefixes = tuple(self.dynamic_prefixes())
+        used = {key for key in defined if key in self.static_refs}
+        maybe = {
+            key for key in defined - used
+            if key in self.literal_mentions or (prefixes and key.startswith(prefixes))
+        }
+        return {
+            'defined': defined,
+            'used': used,
+            'maybe_used': maybe,
+            'unused': defined - used - maybe,
+            'undefined': set(self.static_refs) - defined,
+        }
+
+    def catalog_size(self, catalog: Dict) -> int:
+        return len(json.dumps(catalog, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    def write_pruned_catalogs(self, output_dir: str, unused: Set[str]) -> Dict[str, Dict[str, int]]:
+        """Write catalogs without unused keys, preserving key order"""
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        sizes = {}
+        for lang, catalog in self.catalogs.items():
+            pruned = {k: v for k, v in catalog.items() if k not in unused}
+            with open(out / f"{lang}.json", 'w', encoding='utf-8') as f:
+                json.dump(pruned, f, ensure_ascii=False, indent=2)
+            sizes[lang] = {'before': self.catalog_size(catalog), 'after': self.catalog_size(pruned)}
+            print(f"✓ Wrote pruned {lang}.json ({len(catalog) - len(pruned)} keys removed)")
+        return sizes
+
+    def save_json_output(self, output_path: str, classes: Dict[str, Set[str]], sizes: Dict = None):
+        missing_by_locale = {
+            lang: sorted(classes['used'] - set(catalog.keys()))
+            for lang, catalog in self.catalogs.items()
+        }
+        output_data = {
+            'metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'total_files': len(self.dart_files),
+                'static_references': sum(len(refs) for refs in self.static_refs.values()),
+                'dynamic_references': len(self.dynamic_refs),
+                'defined_keys': len(classes['defined']),
+                'used_keys': len(classes['used']),
+                'maybe_used_keys': len(classes['maybe_used']),
+                'unused_keys': len(classes['unused']),
+                'undefined_keys': len(classes['undefined']),
+            },
+            'undefined_keys': {k: self.static_refs[k] for k in sorted(classes['undefined'])},
+            'missing_by_locale': missing_by_locale,
+            'unused_keys': sorted(classes['unused']),
+            'maybe_used_keys': sorted(classes['maybe_used']),
+            'dynamic_references': self.dynamic_refs,
+            'dynamic_prefixes': self.dynamic_prefixes(),
+        }
+        if sizes:
+            output_data['pruned_sizes'] = sizes
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find used, unused and undefined translation keys')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--json', default='translation_key_usage.json', help='Output JSON file')
+    parser.add_argument('--prune-to', help='Directory to write pruned catalogs into')
+
+    args = parser.parse_args()
+
+    scanner = TranslationKeyScanner(args.root)
+    scanner.scan_all()
+    classes = scanner.classify_keys()
+
+    sizes = None
+    if args.prune_to:
+        sizes = scanner.write_pruned_catalogs(args.prune_to, classes['unused'])
+
+    scanner.save_json_output(args.json, classes, sizes)
+
+    print(f"\n{'='*60}")
+    print("TRANSLATION KEY USAGE")
+    print(f"{'='*60}")
+    print(f"Defined keys:        {len(classes['defined'])}")
+    print(f"Used (static):       {len(classes['used'])}")
+    print(f"Maybe used:          {len(classes['maybe_used'])} (dynamic prefix or indirect literal)")
+    print(f"Unused:              {len(classes['unused'])}")
+    print(f"Undefined in catalog: {len(classes['undefined'])}")
+    print(f"Dynamic call sites:  {len(scanner.dynamic_refs)}")
+    if sizes:
+        before = sum(s['before'] for s in sizes.values())
+        after = sum(s['after'] for s in sizes.values())
+        print(f"Catalog bytes:       {before:,} -> {after:,} ({before - after:,} saved)")
+    print(f"{'='*60}")
+    print(f"📊 Data saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
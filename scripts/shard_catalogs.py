@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Translation Catalog Sharder
+Splits each assets/translations/<lang>.json into per-package shards plus a
+lazy-load manifest, verifies the shards reassemble to the original and
+reports how much JSON the first screen has to parse.
+
+A loader finds a key's shard in the manifest: key_shards first (explicit
+assignments, written for --by-usage keys that the prefix rule would place
+elsewhere), then the first entry of prefix_shards whose prefix the key
+starts with (longest prefix first, so art_walk_ wins over art_), then
+fallback_shard.
+"""
+
+import json
+import hashlib
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+
+# Key prefixes that belong to a package but do not carry its name
+NAMESPACE_ALIASES = {
+    'event': 'events',
+    'common': 'core',
+    'error': 'core',
+    'app': 'core',
+    'splash': 'core',
+    'drawer': 'core',
+    'dashboard': 'core',
+}
+
+# Keys whose prefix names no package; not 'common', since common_ keys go to core
+FALLBACK_SHARD = 'misc'
+
+
+def package_namespaces(project_root: Path) -> List[str]:
+    """Package namespaces, longest first so art_walk_ wins over artist_/art_"""
+    packages_dir = Path(project_root) / 'packages'
+    names = [
+        p.name.replace('artbeat_', '')
+        for p in packages_dir.iterdir()
+        if p.is_dir() and p.name.startswith('artbeat_')
+    ] if packages_dir.exists() else []
+    return sorted(names, key=len, reverse=True)
+
+
+def prefix_shards(namespaces: List[str]) -> List[Tuple[str, str]]:
+    """(key prefix, shard) for packages and aliases, longest prefix first"""
+    rules = {f"{name}_": name for name in namespaces}
+    for alias, shard in NAMESPACE_ALIASES.items():
+        rules.setdefault(f"{alias}_", shard)
+    return sorted(rules.items(), key=lambda rule: (-len(rule[0]), rule[0]))
+
+
+def key_namespace(key: str, namespaces: List[str]) -> str:
+    """Namespace a generate_key()-style key belongs to: the longest matching prefix"""
+    for prefix, shard in prefix_shards(namespaces):
+        if key.startswith(prefix):
+            return shard
+    return FALLBACK_SHARD
+
+
+def canonical_bytes(data: Dict) -> bytes:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def shard_bytes(data: Dict) -> bytes:
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class CatalogSharder:
+    def __init__(self, project_root: str, output_dir: str, by_usage: bool = False):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / "assets" / "translations"
+        self.output_dir = Path(output_dir)
+        self.namespaces = self.load_namespaces()
+        self.usage_namespaces: Dict[str, str] = self.load_usage_namespaces() if by_usage else {}
+        self.manifest: Dict = {'version': 1, 'locales': {}}
+        self.keys: set = set()
+
+    def load_namespaces(self) -> List[str]:
+        return package_namespaces(self.project_root)
+
+    def load_usage_namespaces(self) -> Dict[str, str]:
+        """Assign each key to the package that references it (core if several do)"""
+        from scan_translation_keys import TranslationKeyScanner
+
+        scanner = TranslationKeyScanner(str(self.project_root))
+        scanner.scan_all()
+        assigned = {}
+        for key, refs in scanner.static_refs.items():
+            packages = {
+                ref['file'].split('/')[1].replace('artbeat_', '') if ref['file'].startswith('packages/') else 'core'
+                for ref in refs
+            }
+            assigned[key] = packages.pop() if len(packages) == 1 else 'core'
+        return assigned
+
+    def namespace_for(self, key: str) -> str:
+        if key in self.usage_namespaces:
+            return self.usage_namespaces[key]
+        return key_namespace(key, self.namespaces)
+
+    def split(self, catalog: Dict) -> Dict[str, Dict]:
+        shards: Dict[str, Dict] = {}
+        for key, value in catalog.items():
+            shards.setdefault(self.namespace_for(key), {})[key] = value
+        return shards
+
+    def verify(self, original: Dict, shards: Dict[str, Dict]) -> bool:
+        """Shards must be disjoint and reassemble to exactly the original catalog"""
+        merged: Dict = {}
+        for shard in shards.values():
+            if merged.keys() & shard.keys():
+                return False
+            merged.update(shard)
+        return canonical_bytes(merged) == canonical_bytes(original)
+
+    def shard_locale(self, lang: str) -> Optional[Dict]:
+        file_path = self.assets_dir / f"{lang}.json"
+        if not file_path.exists():
+            return None
+        with open(file_path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+        self.keys.update(catalog)
+
+        shards = self.split(catalog)
+        if not self.verify(catalog, shards):
+            raise ValueError(f"{lang}.json shards do not reassemble to the original catalog")
+
+        locale_dir = self.output_dir / lang
+        locale_dir.mkdir(parents=True, exist_ok=True)
+        entries = {}
+        for name in sorted(shards):
+            data = dict(sorted(shards[name].items()))
+            payload = shard_bytes(data)
+            with open(locale_dir / f"{name}.json", 'wb') as f:
+                f.write(payload)
+            keys = list(data.keys())
+            entries[name] = {
+                'file': f"{lang}/{name}.json",
+                'keys': len(keys),
+                'first_key': keys[0],
+                'last_key': keys[-1],
+                'bytes': len(payload),
+                'sha256': hashlib.sha256(payload).hexdigest(),
+            }
+
+        return {
+            'source': f"assets/translations/{lang}.json",
+            'source_bytes': file_path.stat().st_size,
+            'source_sha256': hashlib.sha256(canonical_bytes(catalog)).hexdigest(),
+            'keys': len(catalog),
+            'shards': entries,
+        }
+
+    def shard_all(self, languages: List[str]):
+        for lang in languages:
+            entry = self.shard_locale(lang)
+            if entry is None:
+                print(f"  - {lang}.json not found, skipping")
+                continue
+            self.manifest['locales'][lang] = entry
+            print(f"  ✓ {lang}.json -> {len(entry['shards'])} shards (verified)")
+
+        self.manifest['prefix_shards'] = [list(rule) for rule in prefix_shards(self.namespaces)]
+        self.manifest['fallback_shard'] = FALLBACK_SHARD
+        # Usage assignments the prefix rule cannot reproduce
+        self.manifest['key_shards'] = {
+            key: self.usage_namespaces[key] for key in sorted(self.keys)
+            if key in self.usage_namespaces and self.usage_namespaces[key] != key_namespace(key, self.namespaces)
+        }
+        with open(self.output_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+
+    def first_screen_report(self, eager: List[str]) -> Dict:
+        """Bytes parsed at startup if only the eager shards load"""
+        report = {}
+        for lang, entry in self.manifest['locales'].items():
+            eager_bytes = sum(s['bytes'] for name, s in entry['shards'].items() if name in eager)
+            eager_keys = sum(s['keys'] for name, s in entry['shards'].items() if name in eager)
+            report[lang] = {
+                'monolithic_bytes': entry['source_bytes'],
+                'eager_bytes': eager_bytes,
+                'eager_keys': eager_keys,
+                'saved_pct': round(100 * (1 - eager_bytes / entry['source_bytes']), 1) if entry['source_bytes'] else 0.0,
+            }
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shard translation catalogs per package')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--output', default='build/translation_shards', help='Output directory for shards and manifest')
+    parser.add_argument('--locales', nargs='*', default=LANGUAGES, help='Locales to shard')
+    parser.add_argument('--eager', nargs='*', default=['core', 'auth'], help='Shards loaded at startup')
+    parser.add_argument('--by-usage', action='store_true',
+                        help='Assign keys to the package that references them instead of by prefix')
+
+    args = parser.parse_args()
+
+    output_dir = Path(args.output)
+    if not output_dir.is_absolute():
+        output_dir = Path(args.root) / output_dir
+
+    sharder = CatalogSharder(args.root, str(output_dir), by_usage=args.by_usage)
+    print(f"Sharding catalogs into {output_dir}")
+    sharder.shard_all(args.locales)
+
+    report = sharder.first_screen_report(args.eager)
+    sizes = Counter()
+    print(f"\n{'='*60}")
+    print(f"FIRST SCREEN PARSE COST (eager: {', '.join(args.eager)})")
+    print(f"{'='*60}")
+    for lang, row in report.items():
+        print(f"  {lang}: {row['eager_bytes']:>9,} of {row['monolithic_bytes']:>9,} bytes "
+              f"({row['eager_keys']} keys, {row['saved_pct']}% less)")
+        sizes['eager'] += row['eager_bytes']
+        sizes['total'] += row['monolithic_bytes']
+    if sizes['total']:
+        print(f"  all locales: {sizes['eager']:,} of {sizes['total']:,} bytes "
+              f"({100 * (1 - sizes['eager'] / sizes['total']):.1f}% less)")
+    print(f"{'='*60}")
+    print(f"📦 Manifest saved to: {output_dir / 'manifest.json'}")
+
+
+if __name__ == '__main__':
+    main()
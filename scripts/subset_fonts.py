@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Font Subsetter
+Collects the characters the app can render from the translation catalogs
+and the extracted text literals, subsets every font in assets/fonts to
+them (split per script) and reports the bytes saved.
+
+Requires fontTools (pip install fonttools).
+"""
+
+import json
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from check_placeholders import flatten_catalog
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+FONT_SUFFIXES = ('.ttf', '.otf')
+
+# User-generated content (names, captions, messages) renders in the same
+# fonts, so the Latin ranges stay even when no catalog string uses them.
+DEFAULT_KEEP = 'U+0020-007E,U+00A0-017F,U+2000-206F,U+20AC,U+2122,U+FFFD'
+
+# Arabic needs its contextual forms and ligatures kept for shaping
+ARABIC_FEATURES = ['init', 'medi', 'fina', 'isol', 'rlig', 'liga', 'calt', 'ccmp', 'mark', 'mkmk', 'curs']
+
+SCRIPT_RANGES = [
+    ('arabic', [(0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)]),
+    ('cjk', [(0x2E80, 0x2FFF), (0x3000, 0x303F), (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF), (0xFF00, 0xFFEF)]),
+    ('cyrillic', [(0x0400, 0x052F)]),
+    ('greek', [(0x0370, 0x03FF)]),
+]
+
+
+def script_of(codepoint: int) -> str:
+    for script, ranges in SCRIPT_RANGES:
+        for low, high in ranges:
+            if low <= codepoint <= high:
+                return script
+    return 'latin'
+
+
+def parse_unicode_ranges(spec: str) -> Set[int]:
+    """Parse 'U+0020-007E,U+00A0' into a set of codepoints"""
+    codepoints: Set[int] = set()
+    for part in filter(None, (p.strip() for p in spec.split(','))):
+        part = part.upper().replace('U+', '')
+        if '-' in part:
+            low, high = part.split('-', 1)
+            codepoints.update(range(int(low, 16), int(high, 16) + 1))
+        else:
+            codepoints.add(int(part, 16))
+    return codepoints
+
+
+class FontSubsetter:
+    def __init__(self, project_root: str, output_dir: str, keep: str = DEFAULT_KEEP):
+        self.project_root = Path(project_root)
+        self.fonts_dir = self.project_root / "assets" / "fonts"
+        self.output_dir = Path(output_dir)
+        self.keep = parse_unicode_ranges(keep)
+        self.codepoints: Set[int] = set()
+        self.results: List[Dict] = []
+
+    def add_texts(self, texts: Iterable[str]):
+        for text in texts:
+            self.codepoints.update(ord(c) for c in text)
+
+    def collect_catalog_glyphs(self):
+        """Every character of every value in the seven locale catalogs"""
+        for lang in LANGUAGES:
+            file_path = self.project_root / "assets" / "translations" / f"{lang}.json"
+            if not file_path.exists():
+                continue
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self.add_texts(value for _, value in flatten_catalog(json.load(f)))
+
+    def collect_extracted_literals(self):
+        """Literals found by extract_english_text.py and the per-package text dumps"""
+        for file_path in sorted(self.project_root.glob('*_texts_data.json')):
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading {file_path.name}: {e}")
+                continue
+            if 'all_unique_texts' in data:
+                self.add_texts(data['all_unique_texts'])
+            else:
+                self.add_texts(value for _, value in flatten_catalog(data))
+
+    def find_fonts(self) -> List[Path]:
+        return sorted(p for p in self.fonts_dir.rglob('*') if p.suffix.lower() in FONT_SUFFIXES)
+
+    def split_by_script(self, codepoints: Set[int]) -> Dict[str, Set[int]]:
+        scripts: Dict[str, Set[int]] = defaultdict(set)
+        for cp in codepoints:
+            scripts[script_of(cp)].add(cp)
+        return scripts
+
+    def subset_font(self, font_path: Path, needed: Set[int]) -> Dict:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+
+        font = TTFont(str(font_path), lazy=True)
+        covered = set(font.getBestCmap() or {})
+        font.close()
+
+        relative = font_path.relative_to(self.fonts_dir)
+        result = {'font': str(relative), 'original_bytes': font_path.stat().st_size, 'splits': {}}
+
+        for script, codepoints in sorted(self.split_by_script(needed & covered).items()):
+            options = subset.Options()
+            options.name_IDs = ['*']
+            options.notdef_outline = True
+            options.recalc_bounds = True
+            if script == 'arabic':
+                options.layout_features = ARABIC_FEATURES + ['kern']
+                options.layout_scripts = ['arab', 'DFLT']
+            else:
+                options.layout_features = ['kern', 'liga', 'calt', 'ccmp', 'locl', 'mark', 'mkmk']
+
+            subsetter = subset.Subsetter(options=options)
+            subsetter.populate(unicodes=codepoints)
+            subset_font = subset.load_font(str(font_path), options)
+            subsetter.subset(subset_font)
+
+            out_path = self.output_dir / relative.parent / f"{font_path.stem}-{script}{font_path.suffix}"
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            subset.save_font(subset_font, str(out_path), options)
+            subset_font.close()
+
+            result['splits'][script] = {
+                'file': str(out_path.relative_to(self.output_dir)),
+                'codepoints': len(codepoints),
+                'bytes': out_path.stat().st_size,
+            }
+
+        result['subset_bytes'] = sum(s['bytes'] for s in result['splits'].values())
+        result['saved_bytes'] = result['original_bytes'] - result['subset_bytes']
+        return result
+
+    def run(self, include_literals: bool = True):
+        self.collect_catalog_glyphs()
+        if include_literals:
+            self.collect_extracted_literals()
+        needed = {cp for cp in self.codepoints if cp >= 0x20} | self.keep
+
+        fonts = self.find_fonts()
+        print(f"Collected {len(self.codepoints)} distinct characters; subsetting {len(fonts)} fonts")
+        for font_path in fonts:
+            result = self.subset_font(font_path, needed)
+            self.results.append(result)
+            splits = ', '.join(f"{k}: {v['bytes']:,}" for k, v in result['splits'].items())
+            print(f"  ✓ {result['font']}: {result['original_bytes']:,} -> {result['subset_bytes']:,} bytes ({splits})")
+
+    def save_json_output(self, output_path: str):
+        by_script = defaultdict(int)
+        for cp in self.codepoints:
+            by_script[script_of(cp)] += 1
+        output_data = {
+            'metadata': {
+                'fonts': len(self.results),
+                'distinct_characters': len(self.codepoints),
+                'characters_by_script': dict(by_script),
+                'original_bytes': sum(r['original_bytes'] for r in self.results),
+                'subset_bytes': sum(r['subset_bytes'] for r in self.results),
+                'saved_bytes': sum(r['saved_bytes'] for r in self.results),
+            },
+            'fonts': self.results,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Subset assets/fonts to the glyphs the app renders')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--output', default='build/fonts_subset', help='Output directory for subset fonts')
+    parser.add_argument('--json', default='font_subset_report.json', help='Output JSON report')
+    parser.add_argument('--keep', default=DEFAULT_KEEP, help='Unicode ranges always kept (for user content)')
+    parser.add_argument('--catalogs-only', action='store_true', help='Ignore the extracted *_texts_data.json literals')
+
+    args = parser.parse_args()
+
+    try:
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("fontTools is required: pip install fonttools")
+        raise SystemExit(1)
+
+    output_dir = Path(args.output)
+    if not output_dir.is_absolute():
+        output_dir = Path(args.root) / output_dir
+
+    subsetter = FontSubsetter(args.root, str(output_dir), args.keep)
+    subsetter.run(include_literals=not args.catalogs_only)
+    subsetter.save_json_output(args.json)
+
+    original = sum(r['original_bytes'] for r in subsetter.results)
+    subset_total = sum(r['subset_bytes'] for r in subsetter.results)
+    print("\n✅ Subsetting complete!")
+    print(f"📦 {original:,} -> {subset_total:,} bytes ({original - subset_total:,} saved)")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Text Expansion Report
+Measures every catalog value in every locale with the advance widths of the
+bundled fonts and compares it with the English value, then joins the keys
+with the widget context recorded in english_texts_data.json (AppBar title,
+button label, Tab, ...) to rank the strings most likely to overflow.
+
+Widths are sums of glyph advances: no kerning and no shaping, so Arabic is
+measured with isolated forms. Characters the font lacks fall back to a
+per-script em width. fontTools is optional; without it every character
+uses the fallback table.
+"""
+
+import re
+import json
+import time
+import argparse
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from check_placeholders import PLACEHOLDER_PATTERN, flatten_catalog
+from subset_fonts import script_of
+
+LANGUAGES = ['en', 'ar', 'de', 'es', 'fr', 'pt', 'zh']
+RTL_LANGUAGES = {'ar'}
+
+# Placeholders are filled at runtime; give them the width of a short name in every locale
+PLACEHOLDER_STAND_IN = 'nnnnnn'
+
+# Em widths for characters the font does not cover
+SCRIPT_EM_WIDTHS = {'latin': 0.55, 'cyrillic': 0.58, 'greek': 0.58, 'arabic': 0.5, 'cjk': 1.0}
+NARROW_CHARACTERS = set("iljtfrI.,:;!|' ")
+WIDE_CHARACTERS = set('mwMW@%')
+
+# Single-line width budget (logical px on a 360 dp phone), font size and weight per context
+CONTEXT_LAYOUT = {
+    'app_bar_title': (240, 22, 'regular'),
+    'dialog_title': (260, 24, 'regular'),
+    'tab': (100, 14, 'medium'),
+    'button': (160, 14, 'medium'),
+    'chip': (120, 14, 'medium'),
+    'field_label': (280, 16, 'regular'),
+    'text': (None, 14, 'regular'),
+}
+# english_texts_data.json keeps ~50 characters either side of a literal, so the
+# widget constructor is often cut off; sibling arguments identify the slot too
+CONTEXT_PATTERNS = [
+    ('app_bar_title', re.compile(r"\b(?:SliverAppBar|AppBar|\w*Header)\s*\(.*\btitle\s*:\s*(?:(?:const\s+)?Text\s*\(\s*)?$")),
+    ('dialog_title', re.compile(r"\b(?:AlertDialog|SimpleDialog)\s*\(.*\btitle\s*:\s*(?:const\s+)?Text\s*\(\s*$")),
+    ('tab', re.compile(r"\bTab\s*\(\s*(?:text\s*:\s*|child\s*:\s*(?:const\s+)?Text\s*\(\s*)$")),
+    ('chip', re.compile(r"\b(?:Chip|ChoiceChip|FilterChip|ActionChip|InputChip)\s*\(.*\blabel\s*:\s*(?:const\s+)?Text\s*\(\s*$")),
+    ('button', re.compile(r"(?:\b(?:ElevatedButton|TextButton|OutlinedButton|FilledButton|FloatingActionButton)\b|"
+                          r"\bonPressed\s*:).*\bchild\s*:\s*(?:const\s+)?Text\s*\(\s*$")),
+    ('button', re.compile(r"\b(?:icon\s*:|Icon\s*\().*\blabel\s*:\s*(?:const\s+)?Text\s*\(\s*$")),
+    ('field_label', re.compile(r"\b(?:labelText|hintText|helperText)\s*:\s*$")),
+]
+
+
+class AdvanceTable(dict):
+    """Character -> advance width in em; misses are filled from the fallback table"""
+
+    def __init__(self):
+        super().__init__()
+        self.covered = set()       # characters the font itself has
+
+    def __missing__(self, char: str) -> float:
+        script = script_of(ord(char))
+        if script == 'latin':
+            width = 0.3 if char in NARROW_CHARACTERS else 0.85 if char in WIDE_CHARACTERS else \
+                0.65 if char.isupper() else SCRIPT_EM_WIDTHS['latin']
+        else:
+            width = SCRIPT_EM_WIDTHS[script]
+        self[char] = width
+        return width
+
+
+def load_advance_table(font_path: Optional[Path]) -> AdvanceTable:
+    table = AdvanceTable()
+    if font_path is None:
+        return table
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(str(font_path), lazy=True)
+    units = font['head'].unitsPerEm
+    metrics = font['hmtx'].metrics
+    for codepoint, glyph in (font.getBestCmap() or {}).items():
+        table[chr(codepoint)] = metrics[glyph][0] / units
+    table.covered = set(table)
+    font.close()
+    return table
+
+
+def classify_context(context: str, text: str) -> str:
+    """Widget slot of a literal from the ~100 characters of source around it"""
+    position = context.find(text)
+    before = context[:position].rstrip(' \'"') if position >= 0 else context
+    for kind, pattern in CONTEXT_PATTERNS:
+        if pattern.search(before[-160:]):
+            return kind
+    return 'text'
+
+
+class TextExpansionAnalyzer:
+    def __init__(self, project_root: str, regular_font: Optional[str] = None, medium_font: Optional[str] = None):
+        self.project_root = Path(project_root)
+        fonts_dir = self.project_root / 'assets' / 'fonts'
+        self.font_paths = {
+            'regular': Path(regular_font) if regular_font else fonts_dir / 'Roboto-Regular.ttf',
+            'medium': Path(medium_font) if medium_font else fonts_dir / 'Roboto-Medium.ttf',
+        }
+        self.tables: Dict[str, AdvanceTable] = {}
+        self.keys: List[str] = []
+        self.columns: Dict[str, List[Optional[str]]] = {}
+        self.widths: Dict[str, Dict[str, List[Optional[float]]]] = {}
+        self.contexts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.ranked: List[Dict] = []
+        self.uses_font_metrics = True
+        self.measure_seconds = 0.0
+
+    def load_fonts(self):
+        try:
+            import fontTools  # noqa: F401
+        except ImportError:
+            print("⚠️  fontTools not installed; using fallback character widths (pip install fonttools)")
+            self.uses_font_metrics = False
+        for weight, path in self.font_paths.items():
+            self.tables[weight] = load_advance_table(path if self.uses_font_metrics and path.exists() else None)
+
+    def load_catalogs(self):
+        """One column per locale, aligned on the English keys"""
+        catalogs = {}
+        for lang in LANGUAGES:
+            file_path = self.project_root / 'assets' / 'translations' / f'{lang}.json'
+            if not file_path.exists():
+                continue
+            with open(file_path, 'r', encoding='utf-8') as f:
+                catalogs[lang] = dict(flatten_catalog(json.load(f)))
+        self.keys = sorted(catalogs.get('en', {}))
+        for lang, values in catalogs.items():
+            self.columns[lang] = [values.get(key) for key in self.keys]
+
+    def load_contexts(self, data_path: Path):
+        """Join extracted English literals to catalog keys by their English value"""
+        if not data_path.exists():
+            print(f"⚠️  {data_path.name} not found; every key is treated as plain text")
+            return
+        with open(data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        keys_by_value = defaultdict(list)
+        for key, value in zip(self.keys, self.columns['en']):
+            keys_by_value[value.strip()].append(key)
+        for entries in data.get('files', {}).values():
+            for entry in entries:
+                keys = keys_by_value.get(entry['text'].strip())
+                if keys:
+                    kind = classify_context(entry.get('context', ''), entry['text'])
+                    for key in keys:
+                        self.contexts[key][kind] += 1
+
+    def measure(self):
+        """Rendered width in em of every cell, computed a whole locale column at a time"""
+        start = time.perf_counter()
+        for weight, table in self.tables.items():
+            lookup = table.__getitem__
+            self.widths[weight] = {
+                lang: [sum(map(lookup, PLACEHOLDER_PATTERN.sub(PLACEHOLDER_STAND_IN, v))) if v else None for v in column]
+                for lang, column in self.columns.items()
+            }
+        self.measure_seconds = time.perf_counter() - start
+
+    def rank(self):
+        for i, key in enumerate(self.keys):
+            kinds = dict(self.contexts.get(key, {})) or {'text': 0}
+            # The tightest slot the key is used in decides its budget
+            slot = min(kinds, key=lambda k: CONTEXT_LAYOUT[k][0] or float('inf'))
+            budget, size, weight = CONTEXT_LAYOUT[slot]
+            widths = self.widths[weight]
+            english = widths['en'][i]
+            if not english:
+                continue
+
+            locales = {}
+            for lang in self.columns:
+                width = widths[lang][i]
+                if lang == 'en' or width is None:
+                    continue
+                locales[lang] = {
+                    'ratio': round(width / english, 3),
+                    'width_px': round(width * size, 1),
+                    'overflow': round(width * size / budget, 3) if budget else None,
+                }
+            if not locales:
+                continue
+            worst_lang = max(locales, key=lambda l: locales[l]['ratio'])
+            overflow = max((v['overflow'] for v in locales.values() if v['overflow'] is not None), default=None)
+            self.ranked.append({
+                'key': key,
+                'english': self.columns['en'][i],
+                'context': slot,
+                'contexts': kinds,
+                'budget_px': budget,
+                'english_px': round(english * size, 1),
+                'max_ratio': locales[worst_lang]['ratio'],
+                'worst_locale': worst_lang,
+                'max_overflow': overflow,
+                'locales': locales,
+            })
+        self.ranked.sort(key=lambda r: (-(r['max_overflow'] or 0), -r['max_ratio']))
+
+    def analyze(self):
+        self.load_fonts()
+        self.load_catalogs()
+        self.load_contexts(self.project_root / 'english_texts_data.json')
+        self.measure()
+        self.rank()
+
+    def locale_summary(self) -> Dict[str, Dict]:
+        summary = {}
+        for lang in self.columns:
+            if lang == 'en':
+                continue
+            ratios = [r['locales'][lang]['ratio'] for r in self.ranked if lang in r['locales']]
+            if len(ratios) < 2:
+                continue
+            table = self.tables['regular']
+            characters = {c for value in self.columns[lang] if value for c in value}
+            covered = len(characters & table.covered)
+            summary[lang] = {
+                'rtl': lang in RTL_LANGUAGES,
+                'median_ratio': round(statistics.median(ratios), 3),
+                'p90_ratio': round(statistics.quantiles(ratios, n=10)[-1], 3),
+                'keys_over_1_3x': sum(1 for r in ratios if r > 1.3),
+                'overflowing_keys': sum(1 for r in self.ranked
+                                        if ((r['locales'].get(lang) or {}).get('overflow') or 0) > 1),
+                'font_coverage': round(covered / len(characters), 3) if characters else 1.0,
+            }
+        return summary
+
+    def save_json_output(self, output_path: str):
+        output_data = {
+            'metadata': {
+                'keys': len(self.keys),
+                'locales': list(self.columns),
+                'cells': sum(1 for column in self.columns.values() for v in column if v),
+                'font_metrics': self.uses_font_metrics,
+                'fonts': {w: str(p.relative_to(self.project_root)) if p.is_relative_to(self.project_root) else str(p)
+                          for w, p in self.font_paths.items()},
+                'keys_with_context': len(self.contexts),
+                'measure_seconds': round(self.measure_seconds, 3),
+            },
+            'locales': self.locale_summary(),
+            'context_layout': {k: {'budget_px': b, 'font_size': s, 'weight': w} for k, (b, s, w) in CONTEXT_LAYOUT.items()},
+            'keys': self.ranked,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank translation keys by text expansion and overflow risk')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--font', help='Regular-weight font (default: assets/fonts/Roboto-Regular.ttf)')
+    parser.add_argument('--medium-font', help='Medium-weight font for buttons and tabs (default: Roboto-Medium.ttf)')
+    parser.add_argument('--json', default='text_expansion_report.json', help='Output JSON file')
+    parser.add_argument('--top', type=int, default=20, help='Keys to print')
+
+    args = parser.parse_args()
+
+    analyzer = TextExpansionAnalyzer(args.root, args.font, args.medium_font)
+    analyzer.analyze()
+    analyzer.save_json_output(args.json)
+
+    cells = sum(1 for column in analyzer.columns.values() for v in column if v)
+    print(f"\n{'='*60}")
+    print("TEXT EXPANSION REPORT")
+    print(f"{'='*60}")
+    print(f"Measured {cells:,} cells ({len(analyzer.keys):,} keys x {len(analyzer.columns)} locales) "
+          f"in {analyzer.measure_seconds:.2f}s")
+    print(f"Keys with widget context: {len(analyzer.contexts)}")
+    for lang, row in analyzer.locale_summary().items():
+        rtl = ' RTL' if row['rtl'] else ''
+        print(f"  {lang}{rtl}: median {row['median_ratio']:.2f}x, p90 {row['p90_ratio']:.2f}x, "
+              f"{row['keys_over_1_3x']} keys > 1.3x, font coverage {row['font_coverage']:.0%}")
+
+    print("\nMost likely to overflow:")
+    for row in [r for r in analyzer.ranked if r['max_overflow']][:args.top]:
+        marker = '✗' if row['max_overflow'] > 1 else ' '
+        print(f"  {marker} {row['max_overflow']:.2f} of {row['budget_px']}px  {row['context']:<13} "
+              f"{row['key']} ({row['worst_locale']} {row['max_ratio']:.2f}x)")
+    print(f"{'='*60}")
+    print(f"📊 Report saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+ArtBeat Translation Dictionary Bundle
+Collects the English -> translation dict literals from the translate_*.py,
+remove_*_prefixes*.py and create_*_translations.py passes with `ast` (the
+scripts are never imported, several of them rewrite catalogs at import
+time) and stores them in one marshal bundle stamped with a sha256 of the
+sources.
+
+load_bundle() checks the stamp and rebuilds a stale bundle, so a pass can
+look up translations in one shared per-locale table without re-executing
+thousands of lines of dict literals.
+"""
+
+import os
+import re
+import ast
+import sys
+import time
+import marshal
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+BUNDLE_PATH = Path('build/i18n/translation_dictionaries.marshal')
+BUNDLE_FORMAT = 1
+SOURCE_GLOBS = ('scripts/translate_*.py', 'scripts/remove_*_prefixes*.py', 'scripts/create_*_translations.py',
+                'translate_*.py')
+MIN_ENTRIES = 20
+TARGET_CATALOG = re.compile(r"translations/([a-z]{2})\.json")
+FILENAME_LANGUAGES = {
+    'arabic': 'ar', 'chinese': 'zh', 'french': 'fr', 'portuguese': 'pt', 'spanish': 'es',
+    'ar': 'ar', 'de': 'de', 'es': 'es', 'fr': 'fr', 'pt': 'pt', 'zh': 'zh',
+}
+
+
+def natural_key(path: Path) -> List:
+    # translate_arabic_mega_10 runs after _9, not after _1
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', path.as_posix())]
+
+
+def source_files(project_root: Path) -> List[Path]:
+    files = {path for pattern in SOURCE_GLOBS for path in project_root.glob(pattern)}
+    return sorted(files, key=lambda p: natural_key(p.relative_to(project_root)))
+
+
+def sources_stamp(project_root: Path, files: List[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.relative_to(project_root).as_posix().encode('utf-8') + b'\0')
+        digest.update(path.read_bytes())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def string_dict(node: ast.AST) -> Optional[Dict[str, str]]:
+    """A dict literal made only of str -> str entries, else None"""
+    if not isinstance(node, ast.Dict) or len(node.keys) < MIN_ENTRIES:
+        return None
+    for part in (*node.keys, *node.values):
+        if not isinstance(part, ast.Constant) or not isinstance(part.value, str):
+            return None
+    return {sys.intern(k.value): sys.intern(v.value) for k, v in zip(node.keys, node.values)}
+
+
+def module_dictionaries(tree: ast.Module) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """Module-level NAME = {...} tables, plus `return {...}` from top-level loader functions"""
+    for statement in tree.body:
+        if isinstance(statement, (ast.Assign, ast.AnnAssign)):
+            targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+            table = string_dict(statement.value)
+            if table is not None and isinstance(targets[0], ast.Name):
+                yield targets[0].id, table
+        elif isinstance(statement, ast.FunctionDef):
+            for node in ast.walk(statement):
+                if isinstance(node, ast.Return):
+                    table = string_dict(node.value)
+                    if table is not None:
+                        yield f"{statement.name}()", table
+
+
+def target_language(path: Path, source: str) -> Optional[str]:
+    """The locale a pass writes: the catalog it opens, else its filename"""
+    catalogs = [lang for lang in TARGET_CATALOG.findall(source) if lang != 'en']
+    if catalogs:
+        return catalogs[0]
+    for token in re.split(r'[_\d]+', path.stem):
+        if token in FILENAME_LANGUAGES:
+            return FILENAME_LANGUAGES[token]
+    return None
+
+
+class TranslationBundle:
+    def __init__(self, data: Dict):
+        self.stamp: str = data['stamp']
+        self.sources: Dict[str, Dict] = data['sources']
+        self.tables: Dict[str, Dict[str, str]] = data['tables']
+        self.languages: Dict[str, Dict[str, str]] = data['languages']
+        self.conflicts: Dict[str, int] = data['conflicts']
+
+    def lookup(self, lang: str, english: str) -> Optional[str]:
+        table = self.languages.get(lang)
+        return table.get(english) if table else None
+
+    def table(self, source: str, name: str) -> Dict[str, str]:
+        """One pass's own dictionary, e.g. table('scripts/translate_arabic_mega_5.py', 'AR_MEGA_TRANSLATIONS_5')"""
+        return self.tables[f"{source}:{name}"]
+
+
+class BundleBuilder:
+    def __init__(self, project_root: str, bundle_path: Path = BUNDLE_PATH):
+        self.project_root = Path(project_root)
+        self.bundle_file = self.project_root / bundle_path
+        self.files = source_files(self.project_root)
+        self.skipped: List[str] = []
+
+    def build(self) -> Dict:
+        sources, tables, conflicts = {}, {}, {}
+        languages: Dict[str, Dict[str, str]] = {}
+        for path in self.files:
+            relative_path = path.relative_to(self.project_root).as_posix()
+            try:
+                source = path.read_text(encoding='utf-8')
+                tree = ast.parse(source, filename=relative_path)
+            except (OSError, SyntaxError, UnicodeDecodeError) as e:
+                print(f"Error reading {path}: {e}")
+                self.skipped.append(relative_path)
+                continue
+
+            lang = target_language(path, source)
+            found = {}
+            for name, table in module_dictionaries(tree):
+                found[name] = len(table)
+                tables[f"{relative_path}:{name}"] = table
+                if lang is None:
+                    continue
+                # Later passes win, the same way running them in order would
+                merged = languages.setdefault(lang, {})
+                for english, translation in table.items():
+                    if merged.get(english, translation) != translation:
+                        conflicts[lang] = conflicts.get(lang, 0) + 1
+                    merged[english] = translation
+            if found:
+                sources[relative_path] = {'language': lang, 'dictionaries': found}
+            else:
+                self.skipped.append(relative_path)
+
+        return {
+            'format': BUNDLE_FORMAT,
+            'stamp': sources_stamp(self.project_root, self.files),
+            'sources': sources,
+            'tables': tables,
+            'languages': languages,
+            'conflicts': conflicts,
+        }
+
+    def read_bundle(self) -> Optional[Dict]:
+        try:
+            with open(self.bundle_file, 'rb') as f:
+                data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict) or data.get('format') != BUNDLE_FORMAT:
+            return None
+        return data
+
+    def is_current(self, data: Optional[Dict]) -> bool:
+        return data is not None and data.get('stamp') == sources_stamp(self.project_root, self.files)
+
+    def write(self, data: Dict):
+        self.bundle_file.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process temp name: concurrent rebuilds must not rename each other's file away
+        temp = self.bundle_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp, 'wb') as f:
+            marshal.dump(data, f)
+        temp.replace(self.bundle_file)
+
+
+def load_bundle(project_root: Optional[str] = None, rebuild: bool = True) -> TranslationBundle:
+    """Load the bundle, rebuilding it first when a source pass has changed"""
+    builder = BundleBuilder(project_root or str(Path(__file__).parent.parent))
+    data = builder.read_bundle()
+    if not builder.is_current(data):
+        if not rebuild:
+            raise RuntimeError(f"{builder.bundle_file} is missing or stale; run scripts/translation_bundle.py")
+        data = builder.build()
+        builder.write(data)
+    return TranslationBundle(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the precompiled translation dictionary bundle')
+    parser.add_argument('--root', default=str(Path(__file__).parent.parent), help='Root directory of the project')
+    parser.add_argument('--check', action='store_true', help='Exit 1 if the bundle is missing or stale')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if the stamp matches')
+
+    args = parser.parse_args()
+
+    builder = BundleBuilder(args.root)
+    existing = builder.read_bundle()
+    current = builder.is_current(existing)
+    if args.check:
+        print(f"{'✅' if current else '✗'} {builder.bundle_file} is {'current' if current else 'missing or stale'}")
+        sys.exit(0 if current else 1)
+
+    start = time.perf_counter()
+    if current and not args.force:
+        data, status = existing, 'unchanged'
+    else:
+        data = builder.build()
+        builder.write(data)
+        status = 'written'
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bundle = load_bundle(args.root, rebuild=False)
+    load_seconds = time.perf_counter() - start
+
+    print(f"\n{'='*60}")
+    print("TRANSLATION DICTIONARY BUNDLE")
+    print(f"{'='*60}")
+    print(f"Source passes: {len(data['sources'])} ({len(builder.skipped)} without dictionaries)")
+    print(f"Dictionaries: {len(data['tables'])}  Entries: {sum(len(t) for t in data['tables'].values()):,}")
+    for lang, table in sorted(bundle.languages.items()):
+        conflicts = bundle.conflicts.get(lang, 0)
+        print(f"  {lang}: {len(table):,} unique source strings"
+              + (f" ({conflicts} overridden by later passes)" if conflicts else ''))
+    print(f"Bundle {status}: {builder.bundle_file} ({builder.bundle_file.stat().st_size / 1024:.1f} KB, "
+          f"{build_seconds * 1000:.0f} ms)")
+    print(f"Load with stamp check: {load_seconds * 1000:.1f} ms")
+    print(f"{'='*60}")
+
+
+if __name__ == '__main__':
+    main()